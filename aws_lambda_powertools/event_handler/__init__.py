@@ -9,9 +9,11 @@ from aws_lambda_powertools.event_handler.api_gateway import (
     APIGatewayRestResolver,
     CORSConfig,
     Response,
+    StreamingResponse,
 )
 from aws_lambda_powertools.event_handler.appsync import AppSyncResolver
 from aws_lambda_powertools.event_handler.bedrock_agent import BedrockAgentResolver
+from aws_lambda_powertools.event_handler.compression import CompressionConfig
 from aws_lambda_powertools.event_handler.lambda_function_url import (
     LambdaFunctionUrlResolver,
 )
@@ -24,9 +26,11 @@ __all__ = [
     "ALBResolver",
     "ApiGatewayResolver",
     "BedrockAgentResolver",
+    "CompressionConfig",
     "CORSConfig",
     "LambdaFunctionUrlResolver",
     "Response",
+    "StreamingResponse",
     "VPCLatticeResolver",
     "VPCLatticeV2Resolver",
 ]
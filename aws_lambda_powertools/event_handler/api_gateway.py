@@ -1,22 +1,44 @@
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
+import contextvars
+import inspect
 import json
 import logging
 import re
 import traceback
 import warnings
-import zlib
 from abc import ABC, abstractmethod
 from enum import Enum
 from functools import partial
 from http import HTTPStatus
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Mapping, Match, Pattern, Sequence, TypeVar, cast
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generic,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Match,
+    NamedTuple,
+    Pattern,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import override
 
 from aws_lambda_powertools.event_handler import content_types
+from aws_lambda_powertools.event_handler.compression import CompressionConfig
 from aws_lambda_powertools.event_handler.exceptions import NotFoundError, ServiceError
 from aws_lambda_powertools.event_handler.openapi.constants import DEFAULT_API_VERSION, DEFAULT_OPENAPI_VERSION
 from aws_lambda_powertools.event_handler.openapi.exceptions import RequestValidationError, SchemaValidationError
@@ -33,7 +55,9 @@ from aws_lambda_powertools.event_handler.util import (
     _FrozenDict,
     _FrozenListDict,
     _validate_openapi_security_parameters,
+    etag_matches,
     extract_origin_header,
+    weak_etag,
 )
 from aws_lambda_powertools.shared.cookies import Cookie
 from aws_lambda_powertools.shared.functions import powertools_dev_is_set
@@ -58,11 +82,21 @@ _UNSAFE_URI = r"%<> \[\]{}|^"
 _NAMED_GROUP_BOUNDARY_PATTERN = rf"(?P\1[{_SAFE_URI}{_UNSAFE_URI}\\w]+)"
 _DEFAULT_OPENAPI_RESPONSE_DESCRIPTION = "Successful Response"
 _ROUTE_REGEX = "^{}$"
+# Rules without these characters nor dynamic segments only match their own path
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+# A wildcard in an allowed CORS origin matches a single subdomain or port, e.g. https://*.example.com
+_WILDCARD_ORIGIN_PATTERN = "[A-Za-z0-9-]+"
+# Lambda response streaming separates the JSON prelude (status code, headers, cookies) from the body with 8 null bytes
+_STREAMING_PRELUDE_DELIMITER = b"\x00" * 8
+_DEFAULT_STREAMING_CHUNK_SIZE = 64 * 1024
+# Binary bodies are base64 encoded without copying them into bytes first
+_BINARY_BODY_TYPES = (bytes, bytearray, memoryview)
 
 ResponseEventT = TypeVar("ResponseEventT", bound=BaseProxyEvent)
 ResponseT = TypeVar("ResponseT")
 
 if TYPE_CHECKING:
+    from aws_lambda_powertools.event_handler.middlewares.openapi_validation import RequestValidationPlan
     from aws_lambda_powertools.event_handler.openapi.compat import (
         JsonSchemaValue,
         ModelField,
@@ -164,7 +198,8 @@ class CORSConfig:
             The value of the `Access-Control-Allow-Origin` to send in the response. Defaults to "*", but should
             only be used during development.
         extra_origins: list[str] | None
-            The list of additional allowed origins.
+            The list of additional allowed origins. Origins can use `*` as a wildcard for a single subdomain
+            or port, e.g. `https://*.example.com`.
         allow_headers: list[str] | None
             The list of additional allowed headers. This list is added to list of
             built-in allowed headers: `Authorization`, `Content-Type`, `X-Amz-Date`,
@@ -187,6 +222,42 @@ class CORSConfig:
         self.max_age = max_age
         self.allow_credentials = allow_credentials
 
+        # Origins are checked on every response, so they're matched against a set,
+        # and wildcard origins against a single precompiled regex
+        self._allow_all_origins = "*" in self._allowed_origins
+        self._exact_origins = frozenset(self._allowed_origins)
+        self._wildcard_origins = self._compile_wildcard_origins(self._allowed_origins)
+
+        # Headers that don't depend on the request origin are only built once
+        self._headers = self._build_static_headers()
+
+    def _build_static_headers(self) -> dict[str, str]:
+        headers = {"Access-Control-Allow-Headers": CORSConfig.build_allow_methods(self.allow_headers)}
+
+        if self.expose_headers:
+            headers["Access-Control-Expose-Headers"] = ",".join(self.expose_headers)
+        if self.max_age is not None:
+            headers["Access-Control-Max-Age"] = str(self.max_age)
+        return headers
+
+    @staticmethod
+    def _compile_wildcard_origins(origins: list[str]) -> Pattern | None:
+        """Compiles origins with wildcards, e.g. `https://*.example.com`, into a single regex"""
+        patterns = [
+            re.escape(origin).replace(r"\*", _WILDCARD_ORIGIN_PATTERN)
+            for origin in origins
+            if "*" in origin and origin != "*"
+        ]
+        if not patterns:
+            return None
+
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+    def _is_allowed_origin(self, origin: str) -> bool:
+        if origin in self._exact_origins:
+            return True
+        return self._wildcard_origins is not None and self._wildcard_origins.fullmatch(origin) is not None
+
     def to_dict(self, origin: str | None) -> dict[str, str]:
         """Builds the configured Access-Control http headers"""
 
@@ -196,27 +267,20 @@ class CORSConfig:
 
         # If the origin doesn't match any of the allowed origins, and we don't allow all origins ("*"),
         # don't add any CORS headers
-        if origin not in self._allowed_origins and "*" not in self._allowed_origins:
+        if not self._allow_all_origins and not self._is_allowed_origin(origin):
             return {}
 
         # The origin matched an allowed origin, so return the CORS headers
-        headers = {
-            "Access-Control-Allow-Origin": origin,
-            "Access-Control-Allow-Headers": CORSConfig.build_allow_methods(self.allow_headers),
-        }
+        headers = {"Access-Control-Allow-Origin": origin, **self._headers}
 
-        if self.expose_headers:
-            headers["Access-Control-Expose-Headers"] = ",".join(self.expose_headers)
-        if self.max_age is not None:
-            headers["Access-Control-Max-Age"] = str(self.max_age)
         if origin != "*" and self.allow_credentials is True:
             headers["Access-Control-Allow-Credentials"] = "true"
         return headers
 
     def allowed_origin(self, extracted_origin: str) -> str | None:
-        if extracted_origin in self._allowed_origins:
+        if extracted_origin is not None and self._is_allowed_origin(extracted_origin):
             return extracted_origin
-        if extracted_origin is not None and "*" in self._allowed_origins:
+        if extracted_origin is not None and self._allow_all_origins:
             return "*"
 
         return None
@@ -261,7 +325,8 @@ class Response(Generic[ResponseT]):
             Optionally set the Content-Type header, example "application/json". Note this will be merged into any
             provided http headers
         body: str | bytes | None
-            Optionally set the response body. Note: bytes body will be automatically base64 encoded
+            Optionally set the response body. Note: bytes-like bodies (bytes, bytearray, memoryview) will be
+            automatically base64 encoded
         headers: Mapping[str, str | list[str]]
             Optionally set specific http headers. Setting "Content-Type" here would override the `content_type` value.
         cookies: list[Cookie]
@@ -287,6 +352,94 @@ class Response(Generic[ResponseT]):
         return content_type.startswith("application/json")
 
 
+class StreamingResponse(Response[Union[str, bytes, Iterable[Union[str, bytes]], IO]]):
+    """Response data class whose body is written in chunks with Lambda response streaming
+
+    Use it with `resolve_stream` when your function is invoked with response streaming, e.g. Lambda Function URLs
+    with `RESPONSE_STREAM` invoke mode, so large or long-lived responses aren't held in memory nor base64 encoded.
+    With `resolve`, the body is read into memory and returned like any other response.
+
+    Examples
+    --------
+
+    ```python
+    from aws_lambda_powertools.event_handler import LambdaFunctionUrlResolver, StreamingResponse
+
+    app = LambdaFunctionUrlResolver()
+
+    @app.get("/events")
+    def stream_events():
+        def events():
+            for i in range(10):
+                yield f"data: {i}\\n\\n"
+
+        return StreamingResponse(200, "text/event-stream", events())
+
+    def lambda_handler(event, context):
+        return app.resolve_stream(event, context)
+    ```
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        content_type: str | None = None,
+        body: str | bytes | Iterable[str | bytes] | IO | None = None,
+        headers: Mapping[str, str | list[str]] | None = None,
+        cookies: list[Cookie] | None = None,
+        compress: bool | None = None,
+        chunk_size: int = _DEFAULT_STREAMING_CHUNK_SIZE,
+    ):
+        """
+
+        Parameters
+        ----------
+        status_code: int
+            Http status code, example 200
+        content_type: str
+            Optionally set the Content-Type header, example "text/event-stream"
+        body: str | bytes | Iterable[str | bytes] | IO | None
+            Optionally set the response body, as a generator or iterable of chunks, or a file-like object
+        headers: Mapping[str, str | list[str]]
+            Optionally set specific http headers. Setting "Content-Type" here would override the `content_type` value.
+        cookies: list[Cookie]
+            Optionally set cookies.
+        compress: bool | None
+            Optionally enable or disable compression of chunks as they're written
+        chunk_size: int
+            Size in bytes of chunks read from file-like objects, by default 64 KiB
+        """
+        super().__init__(status_code, content_type, body, headers, cookies, compress)
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Iterate over the body chunks as bytes"""
+        body = self.body
+        if body is None:
+            body = []
+        elif isinstance(body, (str, bytes)):
+            body = [body]
+        elif hasattr(body, "read"):
+            body = self._read_chunks(cast(IO, body), self.chunk_size)
+
+        # chunks are encoded lazily, as they're produced
+        return (chunk.encode("utf-8") if isinstance(chunk, str) else chunk for chunk in body if chunk)
+
+    @staticmethod
+    def _read_chunks(file: IO, chunk_size: int) -> Iterator[str | bytes]:
+        # file-like objects are closed once fully read
+        with file:
+            yield from iter(partial(file.read, chunk_size), file.read(0))
+
+
+class PreflightRule(NamedTuple):
+    """Methods allowed in CORS pre-flight responses for paths matching a route rule"""
+
+    rule: Pattern
+    methods: frozenset[str]
+    allow_methods: str
+
+
 class Route:
     """Internally used Route Configuration"""
 
@@ -377,12 +530,21 @@ class Route:
         # _middleware_stack_built is used to ensure the middleware stack is only built once.
         self._middleware_stack_built = False
 
+        # _async_middleware_stack is used to await async route handlers and middlewares, built once when needed
+        self._async_middleware_stack: Callable[..., Awaitable[Response]] | None = None
+
+        # _requires_async is used to cache whether the route handler or any of its middlewares is async
+        self._requires_async: bool | None = None
+
         # _dependant is used to cache the dependant model for the handler function
         self._dependant: Dependant | None = None
 
         # _body_field is used to cache the dependant model for the body field
         self._body_field: ModelField | None = None
 
+        # _request_validation_plan is used to cache the compiled request validation model
+        self._request_validation_plan: RequestValidationPlan | None = None
+
     def __call__(
         self,
         router_middlewares: list[Callable],
@@ -413,8 +575,65 @@ class Route:
 
         # Save CPU cycles by building middleware stack once
         if not self._middleware_stack_built:
-            self._build_middleware_stack(router_middlewares=router_middlewares)
+            self._build_middleware_stack(router_middlewares=router_middlewares, debug=app._debug)
+
+        self._prepare_call(router_middlewares=router_middlewares, app=app, route_arguments=route_arguments)
+
+        # Call the Middleware Wrapped _call_stack function handler with the app
+        return self._middleware_stack(app)
+
+    async def call_async(
+        self,
+        router_middlewares: list[Callable],
+        app: ApiGatewayResolver,
+        route_arguments: dict[str, str],
+    ) -> Response:
+        """Calls the route awaiting async route handlers and middlewares, in the running event loop
+
+        Synchronous middlewares run in a worker thread, so they can wait for the next middleware while
+        the event loop keeps running. Synchronous route handlers are called directly.
+
+        Parameters
+        ----------
+        router_middlewares: list[Callable]
+            The list of Router Middlewares (assigned to ALL routes)
+        app: "ApiGatewayResolver"
+            The ApiGatewayResolver instance to pass into the middleware stack
+        route_arguments: dict[str, str]
+            The route arguments to pass to the app function (extracted from the Api Gateway
+            Lambda Message structure from AWS)
 
+        Returns
+        -------
+        Response
+            API Response object
+        """
+        # Save CPU cycles by building middleware stack once
+        if self._async_middleware_stack is None:
+            self._async_middleware_stack = self._build_async_middleware_stack(
+                router_middlewares=router_middlewares,
+                debug=app._debug,
+            )
+
+        self._prepare_call(router_middlewares=router_middlewares, app=app, route_arguments=route_arguments)
+
+        return await self._async_middleware_stack(app)
+
+    def requires_async(self, router_middlewares: list[Callable]) -> bool:
+        """Whether the route handler or any of its middlewares is async, and must be called with `call_async`"""
+        if self._requires_async is None:
+            self._requires_async = any(
+                _is_async_callable(handler) for handler in [self.func, *router_middlewares, *self.middlewares]
+            )
+
+        return self._requires_async
+
+    def _prepare_call(
+        self,
+        router_middlewares: list[Callable],
+        app: ApiGatewayResolver,
+        route_arguments: dict[str, str],
+    ) -> None:
         # If debug is turned on then output the middleware stack to the console
         if app._debug:
             print(f"\nProcessing Route:::{self.func.__name__} ({app.context['_path']})")
@@ -428,10 +647,7 @@ class Route:
         # Add Route Arguments to app context
         app.append_context(_route_args=route_arguments)
 
-        # Call the Middleware Wrapped _call_stack function handler with the app
-        return self._middleware_stack(app)
-
-    def _build_middleware_stack(self, router_middlewares: list[Callable[..., Any]]) -> None:
+    def _build_middleware_stack(self, router_middlewares: list[Callable[..., Any]], debug: bool = False) -> None:
         """
         Builds the middleware stack for the handler by wrapping each
         handler in an instance of MiddlewareWrapper which is used to contain the state
@@ -448,6 +664,9 @@ class Route:
         -----
         The Route Middleware stack is processed in reverse order. This is so the stack of
         middleware handlers is applied in the order of being added to the handler.
+
+        Unless debug is enabled, the stack is compiled into plain closures instead, skipping the
+        bookkeeping of processed stack frames that is only printed in debug mode.
         """
         all_middlewares = router_middlewares + self.middlewares
         logger.debug(f"Building middleware stack: {all_middlewares}")
@@ -469,10 +688,37 @@ class Route:
         #
         # Start with the route function and wrap from last to the first Middleware handler.
         for handler in reversed(all_middlewares):
-            self._middleware_stack = MiddlewareFrame(current_middleware=handler, next_middleware=self._middleware_stack)
+            if debug:
+                self._middleware_stack = MiddlewareFrame(
+                    current_middleware=handler,
+                    next_middleware=self._middleware_stack,
+                )
+            else:
+                self._middleware_stack = _bind_next_middleware(handler, self._middleware_stack)
 
         self._middleware_stack_built = True
 
+    def _build_async_middleware_stack(
+        self,
+        router_middlewares: list[Callable[..., Any]],
+        debug: bool = False,
+    ) -> Callable[..., Awaitable[Response]]:
+        """
+        Builds the middleware stack for async route handlers and middlewares, in the same order as
+        `_build_middleware_stack`. Each frame awaits the next one, so the whole chain runs in the event loop.
+        """
+        all_middlewares = router_middlewares + self.middlewares + [_registered_async_api_adapter]
+        logger.debug(f"Building async middleware stack: {all_middlewares}")
+
+        middleware_stack: Callable[..., Any] = self.func
+        for handler in reversed(all_middlewares):
+            if debug:
+                middleware_stack = AsyncMiddlewareFrame(current_middleware=handler, next_middleware=middleware_stack)
+            else:
+                middleware_stack = _bind_next_async_middleware(handler, middleware_stack)
+
+        return middleware_stack
+
     @property
     def dependant(self) -> Dependant:
         if self._dependant is None:
@@ -491,6 +737,15 @@ class Route:
 
         return self._body_field
 
+    @property
+    def request_validation_plan(self) -> RequestValidationPlan:
+        if self._request_validation_plan is None:
+            from aws_lambda_powertools.event_handler.middlewares.openapi_validation import RequestValidationPlan
+
+            self._request_validation_plan = RequestValidationPlan(dependant=self.dependant)
+
+        return self._request_validation_plan
+
     def _get_openapi_path(
         self,
         *,
@@ -814,10 +1069,20 @@ class ResponseBuilder(Generic[ResponseEventT]):
             self.response.headers.update(cors.to_dict(origin))
 
     def _add_cache_control(self, cache_control: str):
-        """Set the specified cache control headers for 200 http responses. For non-200 `no-cache` is used."""
-        cache_control = cache_control if self.response.status_code == 200 else "no-cache"
+        """Set the specified cache control headers for 200 and 304 http responses. For others `no-cache` is used."""
+        cache_control = cache_control if self.response.status_code in (200, 304) else "no-cache"
         self.response.headers["Cache-Control"] = cache_control
 
+    def _add_vary(self, header: str):
+        """Add a request header to the Vary response header, keeping any headers already listed"""
+        vary = self.response.headers.get("Vary")
+        if vary is None:
+            self.response.headers["Vary"] = header
+        elif isinstance(vary, list):
+            vary.append(header)
+        else:
+            self.response.headers["Vary"] = f"{vary}, {header}"
+
     @staticmethod
     def _has_compression_enabled(
         route_compression: bool,
@@ -841,10 +1106,9 @@ class ResponseBuilder(Generic[ResponseEventT]):
         Returns
         -------
         bool
-            True if compression is enabled and the "gzip" encoding is accepted, False otherwise.
+            True if compression is enabled and the request has an "Accept-Encoding" header, False otherwise.
         """
-        encoding = event.headers.get("accept-encoding", "")
-        if "gzip" in encoding:
+        if event.headers.get("accept-encoding"):
             if response_compression is not None:
                 return response_compression  # e.g., Response(compress=False/True))
             if route_compression:
@@ -852,16 +1116,42 @@ class ResponseBuilder(Generic[ResponseEventT]):
 
         return False
 
-    def _compress(self):
-        """Compress the response body, but only if `Accept-Encoding` headers includes gzip."""
-        self.response.headers["Content-Encoding"] = "gzip"
-        if isinstance(self.response.body, str):
-            logger.debug("Converting string response to bytes before compressing it")
-            self.response.body = bytes(self.response.body, "utf-8")
-        gzip = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS | 16)
-        self.response.body = gzip.compress(self.response.body) + gzip.flush()
+    def _compress(self, event: ResponseEventT, compression: CompressionConfig, streaming: bool = False):
+        """Compress the response body with the best encoding accepted by the client, if it's large enough.
 
-    def _route(self, event: ResponseEventT, cors: CORSConfig | None):
+        Streamed responses are compressed chunk by chunk instead, as they're written.
+        """
+        # The body depends on the client's Accept-Encoding, so shared caches must not serve it to other clients
+        self._add_vary("Accept-Encoding")
+
+        encoding = compression.negotiate(event.headers.get("accept-encoding", ""))
+        if encoding is None:
+            return
+
+        if streaming and isinstance(self.response, StreamingResponse):
+            # The body size isn't known upfront, so chunks are compressed as they're written
+            self.response.headers["Content-Encoding"] = encoding
+            self.response.body = compression.compress_stream(self.response.iter_chunks(), encoding)
+            return
+
+        body = self.response.body
+        if isinstance(body, str):
+            body = bytes(body, "utf-8")
+
+        if not body or len(body) < compression.minimum_size:
+            logger.debug("Skipping compression for response body smaller than the minimum size")
+            return
+
+        self.response.headers["Content-Encoding"] = encoding
+        self.response.body = compression.compress(body, encoding)
+
+    def _route(
+        self,
+        event: ResponseEventT,
+        cors: CORSConfig | None,
+        compression: CompressionConfig | None = None,
+        streaming: bool = False,
+    ):
         """Optionally handle any of the route's configure response handling"""
         if self.route is None:
             return
@@ -874,22 +1164,34 @@ class ResponseBuilder(Generic[ResponseEventT]):
             response_compression=self.response.compress,
             event=event,
         ):
-            self._compress()
+            self._compress(event, compression or CompressionConfig(), streaming=streaming)
 
-    def build(self, event: ResponseEventT, cors: CORSConfig | None = None) -> dict[str, Any]:
+    def build(
+        self,
+        event: ResponseEventT,
+        cors: CORSConfig | None = None,
+        compression: CompressionConfig | None = None,
+    ) -> dict[str, Any]:
         """Build the full response dict to be returned by the lambda"""
 
+        if isinstance(self.response, StreamingResponse):
+            logger.debug("Reading streaming response body into memory, as the response isn't streamed")
+            self.response.body = b"".join(self.response.iter_chunks())
         # We only apply the serializer when the content type is JSON and the
         # body is not a str, to avoid double encoding
-        if self.response.is_json() and not isinstance(self.response.body, str):
+        elif self.response.is_json() and not isinstance(self.response.body, str):
             self.response.body = self.serializer(self.response.body)
 
-        self._route(event, cors)
+        self._route(event, cors, compression)
 
-        if isinstance(self.response.body, bytes):
+        if isinstance(self.response.body, _BINARY_BODY_TYPES):
             logger.debug("Encoding bytes response with base64")
+            # b2a_base64 reads bytes-like bodies in place, and the raw body is released before decoding
+            # the encoded bytes into a str, so it isn't held along both encoded copies
+            encoded = binascii.b2a_base64(self.response.body, newline=False)
+            self.response.body = None
             self.response.base64_encoded = True
-            self.response.body = base64.b64encode(self.response.body).decode()
+            self.response.body = encoded.decode("ascii")
 
         return {
             "statusCode": self.response.status_code,
@@ -898,6 +1200,39 @@ class ResponseBuilder(Generic[ResponseEventT]):
             **event.header_serializer().serialize(headers=self.response.headers, cookies=self.response.cookies),
         }
 
+    def build_stream(
+        self,
+        event: ResponseEventT,
+        cors: CORSConfig | None = None,
+        compression: CompressionConfig | None = None,
+    ) -> Iterator[bytes]:
+        """Build the response for Lambda response streaming
+
+        The response is written as a JSON prelude with the status code, headers and cookies, followed by
+        8 null bytes and the body chunks. Bytes aren't base64 encoded, as the body is streamed as-is.
+        """
+        streaming = isinstance(self.response, StreamingResponse)
+        if not streaming and self.response.is_json() and not isinstance(self.response.body, str):
+            self.response.body = self.serializer(self.response.body)
+
+        self._route(event, cors, compression, streaming=streaming)
+
+        prelude = {
+            "statusCode": self.response.status_code,
+            **event.header_serializer().serialize(headers=self.response.headers, cookies=self.response.cookies),
+        }
+
+        return self._stream(json.dumps(prelude, separators=(",", ":")).encode("utf-8"))
+
+    def _stream(self, prelude: bytes) -> Iterator[bytes]:
+        yield prelude + _STREAMING_PRELUDE_DELIMITER
+
+        if isinstance(self.response, StreamingResponse):
+            yield from self.response.iter_chunks()
+        elif self.response.body:
+            body = self.response.body
+            yield body.encode("utf-8") if isinstance(body, str) else body
+
 
 class BaseRouter(ABC):
     current_event: BaseProxyEvent
@@ -1409,6 +1744,181 @@ class MiddlewareFrame:
         return self.current_middleware(app, self.next_middleware)
 
 
+class AsyncMiddlewareFrame(MiddlewareFrame):
+    """
+    Middleware Frame for async route handlers and middlewares, awaiting the current middleware.
+
+    Middlewares are called depending on their type:
+
+    * `async def` middlewares are awaited, and `next_middleware(app)` returns an awaitable Response
+    * Middlewares with an `async_handler` method, e.g. `OpenAPIValidationMiddleware`, have it awaited
+    * Synchronous middlewares run in a worker thread, so `next_middleware(app)` can wait for the rest of the chain.
+      Consecutive synchronous middlewares run in the same worker thread.
+    """
+
+    def __init__(
+        self,
+        current_middleware: Callable[..., Any],
+        next_middleware: Callable[..., Any],
+    ) -> None:
+        super().__init__(current_middleware=current_middleware, next_middleware=next_middleware)
+
+        # Resolve how to call the current middleware once, instead of on every request
+        self._async_middleware = _to_async_middleware(current_middleware)
+        self.run_in_worker_thread = self._run_in_worker_thread if _is_sync_middleware(current_middleware) else None
+
+    def _run_in_worker_thread(self, app: ApiGatewayResolver, loop: asyncio.AbstractEventLoop) -> Response:
+        logger.debug("AsyncMiddlewareFrame: %s", self)
+        app._push_processed_stack_frame(str(self))
+
+        return _run_sync_middleware(self.current_middleware, self.next_middleware, app, loop)
+
+    async def __call__(self, app: ApiGatewayResolver) -> Response:  # type: ignore[override]
+        """
+        Call the middleware Frame to process the request, awaiting the next middleware in the chain.
+
+        Parameters
+        ----------
+        app: BaseRouter
+            The router instance
+
+        Returns
+        -------
+        Response
+            API Response object
+        """
+        logger.debug("AsyncMiddlewareFrame: %s", self)
+        app._push_processed_stack_frame(str(self))
+
+        return await self._async_middleware(app, self.next_middleware)
+
+
+def _bind_next_middleware(middleware: Callable[..., Any], next_middleware: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Binds a middleware to the next one in the chain, like a MiddlewareFrame without recording processed stack frames.
+
+    Middleware chains are compiled into these closures unless debug is enabled, to reduce per-request overhead.
+    """
+
+    def call_middleware(app: ApiGatewayResolver) -> dict | tuple | Response:
+        return middleware(app, next_middleware)
+
+    # Middlewares may rely on the name of the next middleware, e.g. for logging
+    call_middleware.__name__ = middleware.__name__
+    return call_middleware
+
+
+def _bind_next_async_middleware(
+    middleware: Callable[..., Any],
+    next_middleware: Callable[..., Any],
+) -> Callable[..., Awaitable[Response]]:
+    """Binds a middleware to the next one in the async chain, like an AsyncMiddlewareFrame without debugging"""
+    async_middleware = _to_async_middleware(middleware)
+
+    async def call_middleware(app: ApiGatewayResolver) -> Response:
+        return await async_middleware(app, next_middleware)
+
+    call_middleware.__name__ = middleware.__name__
+    if _is_sync_middleware(middleware):
+        call_middleware.run_in_worker_thread = partial(  # type: ignore[attr-defined]
+            _run_sync_middleware,
+            middleware,
+            next_middleware,
+        )
+    return call_middleware
+
+
+def _to_async_middleware(middleware: Callable[..., Any]) -> Callable[..., Awaitable[Response]]:
+    """Returns how to await a middleware in the async middleware stack, depending on its type"""
+    if _is_sync_middleware(middleware):
+        return partial(_call_sync_middleware, middleware)
+
+    return getattr(middleware, "async_handler", None) or middleware
+
+
+def _is_sync_middleware(middleware: Callable[..., Any]) -> bool:
+    """Whether a middleware in the async middleware stack must run in a worker thread"""
+    return getattr(middleware, "async_handler", None) is None and not _is_async_callable(middleware)
+
+
+def _is_async_callable(func: Callable[..., Any]) -> bool:
+    """Whether a route handler or middleware, including BaseMiddlewareHandler instances, must be awaited"""
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(getattr(func, "handler", None))
+
+
+async def _call_sync_middleware(
+    middleware: Callable[..., Any],
+    app: ApiGatewayResolver,
+    next_middleware: Callable[..., Coroutine[Any, Any, Response]],
+) -> Response:
+    """
+    Calls a synchronous middleware in a worker thread from the async middleware stack.
+
+    The middleware receives a synchronous `next_middleware`, which schedules the rest of the chain in the
+    event loop and waits for its Response. This keeps existing middlewares working with async route handlers.
+    """
+    loop = asyncio.get_running_loop()
+
+    # Propagate context variables to the worker thread, as `asyncio.to_thread` does in Python 3.9+
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, context.run, _run_sync_middleware, middleware, next_middleware, app, loop)
+
+
+def _run_sync_middleware(
+    middleware: Callable[..., Any],
+    next_middleware: Callable[..., Any],
+    app: ApiGatewayResolver,
+    loop: asyncio.AbstractEventLoop,
+) -> Response:
+    """
+    Runs a synchronous middleware in the current worker thread, along with the synchronous middlewares after it.
+
+    Only async middlewares and route handlers are scheduled in the event loop. Otherwise, each synchronous
+    middleware would block a worker thread waiting for the next one, exhausting the default executor with
+    long middleware chains.
+    """
+
+    def call_next_middleware(app: ApiGatewayResolver) -> Response:
+        run_in_worker_thread = getattr(next_middleware, "run_in_worker_thread", None)
+        if run_in_worker_thread is not None:
+            return run_in_worker_thread(app, loop)
+
+        return asyncio.run_coroutine_threadsafe(next_middleware(app), loop).result()
+
+    return middleware(app, call_next_middleware)
+
+
+async def _registered_async_api_adapter(
+    app: ApiGatewayResolver,
+    next_middleware: Callable[..., Any],
+) -> Response:
+    """
+    Calls the registered API like `_registered_api_adapter`, awaiting async route handlers.
+
+    It MUST be the final frame in the async middleware stack.
+
+    Parameters
+    ----------
+    app: ApiGatewayResolver
+        The API Gateway resolver
+    next_middleware: Callable[..., Any]
+        The function to handle the API
+
+    Returns
+    -------
+    Response
+        The API Response Object
+    """
+    route_args: dict = app.context.get("_route_args", {})
+    logger.debug(f"Calling async API Route Handler: {route_args}")
+
+    result = next_middleware(**route_args)
+    if inspect.isawaitable(result):
+        result = await result
+
+    return app._to_response(result)
+
+
 def _registered_api_adapter(app: ApiGatewayResolver, next_middleware: Callable[..., Any]) -> dict | tuple | Response:
     """
     Calls the registered API using the "_route_args" from the Resolver context to ensure the last call
@@ -1474,6 +1984,7 @@ class ApiGatewayResolver(BaseRouter):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression: CompressionConfig | None = None,
     ):
         """
         Parameters
@@ -1493,15 +2004,29 @@ class ApiGatewayResolver(BaseRouter):
             Each prefix can be a static string or a compiled regex pattern
         enable_validation: bool | None
             Enables validation of the request body against the route schema, by default False.
+        compression: CompressionConfig | None
+            Optionally configure how responses are compressed for routes with `compress=True`, by default gzip
         """
         self._proxy_type = proxy_type
         self._dynamic_routes: list[Route] = []
         self._static_routes: list[Route] = []
         self._route_keys: list[str] = []
         self._exception_handlers: dict[type, Callable] = {}
+        # Exception handlers resolved by exception type, including base classes, reset when registering handlers
+        self._exception_handlers_cache: dict[type, Callable | None] = {}
         self._cors = cors
         self._cors_enabled: bool = cors is not None
         self._cors_methods: set[str] = {"OPTIONS"}
+        # Pre-flight responses, built when registering routes and indexed by route rule pattern
+        self._cors_allow_methods = CORSConfig.build_allow_methods(self._cors_methods)
+        self._cors_preflight_rules: dict[str, PreflightRule] = {}
+        # Static rules are looked up by path, so only dynamic and regex rules are scanned for each pre-flight request
+        self._cors_static_preflight_rules: dict[str, dict[str, PreflightRule]] = {}
+        self._cors_dynamic_preflight_rules: dict[str, PreflightRule] = {}
+        # Generated OpenAPI schemas and their JSON by schema parameters, reset when routes are registered
+        self._openapi_schema_cache: list[tuple[dict[str, Any], OpenAPI]] = []
+        self._openapi_json_cache: list[tuple[dict[str, Any], str]] = []
+        self._compression = compression or CompressionConfig()
         self._debug = self._has_debug(debug)
         self._enable_validation = enable_validation
         self._strip_prefixes = strip_prefixes
@@ -1509,6 +2034,9 @@ class ApiGatewayResolver(BaseRouter):
         self.processed_stack_frames = []
         self._response_builder_class = ResponseBuilder[BaseProxyEvent]
 
+        # Event loop running async routes from `resolve`, kept across warm invocations
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+
         # Allow for a custom serializer or a concise json serialization
         self._serializer = serializer or partial(json.dumps, separators=(",", ":"), cls=Encoder)
 
@@ -1571,8 +2099,27 @@ class ApiGatewayResolver(BaseRouter):
         Returns
         -------
         OpenAPI: pydantic model
-            The OpenAPI schema as a pydantic model.
+            The OpenAPI schema as a pydantic model. It's generated once for the same parameters, and
+            generated again when routes are registered. Each call returns a copy that is safe to modify.
         """
+        params: dict[str, Any] = {
+            "title": title,
+            "version": version,
+            "openapi_version": openapi_version,
+            "summary": summary,
+            "description": description,
+            "tags": tags,
+            "servers": servers,
+            "terms_of_service": terms_of_service,
+            "contact": contact,
+            "license_info": license_info,
+            "security_schemes": security_schemes,
+            "security": security,
+            "openapi_extensions": openapi_extensions,
+        }
+        cached_schema = self._get_cached_openapi(self._openapi_schema_cache, params)
+        if cached_schema is not None:
+            return cached_schema.model_copy(deep=True)
 
         from aws_lambda_powertools.event_handler.openapi.compat import (
             GenerateJsonSchema,
@@ -1665,7 +2212,18 @@ class ApiGatewayResolver(BaseRouter):
 
         output["paths"] = {k: PathItem(**v) for k, v in paths.items()}
 
-        return OpenAPI(**output)
+        schema = OpenAPI(**output)
+        self._openapi_schema_cache.append((params, schema))
+        return schema.model_copy(deep=True)
+
+    @staticmethod
+    def _get_cached_openapi(cache: list[tuple[dict[str, Any], Any]], params: dict[str, Any]) -> Any:
+        """Returns the schema cached for the same parameters, compared by equality as they aren't hashable"""
+        for cached_params, cached_schema in cache:
+            if cached_params == params:
+                return cached_schema
+
+        return None
 
     @staticmethod
     def _get_openapi_servers(servers: list[Server] | None) -> list[Server]:
@@ -1755,30 +2313,38 @@ class ApiGatewayResolver(BaseRouter):
         Returns
         -------
         str
-            The OpenAPI schema as a JSON serializable dict.
+            The OpenAPI schema as a JSON serializable dict. It's serialized once for the same parameters,
+            and serialized again when routes are registered.
         """
         from aws_lambda_powertools.event_handler.openapi.compat import model_json
 
-        return model_json(
-            self.get_openapi_schema(
-                title=title,
-                version=version,
-                openapi_version=openapi_version,
-                summary=summary,
-                description=description,
-                tags=tags,
-                servers=servers,
-                terms_of_service=terms_of_service,
-                contact=contact,
-                license_info=license_info,
-                security_schemes=security_schemes,
-                security=security,
-                openapi_extensions=openapi_extensions,
-            ),
+        params: dict[str, Any] = {
+            "title": title,
+            "version": version,
+            "openapi_version": openapi_version,
+            "summary": summary,
+            "description": description,
+            "tags": tags,
+            "servers": servers,
+            "terms_of_service": terms_of_service,
+            "contact": contact,
+            "license_info": license_info,
+            "security_schemes": security_schemes,
+            "security": security,
+            "openapi_extensions": openapi_extensions,
+        }
+        cached_json = self._get_cached_openapi(self._openapi_json_cache, params)
+        if cached_json is not None:
+            return cached_json
+
+        openapi_json = model_json(
+            self.get_openapi_schema(**params),
             by_alias=True,
             exclude_none=True,
             indent=2,
         )
+        self._openapi_json_cache.append((params, openapi_json))
+        return openapi_json
 
     def enable_swagger(
         self,
@@ -1802,6 +2368,7 @@ class ApiGatewayResolver(BaseRouter):
         oauth2_config: OAuth2Config | None = None,
         persist_authorization: bool = False,
         openapi_extensions: dict[str, Any] | None = None,
+        openapi_schema_file: str | Path | None = None,
     ):
         """
         Returns the OpenAPI schema as a JSON serializable dict
@@ -1846,8 +2413,10 @@ class ApiGatewayResolver(BaseRouter):
             Whether to persist authorization data on browser close/refresh.
         openapi_extensions: dict[str, Any], optional
             Additional OpenAPI extensions as a dictionary.
+        openapi_schema_file: str | Path, optional
+            Path to an OpenAPI JSON schema generated at build time with `get_openapi_json_schema`, served
+            instead of generating the schema. The schema parameters above are ignored when it's set.
         """
-        from aws_lambda_powertools.event_handler.openapi.compat import model_json
         from aws_lambda_powertools.event_handler.openapi.models import Server
         from aws_lambda_powertools.event_handler.openapi.swagger_ui import (
             generate_oauth2_redirect_html,
@@ -1868,7 +2437,61 @@ class ApiGatewayResolver(BaseRouter):
                     body=generate_oauth2_redirect_html(),
                 )
 
-            base_path = self._get_base_path()
+            if openapi_schema_file:
+                spec = read_openapi_schema_file()
+            else:
+                base_path = self._get_base_path()
+                openapi_servers = servers or [Server(url=(base_path or "/"))]
+
+                spec = self.get_openapi_json_schema(
+                    title=title,
+                    version=version,
+                    openapi_version=openapi_version,
+                    summary=summary,
+                    description=description,
+                    tags=tags,
+                    servers=openapi_servers,
+                    terms_of_service=terms_of_service,
+                    contact=contact,
+                    license_info=license_info,
+                    security_schemes=security_schemes,
+                    security=security,
+                    openapi_extensions=openapi_extensions,
+                )
+
+            page = render_swagger(spec)
+
+            # Check for query parameters; if "format" is specified as "json",
+            # respond with the JSON used in the OpenAPI spec
+            # Example: https://www.example.com/swagger?format=json
+            if query_params.get("format") == "json":
+                content_type, body, etag = "application/json", page["escaped_spec"], page["spec_etag"]
+            else:
+                content_type, body, etag = "text/html", page["html"], page["html_etag"]
+
+            if etag_matches(etag, self.current_event.headers.get("if-none-match")):
+                return Response(status_code=304, body="", headers={"ETag": etag})
+
+            return Response(
+                status_code=200,
+                content_type=content_type,
+                body=body,
+                headers={"ETag": etag},
+            )
+
+        # The schema file, Swagger UI assets and pages are read and rendered once,
+        # and rendered again when the OpenAPI schema changes, e.g. when routes are registered
+        rendered: dict[str, str] = {}
+
+        def read_openapi_schema_file() -> str:
+            # Read on the first request, as the file can be generated by importing the resolver at build time
+            if "schema_file" not in rendered:
+                rendered["schema_file"] = Path(cast(Union[str, Path], openapi_schema_file)).read_text(encoding="utf-8")
+            return rendered["schema_file"]
+
+        def render_swagger(spec: str) -> dict[str, str]:
+            if rendered.get("spec") == spec:
+                return rendered
 
             if swagger_base_url:
                 swagger_js = f"{swagger_base_url}/swagger-ui-bundle.min.js"
@@ -1880,58 +2503,28 @@ class ApiGatewayResolver(BaseRouter):
                 ).read()
                 swagger_css = Path.open(Path(__file__).parent / "openapi" / "swagger_ui" / "swagger-ui.min.css").read()
 
-            openapi_servers = servers or [Server(url=(base_path or "/"))]
-
-            spec = self.get_openapi_schema(
-                title=title,
-                version=version,
-                openapi_version=openapi_version,
-                summary=summary,
-                description=description,
-                tags=tags,
-                servers=openapi_servers,
-                terms_of_service=terms_of_service,
-                contact=contact,
-                license_info=license_info,
-                security_schemes=security_schemes,
-                security=security,
-                openapi_extensions=openapi_extensions,
-            )
-
             # The .replace('</', '<\\/') part is necessary to prevent a potential issue where the JSON string contains
             # </script> or similar tags. Escaping the forward slash in </ as <\/ ensures that the JSON does not
             # inadvertently close the script tag, and the JSON remains a valid string within the JavaScript code.
-            escaped_spec = model_json(
-                spec,
-                by_alias=True,
-                exclude_none=True,
-                indent=2,
-            ).replace("</", "<\\/")
+            escaped_spec = spec.replace("</", "<\\/")
 
-            # Check for query parameters; if "format" is specified as "json",
-            # respond with the JSON used in the OpenAPI spec
-            # Example: https://www.example.com/swagger?format=json
-            if query_params.get("format") == "json":
-                return Response(
-                    status_code=200,
-                    content_type="application/json",
-                    body=escaped_spec,
-                )
-
-            body = generate_swagger_html(
+            html = generate_swagger_html(
                 escaped_spec,
                 swagger_js,
                 swagger_css,
-                swagger_base_url,
+                swagger_base_url or "",
                 oauth2_config,
                 persist_authorization,
             )
 
-            return Response(
-                status_code=200,
-                content_type="text/html",
-                body=body,
+            rendered.update(
+                spec=spec,
+                escaped_spec=escaped_spec,
+                spec_etag=weak_etag(escaped_spec.encode("utf-8")),
+                html=html,
+                html_etag=weak_etag(html.encode("utf-8")),
             )
+            return rendered
 
     def route(
         self,
@@ -1993,12 +2586,59 @@ class ApiGatewayResolver(BaseRouter):
 
                 if cors_enabled:
                     logger.debug(f"Registering method {item.upper()} to Allow Methods in CORS")
-                    self._cors_methods.add(item.upper())
+                    self._register_cors_method(_route)
+
+            self._openapi_schema_cache.clear()
+            self._openapi_json_cache.clear()
 
             return func
 
         return register_resolver
 
+    def _register_cors_method(self, route: Route) -> None:
+        """Adds the route method to the Access-Control-Allow-Methods of pre-flight responses"""
+        self._cors_methods.add(route.method)
+        self._cors_allow_methods = CORSConfig.build_allow_methods(self._cors_methods)
+
+        pattern = route.rule.pattern
+        preflight_rule = self._cors_preflight_rules.get(pattern)
+        methods = (preflight_rule.methods if preflight_rule else frozenset({"OPTIONS"})) | {route.method}
+        preflight_rule = PreflightRule(
+            rule=route.rule,
+            methods=methods,
+            allow_methods=CORSConfig.build_allow_methods(set(methods)),
+        )
+        self._cors_preflight_rules[pattern] = preflight_rule
+
+        if route.rule.groups > 0 or not _REGEX_METACHARACTERS.isdisjoint(route.path):
+            self._cors_dynamic_preflight_rules[pattern] = preflight_rule
+        else:
+            static_key = self._static_preflight_key(route.path)
+            self._cors_static_preflight_rules.setdefault(static_key, {})[pattern] = preflight_rule
+
+    @staticmethod
+    def _static_preflight_key(path: str) -> str:
+        # trailing slashes are ignored, as some resolvers match static routes with and without them
+        return path.rstrip("/") or "/"
+
+    def _preflight_allow_methods(self, path: str) -> str:
+        """Access-Control-Allow-Methods for a pre-flight request, with the methods of routes matching the path
+
+        When no route matches the path, all methods registered with CORS are allowed.
+        """
+        static_rules = self._cors_static_preflight_rules.get(self._static_preflight_key(path), {})
+        matched = [preflight for preflight in static_rules.values() if preflight.rule.match(path)]
+        matched.extend(
+            preflight for preflight in self._cors_dynamic_preflight_rules.values() if preflight.rule.match(path)
+        )
+        if not matched:
+            return self._cors_allow_methods
+        if len(matched) == 1:
+            return matched[0].allow_methods
+
+        # Static and dynamic routes can match the same path, e.g. /todos/fetch and /todos/<todo_id>
+        return CORSConfig.build_allow_methods(set().union(*(preflight.methods for preflight in matched)))
+
     def resolve(self, event, context) -> dict[str, Any]:
         """Resolves the response based on the provide event and decorator routes
 
@@ -2043,11 +2683,73 @@ class ApiGatewayResolver(BaseRouter):
         dict
             Returns the dict response
         """
+        response = self._resolve_event(event, context).build(self.current_event, self._cors, self._compression)
+        self._finish_resolve()
+
+        return response
+
+    def resolve_stream(self, event, context) -> Iterator[bytes]:
+        """Resolves the response based on the provided event and decorator routes, for Lambda response streaming
+
+        Use it when your function is invoked with response streaming, e.g. Lambda Function URLs with
+        `RESPONSE_STREAM` invoke mode. Routes run as with `resolve`, and return a `StreamingResponse` to stream
+        their body in chunks; other responses are written at once.
+
+        Parameters
+        ----------
+        event: dict[str, Any]
+            Event
+        context: LambdaContext
+            Lambda context
+
+        Returns
+        -------
+        Iterator[bytes]
+            JSON prelude with the status code, headers and cookies, followed by 8 null bytes and the body chunks,
+            to write to the response stream, e.g. with `send_streaming_response`
+        """
+        response = self._resolve_event(event, context).build_stream(self.current_event, self._cors, self._compression)
+
+        # Streamed bodies are produced lazily and can still use the current event and context
+        return self._finish_resolve_after(response)
+
+    async def async_resolve(self, event, context) -> dict[str, Any]:
+        """Resolves the response based on the provided event and decorator routes, awaiting async routes
+
+        Use it when you already run an event loop, e.g. in an async Lambda handler. Route handlers and middlewares
+        defined with `async def` are awaited in the running event loop, while synchronous middlewares run in a
+        worker thread. With `resolve`, async routes run in an event loop kept across warm invocations instead.
+
+        Parameters
+        ----------
+        event: dict[str, Any]
+            Event
+        context: LambdaContext
+            Lambda context
+
+        Returns
+        -------
+        dict
+            Returns the dict response
+        """
+        self._set_current_event(event, context)
+        response_builder = await self._call_route_async(*self._match_route())
+        response = response_builder.build(self.current_event, self._cors, self._compression)
+        self._finish_resolve()
+
+        return response
+
+    def _resolve_event(self, event, context) -> ResponseBuilder:
+        self._set_current_event(event, context)
+
+        return self._resolve()
+
+    def _set_current_event(self, event, context) -> None:
         if isinstance(event, BaseProxyEvent):
             warnings.warn(
                 "You don't need to serialize event to Event Source Data Class when using Event Handler; "
                 "see issue #1152",
-                stacklevel=2,
+                stacklevel=3,
             )
             event = event.raw_event
 
@@ -2058,8 +2760,13 @@ class ApiGatewayResolver(BaseRouter):
         BaseRouter.current_event = self._to_proxy_event(event)
         BaseRouter.lambda_context = context
 
-        response = self._resolve().build(self.current_event, self._cors)
+    def _finish_resolve_after(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        try:
+            yield from chunks
+        finally:
+            self._finish_resolve()
 
+    def _finish_resolve(self) -> None:
         # Debug print Processed Middlewares
         if self._debug:
             print("\nProcessed Middlewares:")
@@ -2069,8 +2776,6 @@ class ApiGatewayResolver(BaseRouter):
 
         self.clear_context()
 
-        return response
-
     def __call__(self, event, context) -> Any:
         return self.resolve(event, context)
 
@@ -2152,6 +2857,10 @@ class ApiGatewayResolver(BaseRouter):
 
     def _resolve(self) -> ResponseBuilder:
         """Resolves the response or return the not found response"""
+        return self._call_route(*self._match_route())
+
+    def _match_route(self) -> tuple[Route, dict[str, str]]:
+        """Finds the route matching the current event, or the not found route, with its route arguments"""
         method = self.current_event.http_method.upper()
         path = self._remove_prefix(self.current_event.path)
 
@@ -2167,9 +2876,9 @@ class ApiGatewayResolver(BaseRouter):
                 self.append_context(_route=route, _path=path)
 
                 route_keys = self._convert_matches_into_route_keys(match_results)
-                return self._call_route(route, route_keys)  # pass fn args
+                return route, route_keys  # pass fn args
 
-        return self._handle_not_found(method=method, path=path)
+        return self._not_found_route(method=method, path=path), {}
 
     def _remove_prefix(self, path: str) -> str:
         """Remove the configured prefix from the path"""
@@ -2207,7 +2916,7 @@ class ApiGatewayResolver(BaseRouter):
 
         return path.startswith(prefix + "/")
 
-    def _handle_not_found(self, method: str, path: str) -> ResponseBuilder:
+    def _not_found_route(self, method: str, path: str) -> Route:
         """Called when no matching route was found and includes support for the cors preflight response"""
         logger.debug(f"No match found for path {path} and method {method}")
 
@@ -2230,7 +2939,7 @@ class ApiGatewayResolver(BaseRouter):
             # Pre-flight request? Return immediately to avoid browser error
             if self._cors and method == "OPTIONS":
                 logger.debug("Pre-flight request detected. Returning CORS with empty response")
-                _headers["Access-Control-Allow-Methods"] = CORSConfig.build_allow_methods(self._cors_methods)
+                _headers["Access-Control-Allow-Methods"] = self._preflight_allow_methods(path)
 
                 return Response(status_code=204, content_type=None, headers=_headers, body="")
 
@@ -2260,47 +2969,111 @@ class ApiGatewayResolver(BaseRouter):
         # Add matched Route reference into the Resolver context
         self.append_context(_route=route, _path=path)
 
-        # Kick-off request chain:
+        # The route triggers the request chain when called:
         # -> exception_handlers()
         # --> middlewares()
         # ---> not_found_route()
-        return self._call_route(route=route, route_arguments={})
+        return route
 
     def _call_route(self, route: Route, route_arguments: dict[str, str]) -> ResponseBuilder:
         """Actually call the matching route with any provided keyword arguments."""
         try:
             # Reset Processed stack for Middleware (for debugging purposes)
-            self._reset_processed_stack()
+            if self._debug:
+                self._reset_processed_stack()
+
+            result: dict | tuple | Response
+            if route.requires_async(self._router_middlewares):
+                result = self._run_coroutine(
+                    route.call_async(
+                        router_middlewares=self._router_middlewares,
+                        app=self,
+                        route_arguments=route_arguments,
+                    ),
+                )
+            else:
+                result = route(router_middlewares=self._router_middlewares, app=self, route_arguments=route_arguments)
 
             return self._response_builder_class(
-                response=self._to_response(
-                    route(router_middlewares=self._router_middlewares, app=self, route_arguments=route_arguments),
-                ),
+                response=self._to_response(result),
                 serializer=self._serializer,
                 route=route,
             )
         except Exception as exc:
-            # If exception is handled then return the response builder to reduce noise
-            response_builder = self._call_exception_handler(exc, route)
-            if response_builder:
-                return response_builder
+            response_builder = self._handle_route_exception(exc, route)
+            if response_builder is None:
+                raise
+
+            return response_builder
 
-            logger.exception(exc)
+    async def _call_route_async(self, route: Route, route_arguments: dict[str, str]) -> ResponseBuilder:
+        """Actually call the matching route with any provided keyword arguments, awaiting async routes."""
+        try:
+            # Reset Processed stack for Middleware (for debugging purposes)
             if self._debug:
-                # If the user has turned on debug mode,
-                # we'll let the original exception propagate, so
-                # they get more information about what went wrong.
-                return self._response_builder_class(
-                    response=Response(
-                        status_code=500,
-                        content_type=content_types.TEXT_PLAIN,
-                        body="".join(traceback.format_exc()),
-                    ),
-                    serializer=self._serializer,
-                    route=route,
-                )
+                self._reset_processed_stack()
+
+            return self._response_builder_class(
+                response=await route.call_async(
+                    router_middlewares=self._router_middlewares,
+                    app=self,
+                    route_arguments=route_arguments,
+                ),
+                serializer=self._serializer,
+                route=route,
+            )
+        except Exception as exc:
+            response_builder = self._handle_route_exception(exc, route)
+            if response_builder is None:
+                raise
+
+            return response_builder
+
+    def _run_coroutine(self, coroutine: Coroutine[Any, Any, Response]) -> Response:
+        """Runs async routes from `resolve` in the same event loop across warm invocations
+
+        Reusing the event loop keeps clients bound to it, e.g. aiohttp sessions created at module level, working
+        across invocations, and avoids creating a new event loop for every request like `asyncio.run` does.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coroutine.close()
+            raise RuntimeError(
+                "Async routes can't be resolved with `resolve` from a running event loop, "
+                "use `await app.async_resolve(event, context)` instead",
+            )
 
-            raise
+        if self._event_loop is None or self._event_loop.is_closed():
+            self._event_loop = asyncio.new_event_loop()
+
+        return self._event_loop.run_until_complete(coroutine)
+
+    def _handle_route_exception(self, exc: Exception, route: Route) -> ResponseBuilder | None:
+        """Calls the exception handler for an exception raised by the route, returning None when unhandled"""
+        # If exception is handled then return the response builder to reduce noise
+        response_builder = self._call_exception_handler(exc, route)
+        if response_builder:
+            return response_builder
+
+        logger.exception(exc)
+        if self._debug:
+            # If the user has turned on debug mode,
+            # we'll let the original exception propagate, so
+            # they get more information about what went wrong.
+            return self._response_builder_class(
+                response=Response(
+                    status_code=500,
+                    content_type=content_types.TEXT_PLAIN,
+                    body="".join(traceback.format_exc()),
+                ),
+                serializer=self._serializer,
+                route=route,
+            )
+
+        return None
 
     def not_found(self, func: Callable | None = None):
         if func is None:
@@ -2314,17 +3087,28 @@ class ApiGatewayResolver(BaseRouter):
                     self._exception_handlers[exp] = func
             else:
                 self._exception_handlers[exc_class] = func
+            self._exception_handlers_cache.clear()
             return func
 
         return register_exception_handler
 
     def _lookup_exception_handler(self, exp_type: type) -> Callable | None:
+        # Resolve each exception type once, as the same exceptions are usually raised across requests
+        try:
+            return self._exception_handlers_cache[exp_type]
+        except KeyError:
+            pass
+
+        handler = None
         # Use "Method Resolution Order" to allow for matching against a base class
         # of an exception
         for cls in exp_type.__mro__:
             if cls in self._exception_handlers:
-                return self._exception_handlers[cls]
-        return None
+                handler = self._exception_handlers[cls]
+                break
+
+        self._exception_handlers_cache[exp_type] = handler
+        return handler
 
     def _call_exception_handler(self, exp: Exception, route: Route) -> ResponseBuilder | None:
         handler = self._lookup_exception_handler(type(exp))
@@ -2407,6 +3191,7 @@ class ApiGatewayResolver(BaseRouter):
 
         logger.debug("Appending Router exception_handler into App exception_handler.")
         self._exception_handlers.update(router._exception_handlers)
+        self._exception_handlers_cache.clear()
 
         # use pointer to allow context clearance after event is processed e.g., resolve(evt, ctx)
         router.context = self.context
@@ -2556,6 +3341,7 @@ class APIGatewayRestResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression: CompressionConfig | None = None,
     ):
         """Amazon API Gateway REST and HTTP API v1 payload resolver"""
         super().__init__(
@@ -2565,6 +3351,7 @@ class APIGatewayRestResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            compression,
         )
 
     def _get_base_path(self) -> str:
@@ -2634,6 +3421,7 @@ class APIGatewayHttpResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression: CompressionConfig | None = None,
     ):
         """Amazon API Gateway HTTP API v2 payload resolver"""
         super().__init__(
@@ -2643,6 +3431,7 @@ class APIGatewayHttpResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            compression,
         )
 
     def _get_base_path(self) -> str:
@@ -2669,9 +3458,18 @@ class ALBResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression: CompressionConfig | None = None,
     ):
         """Amazon Application Load Balancer (ALB) resolver"""
-        super().__init__(ProxyEventType.ALBEvent, cors, debug, serializer, strip_prefixes, enable_validation)
+        super().__init__(
+            ProxyEventType.ALBEvent,
+            cors,
+            debug,
+            serializer,
+            strip_prefixes,
+            enable_validation,
+            compression,
+        )
 
     def _get_base_path(self) -> str:
         # ALB doesn't have a stage variable, so we just return an empty string
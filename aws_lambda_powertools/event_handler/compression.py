@@ -0,0 +1,217 @@
+"""
+Response compression for Event Handler
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Optional compression libraries, used when installed
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Valid compression levels for each content coding, from fastest to smallest
+COMPRESSION_LEVELS = {"gzip": (1, 9), "br": (0, 11), "zstd": (1, 22)}
+# Default levels favor speed, as higher levels cost considerably more CPU time for a marginally smaller body
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+# Content codings that are compressed the same way, e.g. "x-gzip" is an alias for "gzip"
+ENCODING_ALIASES = {"x-gzip": "gzip"}
+
+
+def _compress_gzip(body: bytes, level: int) -> bytes:
+    gzip = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return gzip.compress(body) + gzip.flush()
+
+
+def _compress_br(body: bytes, level: int) -> bytes:
+    return brotli.compress(body, quality=level)
+
+
+def _compress_zstd(body: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+# Streaming compressors flush each chunk, so clients receive data as soon as it's produced
+def _compress_gzip_stream(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    gzip = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        yield gzip.compress(chunk) + gzip.flush(zlib.Z_SYNC_FLUSH)
+    yield gzip.flush()
+
+
+def _compress_br_stream(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    compressor = brotli.Compressor(quality=level)
+    for chunk in chunks:
+        yield compressor.process(chunk) + compressor.flush()
+    yield compressor.finish()
+
+
+def _compress_zstd_stream(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+    yield compressor.flush()
+
+
+COMPRESSORS: dict[str, Callable[[bytes, int], bytes]] = {"gzip": _compress_gzip}
+STREAM_COMPRESSORS: dict[str, Callable[[Iterable[bytes], int], Iterator[bytes]]] = {"gzip": _compress_gzip_stream}
+if brotli is not None:
+    COMPRESSORS["br"] = _compress_br
+    STREAM_COMPRESSORS["br"] = _compress_br_stream
+if zstandard is not None:
+    COMPRESSORS["zstd"] = _compress_zstd
+    STREAM_COMPRESSORS["zstd"] = _compress_zstd_stream
+
+SUPPORTED_ENCODINGS = frozenset({"gzip", "br", "zstd"})
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Parses an `Accept-Encoding` header into content codings and their quality values
+
+    Parameters
+    ----------
+    accept_encoding: str
+        Header value, e.g. `gzip;q=0.8, br, *;q=0`
+
+    Returns
+    -------
+    dict[str, float]
+        Lowercase content codings and their quality value, e.g. `{"gzip": 0.8, "br": 1.0, "*": 0.0}`
+    """
+    codings: dict[str, float] = {}
+
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        coding = ENCODING_ALIASES.get(coding, coding)
+        codings[coding] = max(quality, codings.get(coding, 0.0))
+
+    return codings
+
+
+class CompressionConfig:
+    """Compression Config
+
+    Configures how responses are compressed for routes and responses with compression enabled, e.g.
+    `@app.get("/todos", compress=True)` or `Response(..., compress=True)`.
+
+    Examples
+    --------
+
+    Prefer brotli when installed and accepted by the client, and skip compressing small bodies
+
+    ```python
+    from aws_lambda_powertools.event_handler import APIGatewayRestResolver, CompressionConfig
+
+    compression = CompressionConfig(level={"br": 5, "gzip": 5}, minimum_size=1024, encodings=["br", "gzip"])
+    app = APIGatewayRestResolver(compression=compression)
+
+    @app.get("/todos", compress=True)
+    def get_todos():
+        return {"todos": [...]}
+    ```
+    """
+
+    def __init__(
+        self,
+        level: int | dict[str, int] | None = None,
+        minimum_size: int = 0,
+        encodings: list[str] | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        level: int | dict[str, int] | None
+            Compression level for all encodings, or for each encoding, e.g. `{"gzip": 6, "br": 5}`. Levels range
+            from 1 to 9 for gzip, 0 to 11 for br, and 1 to 22 for zstd, from fastest to smallest. Defaults to 6 for
+            gzip, 4 for br, and 3 for zstd, as higher levels cost considerably more CPU time for a marginally
+            smaller body.
+        minimum_size: int
+            Minimum body size in bytes to compress. Smaller bodies are returned as-is, as compressing and
+            base64 encoding them can result in a larger response. Defaults to 0, compressing all bodies.
+        encodings: list[str] | None
+            Content codings to use in order of preference when accepted by the client with the same quality.
+            Supports "gzip", "br" when `brotli` is installed, and "zstd" when `zstandard` is installed.
+            Unavailable codings are ignored. Defaults to `["gzip"]`.
+        """
+        encodings = encodings if encodings is not None else ["gzip"]
+        levels = level if isinstance(level, dict) else dict.fromkeys(encodings, level)
+        unsupported = (set(encodings) | set(levels)) - SUPPORTED_ENCODINGS
+        if unsupported:
+            raise ValueError(f"Unsupported compression encodings: {sorted(unsupported)}")
+
+        self.levels = {**DEFAULT_COMPRESSION_LEVELS, **{k: v for k, v in levels.items() if v is not None}}
+        for encoding, encoding_level in self.levels.items():
+            lowest, highest = COMPRESSION_LEVELS[encoding]
+            if not lowest <= encoding_level <= highest:
+                raise ValueError(
+                    f"Compression level for {encoding} must be between {lowest} and {highest}, got {encoding_level}",
+                )
+
+        self.minimum_size = minimum_size
+        self.encodings = [encoding for encoding in encodings if encoding in COMPRESSORS]
+
+        if len(self.encodings) != len(encodings):
+            logger.debug(
+                "Ignoring compression encodings whose library isn't installed",
+                extra={"encodings": [encoding for encoding in encodings if encoding not in COMPRESSORS]},
+            )
+
+    def negotiate(self, accept_encoding: str) -> str | None:
+        """Selects the content coding to use based on the client's `Accept-Encoding` quality values
+
+        Parameters
+        ----------
+        accept_encoding: str
+            `Accept-Encoding` header value, e.g. `gzip, deflate, br`
+
+        Returns
+        -------
+        str | None
+            Content coding with the highest quality value, using the configured order of preference for ties,
+            or None when none of the configured codings is acceptable.
+        """
+        if not accept_encoding:
+            return None
+
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+
+        selected, selected_quality = None, 0.0
+        for encoding in self.encodings:
+            quality = accepted.get(encoding, wildcard)
+            if quality > selected_quality:
+                selected, selected_quality = encoding, quality
+
+        return selected
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compresses the body with a content coding returned by `negotiate`"""
+        return COMPRESSORS[encoding](body, self.levels[encoding])
+
+    def compress_stream(self, chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+        """Compresses body chunks as they're produced with a content coding returned by `negotiate`"""
+        return STREAM_COMPRESSORS[encoding](chunks, self.levels[encoding])
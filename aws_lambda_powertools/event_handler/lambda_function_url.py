@@ -8,7 +8,7 @@ from aws_lambda_powertools.event_handler.api_gateway import (
 )
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.event_handler import CORSConfig
+    from aws_lambda_powertools.event_handler import CompressionConfig, CORSConfig
     from aws_lambda_powertools.utilities.data_classes import LambdaFunctionUrlEvent
 
 
@@ -57,6 +57,7 @@ class LambdaFunctionUrlResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression: CompressionConfig | None = None,
     ):
         super().__init__(
             ProxyEventType.LambdaFunctionUrlEvent,
@@ -65,6 +66,7 @@ class LambdaFunctionUrlResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            compression,
         )
 
     def _get_base_path(self) -> str:
@@ -0,0 +1,478 @@
+"""
+Run Event Handler resolvers locally as ASGI or WSGI applications
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+from urllib.parse import parse_qsl
+
+from aws_lambda_powertools.event_handler.api_gateway import ProxyEventType
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.event_handler.api_gateway import ApiGatewayResolver
+
+logger = logging.getLogger(__name__)
+
+LOCAL_STAGE = "local"
+LOCAL_ACCOUNT_ID = "123456789012"
+LOCAL_REGION = "us-east-1"
+# Lambda function timeout used to compute the remaining time in the Lambda context
+LOCAL_TIMEOUT_MS = 30_000
+
+# API Gateway response when the function fails with an unhandled exception
+INTERNAL_SERVER_ERROR = {
+    "statusCode": HTTPStatus.BAD_GATEWAY.value,
+    "headers": {"Content-Type": "application/json"},
+    "body": '{"message": "Internal server error"}',
+    "isBase64Encoded": False,
+}
+
+
+class LocalLambdaContext:
+    """Lambda context for requests resolved locally, with a new request ID for each request"""
+
+    function_name = "local"
+    function_version = "$LATEST"
+    invoked_function_arn = f"arn:aws:lambda:{LOCAL_REGION}:{LOCAL_ACCOUNT_ID}:function:local"
+    memory_limit_in_mb = 128
+    log_group_name = "/aws/lambda/local"
+    log_stream_name = "local"
+    identity = None
+    client_context = None
+
+    def __init__(self, timeout_ms: int = LOCAL_TIMEOUT_MS):
+        self.aws_request_id = str(uuid.uuid4())
+        self._deadline = time.monotonic() + timeout_ms / 1000
+
+    def get_remaining_time_in_millis(self) -> int:
+        return max(0, int((self._deadline - time.monotonic()) * 1000))
+
+
+def build_event(
+    proxy_type: ProxyEventType,
+    method: str,
+    path: str,
+    query_string: str = "",
+    headers: Iterable[tuple[str, str]] = (),
+    body: bytes = b"",
+    source_ip: str = "127.0.0.1",
+    request_id: str | None = None,
+) -> dict[str, Any]:
+    """Builds the Lambda event an integration sends for an HTTP request
+
+    Parameters
+    ----------
+    proxy_type: ProxyEventType
+        Event shape to build, e.g. `ProxyEventType.APIGatewayProxyEventV2` for API Gateway HTTP APIs
+    method: str
+        HTTP method, e.g. `GET`
+    path: str
+        Decoded request path, e.g. `/todos/1`
+    query_string: str
+        Raw query string, without the leading `?`
+    headers: Iterable[tuple[str, str]]
+        Request headers, including repeated headers
+    body: bytes
+        Request body, base64 encoded in the event when it isn't UTF-8 text
+    source_ip: str
+        Client IP address
+    request_id: str | None
+        Request ID, a new UUID by default
+
+    Returns
+    -------
+    dict[str, Any]
+        Lambda event for the proxy type
+    """
+    request = _HttpRequest(method, path, query_string, headers, body, source_ip, request_id or str(uuid.uuid4()))
+
+    builders: dict[ProxyEventType, Callable[[_HttpRequest], dict[str, Any]]] = {
+        ProxyEventType.APIGatewayProxyEvent: _build_rest_api_event,
+        ProxyEventType.APIGatewayProxyEventV2: _build_http_api_event,
+        ProxyEventType.LambdaFunctionUrlEvent: _build_http_api_event,
+        ProxyEventType.ALBEvent: _build_alb_event,
+        ProxyEventType.VPCLatticeEvent: _build_vpc_lattice_event,
+        ProxyEventType.VPCLatticeEventV2: _build_vpc_lattice_v2_event,
+    }
+
+    builder = builders.get(proxy_type)
+    if builder is None:
+        raise ValueError(f"{proxy_type.value} events can't be built from HTTP requests")
+
+    return builder(request)
+
+
+def parse_response(response: dict[str, Any]) -> tuple[int, list[tuple[str, str]], bytes]:
+    """Translates a resolver response back into an HTTP response
+
+    Parameters
+    ----------
+    response: dict[str, Any]
+        Response returned by `resolve`, e.g. `{"statusCode": 200, "headers": {...}, "body": "..."}`
+
+    Returns
+    -------
+    tuple[int, list[tuple[str, str]], bytes]
+        Status code, headers including repeated headers and cookies, and decoded body
+    """
+    headers: list[tuple[str, str]] = []
+    for name, values in (response.get("multiValueHeaders") or {}).items():
+        headers.extend((name, value) for value in values)
+    for name, value in (response.get("headers") or {}).items():
+        headers.append((name, value))
+    headers.extend(("Set-Cookie", cookie) for cookie in response.get("cookies") or [])
+
+    body = response.get("body") or ""
+    if response.get("isBase64Encoded"):
+        return response["statusCode"], headers, base64.b64decode(body)
+
+    return response["statusCode"], headers, body.encode("utf-8")
+
+
+class ASGIAdapter:
+    """Exposes a resolver as an ASGI application, to run it locally with an ASGI server like uvicorn
+
+    HTTP requests are translated into the event of the resolver's integration, e.g. API Gateway REST API events
+    for `APIGatewayRestResolver`, and responses back into HTTP responses.
+
+    Like a Lambda execution environment, requests are resolved one at a time in a dedicated thread, so async
+    routes run in the resolver's own event loop. Run multiple server workers to handle concurrent requests.
+
+    Examples
+    --------
+    **Running a resolver locally with uvicorn**
+
+    ```python
+    from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+    from aws_lambda_powertools.event_handler.local import ASGIAdapter
+
+    app = APIGatewayRestResolver()
+
+    @app.get("/todos")
+    def get_todos():
+        return {"todos": []}
+
+    asgi_app = ASGIAdapter(app)  # uvicorn app:asgi_app
+    ```
+    """
+
+    def __init__(self, app: ApiGatewayResolver):
+        """
+        Parameters
+        ----------
+        app: ApiGatewayResolver
+            Resolver to expose, e.g. `APIGatewayHttpResolver`
+        """
+        self.app = app
+        self._proxy_type = ProxyEventType(app._proxy_type)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-handler")
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        body = await self._read_body(receive)
+        client = scope.get("client") or ("127.0.0.1", 0)
+        event = build_event(
+            self._proxy_type,
+            method=scope["method"],
+            path=scope["path"],
+            query_string=scope["query_string"].decode("latin-1"),
+            headers=[(name.decode("latin-1"), value.decode("latin-1")) for name, value in scope["headers"]],
+            body=body,
+            source_ip=client[0],
+        )
+
+        response = await asyncio.get_running_loop().run_in_executor(self._executor, _resolve, self.app, event)
+        status_code, headers, response_body = parse_response(response)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers],
+            },
+        )
+        await send({"type": "http.response.body", "body": response_body})
+
+    @staticmethod
+    async def _read_body(receive: Callable) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+class WSGIAdapter:
+    """Exposes a resolver as a WSGI application, to run it locally with a WSGI server
+
+    It works like `ASGIAdapter`, and can run with the standard library `wsgiref` server without dependencies.
+
+    Examples
+    --------
+    **Running a resolver locally with wsgiref**
+
+    ```python
+    from wsgiref.simple_server import make_server
+
+    from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+    from aws_lambda_powertools.event_handler.local import WSGIAdapter
+
+    app = APIGatewayRestResolver()
+
+    @app.get("/todos")
+    def get_todos():
+        return {"todos": []}
+
+    if __name__ == "__main__":
+        make_server("localhost", 8000, WSGIAdapter(app)).serve_forever()
+    ```
+    """
+
+    def __init__(self, app: ApiGatewayResolver):
+        """
+        Parameters
+        ----------
+        app: ApiGatewayResolver
+            Resolver to expose, e.g. `APIGatewayHttpResolver`
+        """
+        self.app = app
+        self._proxy_type = ProxyEventType(app._proxy_type)
+        # Resolvers process one request at a time, while WSGI servers can call the application from multiple threads
+        self._lock = threading.Lock()
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable) -> list[bytes]:
+        headers = [
+            (name[5:].replace("_", "-").lower(), value) for name, value in environ.items() if name.startswith("HTTP_")
+        ]
+        for name in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            if environ.get(name):
+                headers.append((name.replace("_", "-").lower(), environ[name]))
+
+        content_length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(content_length) if content_length else b""
+
+        event = build_event(
+            self._proxy_type,
+            method=environ["REQUEST_METHOD"],
+            # PEP 3333 decodes paths as latin-1
+            path=environ.get("PATH_INFO", "/").encode("latin-1").decode("utf-8"),
+            query_string=environ.get("QUERY_STRING", ""),
+            headers=headers,
+            body=body,
+            source_ip=environ.get("REMOTE_ADDR", "127.0.0.1"),
+        )
+
+        with self._lock:
+            response = _resolve(self.app, event)
+
+        status_code, response_headers, response_body = parse_response(response)
+        start_response(_status_line(status_code), response_headers)
+        return [response_body]
+
+
+def _resolve(app: ApiGatewayResolver, event: dict[str, Any]) -> dict[str, Any]:
+    try:
+        return app.resolve(event, LocalLambdaContext())
+    except Exception:
+        logger.exception("Unhandled exception resolving the request")
+        return INTERNAL_SERVER_ERROR
+
+
+def _status_line(status_code: int) -> str:
+    try:
+        return f"{status_code} {HTTPStatus(status_code).phrase}"
+    except ValueError:
+        return str(status_code)
+
+
+class _HttpRequest:
+    """HTTP request details shared by event builders"""
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        query_string: str,
+        headers: Iterable[tuple[str, str]],
+        body: bytes,
+        source_ip: str,
+        request_id: str,
+    ):
+        self.method = method.upper()
+        self.path = path or "/"
+        self.query_string = query_string
+        self.source_ip = source_ip
+        self.request_id = request_id
+        self.time_epoch_ms = int(time.time() * 1000)
+
+        self.headers: dict[str, list[str]] = {}
+        for name, value in headers:
+            self.headers.setdefault(name.lower(), []).append(value)
+
+        self.query: dict[str, list[str]] = {}
+        for name, value in parse_qsl(query_string, keep_blank_values=True):
+            self.query.setdefault(name, []).append(value)
+
+        # Integrations send text bodies as-is, and binary bodies base64 encoded
+        try:
+            self.body: str | None = body.decode("utf-8") if body else None
+            self.is_base64_encoded = False
+        except UnicodeDecodeError:
+            self.body = base64.b64encode(body).decode()
+            self.is_base64_encoded = True
+
+    @property
+    def user_agent(self) -> str:
+        return self.joined_headers().get("user-agent", "")
+
+    def joined_headers(self) -> dict[str, str]:
+        return {name: ",".join(values) for name, values in self.headers.items()}
+
+    def last_headers(self) -> dict[str, str]:
+        return {name: values[-1] for name, values in self.headers.items()}
+
+
+def _build_rest_api_event(request: _HttpRequest) -> dict[str, Any]:
+    return {
+        "resource": request.path,
+        "path": request.path,
+        "httpMethod": request.method,
+        "headers": request.last_headers(),
+        "multiValueHeaders": request.headers,
+        "queryStringParameters": {name: values[-1] for name, values in request.query.items()} or None,
+        "multiValueQueryStringParameters": request.query or None,
+        "pathParameters": None,
+        "stageVariables": None,
+        "requestContext": {
+            "accountId": LOCAL_ACCOUNT_ID,
+            "apiId": LOCAL_STAGE,
+            "httpMethod": request.method,
+            "identity": {"sourceIp": request.source_ip, "userAgent": request.user_agent},
+            "path": f"/{LOCAL_STAGE}{request.path}",
+            "protocol": "HTTP/1.1",
+            "requestId": request.request_id,
+            "requestTimeEpoch": request.time_epoch_ms,
+            "resourcePath": request.path,
+            "stage": LOCAL_STAGE,
+        },
+        "body": request.body,
+        "isBase64Encoded": request.is_base64_encoded,
+    }
+
+
+def _build_http_api_event(request: _HttpRequest) -> dict[str, Any]:
+    headers = request.joined_headers()
+    # HTTP APIs and Function URLs send cookies in a separate field
+    cookie_header = headers.pop("cookie", "")
+
+    event: dict[str, Any] = {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": request.path,
+        "rawQueryString": request.query_string,
+        "headers": headers,
+        "requestContext": {
+            "accountId": LOCAL_ACCOUNT_ID,
+            "apiId": LOCAL_STAGE,
+            "domainName": headers.get("host", "localhost"),
+            "http": {
+                "method": request.method,
+                "path": request.path,
+                "protocol": "HTTP/1.1",
+                "sourceIp": request.source_ip,
+                "userAgent": request.user_agent,
+            },
+            "requestId": request.request_id,
+            "routeKey": "$default",
+            "stage": "$default",
+            "timeEpoch": request.time_epoch_ms,
+        },
+        "body": request.body,
+        "isBase64Encoded": request.is_base64_encoded,
+    }
+
+    if cookie_header:
+        event["cookies"] = [cookie.strip() for cookie in cookie_header.split(";") if cookie.strip()]
+    if request.query:
+        event["queryStringParameters"] = {name: ",".join(values) for name, values in request.query.items()}
+
+    return event
+
+
+def _build_alb_event(request: _HttpRequest) -> dict[str, Any]:
+    # ALB sends query string parameters without decoding them
+    query: dict[str, str] = {}
+    for parameter in filter(None, request.query_string.split("&")):
+        name, _, value = parameter.partition("=")
+        query[name] = value
+
+    return {
+        "requestContext": {
+            "elb": {
+                "targetGroupArn": f"arn:aws:elasticloadbalancing:{LOCAL_REGION}:{LOCAL_ACCOUNT_ID}:targetgroup/local",
+            },
+        },
+        "httpMethod": request.method,
+        "path": request.path,
+        "queryStringParameters": query,
+        "headers": request.last_headers(),
+        "body": request.body or "",
+        "isBase64Encoded": request.is_base64_encoded,
+    }
+
+
+def _build_vpc_lattice_event(request: _HttpRequest) -> dict[str, Any]:
+    return {
+        "raw_path": request.path,
+        "method": request.method,
+        "headers": request.joined_headers(),
+        "query_string_parameters": {name: values[-1] for name, values in request.query.items()},
+        "body": request.body or "",
+        "is_base64_encoded": request.is_base64_encoded,
+    }
+
+
+def _build_vpc_lattice_v2_event(request: _HttpRequest) -> dict[str, Any]:
+    return {
+        "version": "2.0",
+        "path": request.path,
+        "method": request.method,
+        "headers": request.joined_headers(),
+        "queryStringParameters": request.query,
+        "body": request.body or "",
+        "isBase64Encoded": request.is_base64_encoded,
+        "requestContext": {
+            "serviceNetworkArn": f"arn:aws:vpc-lattice:{LOCAL_REGION}:{LOCAL_ACCOUNT_ID}:servicenetwork/local",
+            "serviceArn": f"arn:aws:vpc-lattice:{LOCAL_REGION}:{LOCAL_ACCOUNT_ID}:service/local",
+            "targetGroupArn": f"arn:aws:vpc-lattice:{LOCAL_REGION}:{LOCAL_ACCOUNT_ID}:targetgroup/local",
+            "identity": {"type": "NONE"},
+            "region": LOCAL_REGION,
+            "timeEpoch": str(request.time_epoch_ms * 1000),
+        },
+    }
@@ -1,3 +1,7 @@
-from aws_lambda_powertools.event_handler.middlewares.base import BaseMiddlewareHandler, NextMiddleware
+from aws_lambda_powertools.event_handler.middlewares.base import (
+    AsyncNextMiddleware,
+    BaseMiddlewareHandler,
+    NextMiddleware,
+)
 
-__all__ = ["BaseMiddlewareHandler", "NextMiddleware"]
+__all__ = ["AsyncNextMiddleware", "BaseMiddlewareHandler", "NextMiddleware"]
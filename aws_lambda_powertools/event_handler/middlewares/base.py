@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, Protocol
+from typing import TYPE_CHECKING, Awaitable, Generic, Protocol
 
 from aws_lambda_powertools.event_handler.types import EventHandlerInstance
 
@@ -19,6 +19,16 @@ class NextMiddleware(Protocol):
         ...
 
 
+class AsyncNextMiddleware(Protocol):
+    def __call__(self, app: EventHandlerInstance) -> Awaitable[Response]:
+        """Protocol for callback of async middlewares, awaited to get the Response, e.g. await next_middleware(app)"""
+        ...
+
+    def __name__(self) -> str:  # noqa A003
+        """Protocol for name of the Middleware"""
+        ...
+
+
 class BaseMiddlewareHandler(Generic[EventHandlerInstance], ABC):
     """Base implementation for Middlewares to run code before and after in a chain.
 
@@ -26,6 +36,9 @@ class BaseMiddlewareHandler(Generic[EventHandlerInstance], ABC):
     This is the middleware handler function where middleware logic is implemented.
     The next middleware handler is represented by `next_middleware`, returning a Response object.
 
+    Middlewares can also be async by defining `async def handler`, awaiting `next_middleware(app)`, or by adding an
+    `async_handler` method used with async routes, as synchronous middlewares run in a worker thread for them.
+
     Examples
     --------
 
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from aws_lambda_powertools.event_handler.api_gateway import ApiGatewayResolver, Response, StreamingResponse
+from aws_lambda_powertools.event_handler.middlewares import BaseMiddlewareHandler, NextMiddleware
+from aws_lambda_powertools.event_handler.util import etag_matches, weak_etag
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.event_handler.types import EventHandlerInstance
+
+logger = logging.getLogger(__name__)
+
+# Only safe methods are answered with 304 Not Modified, and cached
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+# Request headers identifying the caller, always part of the cache key so responses aren't shared across callers
+CREDENTIAL_HEADERS = ("authorization", "cookie")
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    content_type: str | None
+    body: Any
+    headers: dict[str, str | list[str]]
+    compress: bool | None
+    expires_at: float
+
+
+class ConditionalRequestMiddleware(BaseMiddlewareHandler):
+    """Middleware to answer conditional requests with `304 Not Modified`, and optionally cache responses in memory.
+
+    Responses to `GET` and `HEAD` requests get an `ETag` header, a hash of the serialized body by default.
+    When the client sends it back in the `If-None-Match` header and it still matches, a `304 Not Modified`
+    response without body is returned instead.
+
+    With `cache_ttl`, successful responses are cached in memory and reused by warm Lambda execution
+    environments, so the route function doesn't run again until they expire.
+
+    Examples
+    --------
+    **Answering conditional requests and caching responses for 60 seconds**
+
+    ```python
+    from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+    from aws_lambda_powertools.event_handler.middlewares.conditional_requests import ConditionalRequestMiddleware
+
+    app = APIGatewayRestResolver()
+    conditional_requests = ConditionalRequestMiddleware(cache_ttl=60, cache_query_params=["page"])
+
+
+    @app.get("/todos", middlewares=[conditional_requests])
+    def get_todos():
+        return {"todos": [...]}
+
+
+    def lambda_handler(event, context):
+        return app.resolve(event, context)
+    ```
+    """
+
+    def __init__(
+        self,
+        version: Callable[[ApiGatewayResolver], str | None] | None = None,
+        cache_ttl: float = 0,
+        cache_query_params: list[str] | None = None,
+        cache_headers: list[str] | None = None,
+        max_cache_entries: int = 128,
+    ):
+        """
+        Parameters
+        ----------
+        version : Callable[[ApiGatewayResolver], str | None] | None, optional
+            Function returning the current version of the requested resource to use as ETag, e.g. a
+            last modified timestamp. It allows answering `If-None-Match` without running the route.
+            When it returns None, or it's not set, the ETag is a hash of the serialized body.
+        cache_ttl : float, optional
+            How long to cache successful responses in memory, in seconds. Defaults to 0, disabling the cache.
+        cache_query_params : list[str] | None, optional
+            Query string parameters that change the response, included in the cache key along with method and path.
+            Defaults to None, including the full query string.
+        cache_headers : list[str] | None, optional
+            Request headers that change the response, e.g. `Accept-Language`, included in the cache key.
+            `Authorization` and `Cookie` headers are always included.
+        max_cache_entries : int, optional
+            Maximum number of cached responses, evicting the least recently used. Defaults to 128.
+        """
+        super().__init__()
+        self.version = version
+        self.cache_ttl = cache_ttl
+        self.cache_query_params = cache_query_params
+        self.cache_headers = [*CREDENTIAL_HEADERS, *(cache_headers or [])]
+        self.max_cache_entries = max_cache_entries
+        self._cache: OrderedDict[tuple, CachedResponse] = OrderedDict()
+
+    def handler(self, app: EventHandlerInstance, next_middleware: NextMiddleware) -> Response:
+        """Answers conditional requests with 304 Not Modified, and serves cached responses when enabled
+
+        Parameters
+        ----------
+        app : EventHandlerInstance
+            An instance of an Event Handler
+        next_middleware : NextMiddleware
+            Callable to get response from the next middleware or route handler in the chain
+
+        Returns
+        -------
+        Response
+            It can return three types of response objects
+
+            - Original response: Propagates HTTP response returned from the next middleware, with an ETag header
+            - Cached response: Response previously returned from the next middleware, when cached and not expired
+            - HTTP 304: When the `If-None-Match` header matches the response ETag
+        """
+        if app.current_event.http_method.upper() not in CONDITIONAL_METHODS:
+            return next_middleware(app)
+
+        if_none_match = app.current_event.headers.get("if-none-match", "")
+
+        version = self.version(app) if self.version else None
+        etag = f'W/"{version}"' if version is not None else None
+        if etag is not None and etag_matches(etag, if_none_match):
+            logger.debug("Resource version matches If-None-Match, skipping route")
+            return self._not_modified(etag)
+
+        cache_key = self._build_cache_key(app) if self.cache_ttl > 0 else None
+        response = self._get_cached_response(cache_key, etag) if cache_key else None
+
+        if response is None:
+            response = next_middleware(app)
+            if response.status_code != 200 or isinstance(response, StreamingResponse):
+                return response
+
+            etag = etag or self._hash_body(app, response)
+            if etag is None:
+                return response
+
+            response.headers["ETag"] = etag
+            if cache_key and not response.cookies:
+                self._cache_response(cache_key, response)
+
+        response_etag = response.headers.get("ETag")
+        if isinstance(response_etag, str) and etag_matches(response_etag, if_none_match):
+            return self._not_modified(response_etag)
+
+        return response
+
+    def _build_cache_key(self, app: EventHandlerInstance) -> tuple:
+        event = app.current_event
+
+        if self.cache_query_params is None:
+            query: tuple = tuple(
+                sorted((name, tuple(values)) for name, values in event.resolved_query_string_parameters.items()),
+            )
+        else:
+            query = tuple(event.get_query_string_value(name) for name in self.cache_query_params)
+
+        return (
+            event.http_method.upper(),
+            event.path,
+            query,
+            tuple(event.headers.get(name) for name in self.cache_headers),
+        )
+
+    def _get_cached_response(self, cache_key: tuple, etag: str | None) -> Response | None:
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
+
+        # a newer resource version makes the cached response stale
+        if cached.expires_at <= time.monotonic() or (etag is not None and cached.headers.get("ETag") != etag):
+            del self._cache[cache_key]
+            return None
+
+        logger.debug("Returning cached response")
+        self._cache.move_to_end(cache_key)
+
+        # responses are modified when built, e.g. compressed, so a copy is returned
+        return Response(
+            status_code=cached.status_code,
+            content_type=cached.content_type,
+            body=cached.body,
+            headers=self._copy_headers(cached.headers),
+            compress=cached.compress,
+        )
+
+    def _cache_response(self, cache_key: tuple, response: Response) -> None:
+        self._cache[cache_key] = CachedResponse(
+            status_code=response.status_code,
+            content_type=response.content_type,
+            body=response.body,
+            headers=self._copy_headers(response.headers),
+            compress=response.compress,
+            expires_at=time.monotonic() + self.cache_ttl,
+        )
+        self._cache.move_to_end(cache_key)
+
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _copy_headers(headers: dict[str, Any]) -> dict[str, Any]:
+        # multi-value headers are appended to when building responses, e.g. Vary, so lists aren't shared
+        return {name: list(value) if isinstance(value, list) else value for name, value in headers.items()}
+
+    @staticmethod
+    def _hash_body(app: EventHandlerInstance, response: Response) -> str | None:
+        body = response.body
+        if body is None:
+            return None
+
+        if not isinstance(body, (str, bytes)):
+            try:
+                body = app._serializer(body)
+            except (TypeError, ValueError):
+                logger.debug("Unable to serialize response body to compute ETag")
+                return None
+
+            # the body is only serialized once, unless it's validated and serialized by OpenAPI validation
+            if response.is_json() and not app._enable_validation:
+                response.body = body
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        return weak_etag(body)
+
+    @staticmethod
+    def _not_modified(etag: str) -> Response:
+        return Response(status_code=304, body="", headers={"ETag": etag})
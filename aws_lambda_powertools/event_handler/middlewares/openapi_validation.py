@@ -3,11 +3,14 @@ from __future__ import annotations
 import dataclasses
 import json
 import logging
-from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Callable, Mapping, MutableMapping, Sequence
+from copy import copy, deepcopy
+from typing import TYPE_CHECKING, Any, Callable, Mapping, MutableMapping, Sequence, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, create_model
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticSerializationError
 
+from aws_lambda_powertools.event_handler.api_gateway import StreamingResponse
 from aws_lambda_powertools.event_handler.middlewares import BaseMiddlewareHandler
 from aws_lambda_powertools.event_handler.openapi.compat import (
     _model_dump,
@@ -23,8 +26,9 @@ from aws_lambda_powertools.event_handler.openapi.params import Param
 if TYPE_CHECKING:
     from aws_lambda_powertools.event_handler import Response
     from aws_lambda_powertools.event_handler.api_gateway import Route
-    from aws_lambda_powertools.event_handler.middlewares import NextMiddleware
+    from aws_lambda_powertools.event_handler.middlewares import AsyncNextMiddleware, NextMiddleware
     from aws_lambda_powertools.event_handler.openapi.compat import ModelField
+    from aws_lambda_powertools.event_handler.openapi.params import Dependant
     from aws_lambda_powertools.event_handler.openapi.types import IncEx
     from aws_lambda_powertools.event_handler.types import EventHandlerInstance
 
@@ -74,7 +78,48 @@ class OpenAPIValidationMiddleware(BaseMiddlewareHandler):
         logger.debug("OpenAPIValidationMiddleware handler")
 
         route: Route = app.context["_route"]
+        self._validate_request(app=app, route=route)
 
+        # Call the handler by calling the next middleware
+        response = next_middleware(app)
+
+        # Process the response
+        return self._handle_response(route=route, response=response)
+
+    async def async_handler(self, app: EventHandlerInstance, next_middleware: AsyncNextMiddleware) -> Response:
+        """Validates requests and responses of async routes, awaiting the next middleware in the event loop"""
+        logger.debug("OpenAPIValidationMiddleware async handler")
+
+        route: Route = app.context["_route"]
+        self._validate_request(app=app, route=route)
+
+        response = await next_middleware(app)
+
+        return self._handle_response(route=route, response=response)
+
+    def _validate_request(self, *, app: EventHandlerInstance, route: Route) -> None:
+        """
+        Validate the request, re-writing the route arguments with the validated values.
+        """
+        plan = route.request_validation_plan
+        if plan.model is not None:
+            # Validate path, query, header and body values in a single call
+            values = plan.validate(
+                path=app.context["_route_args"],
+                query=app.current_event.resolved_query_string_parameters,
+                headers=app.current_event.resolved_headers_field,
+                get_body=lambda: self._get_body(app),
+            )
+        else:
+            values = self._validate_request_fields(app=app, route=route)
+
+        # Re-write the route_args with the validated values
+        app.context["_route_args"] = values
+
+    def _validate_request_fields(self, *, app: EventHandlerInstance, route: Route) -> dict[str, Any]:
+        """
+        Validate each path, query, header and body field separately, returning validated values.
+        """
         values: dict[str, Any] = {}
         errors: list[Any] = []
 
@@ -125,21 +170,14 @@ class OpenAPIValidationMiddleware(BaseMiddlewareHandler):
         if errors:
             # Raise the validation errors
             raise RequestValidationError(_normalize_errors(errors))
-        else:
-            # Re-write the route_args with the validated values, and call the next middleware
-            app.context["_route_args"] = values
-
-            # Call the handler by calling the next middleware
-            response = next_middleware(app)
 
-            # Process the response
-            return self._handle_response(route=route, response=response)
+        return values
 
     def _handle_response(self, *, route: Route, response: Response):
         # Process the response body if it exists
         if response.body:
-            # Validate and serialize the response, if it's JSON
-            if response.is_json():
+            # Validate and serialize the response, if it's JSON and not streamed
+            if response.is_json() and not isinstance(response, StreamingResponse):
                 response.body = self._serialize_response(
                     field=route.dependant.return_param,
                     response_content=response.body,
@@ -177,7 +215,24 @@ class OpenAPIValidationMiddleware(BaseMiddlewareHandler):
             if errors:
                 raise RequestValidationError(errors=_normalize_errors(errors), body=response_content)
 
-            if hasattr(field, "serialize"):
+            # Fast path: serialize straight to JSON with pydantic-core, unless a custom serializer was provided
+            if self._validation_serializer is None and hasattr(field, "serialize_json"):
+                try:
+                    serialized = field.serialize_json(
+                        value,
+                        include=include,
+                        exclude=exclude,
+                        by_alias=by_alias,
+                        exclude_unset=exclude_unset,
+                        exclude_defaults=exclude_defaults,
+                        exclude_none=exclude_none,
+                    )
+                except PydanticSerializationError:
+                    logger.debug("Unable to serialize response with pydantic-core, falling back to jsonable_encoder")
+                else:
+                    # The response builder returns strings as-is, so a JSON string must be returned as its value
+                    return json.loads(serialized) if serialized.startswith(b'"') else serialized.decode()
+            elif hasattr(field, "serialize"):
                 return field.serialize(
                     value,
                     include=include,
@@ -261,6 +316,148 @@ class OpenAPIValidationMiddleware(BaseMiddlewareHandler):
             raise NotImplementedError("Only JSON body is supported")
 
 
+class RequestValidationPlan:
+    """
+    Route parameters and body compiled into a single Pydantic model, so a request is validated in one call.
+
+    Values are looked up by alias in the request, and errors are reported with the same location as when
+    validating each parameter separately, e.g. `("query", "page")` or `("body", "name")`.
+
+    Parameters
+    ----------
+    dependant: Dependant
+        The route dependant with path, query, header, and body params
+    """
+
+    def __init__(self, dependant: Dependant):
+        # (model field name, field, error location prefix)
+        self._fields: list[tuple[str, ModelField, tuple[str, ...]]] = []
+        self._path_fields: list[tuple[str, str]] = []
+        self._query_fields: list[tuple[str, str, bool]] = []
+        self._header_fields: list[tuple[str, str, bool]] = []
+        self._body_fields: list[tuple[str, str]] = []
+        self._body_alias_omitted = False
+
+        for field in dependant.path_params:
+            self._path_fields.append((self._add_param_field(field), field.alias))
+
+        # scalar params keep the first value of multi-value query strings and headers
+        for field in dependant.query_params:
+            self._query_fields.append((self._add_param_field(field), field.alias, is_scalar_field(field)))
+
+        for field in dependant.header_params:
+            self._header_fields.append((self._add_param_field(field), field.alias, is_scalar_field(field)))
+
+        if dependant.body_params:
+            _, self._body_alias_omitted = _get_embed_body(
+                field=dependant.body_params[0],
+                required_params=dependant.body_params,
+                received_body=None,
+            )
+            for field in dependant.body_params:
+                # { "user": { object } } if field.alias == user, or { object } if field alias is omitted
+                loc = ("body",) if self._body_alias_omitted else ("body", field.alias)
+                self._body_fields.append((self._add_field(field, loc=loc), field.alias))
+
+        self._locations = {key: loc for key, _, loc in self._fields}
+        self.model: type[BaseModel] | None = None
+
+        try:
+            # Fields are named after their position, as aliases can be repeated across path, query, headers and body
+            self.model = create_model(  # type: ignore[call-overload]
+                "RequestValidationModel",
+                **{
+                    key: (
+                        field.field_info.annotation,
+                        FieldInfo.merge_field_infos(field.field_info, alias=key, validation_alias=None),
+                    )
+                    for key, field, _ in self._fields
+                },
+            )
+        except Exception as exc:
+            # fallback to validating each field separately
+            logger.debug(f"Unable to compile request validation model, validating fields separately: {exc}")
+
+    def _add_param_field(self, field: ModelField) -> str:
+        # To ensure early failure, we check if it's not an instance of Param.
+        if not isinstance(field.field_info, Param):
+            raise AssertionError(f"Expected Param field_info, got {field.field_info}")
+
+        return self._add_field(field, loc=(field.field_info.in_.value, field.alias))
+
+    def _add_field(self, field: ModelField, loc: tuple[str, ...]) -> str:
+        key = f"field_{len(self._fields)}"
+        self._fields.append((key, field, loc))
+        return key
+
+    def validate(
+        self,
+        *,
+        path: Mapping[str, Any],
+        query: Mapping[str, Any],
+        headers: Mapping[str, Any],
+        get_body: Callable[[], Any],
+    ) -> dict[str, Any]:
+        """
+        Validate the request values, returning validated values by parameter name
+
+        Raises
+        ------
+        RequestValidationError
+            When any value fails validation, with all errors found
+        """
+        data: dict[str, Any] = {}
+        errors: dict[str, list[dict[str, Any]]] = {}
+
+        for key, alias in self._path_fields:
+            data[key] = path.get(alias)
+
+        for key, alias, is_scalar in self._query_fields:
+            value = query.get(alias)
+            data[key] = value[0] if is_scalar and value is not None else value
+
+        if headers:
+            for key, alias, is_scalar in self._header_fields:
+                value = headers.get(alias)
+                # if the list contains only 1 element, we keep the first value of the headers
+                data[key] = value[0] if is_scalar and value is not None and len(value) == 1 else value
+
+        if self._body_fields:
+            received_body = get_body()
+            if self._body_alias_omitted:
+                received_body = {self._body_fields[0][1]: received_body}
+
+            for key, alias in self._body_fields:
+                try:
+                    data[key] = received_body.get(alias) if received_body is not None else None
+                except AttributeError:
+                    # the body isn't an object, so the value is missing regardless of the field being required
+                    errors[key] = [get_missing_field_error(self._locations[key])]
+
+        # Missing values are validated as such, falling back to field defaults
+        data = {key: value for key, value in data.items() if value is not None and key not in errors}
+        missing_body = set(errors)
+
+        try:
+            validated = self.model.model_validate(data, from_attributes=True)  # type: ignore[union-attr]
+        except ValidationError as exc:
+            for error in exc.errors():
+                key = cast(str, error["loc"][0])
+                if key in missing_body:
+                    continue
+                if error["type"] == "missing":
+                    error["input"] = None
+                errors.setdefault(key, []).append({**error, "loc": self._locations[key] + error["loc"][1:]})
+
+        if errors:
+            # Errors are reported in the order of path, query, header, and body params
+            raise RequestValidationError(
+                _normalize_errors([error for key, _, _ in self._fields for error in errors.get(key, [])]),
+            )
+
+        return {field.name: getattr(validated, key) for key, field, _ in self._fields}
+
+
 def _request_params_to_args(
     required_params: Sequence[ModelField],
     received_params: Mapping[str, Any],
@@ -402,7 +599,8 @@ def _normalize_multi_query_string_with_param(
     -------
     A dictionary containing the processed multi_query_string_parameters.
     """
-    resolved_query_string: dict[str, Any] = query_string
+    # the event caches its query string view, so scalar values are resolved on a copy
+    resolved_query_string: dict[str, Any] = dict(query_string)
     for param in filter(is_scalar_field, params):
         try:
             # if the target parameter is a scalar, we keep the first value of the query string
@@ -429,6 +627,8 @@ def _normalize_multi_header_values_with_param(headers: MutableMapping[str, Any],
     A dictionary containing the processed headers.
     """
     if headers:
+        # the event caches its headers view, so scalar values are resolved on a copy keeping case insensitivity
+        headers = copy(headers)
         for param in filter(is_scalar_field, params):
             try:
                 if len(headers[param.alias]) == 1:
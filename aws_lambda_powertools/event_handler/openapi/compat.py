@@ -118,6 +118,28 @@ class ModelField:
             exclude_none=exclude_none,
         )
 
+    def serialize_json(
+        self,
+        value: Any,
+        *,
+        include: IncEx | None = None,
+        exclude: IncEx | None = None,
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> bytes:
+        """Serialize a value straight to JSON bytes with pydantic-core, without an intermediate Python object"""
+        return self._type_adapter.dump_json(
+            value,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+
     def validate(
         self, value: Any, values: dict[str, Any] = {}, *, loc: tuple[int | str, ...] = ()
     ) -> tuple[Any, list[dict[str, Any]] | None]:
@@ -0,0 +1,86 @@
+"""
+Lambda response streaming through the Lambda Runtime API
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import json
+import logging
+import os
+from typing import Iterable
+
+from aws_lambda_powertools.shared import constants
+
+logger = logging.getLogger(__name__)
+
+# Content type for streamed responses with a JSON prelude, e.g. for Lambda Function URLs
+HTTP_INTEGRATION_RESPONSE_CONTENT_TYPE = "application/vnd.awslambda.http-integration-response"
+RUNTIME_API_VERSION = "2018-06-01"
+
+
+class ResponseStreamError(Exception):
+    """When the Lambda Runtime API doesn't accept a streamed response"""
+
+
+def send_streaming_response(
+    request_id: str,
+    chunks: Iterable[bytes],
+    runtime_api: str | None = None,
+    content_type: str = HTTP_INTEGRATION_RESPONSE_CONTENT_TYPE,
+) -> None:
+    """Streams a response to the Lambda Runtime API, writing each chunk as soon as it's produced
+
+    Use it in runtimes that don't stream responses natively, e.g. a custom runtime invoking your
+    handler, with the chunks returned by `resolve_stream`. When producing chunks fails midway, the error
+    is reported to the Runtime API in the response trailers and raised again.
+
+    Parameters
+    ----------
+    request_id: str
+        Invocation request ID, e.g. `context.aws_request_id`
+    chunks: Iterable[bytes]
+        Response chunks, e.g. returned by `app.resolve_stream(event, context)`
+    runtime_api: str | None
+        Runtime API host and port, by default `AWS_LAMBDA_RUNTIME_API` env var
+    content_type: str
+        Response content type, by default the HTTP integration response used with a JSON prelude
+
+    Raises
+    ------
+    ResponseStreamError
+        When the Runtime API rejects the response
+    """
+    connection = http.client.HTTPConnection(runtime_api or os.environ[constants.LAMBDA_RUNTIME_API_ENV])
+
+    try:
+        connection.putrequest("POST", f"/{RUNTIME_API_VERSION}/runtime/invocation/{request_id}/response")
+        connection.putheader("Lambda-Runtime-Function-Response-Mode", "streaming")
+        connection.putheader("Content-Type", content_type)
+        connection.putheader("Transfer-Encoding", "chunked")
+        connection.putheader("Trailer", "Lambda-Runtime-Function-Error-Type, Lambda-Runtime-Function-Error-Body")
+        connection.endheaders()
+
+        trailers = b""
+        try:
+            for chunk in chunks:
+                if chunk:
+                    connection.send(b"%X\r\n%s\r\n" % (len(chunk), chunk))
+        except Exception as exc:
+            logger.debug("Failed to produce response chunk, reporting error to the Runtime API")
+            error = {"errorMessage": str(exc), "errorType": type(exc).__name__}
+            trailers = (
+                f"Lambda-Runtime-Function-Error-Type: {type(exc).__name__}\r\n"
+                f"Lambda-Runtime-Function-Error-Body: {base64.b64encode(json.dumps(error).encode()).decode()}\r\n"
+            ).encode()
+            raise
+        finally:
+            connection.send(b"0\r\n" + trailers + b"\r\n")
+            response = connection.getresponse()
+            body = response.read()
+
+        if response.status >= 300:
+            raise ResponseStreamError(f"Lambda Runtime API rejected streamed response ({response.status}): {body!r}")
+    finally:
+        connection.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from typing import Any, Dict, List, Mapping
 
 
@@ -60,6 +61,49 @@ def extract_origin_header(resolved_headers: Mapping[str, Any]):
     return resolved_header
 
 
+def weak_etag(body: bytes) -> str:
+    """
+    Builds a weak ETag from a hash of the response body.
+
+    It's weak as the same body can be compressed differently depending on the request.
+
+    Args:
+        body (bytes): The serialized response body.
+
+    Returns:
+        str: The ETag, e.g. `W/"3f2a..."`.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """
+    Checks whether an ETag matches the `If-None-Match` request header.
+
+    If-None-Match uses weak comparison, ignoring the `W/` prefix.
+
+    Args:
+        etag (str): The ETag of the current response.
+        if_none_match (str | None): The If-None-Match header value, e.g. `W/"v1", "v2"` or `*`.
+
+    Returns:
+        bool: True if the client already has the current response.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == opaque_tag for tag in if_none_match.split(","))
+
+
+def _opaque_tag(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
 def _validate_openapi_security_parameters(
     security: list[dict[str, list[str]]],
     security_schemes: dict[str, Any] | None = None,
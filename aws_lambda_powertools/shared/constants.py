@@ -49,12 +49,20 @@ EMF_MAX_TIMESTAMP_FUTURE_AGE = 2 * 60 * 60 * 1000  # 2 hours
 # Parameters constants
 PARAMETERS_SSM_DECRYPT_ENV: str = "POWERTOOLS_PARAMETERS_SSM_DECRYPT"
 PARAMETERS_MAX_AGE_ENV: str = "POWERTOOLS_PARAMETERS_MAX_AGE"
+PARAMETERS_STALE_WHILE_REVALIDATE_ENV: str = "POWERTOOLS_PARAMETERS_STALE_WHILE_REVALIDATE"
+PARAMETERS_BACKGROUND_REFRESH_ENV: str = "POWERTOOLS_PARAMETERS_BACKGROUND_REFRESH"
+PARAMETERS_CACHE_MAX_ITEMS_ENV: str = "POWERTOOLS_PARAMETERS_CACHE_MAX_ITEMS"
+PARAMETERS_NEGATIVE_CACHE_TTL_ENV: str = "POWERTOOLS_PARAMETERS_NEGATIVE_CACHE_TTL"
+PARAMETERS_USE_EXTENSION_ENV: str = "POWERTOOLS_PARAMETERS_USE_EXTENSION"
+PARAMETERS_EXTENSION_HTTP_PORT_ENV: str = "PARAMETERS_SECRETS_EXTENSION_HTTP_PORT"
+AWS_SESSION_TOKEN_ENV: str = "AWS_SESSION_TOKEN"
 
 # Runtime and environment constants
 LAMBDA_TASK_ROOT_ENV: str = "LAMBDA_TASK_ROOT"
 SAM_LOCAL_ENV: str = "AWS_SAM_LOCAL"
 CHALICE_LOCAL_ENV: str = "AWS_CHALICE_CLI_MODE"
 LAMBDA_FUNCTION_NAME_ENV: str = "AWS_LAMBDA_FUNCTION_NAME"
+LAMBDA_RUNTIME_API_ENV: str = "AWS_LAMBDA_RUNTIME_API"
 
 # Debug constants
 POWERTOOLS_DEV_ENV: str = "POWERTOOLS_DEV"
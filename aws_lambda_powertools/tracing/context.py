@@ -0,0 +1,183 @@
+"""
+X-Ray SDK trace context storage backed by contextvars
+
+The X-Ray SDK stores the active segment/subsegment stack in a `threading.local`. Coroutines running concurrently
+in the same thread (e.g. `asyncio.gather`) share that stack, so subsegments end up attached to whichever
+entity happens to be on top of it, and subsegments may close another coroutine's entity.
+
+Every asyncio Task runs in a copy of the context it was created from. By storing the entity stack as an immutable
+tuple in a `ContextVar`, each task inherits its parent's stack and pushes/pops its own subsegments without
+affecting sibling tasks. Threads start with an empty context, hence regular sync code keeps thread-local semantics.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from contextvars import ContextVar
+from typing import Any
+
+from aws_xray_sdk import global_sdk_config  # type: ignore
+from aws_xray_sdk.core.context import Context  # type: ignore
+from aws_xray_sdk.core.lambda_launcher import (  # type: ignore
+    LAMBDA_TRACE_HEADER_KEY,
+    LambdaContext,
+)
+from aws_xray_sdk.core.models.dummy_entities import DummySegment  # type: ignore
+from aws_xray_sdk.core.models.facade_segment import FacadeSegment  # type: ignore
+from aws_xray_sdk.core.models.trace_header import TraceHeader  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class ContextVarsContext(Context):
+    """X-Ray trace context storing trace entities in a ContextVar instead of a thread local
+
+    Drop-in replacement for `aws_xray_sdk.core.context.Context` that is safe to use with concurrent coroutines.
+
+    Example
+    -------
+    **Configure X-Ray recorder to use contextvars outside Lambda**
+
+        from aws_xray_sdk.core import xray_recorder
+        from aws_lambda_powertools.tracing.context import ContextVarsContext
+
+        xray_recorder.configure(context=ContextVarsContext())
+    """
+
+    def __init__(self, context_missing: str = "LOG_ERROR"):
+        super().__init__(context_missing=context_missing)
+        self._entities: ContextVar[tuple[Any, ...]] = ContextVar(f"xray_entities_{id(self)}", default=())
+
+    def put_segment(self, segment: Any):
+        self._entities.set((segment,))
+
+    def put_subsegment(self, subsegment: Any):
+        entity = self.get_trace_entity()
+        if not entity:
+            logger.warning(f"Active segment or subsegment not found. Discarded {subsegment.name}.")
+            return
+
+        entity.add_subsegment(subsegment)
+        self._entities.set(self._entities.get() + (subsegment,))
+
+    def end_subsegment(self, end_time: float | None = None) -> bool:
+        entity = self.get_trace_entity()
+        if self._is_subsegment(entity):
+            entity.close(end_time)
+            self._entities.set(self._entities.get()[:-1])
+            return True
+
+        if not isinstance(entity, DummySegment):
+            logger.warning("No subsegment to end.")
+
+        return False
+
+    def get_trace_entity(self) -> Any:
+        entities = self._entities.get()
+        if not entities:
+            if not global_sdk_config.sdk_enabled():
+                return DummySegment()
+            return self.handle_context_missing()
+
+        return entities[-1]
+
+    def set_trace_entity(self, trace_entity: Any):
+        self._entities.set((trace_entity,))
+
+    def clear_trace_entities(self):
+        self._entities.set(())
+
+
+class LambdaContextVarsContext(LambdaContext):
+    """X-Ray Lambda trace context storing trace entities in a ContextVar instead of a thread local
+
+    Drop-in replacement for `aws_xray_sdk.core.lambda_launcher.LambdaContext` that is safe to use with
+    concurrent coroutines. The facade segment is refreshed from `_X_AMZN_TRACE_ID` on every access like the original.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._segment: ContextVar[Any] = ContextVar(f"xray_lambda_segment_{id(self)}", default=None)
+        self._entities: ContextVar[tuple[Any, ...]] = ContextVar(f"xray_lambda_entities_{id(self)}", default=())
+
+    def put_subsegment(self, subsegment: Any):
+        current_entity = self.get_trace_entity()
+
+        if not self._is_subsegment(current_entity) and (
+            getattr(current_entity, "initializing", None) or isinstance(current_entity, DummySegment)
+        ):
+            if global_sdk_config.sdk_enabled() and not os.getenv(LAMBDA_TRACE_HEADER_KEY):
+                logger.warning(f"Subsegment {subsegment.name} discarded due to Lambda worker still initializing")
+            return
+
+        current_entity.add_subsegment(subsegment)
+        self._entities.set(self._entities.get() + (subsegment,))
+
+    def end_subsegment(self, end_time: float | None = None) -> bool:
+        entity = self.get_trace_entity()
+        if self._is_subsegment(entity):
+            entity.close(end_time)
+            self._entities.set(self._entities.get()[:-1])
+            return True
+
+        if not isinstance(entity, DummySegment):
+            logger.warning("No subsegment to end.")
+
+        return False
+
+    def set_trace_entity(self, trace_entity: Any):
+        segment = trace_entity.parent_segment if self._is_subsegment(trace_entity) else trace_entity
+
+        self._segment.set(segment)
+        self._entities.set((trace_entity,))
+
+    def get_trace_entity(self) -> Any:
+        self._refresh_context()
+        entities = self._entities.get()
+        if entities:
+            return entities[-1]
+
+        return self._segment.get()
+
+    def clear_trace_entities(self):
+        self._segment.set(None)
+        self._entities.set(())
+
+    def _refresh_context(self):
+        trace_header = TraceHeader.from_header_str(os.getenv(LAMBDA_TRACE_HEADER_KEY))
+        if not global_sdk_config.sdk_enabled():
+            trace_header._sampled = False
+
+        segment = self._segment.get()
+
+        # Ensure subsegments don't leak across invocations
+        if segment and (not trace_header.root or trace_header.root == segment.trace_id):
+            return
+
+        self._initialize_context(trace_header)
+
+    def _initialize_context(self, trace_header: Any):
+        sampled = None
+        if not global_sdk_config.sdk_enabled():
+            # Force subsequent subsegments to be disabled and turned into DummySegments.
+            sampled = False
+        elif trace_header.sampled == 0:
+            sampled = False
+        elif trace_header.sampled == 1:
+            sampled = True
+
+        if not trace_header.root or not trace_header.parent or trace_header.sampled is None:
+            logger.debug("Creating NoOp/Dummy parent segment")
+            segment = DummySegment()
+        else:
+            segment = FacadeSegment(
+                name="facade",
+                traceid=trace_header.root,
+                entityid=trace_header.parent,
+                sampled=sampled,
+            )
+
+        segment.save_origin_trace_header(trace_header)
+        self._segment.set(segment)
+        self._entities.set(())
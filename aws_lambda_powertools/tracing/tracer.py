@@ -183,6 +183,7 @@ class Tracer:
 
         if self._is_xray_provider():
             self._disable_xray_trace_batching()
+            self._use_xray_contextvars_context()
 
     def put_annotation(self, key: str, value: str | numbers.Number | bool):
         """Adds annotation to existing segment or subsegment
@@ -379,12 +380,12 @@ class Tracer:
         # see here: [Qualified name for classes and functions](https://peps.python.org/pep-3155/)
 
         When running [async functions concurrently](https://docs.python.org/3/library/asyncio-task.html#id6),
-        methods may impact each others subsegment, and can trigger
-        and AlreadyEndedException from X-Ray due to async nature.
+        each coroutine gets its own subsegment attached to the caller's subsegment, as X-Ray
+        trace entities are stored in `contextvars` instead of thread locals.
 
-        For this use case, either use `capture_method` only where
-        `async.gather` is called, or use `in_subsegment_async`
-        context manager via our escape hatch mechanism - See examples.
+        If you configured a custom X-Ray context, methods may impact each others subsegment.
+        For this use case, either use `capture_method` only where `async.gather` is called,
+        or use `in_subsegment_async` context manager via our escape hatch mechanism - See examples.
 
         Parameters
         ----------
@@ -474,9 +475,26 @@ class Tracer:
 
                 return { "task": "done", **ret }
 
-        **Safely tracing concurrent async calls with decorator**
+        **Tracing concurrent async calls**
 
-        This may not needed once [this bug is closed](https://github.com/aws/aws-xray-sdk-python/issues/164)
+            from aws_lambda_powertools import Tracer
+            tracer = Tracer(service="booking")
+
+            @tracer.capture_method
+            async def get_identity():
+                ...
+
+            @tracer.capture_method
+            async def long_async_call():
+                ...
+
+            @tracer.capture_method
+            async def async_tasks():
+                _, ret = await asyncio.gather(get_identity(), long_async_call(), return_exceptions=True)
+
+                return { "task": "done", **ret }
+
+        **Safely tracing concurrent async calls with decorator when using a custom X-Ray context**
 
             from aws_lambda_powertools import Tracer
             tracer = Tracer(service="booking")
@@ -495,9 +513,7 @@ class Tracer:
 
                 return { "task": "done", **ret }
 
-        **Safely tracing each concurrent async calls with escape hatch**
-
-        This may not needed once [this bug is closed](https://github.com/aws/aws-xray-sdk-python/issues/164)
+        **Safely tracing each concurrent async calls with escape hatch when using a custom X-Ray context**
 
             from aws_lambda_powertools import Tracer
             tracer = Tracer(service="booking")
@@ -837,6 +853,31 @@ class Tracer:
 
         aws_xray_sdk.core.xray_recorder.configure(streaming_threshold=0)
 
+    def _use_xray_contextvars_context(self):
+        """Configure X-Ray SDK to store trace entities in contextvars over thread locals
+
+        Thread local storage is shared by coroutines running concurrently (e.g. `asyncio.gather`),
+        leading to subsegments attached to the wrong parent.
+
+        Custom contexts (e.g. `AsyncContext`) set by customers are left untouched.
+        """
+        if self.disabled:
+            logger.debug("Tracing has been disabled, aborting contextvars context override")
+            return
+
+        from aws_xray_sdk.core.context import Context  # type: ignore
+        from aws_xray_sdk.core.lambda_launcher import LambdaContext  # type: ignore
+
+        from aws_lambda_powertools.tracing.context import ContextVarsContext, LambdaContextVarsContext
+
+        current_context = getattr(self.provider, "context", None)
+        if type(current_context) is LambdaContext:
+            logger.debug("Replacing X-Ray Lambda context with contextvars context")
+            self.provider.context = LambdaContextVarsContext()
+        elif type(current_context) is Context:
+            logger.debug("Replacing X-Ray context with contextvars context")
+            self.provider.context = ContextVarsContext(context_missing=current_context.context_missing)
+
     def _is_xray_provider(self):
         return "aws_xray_sdk" in self.provider.__module__
 
@@ -44,7 +44,7 @@ class ALBEvent(BaseProxyEvent):
 
     @property
     def multi_value_headers(self) -> dict[str, list[str]]:
-        return CaseInsensitiveDict(self.get("multiValueHeaders"))
+        return self._normalized_view("multi_value_headers", self.get("multiValueHeaders"), CaseInsensitiveDict)
 
     @property
     def resolved_headers_field(self) -> dict[str, Any]:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import cached_property
 from typing import Any
 
 from aws_lambda_powertools.shared.headers_serializer import (
@@ -14,6 +13,7 @@ from aws_lambda_powertools.utilities.data_classes.common import (
     BaseRequestContextV2,
     CaseInsensitiveDict,
     DictWrapper,
+    split_multi_value_headers,
 )
 
 
@@ -117,7 +117,7 @@ class APIGatewayProxyEvent(BaseProxyEvent):
 
     @property
     def multi_value_headers(self) -> dict[str, list[str]]:
-        return CaseInsensitiveDict(self.get("multiValueHeaders"))
+        return self._normalized_view("multi_value_headers", self.get("multiValueHeaders"), CaseInsensitiveDict)
 
     @property
     def multi_value_query_string_parameters(self) -> dict[str, list[str]]:
@@ -316,6 +316,6 @@ class APIGatewayProxyEventV2(BaseProxyEvent):
     def header_serializer(self):
         return HttpApiHeadersSerializer()
 
-    @cached_property
+    @property
     def resolved_headers_field(self) -> dict[str, Any]:
-        return CaseInsensitiveDict((k, v.split(",") if "," in v else v) for k, v in self.headers.items())
+        return self._normalized_view("resolved_headers_field", self.headers, split_multi_value_headers)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import json
 import warnings
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, overload
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, TypeVar, overload
 
 from typing_extensions import deprecated
 
@@ -14,11 +14,12 @@ if TYPE_CHECKING:
     from aws_lambda_powertools.shared.headers_serializer import BaseHeadersSerializer
 
 from aws_lambda_powertools.utilities.data_classes.shared_functions import (
-    get_header_value,
     get_multi_value_query_string_values,
     get_query_string_value,
 )
 
+T = TypeVar("T")
+
 
 class CaseInsensitiveDict(dict):
     """Case insensitive dict implementation. Assumes string keys only."""
@@ -63,6 +64,11 @@ class CaseInsensitiveDict(dict):
         super().__setitem__(k.lower(), v)
 
 
+def split_multi_value_headers(headers: Mapping[str, str]) -> CaseInsensitiveDict:
+    """Splits comma-separated header values into lists, as multi-value headers are merged by some event sources"""
+    return CaseInsensitiveDict((k, v.split(",") if "," in v else v) for k, v in headers.items())
+
+
 class DictWrapper(Mapping):
     """Provides a single read only access to a wrapper dict"""
 
@@ -147,9 +153,34 @@ class DictWrapper(Mapping):
 
 
 class BaseProxyEvent(DictWrapper):
+    @cached_property
+    def _normalized_views(self) -> dict[str, tuple[Any, Any]]:
+        return {}
+
+    def _normalized_view(self, name: str, raw: Any, normalize: Callable[[Any], T]) -> T:
+        """Returns a view of a raw event field, e.g. headers with lowercase names, normalizing it only once.
+
+        Headers and query strings are read multiple times per request, by Event Handler and customers alike.
+        The view is rebuilt only when the raw field is replaced, e.g. `event.raw_event["headers"] = {...}`.
+
+        The same view is returned to every reader of the event, so it must not be modified in place.
+        """
+        cached = self._normalized_views.get(name)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+
+        view = normalize(raw)
+        self._normalized_views[name] = (raw, view)
+        return view
+
     @property
     def headers(self) -> dict[str, str]:
-        return CaseInsensitiveDict(self.get("headers"))
+        """Request headers, with case-insensitive names
+
+        The same dict is returned on every access, and shared with Event Handler and middlewares,
+        so copy it before modifying it, e.g. `headers = dict(event.headers)`.
+        """
+        return self._normalized_view("headers", self.get("headers"), CaseInsensitiveDict)
 
     @property
     def query_string_parameters(self) -> dict[str, str]:
@@ -159,7 +190,7 @@ class BaseProxyEvent(DictWrapper):
     def multi_value_query_string_parameters(self) -> dict[str, list[str]]:
         return self.get("multiValueQueryStringParameters") or {}
 
-    @cached_property
+    @property
     def resolved_query_string_parameters(self) -> dict[str, list[str]]:
         """
         This property determines the appropriate query string parameter to be used
@@ -167,8 +198,14 @@ class BaseProxyEvent(DictWrapper):
 
         This is necessary because different resolvers use different formats to encode
         multi query string parameters.
+
+        The same dict is returned on every access, so copy it before modifying it.
         """
-        return {k: v.split(",") for k, v in self.query_string_parameters.items()}
+        return self._normalized_view(
+            "resolved_query_string_parameters",
+            self.query_string_parameters,
+            lambda params: {k: v.split(",") for k, v in params.items()},
+        )
 
     @property
     def resolved_headers_field(self) -> dict[str, str]:
@@ -182,6 +219,8 @@ class BaseProxyEvent(DictWrapper):
         Headers are case-insensitive according to RFC 7540 (HTTP/2), so we lower the header name
         This ensures that customers can access headers with any casing, as per the RFC guidelines.
         Reference: https://www.rfc-editor.org/rfc/rfc7540#section-8.1.2
+
+        The same dict is returned on every access, so copy it before modifying it.
         """
         return self.headers
 
@@ -196,9 +235,17 @@ class BaseProxyEvent(DictWrapper):
 
     @cached_property
     def json_body(self) -> Any:
-        """Parses the submitted body as json"""
-        if self.decoded_body:
-            return self._json_deserializer(self.decoded_body)
+        """Parses the submitted body as json
+
+        Base64 encoded bodies are parsed from their decoded bytes, without decoding them into a str first,
+        unless a custom `json_deserializer` is used, as it may only accept str.
+        """
+        body: str | bytes | None = self.body
+        if self.is_base64_encoded:
+            body = self.decoded_body_bytes if self._json_deserializer is json.loads else self.decoded_body
+
+        if body:
+            return self._json_deserializer(body)
 
         return None
 
@@ -207,9 +254,23 @@ class BaseProxyEvent(DictWrapper):
         """Decode the body from base64 if encoded, otherwise return it as is."""
         body: str | None = self.body
         if self.is_base64_encoded and body:
-            return base64.b64decode(body.encode()).decode()
+            return binascii.a2b_base64(body).decode()
         return body
 
+    @cached_property
+    def decoded_body_bytes(self) -> bytes | None:
+        """Decode the body from base64 if encoded, otherwise encode it as UTF-8, returning bytes
+
+        Prefer it over `decoded_body` for binary payloads, e.g. file uploads, as base64 is decoded
+        straight from the body into bytes.
+        """
+        body: str | None = self.body
+        if body is None:
+            return None
+        if self.is_base64_encoded:
+            return binascii.a2b_base64(body)
+        return body.encode()
+
     @property
     def path(self) -> str:
         return self["path"]
@@ -314,12 +375,8 @@ class BaseProxyEvent(DictWrapper):
             category=PowertoolsDeprecationWarning,
             stacklevel=2,
         )
-        return get_header_value(
-            headers=self.headers,
-            name=name,
-            default_value=default_value,
-            case_sensitive=case_sensitive,
-        )
+        # headers are already normalized to lowercase names, so there's no need to compare every header name
+        return self.headers.get(name, default_value)
 
     def header_serializer(self) -> BaseHeadersSerializer:
         raise NotImplementedError()
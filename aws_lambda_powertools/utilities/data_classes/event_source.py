@@ -14,7 +14,7 @@ def event_source(
     handler: Callable[[Any, LambdaContext], Any],
     event: dict[str, Any],
     context: LambdaContext,
-    data_class: type[DictWrapper],
+    data_class: type[DictWrapper] | None = None,
 ):
     """Middleware to create an instance of the passed in event source data class
 
@@ -26,8 +26,8 @@ def event_source(
         Lambda's Event
     context: LambdaContext
         Lambda's Context
-    data_class: type[DictWrapper]
-        Data class type to instantiate
+    data_class: type[DictWrapper] | None
+        Data class type to instantiate. When not set, it's detected from the event source of the event
 
     Example
     --------
@@ -39,5 +39,30 @@ def event_source(
         @event_source(data_class=S3Event)
         def handler(event: S3Event, context):
              return {"key": event.object_key}
+
+    **Detecting the data class from the event**
+
+        from aws_lambda_powertools.utilities.data_classes import SQSEvent, event_source
+
+        @event_source
+        def handler(event: SQSEvent, context):
+             ...
+
+    Raises
+    ------
+    ValueError
+        When the data class isn't set and the event source can't be detected
     """
+    if data_class is None:
+        from aws_lambda_powertools.utilities.data_classes.event_source_router import (
+            EVENT_SOURCE_DATA_CLASSES,
+            detect_event_source,
+        )
+
+        source = detect_event_source(event)
+        if source is None:
+            raise ValueError("Unable to detect the event source, use event_source(data_class=...) instead")
+
+        data_class = EVENT_SOURCE_DATA_CLASSES[source]
+
     return handler(data_class(event), context)
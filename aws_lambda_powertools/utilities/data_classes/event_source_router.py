@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import logging
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
+
+from aws_lambda_powertools.utilities.data_classes.active_mq_event import ActiveMQEvent
+from aws_lambda_powertools.utilities.data_classes.alb_event import ALBEvent
+from aws_lambda_powertools.utilities.data_classes.api_gateway_proxy_event import (
+    APIGatewayProxyEvent,
+    APIGatewayProxyEventV2,
+)
+from aws_lambda_powertools.utilities.data_classes.bedrock_agent_event import BedrockAgentEvent
+from aws_lambda_powertools.utilities.data_classes.cloud_watch_logs_event import CloudWatchLogsEvent
+from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import DynamoDBStreamEvent
+from aws_lambda_powertools.utilities.data_classes.event_bridge_event import EventBridgeEvent
+from aws_lambda_powertools.utilities.data_classes.kafka_event import KafkaEvent
+from aws_lambda_powertools.utilities.data_classes.kinesis_firehose_event import KinesisFirehoseEvent
+from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import KinesisStreamEvent
+from aws_lambda_powertools.utilities.data_classes.lambda_function_url_event import LambdaFunctionUrlEvent
+from aws_lambda_powertools.utilities.data_classes.rabbit_mq_event import RabbitMQEvent
+from aws_lambda_powertools.utilities.data_classes.s3_event import S3Event
+from aws_lambda_powertools.utilities.data_classes.ses_event import SESEvent
+from aws_lambda_powertools.utilities.data_classes.sns_event import SNSEvent
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSEvent
+from aws_lambda_powertools.utilities.data_classes.vpc_lattice import VPCLatticeEvent, VPCLatticeEventV2
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = logging.getLogger(__name__)
+
+
+class EventSourceType(Enum):
+    SQS = "SQS"
+    SNS = "SNS"
+    SES = "SES"
+    S3 = "S3"
+    DYNAMODB_STREAM = "DynamoDBStream"
+    KINESIS_DATA_STREAM = "KinesisDataStream"
+    KINESIS_FIREHOSE = "KinesisFirehose"
+    KAFKA_MSK = "KafkaMsk"
+    KAFKA_SELF_MANAGED = "KafkaSelfManaged"
+    ACTIVE_MQ = "ActiveMQ"
+    RABBIT_MQ = "RabbitMQ"
+    EVENTBRIDGE = "EventBridge"
+    CLOUDWATCH_LOGS = "CloudWatchLogs"
+    API_GATEWAY_REST = "APIGatewayRest"
+    API_GATEWAY_HTTP = "APIGatewayHttp"
+    LAMBDA_FUNCTION_URL = "LambdaFunctionUrl"
+    ALB = "ALB"
+    VPC_LATTICE = "VPCLattice"
+    VPC_LATTICE_V2 = "VPCLatticeV2"
+    BEDROCK_AGENT = "BedrockAgent"
+
+
+# `eventSource` of the first record, e.g. {"Records": [{"eventSource": "aws:sqs", ...}]}
+_RECORD_EVENT_SOURCES = {
+    "aws:sqs": EventSourceType.SQS,
+    "aws:sns": EventSourceType.SNS,
+    "aws:ses": EventSourceType.SES,
+    "aws:s3": EventSourceType.S3,
+    "aws:dynamodb": EventSourceType.DYNAMODB_STREAM,
+    "aws:kinesis": EventSourceType.KINESIS_DATA_STREAM,
+}
+
+# `eventSource` of the event, e.g. {"eventSource": "aws:kafka", "records": {...}}
+# Amazon MQ for ActiveMQ events are documented as "aws:mq", while older samples use "aws:amq"
+_EVENT_SOURCES = {
+    "aws:kafka": EventSourceType.KAFKA_MSK,
+    "aws:SelfManagedKafka": EventSourceType.KAFKA_SELF_MANAGED,
+    "aws:mq": EventSourceType.ACTIVE_MQ,
+    "aws:amq": EventSourceType.ACTIVE_MQ,
+    "aws:rmq": EventSourceType.RABBIT_MQ,
+}
+
+EVENT_SOURCE_DATA_CLASSES: dict[EventSourceType, type[DictWrapper]] = {
+    EventSourceType.SQS: SQSEvent,
+    EventSourceType.SNS: SNSEvent,
+    EventSourceType.SES: SESEvent,
+    EventSourceType.S3: S3Event,
+    EventSourceType.DYNAMODB_STREAM: DynamoDBStreamEvent,
+    EventSourceType.KINESIS_DATA_STREAM: KinesisStreamEvent,
+    EventSourceType.KINESIS_FIREHOSE: KinesisFirehoseEvent,
+    EventSourceType.KAFKA_MSK: KafkaEvent,
+    EventSourceType.KAFKA_SELF_MANAGED: KafkaEvent,
+    EventSourceType.ACTIVE_MQ: ActiveMQEvent,
+    EventSourceType.RABBIT_MQ: RabbitMQEvent,
+    EventSourceType.EVENTBRIDGE: EventBridgeEvent,
+    EventSourceType.CLOUDWATCH_LOGS: CloudWatchLogsEvent,
+    EventSourceType.API_GATEWAY_REST: APIGatewayProxyEvent,
+    EventSourceType.API_GATEWAY_HTTP: APIGatewayProxyEventV2,
+    EventSourceType.LAMBDA_FUNCTION_URL: LambdaFunctionUrlEvent,
+    EventSourceType.ALB: ALBEvent,
+    EventSourceType.VPC_LATTICE: VPCLatticeEvent,
+    EventSourceType.VPC_LATTICE_V2: VPCLatticeEventV2,
+    EventSourceType.BEDROCK_AGENT: BedrockAgentEvent,
+}
+
+
+def detect_event_source(event: Any) -> EventSourceType | None:  # noqa: PLR0911  # ignore many returns
+    """Detects the source of a Lambda event from a few discriminating keys
+
+    Only a fixed number of keys are checked regardless of the event size, e.g. the `eventSource` of the first
+    record, or whether `requestContext` has `http` or `elb` keys, so detection costs the same for every event.
+
+    Parameters
+    ----------
+    event: Any
+        Lambda event
+
+    Returns
+    -------
+    EventSourceType | None
+        The event source, or None when the event doesn't match any supported event source
+
+    Example
+    -------
+
+    **Detecting the event source of a Lambda event**
+
+        from aws_lambda_powertools.utilities.data_classes.event_source_router import (
+            EventSourceType,
+            detect_event_source,
+        )
+
+        def lambda_handler(event: dict, context):
+            if detect_event_source(event) is EventSourceType.SQS:
+                ...
+    """
+    if not isinstance(event, dict):
+        return None
+
+    records = event.get("Records")
+    if isinstance(records, list):
+        record = records[0] if records else None
+        if not isinstance(record, dict):
+            return None
+        # SNS records use `EventSource` instead of `eventSource`
+        record_source = record.get("eventSource") or record.get("EventSource")
+        return _RECORD_EVENT_SOURCES.get(record_source) if isinstance(record_source, str) else None
+
+    request_context = event.get("requestContext")
+    if isinstance(request_context, dict):
+        if "elb" in request_context:
+            return EventSourceType.ALB
+        if "http" in request_context:
+            # Lambda Function URLs use the same payload as API Gateway HTTP API, only their domain differs
+            if ".lambda-url." in request_context.get("domainName", ""):
+                return EventSourceType.LAMBDA_FUNCTION_URL
+            return EventSourceType.API_GATEWAY_HTTP
+        if "serviceNetworkArn" in request_context:
+            return EventSourceType.VPC_LATTICE_V2
+        if "httpMethod" in event:
+            return EventSourceType.API_GATEWAY_REST
+        return None
+
+    if "detail-type" in event and "source" in event:
+        return EventSourceType.EVENTBRIDGE
+    if "awslogs" in event:
+        return EventSourceType.CLOUDWATCH_LOGS
+    if "deliveryStreamArn" in event:
+        return EventSourceType.KINESIS_FIREHOSE
+    if "actionGroup" in event and "agent" in event:
+        return EventSourceType.BEDROCK_AGENT
+    if "raw_path" in event and "method" in event:
+        return EventSourceType.VPC_LATTICE
+
+    event_source = event.get("eventSource")
+    return _EVENT_SOURCES.get(event_source) if isinstance(event_source, str) else None
+
+
+class EventSourceRouter:
+    """Dispatches events from multiple event sources to the handler registered for their source
+
+    The event source is detected with `detect_event_source`, and the event is wrapped in its event source
+    data class, or parsed with a Pydantic model when registered with `model`.
+
+    Example
+    -------
+
+    **Handling SQS and API Gateway events in the same Lambda function**
+
+        from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent, SQSEvent
+        from aws_lambda_powertools.utilities.data_classes.event_source_router import (
+            EventSourceRouter,
+            EventSourceType,
+        )
+
+        router = EventSourceRouter()
+
+        @router.register(EventSourceType.SQS)
+        def handle_messages(event: SQSEvent, context):
+            for record in event.records:
+                ...
+
+        @router.register(EventSourceType.API_GATEWAY_REST)
+        def handle_request(event: APIGatewayProxyEvent, context):
+            return {"statusCode": 200, "body": event.path}
+
+        def lambda_handler(event: dict, context):
+            return router.resolve(event, context)
+    """
+
+    def __init__(self):
+        self._handlers: dict[EventSourceType, tuple[Callable[[Any, LambdaContext], Any], type | None]] = {}
+
+    def register(self, *sources: EventSourceType, model: type | None = None) -> Callable:
+        """Registers a handler for one or more event sources
+
+        Parameters
+        ----------
+        sources: EventSourceType
+            Event sources handled by the handler
+        model: type | None
+            Optional Pydantic model to parse the event with, instead of wrapping it in its event source data class
+        """
+
+        def register_handler(handler: Callable[[Any, LambdaContext], Any]) -> Callable[[Any, LambdaContext], Any]:
+            for source in sources:
+                self._handlers[source] = (handler, model)
+            return handler
+
+        return register_handler
+
+    def resolve(self, event: dict[str, Any], context: LambdaContext) -> Any:
+        """Calls the handler registered for the event source of the event
+
+        Raises
+        ------
+        ValueError
+            When the event source isn't detected, or there's no handler registered for it
+        """
+        source = detect_event_source(event)
+        if source is None or source not in self._handlers:
+            raise ValueError(f"No handler registered for event source {source.value if source else 'unknown'}")
+
+        handler, model = self._handlers[source]
+        logger.debug(f"Dispatching {source.value} event to {handler.__name__}")
+
+        if model is not None:
+            from aws_lambda_powertools.utilities.parser import parse
+
+            return handler(parse(event=event, model=model), context)
+
+        return handler(EVENT_SOURCE_DATA_CLASSES[source](event), context)
+
+    def __call__(self, event: dict[str, Any], context: LambdaContext) -> Any:
+        return self.resolve(event, context)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import binascii
+import json
 from functools import cached_property
 from typing import Any
 
@@ -11,6 +13,7 @@ from aws_lambda_powertools.utilities.data_classes.common import (
     BaseProxyEvent,
     CaseInsensitiveDict,
     DictWrapper,
+    split_multi_value_headers,
 )
 from aws_lambda_powertools.utilities.data_classes.shared_functions import base64_decode
 
@@ -24,12 +27,16 @@ class VPCLatticeEventBase(BaseProxyEvent):
     @cached_property
     def json_body(self) -> Any:
         """Parses the submitted body as json"""
+        # custom deserializers may only accept str, so only json.loads parses the decoded bytes
+        if self.is_base64_encoded and self._json_deserializer is json.loads:
+            return json.loads(binascii.a2b_base64(self["body"]))
+
         return self._json_deserializer(self.decoded_body)
 
     @property
     def headers(self) -> dict[str, str]:
-        """The VPC Lattice event headers."""
-        return CaseInsensitiveDict(self["headers"])
+        """The VPC Lattice event headers, returned as the same dict on every access, so copy it before modifying it."""
+        return self._normalized_view("headers", self["headers"], CaseInsensitiveDict)
 
     @property
     def decoded_body(self) -> str:
@@ -74,9 +81,9 @@ class VPCLatticeEvent(VPCLatticeEventBase):
         """The request query string parameters."""
         return self["query_string_parameters"]
 
-    @cached_property
+    @property
     def resolved_headers_field(self) -> dict[str, Any]:
-        return CaseInsensitiveDict((k, v.split(",") if "," in v else v) for k, v in self.headers.items())
+        return self._normalized_view("resolved_headers_field", self.headers, split_multi_value_headers)
 
 
 class vpcLatticeEventV2Identity(DictWrapper):
@@ -184,19 +191,20 @@ class VPCLatticeEventV2(VPCLatticeEventBase):
         """The VPC Lattice v2 Event request context."""
         return vpcLatticeEventV2RequestContext(self["requestContext"])
 
-    @cached_property
+    @property
     def query_string_parameters(self) -> dict[str, str]:
         """The request query string parameters.
 
         For VPC Lattice V2, the queryStringParameters will contain a dict[str, list[str]]
         so to keep compatibility with existing utilities, we merge all the values with a comma.
         """
-        params = self.get("queryStringParameters") or {}
-        return {k: ",".join(v) for k, v in params.items()}
+        return self._normalized_view(
+            "query_string_parameters",
+            self.get("queryStringParameters"),
+            lambda params: {k: ",".join(v) for k, v in (params or {}).items()},
+        )
 
     @property
     def resolved_headers_field(self) -> dict[str, str]:
-        if self.headers is not None:
-            return {key.lower(): value for key, value in self.headers.items()}
-
-        return {}
+        # headers are already normalized to lowercase names
+        return self.headers
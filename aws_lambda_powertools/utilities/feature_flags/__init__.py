@@ -4,6 +4,7 @@ from aws_lambda_powertools.utilities.feature_flags.appconfig import AppConfigSto
 from aws_lambda_powertools.utilities.feature_flags.base import StoreProvider
 from aws_lambda_powertools.utilities.feature_flags.exceptions import ConfigurationStoreError
 from aws_lambda_powertools.utilities.feature_flags.feature_flags import FeatureFlags
+from aws_lambda_powertools.utilities.feature_flags.local import InMemoryStore, LocalFileStore
 from aws_lambda_powertools.utilities.feature_flags.schema import RuleAction, SchemaValidator
 
 __all__ = [
@@ -12,5 +13,7 @@ __all__ = [
     "RuleAction",
     "SchemaValidator",
     "AppConfigStore",
+    "InMemoryStore",
+    "LocalFileStore",
     "StoreProvider",
 ]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, tzinfo
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Iterator
 
 from dateutil.tz import gettz
 
@@ -19,11 +22,62 @@ def _get_now_from_timezone(timezone: tzinfo | None) -> datetime:
     return datetime.now(timezone)
 
 
+# Current time per timezone name, shared by all conditions evaluated within the same evaluation pass
+_clock_snapshot: ContextVar[dict[str, datetime] | None] = ContextVar("feature_flags_clock_snapshot", default=None)
+
+
+@contextmanager
+def clock_snapshot() -> Iterator[None]:
+    """Evaluation pass where time based comparators compute the current time only once per timezone
+
+    Nested passes reuse the outermost snapshot, so all conditions within it agree on the current time.
+    """
+    if _clock_snapshot.get() is not None:
+        yield
+        return
+
+    token = _clock_snapshot.set({})
+    try:
+        yield
+    finally:
+        _clock_snapshot.reset(token)
+
+
+def _get_now(timezone_name: str, timezone: tzinfo | None) -> datetime:
+    """Returns now in the specified timezone, from the current evaluation pass snapshot if any"""
+    snapshot = _clock_snapshot.get()
+    if snapshot is None:
+        return _get_now_from_timezone(timezone)
+
+    now = snapshot.get(timezone_name)
+    if now is None:
+        now = snapshot[timezone_name] = _get_now_from_timezone(timezone)
+
+    return now
+
+
+@lru_cache(maxsize=128)
+def _get_timezone(timezone_name: str) -> tzinfo | None:
+    return gettz(timezone_name)
+
+
+@lru_cache(maxsize=128)
+def _parse_datetime(value: str, timezone_name: str) -> datetime:
+    # Since dates don't include timezone information, we mark the timestamp with the same timezone as the current time
+    return datetime.fromisoformat(value).replace(tzinfo=_get_timezone(timezone_name))
+
+
+@lru_cache(maxsize=128)
+def _parse_hour_min(value: str) -> tuple[int, int]:
+    hour, minute = value.split(HOUR_MIN_SEPARATOR)
+    return int(hour), int(minute)
+
+
 def compare_days_of_week(context_value: Any, condition_value: dict) -> bool:
     timezone_name = condition_value.get(TimeValues.TIMEZONE.value, "UTC")
 
     # %A = Weekday as locale’s full name.
-    current_day = _get_now_from_timezone(gettz(timezone_name)).strftime("%A").upper()
+    current_day = _get_now(timezone_name, _get_timezone(timezone_name)).strftime("%A").upper()
 
     days = condition_value.get(TimeValues.DAYS.value, [])
     return current_day in days
@@ -31,31 +85,27 @@ def compare_days_of_week(context_value: Any, condition_value: dict) -> bool:
 
 def compare_datetime_range(context_value: Any, condition_value: dict) -> bool:
     timezone_name = condition_value.get(TimeValues.TIMEZONE.value, "UTC")
-    timezone = gettz(timezone_name)
-    current_time: datetime = _get_now_from_timezone(timezone)
-
-    start_date_str = condition_value.get(TimeValues.START.value, "")
-    end_date_str = condition_value.get(TimeValues.END.value, "")
+    current_time: datetime = _get_now(timezone_name, _get_timezone(timezone_name))
 
     # Since start_date and end_date doesn't include timezone information, we mark the timestamp
     # with the same timezone as the current_time. This way all the 3 timestamps will be on
     # the same timezone.
-    start_date = datetime.fromisoformat(start_date_str).replace(tzinfo=timezone)
-    end_date = datetime.fromisoformat(end_date_str).replace(tzinfo=timezone)
+    start_date = _parse_datetime(condition_value.get(TimeValues.START.value, ""), timezone_name)
+    end_date = _parse_datetime(condition_value.get(TimeValues.END.value, ""), timezone_name)
     return start_date <= current_time <= end_date
 
 
 def compare_time_range(context_value: Any, condition_value: dict) -> bool:
     timezone_name = condition_value.get(TimeValues.TIMEZONE.value, "UTC")
-    current_time: datetime = _get_now_from_timezone(gettz(timezone_name))
+    current_time: datetime = _get_now(timezone_name, _get_timezone(timezone_name))
 
-    start_hour, start_min = condition_value.get(TimeValues.START.value, "").split(HOUR_MIN_SEPARATOR)
-    end_hour, end_min = condition_value.get(TimeValues.END.value, "").split(HOUR_MIN_SEPARATOR)
+    start_hour, start_min = _parse_hour_min(condition_value.get(TimeValues.START.value, ""))
+    end_hour, end_min = _parse_hour_min(condition_value.get(TimeValues.END.value, ""))
 
-    start_time = current_time.replace(hour=int(start_hour), minute=int(start_min))
-    end_time = current_time.replace(hour=int(end_hour), minute=int(end_min))
+    start_time = current_time.replace(hour=start_hour, minute=start_min)
+    end_time = current_time.replace(hour=end_hour, minute=end_min)
 
-    if int(end_hour) < int(start_hour):
+    if end_hour < start_hour:
         # When the end hour is smaller than start hour, it means we are crossing a day's boundary.
         # In this case we need to assert that current_time is **either** on one side or the other side of the boundary
         #
@@ -76,6 +126,68 @@ def compare_time_range(context_value: Any, condition_value: dict) -> bool:
         return start_time <= current_time <= end_time
 
 
+def compile_days_of_week(condition_value: dict) -> Callable[[Any], bool]:
+    """Returns a SCHEDULE_BETWEEN_DAYS_OF_WEEK comparator with its timezone and days resolved upfront"""
+    timezone_name = condition_value.get(TimeValues.TIMEZONE.value, "UTC")
+    timezone = _get_timezone(timezone_name)
+    days = frozenset(condition_value.get(TimeValues.DAYS.value, []))
+
+    def comparator(context_value: Any) -> bool:
+        # %A = Weekday as locale’s full name.
+        return _get_now(timezone_name, timezone).strftime("%A").upper() in days
+
+    return comparator
+
+
+def compile_datetime_range(condition_value: dict) -> Callable[[Any], bool]:
+    """Returns a SCHEDULE_BETWEEN_DATETIME_RANGE comparator with its timezone and dates parsed upfront"""
+    timezone_name = condition_value.get(TimeValues.TIMEZONE.value, "UTC")
+    timezone = _get_timezone(timezone_name)
+
+    start_date = _parse_datetime(condition_value.get(TimeValues.START.value, ""), timezone_name)
+    end_date = _parse_datetime(condition_value.get(TimeValues.END.value, ""), timezone_name)
+
+    def comparator(context_value: Any) -> bool:
+        return start_date <= _get_now(timezone_name, timezone) <= end_date
+
+    return comparator
+
+
+def compile_time_range(condition_value: dict) -> Callable[[Any], bool]:
+    """Returns a SCHEDULE_BETWEEN_TIME_RANGE comparator with its timezone and hours parsed upfront"""
+    timezone_name = condition_value.get(TimeValues.TIMEZONE.value, "UTC")
+    timezone = _get_timezone(timezone_name)
+
+    start = _parse_hour_min(condition_value.get(TimeValues.START.value, ""))
+    end = _parse_hour_min(condition_value.get(TimeValues.END.value, ""))
+
+    # compare_time_range replaces hour and minute of the current time, so comparing (hour, minute) is equivalent
+    crosses_midnight = end[0] < start[0]
+
+    def comparator(context_value: Any) -> bool:
+        current_time = _get_now(timezone_name, timezone)
+        current = (current_time.hour, current_time.minute)
+
+        if crosses_midnight:
+            return start <= current or current <= end
+
+        return start <= current <= end
+
+    return comparator
+
+
+def compile_modulo_range(condition_value: dict) -> Callable[[int], bool]:
+    """Returns a MODULO_RANGE comparator with its base, start, and end resolved upfront"""
+    base = condition_value.get(ModuloRangeValues.BASE.value, 1)
+    start = condition_value.get(ModuloRangeValues.START.value, 1)
+    end = condition_value.get(ModuloRangeValues.END.value, 1)
+
+    def comparator(context_value: int) -> bool:
+        return start <= context_value % base <= end
+
+    return comparator
+
+
 def compare_modulo_range(context_value: int, condition_value: dict) -> bool:
     """
     Returns for a given context 'a' and modulo condition 'b' -> b.start <= a % b.base <= b.end
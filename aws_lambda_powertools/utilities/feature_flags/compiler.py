@@ -0,0 +1,183 @@
+"""
+Compiles validated feature flag configurations into predicates, so rules are parsed once per configuration version
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, NamedTuple
+
+from aws_lambda_powertools.utilities.feature_flags import schema
+from aws_lambda_powertools.utilities.feature_flags.comparators import (
+    compare_all_in_list,
+    compare_any_in_list,
+    compare_none_in_list,
+    compile_datetime_range,
+    compile_days_of_week,
+    compile_modulo_range,
+    compile_time_range,
+)
+
+# time based rule actions have no user context. the context is the condition key
+TIME_BASED_ACTIONS = frozenset(
+    {
+        schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
+        schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value,
+        schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value,
+    },
+)
+
+
+class CompiledCondition(NamedTuple):
+    key: str
+    action: str
+    matcher: Callable[[Any], bool]
+    time_based: bool
+
+
+class CompiledRule(NamedTuple):
+    name: str
+    match_value: Any
+    conditions: tuple[CompiledCondition, ...]
+
+
+class CompiledFeature(NamedTuple):
+    name: str
+    default: Any
+    boolean_feature: bool
+    rules: tuple[CompiledRule, ...]
+    # context keys referenced by conditions, in order of first use
+    context_keys: tuple[str, ...]
+
+
+class _Members:
+    """Set-backed membership test, falling back to the original list for unhashable values"""
+
+    __slots__ = ("_members", "_values")
+
+    def __init__(self, values: list, members: frozenset):
+        self._values = values
+        self._members = members
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            return item in self._members
+        except TypeError:
+            return item in self._values
+
+
+def _as_members(condition_value: Any) -> Any:
+    """Returns a container with the same `in` semantics as condition_value, using a set for lists when possible"""
+    if not isinstance(condition_value, list):
+        return condition_value
+
+    try:
+        return _Members(condition_value, frozenset(condition_value))
+    except TypeError:
+        return condition_value
+
+
+def _compile_in(condition_value: Any) -> Callable[[Any], bool]:
+    members = _as_members(condition_value)
+    return lambda a: a in members
+
+
+def _compile_not_in(condition_value: Any) -> Callable[[Any], bool]:
+    members = _as_members(condition_value)
+    return lambda a: a not in members
+
+
+def _compile_all_in_value(condition_value: Any) -> Callable[[Any], bool]:
+    members = _as_members(condition_value)
+    return lambda a: compare_all_in_list(a, members)
+
+
+def _compile_any_in_value(condition_value: Any) -> Callable[[Any], bool]:
+    members = _as_members(condition_value)
+    return lambda a: compare_any_in_list(a, members)
+
+
+def _compile_none_in_value(condition_value: Any) -> Callable[[Any], bool]:
+    members = _as_members(condition_value)
+    return lambda a: compare_none_in_list(a, members)
+
+
+# Returns a predicate over the context value, for a given condition value
+RULE_ACTION_COMPILERS: dict[str, Callable[[Any], Callable[[Any], bool]]] = {
+    schema.RuleAction.EQUALS.value: lambda b: lambda a: a == b,
+    schema.RuleAction.NOT_EQUALS.value: lambda b: lambda a: a != b,
+    schema.RuleAction.KEY_GREATER_THAN_VALUE.value: lambda b: lambda a: a > b,
+    schema.RuleAction.KEY_GREATER_THAN_OR_EQUAL_VALUE.value: lambda b: lambda a: a >= b,
+    schema.RuleAction.KEY_LESS_THAN_VALUE.value: lambda b: lambda a: a < b,
+    schema.RuleAction.KEY_LESS_THAN_OR_EQUAL_VALUE.value: lambda b: lambda a: a <= b,
+    schema.RuleAction.STARTSWITH.value: lambda b: lambda a: a.startswith(b),
+    schema.RuleAction.ENDSWITH.value: lambda b: lambda a: a.endswith(b),
+    schema.RuleAction.IN.value: _compile_in,
+    schema.RuleAction.NOT_IN.value: _compile_not_in,
+    schema.RuleAction.KEY_IN_VALUE.value: _compile_in,
+    schema.RuleAction.KEY_NOT_IN_VALUE.value: _compile_not_in,
+    schema.RuleAction.VALUE_IN_KEY.value: lambda b: lambda a: b in a,
+    schema.RuleAction.VALUE_NOT_IN_KEY.value: lambda b: lambda a: b not in a,
+    schema.RuleAction.ALL_IN_VALUE.value: _compile_all_in_value,
+    schema.RuleAction.ANY_IN_VALUE.value: _compile_any_in_value,
+    schema.RuleAction.NONE_IN_VALUE.value: _compile_none_in_value,
+    schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value: compile_time_range,
+    schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value: compile_datetime_range,
+    schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value: compile_days_of_week,
+    schema.RuleAction.MODULO_RANGE.value: compile_modulo_range,
+}
+
+
+def _never_match(context_value: Any) -> bool:
+    return False
+
+
+def compile_condition(condition: dict[str, Any]) -> CompiledCondition:
+    action = condition.get(schema.CONDITION_ACTION, "")
+    compiler = RULE_ACTION_COMPILERS.get(action)
+
+    return CompiledCondition(
+        key=condition.get(schema.CONDITION_KEY, ""),
+        action=action,
+        matcher=compiler(condition.get(schema.CONDITION_VALUE)) if compiler else _never_match,
+        time_based=action in TIME_BASED_ACTIONS,
+    )
+
+
+def compile_rule(rule_name: str, rule: dict[str, Any]) -> CompiledRule:
+    return CompiledRule(
+        name=rule_name,
+        match_value=rule.get(schema.RULE_MATCH_VALUE),
+        conditions=tuple(compile_condition(condition) for condition in rule.get(schema.CONDITIONS_KEY) or []),
+    )
+
+
+def compile_feature(name: str, feature: dict[str, Any]) -> CompiledFeature:
+    rules = tuple(compile_rule(rule_name, rule) for rule_name, rule in (feature.get(schema.RULES_KEY) or {}).items())
+    context_keys = dict.fromkeys(
+        condition.key for rule in rules for condition in rule.conditions if not condition.time_based
+    )
+
+    return CompiledFeature(
+        name=name,
+        default=feature.get(schema.FEATURE_DEFAULT_VAL_KEY),
+        # backwards compatibility, assume feature flag
+        boolean_feature=feature.get(schema.FEATURE_DEFAULT_VAL_TYPE_KEY, True),
+        rules=rules,
+        context_keys=tuple(context_keys),
+    )
+
+
+def compile_features(features: dict[str, Any]) -> dict[str, CompiledFeature]:
+    """Compiles a feature flags configuration that has already been validated with `SchemaValidator`
+
+    Parameters
+    ----------
+    features: dict[str, Any]
+        Feature flags configuration, e.g. `{"premium_features": {"default": False, "rules": {...}}}`
+
+    Returns
+    -------
+    dict[str, CompiledFeature]
+        Features with their rules' conditions compiled into predicates over the context value
+    """
+    return {name: compile_feature(name, feature) for name, feature in features.items()}
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Callable, List, cast
+from typing import TYPE_CHECKING, Any, Callable, Sequence, cast
 
 from aws_lambda_powertools.utilities.feature_flags import schema
 from aws_lambda_powertools.utilities.feature_flags.comparators import (
+    clock_snapshot,
     compare_all_in_list,
     compare_any_in_list,
     compare_datetime_range,
@@ -13,11 +14,13 @@ from aws_lambda_powertools.utilities.feature_flags.comparators import (
     compare_none_in_list,
     compare_time_range,
 )
+from aws_lambda_powertools.utilities.feature_flags.compiler import compile_features, compile_rule
 from aws_lambda_powertools.utilities.feature_flags.exceptions import ConfigurationStoreError
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.logging import Logger
     from aws_lambda_powertools.utilities.feature_flags.base import StoreProvider
+    from aws_lambda_powertools.utilities.feature_flags.compiler import CompiledCondition, CompiledFeature, CompiledRule
     from aws_lambda_powertools.utilities.feature_flags.types import JSONType, P, T
 
 
@@ -79,20 +82,29 @@ class FeatureFlags:
         self.store = store
         self.logger = logger or logging.getLogger(__name__)
         self._exception_handlers: dict[Exception, Callable] = {}
+        # Last configuration fetched from the store, and its features compiled after validation
+        self._compiled: tuple[dict | None, dict[str, CompiledFeature]] = (None, {})
 
     def _match_by_action(self, action: str, condition_value: Any, context_value: Any) -> bool:
         try:
             func = RULE_ACTION_MAPPING.get(action, lambda a, b: False)
             return func(context_value, condition_value)
         except Exception as exc:
-            self.logger.debug(f"caught exception while matching action: action={action}, exception={str(exc)}")
+            return self._handle_match_exception(action=action, exc=exc)
 
-            handler = self._lookup_exception_handler(exc)
-            if handler:
-                self.logger.debug("Exception handler found! Delegating response.")
-                return handler(exc)
+    def _is_debug_enabled(self) -> bool:
+        # checked once per evaluation to avoid formatting debug messages that would be discarded
+        return self.logger.isEnabledFor(logging.DEBUG)  # type: ignore[union-attr]  # Logger proxies it
 
-            return False
+    def _handle_match_exception(self, action: str, exc: Exception) -> bool:
+        self.logger.debug(f"caught exception while matching action: action={action}, exception={str(exc)}")
+
+        handler = self._lookup_exception_handler(exc)
+        if handler:
+            self.logger.debug("Exception handler found! Delegating response.")
+            return handler(exc)
+
+        return False
 
     def _evaluate_conditions(
         self,
@@ -102,65 +114,144 @@ class FeatureFlags:
         context: dict[str, Any],
     ) -> bool:
         """Evaluates whether context matches conditions, return False otherwise"""
-        rule_match_value = rule.get(schema.RULE_MATCH_VALUE)
-        conditions = cast(List[dict], rule.get(schema.CONDITIONS_KEY))
-
-        if not conditions:
-            self.logger.debug(
-                f"rule did not match, no conditions to match, rule_name={rule_name}, rule_value={rule_match_value}, "
-                f"name={feature_name} ",
-            )
-            return False
-
-        for condition in conditions:
-            context_value = context.get(condition.get(schema.CONDITION_KEY, ""))
-            cond_action = condition.get(schema.CONDITION_ACTION, "")
-            cond_value = condition.get(schema.CONDITION_VALUE)
+        return self._evaluate_compiled_conditions(
+            rule=compile_rule(rule_name, rule),
+            feature_name=feature_name,
+            context=context,
+            debug=self._is_debug_enabled(),
+        )
 
-            # time based rule actions have no user context. the context is the condition key
-            if cond_action in (
-                schema.RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
-                schema.RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE.value,
-                schema.RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK.value,
-            ):
-                context_value = condition.get(schema.CONDITION_KEY)  # e.g., CURRENT_TIME
+    def _evaluate_compiled_conditions(
+        self,
+        rule: CompiledRule,
+        feature_name: str,
+        context: dict[str, Any],
+        debug: bool,
+        time_matches: dict[CompiledCondition, bool] | None = None,
+    ) -> bool:
+        """Evaluates whether context matches compiled conditions, return False otherwise
 
-            if not self._match_by_action(action=cond_action, condition_value=cond_value, context_value=context_value):
+        Time based conditions don't depend on context, their results are reused from `time_matches` when provided.
+        """
+        if not rule.conditions:
+            if debug:
                 self.logger.debug(
-                    f"rule did not match action, rule_name={rule_name}, rule_value={rule_match_value}, "
-                    f"name={feature_name}, context_value={str(context_value)} ",
+                    f"rule did not match, no conditions to match, rule_name={rule.name}, "
+                    f"rule_value={rule.match_value}, name={feature_name} ",
                 )
+            return False
+
+        for condition in rule.conditions:
+            # time based rule actions have no user context. the context is the condition key, e.g., CURRENT_TIME
+            context_value = condition.key if condition.time_based else context.get(condition.key)
+
+            if condition.time_based and time_matches is not None and condition in time_matches:
+                matched = time_matches[condition]
+            else:
+                try:
+                    matched = condition.matcher(context_value)
+                except Exception as exc:
+                    matched = self._handle_match_exception(action=condition.action, exc=exc)
+
+                if condition.time_based and time_matches is not None:
+                    time_matches[condition] = matched
+
+            if not matched:
+                if debug:
+                    self.logger.debug(
+                        f"rule did not match action, rule_name={rule.name}, rule_value={rule.match_value}, "
+                        f"name={feature_name}, context_value={str(context_value)} ",
+                    )
                 return False  # context doesn't match condition
 
-        self.logger.debug(f"rule matched, rule_name={rule_name}, rule_value={rule_match_value}, name={feature_name}")
+        if debug:
+            self.logger.debug(
+                f"rule matched, rule_name={rule.name}, rule_value={rule.match_value}, name={feature_name}",
+            )
         return True
 
     def _evaluate_rules(
         self,
         *,
-        feature_name: str,
+        feature: CompiledFeature,
         context: dict[str, Any],
-        feat_default: Any,
-        rules: dict[str, Any],
-        boolean_feature: bool,
-    ) -> bool:
+        debug: bool,
+        time_matches: dict[CompiledCondition, bool] | None = None,
+    ) -> Any:
         """Evaluates whether context matches rules and conditions, otherwise return feature default"""
-        for rule_name, rule in rules.items():
-            rule_match_value = rule.get(schema.RULE_MATCH_VALUE)
-
+        for rule in feature.rules:
             # Context might contain PII data; do not log its value
-            self.logger.debug(
-                f"Evaluating rule matching, rule={rule_name}, feature={feature_name}, default={str(feat_default)}, boolean_feature={boolean_feature}",  # noqa: E501
-            )
-            if self._evaluate_conditions(rule_name=rule_name, feature_name=feature_name, rule=rule, context=context):
+            if debug:
+                self.logger.debug(
+                    f"Evaluating rule matching, rule={rule.name}, feature={feature.name}, default={str(feature.default)}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+                )
+            if self._evaluate_compiled_conditions(
+                rule=rule,
+                feature_name=feature.name,
+                context=context,
+                debug=debug,
+                time_matches=time_matches,
+            ):
                 # Maintenance: Revisit before going GA.
-                return bool(rule_match_value) if boolean_feature else rule_match_value
+                return bool(rule.match_value) if feature.boolean_feature else rule.match_value
 
         # no rule matched, return default value of feature
-        self.logger.debug(
-            f"no rule matched, returning feature default, default={str(feat_default)}, name={feature_name}, boolean_feature={boolean_feature}",  # noqa: E501
-        )
-        return feat_default
+        if debug:
+            self.logger.debug(
+                f"no rule matched, returning feature default, default={str(feature.default)}, name={feature.name}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+            )
+        return feature.default
+
+    def _evaluate_rules_many(
+        self,
+        *,
+        feature: CompiledFeature,
+        contexts: list[dict[str, Any]],
+        debug: bool,
+        time_matches: dict[CompiledCondition, bool],
+    ) -> list[Any]:
+        """Evaluates rules for each context, reusing results for contexts with the same values for the keys used"""
+        results: dict[tuple, Any] = {}
+        values: list[Any] = []
+
+        for context in contexts:
+            # contexts are grouped by the values of the keys referenced in conditions; other keys can't change results
+            group = tuple(context.get(key) for key in feature.context_keys)
+            try:
+                value = results[group]
+            except KeyError:
+                value = results[group] = self._evaluate_rules(
+                    feature=feature,
+                    context=context,
+                    debug=debug,
+                    time_matches=time_matches,
+                )
+            except TypeError:  # unhashable context values, e.g. lists
+                value = self._evaluate_rules(feature=feature, context=context, debug=debug, time_matches=time_matches)
+
+            values.append(value)
+
+        return values
+
+    def _get_compiled_features(self) -> dict[str, CompiledFeature]:
+        """Get features compiled from the validated configuration, compiling it only when the store returns a new one
+
+        Stores like AppConfigStore return the same configuration object until it changes.
+        """
+        self.logger.debug(f"Fetching schema from registered store, store={self.store}")
+        config: dict = self.store.get_configuration()
+
+        last_config, compiled = self._compiled
+        if config is last_config:
+            return compiled
+
+        validator = schema.SchemaValidator(schema=config, logger=self.logger)
+        validator.validate()
+
+        compiled = compile_features(config)
+        self._compiled = (config, compiled)
+
+        return compiled
 
     def get_configuration(self) -> dict:
         """Get validated feature flag schema from configured store.
@@ -205,12 +296,10 @@ class FeatureFlags:
         ```
         """
         # parse result conf as JSON, keep in cache for max age defined in store
-        self.logger.debug(f"Fetching schema from registered store, store={self.store}")
-        config: dict = self.store.get_configuration()
-        validator = schema.SchemaValidator(schema=config, logger=self.logger)
-        validator.validate()
+        self._get_compiled_features()
 
-        return config
+        # configuration the features were compiled from, which has been validated
+        return cast(dict, self._compiled[0])
 
     def evaluate(self, *, name: str, context: dict[str, Any] | None = None, default: JSONType) -> JSONType:
         """Evaluate whether a feature flag should be enabled according to stored schema and input context
@@ -289,7 +378,7 @@ class FeatureFlags:
             context = {}
 
         try:
-            features = self.get_configuration()
+            features = self._get_compiled_features()
         except ConfigurationStoreError as err:
             self.logger.debug(f"Failed to fetch feature flags from store, returning default provided, reason={err}")
             return default
@@ -299,34 +388,27 @@ class FeatureFlags:
             self.logger.debug(f"Feature not found; returning default provided, name={name}, default={default}")
             return default
 
-        rules = feature.get(schema.RULES_KEY)
-        feat_default = feature.get(schema.FEATURE_DEFAULT_VAL_KEY)
+        debug = self._is_debug_enabled()
+
         # Maintenance: Revisit before going GA. We might to simplify customers on-boarding by not requiring it
         # for non-boolean flags. It'll need minor implementation changes, docs changes, and maybe refactor
         # get_enabled_features. We can minimize breaking change, despite Beta label, by having a new
         # method `get_matching_features` returning dict[feature_name, feature_value]
-        boolean_feature = feature.get(
-            schema.FEATURE_DEFAULT_VAL_TYPE_KEY,
-            True,
-        )  # backwards compatibility, assume feature flag
-        if not rules:
-            self.logger.debug(
-                f"no rules found, returning feature default, name={name}, default={str(feat_default)}, boolean_feature={boolean_feature}",  # noqa: E501
-            )
+        if not feature.rules:
+            if debug:
+                self.logger.debug(
+                    f"no rules found, returning feature default, name={name}, default={str(feature.default)}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+                )
             # Maintenance: Revisit before going GA. We might to simplify customers on-boarding by not requiring it
             # for non-boolean flags.
-            return bool(feat_default) if boolean_feature else feat_default
+            return bool(feature.default) if feature.boolean_feature else feature.default
 
-        self.logger.debug(
-            f"looking for rule match, name={name}, default={str(feat_default)}, boolean_feature={boolean_feature}",  # noqa: E501
-        )
-        return self._evaluate_rules(
-            feature_name=name,
-            context=context,
-            feat_default=feat_default,
-            rules=rules,
-            boolean_feature=boolean_feature,
-        )
+        if debug:
+            self.logger.debug(
+                f"looking for rule match, name={name}, default={str(feature.default)}, boolean_feature={feature.boolean_feature}",  # noqa: E501
+            )
+        with clock_snapshot():
+            return self._evaluate_rules(feature=feature, context=context, debug=debug)
 
     def get_enabled_features(self, *, context: dict[str, Any] | None = None) -> list[str]:
         """Get all enabled feature flags while also taking into account context
@@ -360,32 +442,152 @@ class FeatureFlags:
         features_enabled: list[str] = []
 
         try:
-            features: dict[str, Any] = self.get_configuration()
+            features = self._get_compiled_features()
         except ConfigurationStoreError as err:
             self.logger.debug(f"Failed to fetch feature flags from store, returning empty list, reason={err}")
             return features_enabled
 
+        debug = self._is_debug_enabled()
+
         self.logger.debug("Evaluating all features")
-        for name, feature in features.items():
-            rules = feature.get(schema.RULES_KEY, {})
-            feature_default_value = feature.get(schema.FEATURE_DEFAULT_VAL_KEY)
-            boolean_feature = feature.get(
-                schema.FEATURE_DEFAULT_VAL_TYPE_KEY,
-                True,
-            )  # backwards compatibility, assume feature flag
-
-            if feature_default_value and not rules:
-                self.logger.debug(f"feature is enabled by default and has no defined rules, name={name}")
-                features_enabled.append(name)
-            elif self._evaluate_rules(
-                feature_name=name,
-                context=context,
-                feat_default=feature_default_value,
-                rules=rules,
-                boolean_feature=boolean_feature,
-            ):
-                self.logger.debug(f"feature's calculated value is True, name={name}")
-                features_enabled.append(name)
+        with clock_snapshot():
+            for name, feature in features.items():
+                if feature.default and not feature.rules:
+                    if debug:
+                        self.logger.debug(f"feature is enabled by default and has no defined rules, name={name}")
+                    features_enabled.append(name)
+                elif self._evaluate_rules(feature=feature, context=context, debug=debug):
+                    if debug:
+                        self.logger.debug(f"feature's calculated value is True, name={name}")
+                    features_enabled.append(name)
+
+        return features_enabled
+
+    def evaluate_many(
+        self,
+        *,
+        name: str,
+        contexts: Sequence[dict[str, Any] | None],
+        default: JSONType,
+    ) -> list[JSONType]:
+        """Evaluate a feature flag for each context, e.g. one per record in a batch
+
+        Same as calling `evaluate` for each context, except configuration is fetched and compiled once,
+        time based conditions are evaluated once, and rules are evaluated once for contexts sharing the
+        same values for the keys referenced in conditions.
+
+        Parameters
+        ----------
+        name: str
+            feature name to evaluate
+        contexts: Sequence[dict[str, Any] | None]
+            Attributes that should be evaluated against the stored schema, one dict per evaluation
+
+            for example: `[{"tenant_id": "X", "username": "Y"}, {"tenant_id": "Z", "username": "W"}]`
+        default: JSONType
+            default value if feature flag doesn't exist in the schema,
+            or there has been an error when fetching the configuration from the store
+            Can be boolean or any JSON values for non-boolean features.
+
+        Returns
+        ------
+        list[JSONType]
+            whether feature should be enabled (bool flags) or JSON value when non-bool feature matches,
+            in the same order as contexts
+
+        Raises
+        ------
+        SchemaValidationError
+            When schema doesn't conform with feature flag schema
+
+        Example
+        -------
+        ```python
+        from aws_lambda_powertools.utilities.feature_flags import AppConfigStore, FeatureFlags
+
+        app_config = AppConfigStore(environment="dev", application="product-catalogue", name="features")
+        feature_flags = FeatureFlags(store=app_config)
+
+        def lambda_handler(event: dict, context):
+            contexts = [{"tenant_id": record["tenant_id"]} for record in event["Records"]]
+            premium = feature_flags.evaluate_many(name="premium_features", contexts=contexts, default=False)
+        ```
+        """
+        try:
+            features = self._get_compiled_features()
+        except ConfigurationStoreError as err:
+            self.logger.debug(f"Failed to fetch feature flags from store, returning default provided, reason={err}")
+            return [default] * len(contexts)
+
+        feature = features.get(name)
+        if feature is None:
+            self.logger.debug(f"Feature not found; returning default provided, name={name}, default={default}")
+            return [default] * len(contexts)
+
+        if not feature.rules:
+            self.logger.debug(f"no rules found, returning feature default for all contexts, name={name}")
+            return [bool(feature.default) if feature.boolean_feature else feature.default] * len(contexts)
+
+        with clock_snapshot():
+            return self._evaluate_rules_many(
+                feature=feature,
+                contexts=[context or {} for context in contexts],
+                debug=self._is_debug_enabled(),
+                time_matches={},
+            )
+
+    def get_enabled_features_many(self, *, contexts: Sequence[dict[str, Any] | None]) -> list[list[str]]:
+        """Get all enabled feature flags for each context, e.g. one per record in a batch
+
+        Same as calling `get_enabled_features` for each context, except configuration is fetched and
+        compiled once, time based conditions are evaluated once, and rules are evaluated once for contexts
+        sharing the same values for the keys referenced in conditions.
+
+        Parameters
+        ----------
+        contexts: Sequence[dict[str, Any] | None]
+            Attributes that you would like to match the rules against, one dict per evaluation
+
+        Returns
+        ----------
+        list[list[str]]
+            list of all feature names that either matches context or have True as default, for each context
+            in the same order as contexts
+
+        Raises
+        ------
+        SchemaValidationError
+            When schema doesn't conform with feature flag schema
+        """
+        features_enabled: list[list[str]] = [[] for _ in contexts]
+
+        try:
+            features = self._get_compiled_features()
+        except ConfigurationStoreError as err:
+            self.logger.debug(f"Failed to fetch feature flags from store, returning empty lists, reason={err}")
+            return features_enabled
+
+        debug = self._is_debug_enabled()
+        time_matches: dict[CompiledCondition, bool] = {}
+        evaluated_contexts = [context or {} for context in contexts]
+
+        self.logger.debug("Evaluating all features for all contexts")
+        with clock_snapshot():
+            for name, feature in features.items():
+                if feature.default and not feature.rules:
+                    for enabled in features_enabled:
+                        enabled.append(name)
+                    continue
+
+                values = self._evaluate_rules_many(
+                    feature=feature,
+                    contexts=evaluated_contexts,
+                    debug=debug,
+                    time_matches=time_matches,
+                )
+                for enabled, value in zip(features_enabled, values):
+                    if value:
+                        enabled.append(name)
 
         return features_enabled
 
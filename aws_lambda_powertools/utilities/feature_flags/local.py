@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aws_lambda_powertools.utilities import jmespath_utils
+from aws_lambda_powertools.utilities.feature_flags.base import StoreProvider
+from aws_lambda_powertools.utilities.feature_flags.exceptions import ConfigurationStoreError
+
+if TYPE_CHECKING:
+    import os
+
+    from aws_lambda_powertools.logging import Logger
+
+
+class InMemoryStore(StoreProvider):
+    def __init__(
+        self,
+        configuration: dict[str, Any],
+        envelope: str | None = "",
+        jmespath_options: dict | None = None,
+        logger: logging.Logger | Logger | None = None,
+    ):
+        """This class holds feature flags configuration in memory, e.g. for local development and testing
+
+        The same configuration object is returned until it's replaced with `update`, so `FeatureFlags`
+        validates and compiles its rules only once.
+
+        Parameters
+        ----------
+        configuration: dict[str, Any]
+            Feature flags configuration, or configuration to extract feature flags from when using `envelope`
+        envelope : str | None
+            JMESPath expression to pluck feature flags data from config
+        jmespath_options : dict | None
+            Alternative JMESPath options to be included when filtering expr
+        logger: A logging object
+            Used to log messages. If None is supplied, one will be created.
+        """
+        super().__init__()
+        self.logger = logger or logging.getLogger(__name__)
+        self.envelope = envelope
+        self.jmespath_options = jmespath_options
+        self._raw_configuration: dict[str, Any] = {}
+        self._configuration: dict[str, Any] = {}
+        self.update(configuration)
+
+    def update(self, configuration: dict[str, Any]) -> None:
+        """Replace the configuration held in memory"""
+        config = configuration
+
+        if self.envelope:
+            self.logger.debug("Envelope enabled; extracting data from config", extra={"envelope": self.envelope})
+            config = jmespath_utils.query(
+                data=configuration,
+                envelope=self.envelope,
+                jmespath_options=self.jmespath_options,
+            )
+
+        self._raw_configuration = configuration
+        self._configuration = config
+
+    @property
+    def get_raw_configuration(self) -> dict[str, Any]:
+        """Get configuration held in memory"""
+        return self._raw_configuration
+
+    def get_configuration(self) -> dict[str, Any]:
+        """Get feature flags configuration held in memory
+
+        If envelope is set, it'll return feature flags extracted from configuration,
+        otherwise it'll return the entire configuration.
+
+        Returns
+        -------
+        dict[str, Any]
+            parsed JSON dictionary
+        """
+        return self._configuration
+
+
+class LocalFileStore(StoreProvider):
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        max_age: int = 5,
+        envelope: str | None = "",
+        jmespath_options: dict | None = None,
+        logger: logging.Logger | Logger | None = None,
+    ):
+        """This class reads feature flags configuration from a local JSON file, e.g. packaged with your function
+
+        The file is parsed on first use and reloaded when its modification time changes, which is checked
+        at most once every `max_age` seconds. The same configuration object is returned until the
+        file is reloaded, so `FeatureFlags` validates and compiles its rules only once per file version.
+
+        Parameters
+        ----------
+        path: str | os.PathLike
+            Path to the JSON file, e.g. `features.json`, or `/opt/features.json` when shipped in a Lambda Layer
+        max_age: int
+            How often, in seconds, to check whether the file changed. Use 0 to check on every evaluation.
+        envelope : str | None
+            JMESPath expression to pluck feature flags data from config
+        jmespath_options : dict | None
+            Alternative JMESPath options to be included when filtering expr
+        logger: A logging object
+            Used to log messages. If None is supplied, one will be created.
+        """
+        super().__init__()
+        self.logger = logger or logging.getLogger(__name__)
+        self.path = Path(path)
+        self.cache_seconds = max_age
+        self.envelope = envelope
+        self.jmespath_options = jmespath_options
+        self._snapshot: InMemoryStore | None = None
+        self._file_version: tuple[int, int] | None = None
+        self._next_check = 0.0
+
+    @property
+    def get_raw_configuration(self) -> dict[str, Any]:
+        """Get configuration from the local file"""
+        return self._get_snapshot().get_raw_configuration
+
+    def get_configuration(self) -> dict[str, Any]:
+        """Get feature flags configuration from the local file
+
+        If envelope is set, it'll return feature flags extracted from configuration,
+        otherwise it'll return the entire configuration from the file.
+
+        Raises
+        ------
+        ConfigurationStoreError
+            When the file can't be read or isn't valid JSON
+
+        Returns
+        -------
+        dict[str, Any]
+            parsed JSON dictionary
+        """
+        return self._get_snapshot().get_configuration()
+
+    def _get_snapshot(self) -> InMemoryStore:
+        now = time.monotonic()
+        if self._snapshot is not None and now < self._next_check:
+            return self._snapshot
+
+        try:
+            stat = self.path.stat()
+            # size is also compared, as file systems can have a coarse modification time resolution
+            file_version = (stat.st_mtime_ns, stat.st_size)
+
+            if self._snapshot is None or file_version != self._file_version:
+                self.logger.debug("Loading configuration from file", extra={"path": str(self.path)})
+                with self.path.open("rb") as f:
+                    configuration = json.load(f)
+
+                self._snapshot = InMemoryStore(
+                    configuration=configuration,
+                    envelope=self.envelope,
+                    jmespath_options=self.jmespath_options,
+                    logger=self.logger,
+                )
+                self._file_version = file_version
+        except (OSError, ValueError) as exc:
+            raise ConfigurationStoreError(f"Unable to load configuration file {self.path}") from exc
+
+        self._next_check = now + self.cache_seconds
+        return self._snapshot
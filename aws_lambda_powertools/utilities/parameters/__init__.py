@@ -3,15 +3,26 @@ Parameter retrieval and caching utility
 """
 
 from .appconfig import AppConfigProvider, get_app_config
-from .base import BaseProvider, clear_caches
+from .base import BaseProvider, clear_caches, refresh_stale_values
+from .cache import BaseCache, CacheStats, InMemoryCache, get_default_cache
 from .dynamodb import DynamoDBProvider
 from .exceptions import GetParameterError, TransformParameterError
 from .secrets import SecretsProvider, get_secret, set_secret
-from .ssm import SSMProvider, get_parameter, get_parameters, get_parameters_by_name, set_parameter
+from .ssm import (
+    SSMProvider,
+    get_parameter,
+    get_parameters,
+    get_parameters_by_name,
+    get_parameters_by_name_async,
+    set_parameter,
+)
 
 __all__ = [
     "AppConfigProvider",
     "BaseProvider",
+    "BaseCache",
+    "CacheStats",
+    "InMemoryCache",
     "GetParameterError",
     "DynamoDBProvider",
     "SecretsProvider",
@@ -22,7 +33,10 @@ __all__ = [
     "set_parameter",
     "get_parameters",
     "get_parameters_by_name",
+    "get_parameters_by_name_async",
     "get_secret",
     "set_secret",
     "clear_caches",
+    "refresh_stale_values",
+    "get_default_cache",
 ]
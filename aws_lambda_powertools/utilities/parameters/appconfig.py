@@ -4,27 +4,29 @@ AWS App Config configuration retrieval and caching utility
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
 import warnings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import boto3
 
 from aws_lambda_powertools.shared import constants
-from aws_lambda_powertools.shared.functions import (
-    resolve_env_var_choice,
-    resolve_max_age,
-)
+from aws_lambda_powertools.shared.functions import resolve_env_var_choice
 from aws_lambda_powertools.utilities.parameters.base import BaseProvider
-from aws_lambda_powertools.utilities.parameters.constants import DEFAULT_MAX_AGE_SECS, DEFAULT_PROVIDERS
+from aws_lambda_powertools.utilities.parameters.constants import DEFAULT_PROVIDERS
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
     from botocore.config import Config
     from mypy_boto3_appconfigdata.client import AppConfigDataClient
 
+    from aws_lambda_powertools.utilities.parameters.cache import BaseCache
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
+logger = logging.getLogger(__name__)
+
 
 class AppConfigProvider(BaseProvider):
     """
@@ -42,6 +44,8 @@ class AppConfigProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: AppConfigDataClient, optional
             Boto3 AppConfigData Client to use, boto3_session will be ignored if both are provided
+    cache: BaseCache, optional
+            Cache backend to store values in, by default a bounded in-memory cache shared by all providers
 
     Example
     -------
@@ -79,12 +83,13 @@ class AppConfigProvider(BaseProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: AppConfigDataClient | None = None,
+        cache: BaseCache | None = None,
     ):
         """
         Initialize the App Config client
         """
 
-        super().__init__()
+        super().__init__(cache=cache)
 
         if config:
             warnings.warn(
@@ -110,8 +115,40 @@ class AppConfigProvider(BaseProvider):
         self._next_token: dict[str, str] = {}  # nosec - token for get_latest_configuration executions
         # Dict to store the recently retrieved value for a specific configuration.
         self.last_returned_value: dict[str, bytes] = {}
-
-        super().__init__(client=self.client)
+        # Content hash of the most recently retrieved value, to detect configuration changes
+        self._etags: dict[str, str] = {}
+        # Minimum seconds before polling each configuration again, as requested by AppConfig
+        self._next_poll_interval: dict[str, int] = {}
+        # Configurations retrieved without an explicit max_age, cached for at least their poll interval
+        self._default_max_age: set[str] = set()
+        # Most recently transformed value for a configuration and transform, along with the etag it was transformed from
+        self._transformed: dict[tuple[str, TransformOptions], tuple[str, Any]] = {}
+
+        super().__init__(client=self.client, cache=cache)
+
+    def get(
+        self,
+        name: str,
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        force_fetch: bool = False,
+        stale_while_revalidate: int | None = None,
+        **sdk_options,
+    ) -> str | bytes | dict | None:
+        # An explicit max_age, either as argument or environment variable, takes precedence over the poll interval
+        if max_age is None and os.getenv(constants.PARAMETERS_MAX_AGE_ENV) is None:
+            self._default_max_age.add(name)
+        else:
+            self._default_max_age.discard(name)
+
+        return super().get(
+            name,
+            max_age=max_age,
+            transform=transform,
+            force_fetch=force_fetch,
+            stale_while_revalidate=stale_while_revalidate,
+            **sdk_options,
+        )
 
     def _get(self, name: str, **sdk_options) -> bytes:
         """
@@ -137,6 +174,8 @@ class AppConfigProvider(BaseProvider):
         response = self.client.get_latest_configuration(ConfigurationToken=self._next_token[name])
         return_value = response["Configuration"].read()
         self._next_token[name] = response["NextPollConfigurationToken"]
+        if "NextPollIntervalInSeconds" in response:
+            self._next_poll_interval[name] = response["NextPollIntervalInSeconds"]
 
         # The return of get_latest_configuration can be null because this value is supposed to be cached
         # on the customer side.
@@ -144,9 +183,64 @@ class AppConfigProvider(BaseProvider):
         # See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/appconfigdata/client/get_latest_configuration.html
         if return_value:
             self.last_returned_value[name] = return_value
+            self._etags[name] = hashlib.sha256(return_value).hexdigest()
 
         return self.last_returned_value[name]
 
+    def get_etag(self, name: str) -> str | None:
+        """
+        Return an identifier of the latest configuration retrieved, which changes when its content changes
+
+        Parameters
+        ----------
+        name: str
+            Name of the configuration
+
+        Returns
+        -------
+        str | None
+            SHA-256 hex digest of the configuration content, or None if it wasn't retrieved yet
+
+        Example
+        -------
+        **Rebuild derived state only when the configuration changes**
+
+            >>> from aws_lambda_powertools.utilities import parameters
+            >>>
+            >>> appconf_provider = parameters.AppConfigProvider(environment="my_env", application="my_app")
+            >>>
+            >>> config = appconf_provider.get("my_conf", transform="json")
+            >>> if appconf_provider.get_etag("my_conf") != last_etag:
+            ...     rebuild(config)
+        """
+        return self._etags.get(name)
+
+    def add_to_cache(self, key: tuple, value: Any, max_age: int):
+        # AppConfig rejects polling a configuration again before NextPollIntervalInSeconds
+        next_poll_interval = self._next_poll_interval.get(key[0], 0)
+        if max_age > 0 and key[0] in self._default_max_age:
+            max_age = max(max_age, next_poll_interval)
+        elif 0 < max_age < next_poll_interval:
+            logger.debug(
+                f"max_age {max_age} for configuration {key[0]} is shorter than the "
+                f"{next_poll_interval} seconds AppConfig asks to wait before polling again",
+            )
+
+        super().add_to_cache(key=key, value=value, max_age=max_age)
+
+    def _transform(self, name: str, value: Any, transform: TransformOptions) -> Any:
+        # Unchanged configurations are returned as the last value, no need to transform it again
+        etag = self._etags.get(name)
+        last_etag, last_transformed = self._transformed.get((name, transform), (None, None))
+        if etag is not None and etag == last_etag:
+            return last_transformed
+
+        transformed = super()._transform(name=name, value=value, transform=transform)
+        if etag is not None:
+            self._transformed[(name, transform)] = (etag, transformed)
+
+        return transformed
+
     def _get_multiple(self, path: str, **sdk_options) -> dict[str, str]:
         """
         Retrieving multiple parameter values is not supported with AWS App Config Provider
@@ -211,9 +305,6 @@ def get_app_config(
         >>> print(value)
         My configuration's JSON value
     """
-    # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
-    max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
-
     # Only create the provider if this function is called at least once
     if "appconfig" not in DEFAULT_PROVIDERS:
         DEFAULT_PROVIDERS["appconfig"] = AppConfigProvider(environment=environment, application=application)
@@ -4,13 +4,19 @@ Base for Parameter providers
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import functools
+import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, cast, overload
 
 from aws_lambda_powertools.shared import constants, user_agent
-from aws_lambda_powertools.shared.functions import resolve_max_age
+from aws_lambda_powertools.shared.functions import resolve_max_age, resolve_truthy_env_var_choice
+from aws_lambda_powertools.utilities.parameters.cache import BaseCache, NotFoundValue, ProviderCache, get_default_cache
 from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError, TransformParameterError
 
 if TYPE_CHECKING:
@@ -20,23 +26,32 @@ if TYPE_CHECKING:
 from aws_lambda_powertools.utilities.parameters.constants import (
     DEFAULT_MAX_AGE_SECS,
     DEFAULT_PROVIDERS,
+    DEFAULT_STALE_WHILE_REVALIDATE_SECS,
+    NOT_FOUND_ERROR_CODES,
     TRANSFORM_METHOD_MAPPING,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ExpirableValue(NamedTuple):
-    value: str | bytes | dict[str, Any]
-    ttl: datetime
+    value: str | bytes | dict[str, Any] | NotFoundValue
+    ttl: float  # expiration as per time.monotonic()
 
 
 class BaseProvider(ABC):
     """
     Abstract Base Class for Parameter providers
+
+    Parameters
+    ----------
+    cache: BaseCache, optional
+        Cache backend to store values in, by default a bounded in-memory cache shared by all providers
     """
 
-    store: dict[tuple, ExpirableValue]
+    store: ProviderCache
 
-    def __init__(self, *, client=None, resource=None):
+    def __init__(self, *, client=None, resource=None, cache: BaseCache | None = None):
         """
         Initialize the base provider
         """
@@ -45,10 +60,44 @@ class BaseProvider(ABC):
         if resource is not None:
             user_agent.register_feature_to_resource(resource=resource, feature="parameters")
 
-        self.store: dict[tuple, ExpirableValue] = {}
+        self.cache = cache if cache is not None else get_default_cache()
+        self.store = ProviderCache(backend=self.cache)
+
+        # Stale values waiting to be refreshed, and refreshes in-flight; guarded by `_refresh_lock`
+        self._pending_refresh: dict[tuple, Callable[[], Any]] = {}
+        self._refresh_in_flight: set[tuple] = set()
+        self._refresh_lock = threading.Lock()
+
+    def has_not_expired_in_cache(self, key: tuple, *, record_miss: bool = True) -> bool:
+        cached = self.store.get(key)
+        if cached is not None and cached.ttl >= time.monotonic():
+            self.cache.record_hit(negative=isinstance(cached.value, NotFoundValue))
+            return True
+
+        if record_miss:
+            self.cache.record_miss()
+        return False
+
+    def is_within_stale_window(self, key: tuple, stale_while_revalidate: int) -> bool:
+        """Whether an expired cached value can still be served while it's refreshed
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key
+        stale_while_revalidate : int
+            How long (in seconds) after expiration a cached value can still be served
+
+        Returns
+        -------
+        bool
+            True if the value is cached and expired less than `stale_while_revalidate` seconds ago
+        """
+        cached = self.store.get(key)
+        if stale_while_revalidate <= 0 or cached is None or isinstance(cached.value, NotFoundValue):
+            return False
 
-    def has_not_expired_in_cache(self, key: tuple) -> bool:
-        return key in self.store and self.store[key].ttl >= datetime.now()
+        return cached.ttl + stale_while_revalidate >= time.monotonic()
 
     def get(
         self,
@@ -56,6 +105,7 @@ class BaseProvider(ABC):
         max_age: int | None = None,
         transform: TransformOptions = None,
         force_fetch: bool = False,
+        stale_while_revalidate: int | None = None,
         **sdk_options,
     ) -> str | bytes | dict | None:
         """
@@ -73,6 +123,9 @@ class BaseProvider(ABC):
             values.
         force_fetch: bool, optional
             Force update even before a cached item has expired, defaults to False
+        stale_while_revalidate: int, optional
+            For how long (in seconds) an expired cached value can still be returned while it's refreshed,
+            defaults to 0 (disabled)
         sdk_options: dict, optional
             Arguments that will be passed directly to the underlying API call
 
@@ -94,23 +147,47 @@ class BaseProvider(ABC):
         # of supported transform is small and the probability that a given
         # parameter will always be used in a specific transform, this should be
         # an acceptable tradeoff.
-        value: str | bytes | dict | None = None
         key = self._build_cache_key(name=name, transform=transform)
 
         # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
         max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
+        stale_while_revalidate = resolve_max_age(
+            env=os.getenv(constants.PARAMETERS_STALE_WHILE_REVALIDATE_ENV, DEFAULT_STALE_WHILE_REVALIDATE_SECS),
+            choice=stale_while_revalidate,
+        )
 
         if not force_fetch and self.has_not_expired_in_cache(key):
             return self.fetch_from_cache(key)
 
+        fetch = functools.partial(self._fetch_and_cache, name, key, max_age, transform, **sdk_options)
+
+        if not force_fetch and self.is_within_stale_window(key, stale_while_revalidate):
+            stale_value = self.fetch_from_cache(key)
+            self._revalidate(key=key, fetch=fetch)
+            return stale_value
+
+        return fetch()
+
+    def _fetch_and_cache(
+        self,
+        name: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions = None,
+        **sdk_options,
+    ) -> str | bytes | dict | None:
+        value: str | bytes | dict | None = None
+
         try:
             value = self._get(name, **sdk_options)
         # Encapsulate all errors into a generic GetParameterError
         except Exception as exc:
+            if self._is_not_found_error(exc):
+                self.add_not_found_to_cache(key=key, error=str(exc))
             raise GetParameterError(str(exc))
 
         if transform:
-            value = transform_value(key=name, value=value, transform=transform, raise_on_transform_error=True)
+            value = self._transform(name=name, value=value, transform=transform)
 
         # NOTE: don't cache None, as they might've been failed transforms and may be corrected
         if value is not None:
@@ -118,6 +195,10 @@ class BaseProvider(ABC):
 
         return value
 
+    def _transform(self, name: str, value: Any, transform: TransformOptions) -> Any:
+        """Transform a value retrieved by `_get`, raising TransformParameterError on failure"""
+        return transform_value(key=name, value=value, transform=transform, raise_on_transform_error=True)
+
     @abstractmethod
     def _get(self, name: str, **sdk_options) -> str | bytes | dict[str, Any]:
         """
@@ -138,6 +219,7 @@ class BaseProvider(ABC):
         transform: TransformOptions = None,
         raise_on_transform_error: bool = False,
         force_fetch: bool = False,
+        stale_while_revalidate: int | None = None,
         **sdk_options,
     ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
         """
@@ -158,6 +240,9 @@ class BaseProvider(ABC):
             return a None value for each transform that failed
         force_fetch: bool, optional
             Force update even before a cached item has expired, defaults to False
+        stale_while_revalidate: int, optional
+            For how long (in seconds) expired cached values can still be returned while they're refreshed,
+            defaults to 0 (disabled)
         sdk_options: dict, optional
             Arguments that will be passed directly to the underlying API call
 
@@ -173,10 +258,40 @@ class BaseProvider(ABC):
 
         # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
         max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
+        stale_while_revalidate = resolve_max_age(
+            env=os.getenv(constants.PARAMETERS_STALE_WHILE_REVALIDATE_ENV, DEFAULT_STALE_WHILE_REVALIDATE_SECS),
+            choice=stale_while_revalidate,
+        )
 
         if not force_fetch and self.has_not_expired_in_cache(key):
             return self.fetch_from_cache(key)
 
+        fetch = functools.partial(
+            self._fetch_multiple_and_cache,
+            path,
+            key,
+            max_age,
+            transform,
+            raise_on_transform_error,
+            **sdk_options,
+        )
+
+        if not force_fetch and self.is_within_stale_window(key, stale_while_revalidate):
+            stale_value = self.fetch_from_cache(key)
+            self._revalidate(key=key, fetch=fetch)
+            return stale_value
+
+        return fetch()
+
+    def _fetch_multiple_and_cache(
+        self,
+        path: str,
+        key: tuple,
+        max_age: int,
+        transform: TransformOptions = None,
+        raise_on_transform_error: bool = False,
+        **sdk_options,
+    ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
         try:
             values = self._get_multiple(path, **sdk_options)
         # Encapsulate all errors into a generic GetParameterError
@@ -197,17 +312,207 @@ class BaseProvider(ABC):
         """
         raise NotImplementedError()
 
+    async def get_async(
+        self,
+        name: str,
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        force_fetch: bool = False,
+        **kwargs,
+    ) -> str | bytes | dict | None:
+        """
+        Retrieve a parameter value or return the cached value, without blocking the event loop
+
+        Cached values are returned immediately. Otherwise, the value is retrieved in a worker thread
+        using the same cache and transform as `get`, so multiple values can be fetched concurrently.
+
+        Parameters
+        ----------
+        name: str
+            Parameter name
+        max_age: int
+            Maximum age of the cached value
+        transform: str
+            Optional transformation of the parameter value. Supported values
+            are "json" for JSON strings and "binary" for base 64 encoded
+            values.
+        force_fetch: bool, optional
+            Force update even before a cached item has expired, defaults to False
+        kwargs: dict, optional
+            Arguments supported by the provider's `get` method, e.g. `decrypt` or SDK options
+
+        Example
+        -------
+        **Retrieves multiple parameters concurrently**
+
+            >>> import asyncio
+            >>> from aws_lambda_powertools.utilities.parameters import SSMProvider
+            >>> ssm_provider = SSMProvider()
+            >>>
+            >>> async def lambda_handler(event, context):
+            ...     endpoint, api_key = await asyncio.gather(
+            ...         ssm_provider.get_async("/my/endpoint"),
+            ...         ssm_provider.get_async("/my/api_key", decrypt=True),
+            ...     )
+        """
+        key = self._build_cache_key(name=name, transform=transform)
+        if not force_fetch and self.has_not_expired_in_cache(key, record_miss=False):
+            return self.fetch_from_cache(key)
+
+        return await self._run_in_executor(
+            self.get,
+            name,
+            max_age=max_age,
+            transform=transform,
+            force_fetch=force_fetch,
+            **kwargs,
+        )
+
+    async def get_multiple_async(
+        self,
+        path: str,
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        raise_on_transform_error: bool = False,
+        force_fetch: bool = False,
+        **kwargs,
+    ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
+        """
+        Retrieve multiple parameters based on a path prefix, without blocking the event loop
+
+        Parameters
+        ----------
+        path: str
+            Parameter path used to retrieve multiple parameters
+        max_age: int, optional
+            Maximum age of the cached value
+        transform: str, optional
+            Optional transformation of the parameter value. Supported values
+            are "json" for JSON strings, "binary" for base 64 encoded
+            values or "auto" which looks at the attribute key to determine the type.
+        raise_on_transform_error: bool, optional
+            Raises an exception if any transform fails, otherwise this will
+            return a None value for each transform that failed
+        force_fetch: bool, optional
+            Force update even before a cached item has expired, defaults to False
+        kwargs: dict, optional
+            Arguments supported by the provider's `get_multiple` method, e.g. `recursive` or SDK options
+        """
+        key = self._build_cache_key(name=path, transform=transform, is_nested=True)
+        if not force_fetch and self.has_not_expired_in_cache(key, record_miss=False):
+            return self.fetch_from_cache(key)
+
+        return await self._run_in_executor(
+            self.get_multiple,
+            path,
+            max_age=max_age,
+            transform=transform,
+            raise_on_transform_error=raise_on_transform_error,
+            force_fetch=force_fetch,
+            **kwargs,
+        )
+
+    @staticmethod
+    async def _run_in_executor(func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call in the event loop's default executor, preserving context variables"""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(None, functools.partial(context.run, func, *args, **kwargs))
+
+    def refresh_stale_values(self):
+        """Refresh cached values returned stale since the last refresh
+
+        Use it as a hook at the start of an invocation when background refresh is disabled
+        via `POWERTOOLS_PARAMETERS_BACKGROUND_REFRESH=false`. Refresh failures are logged
+        and stale values remain in cache until `max_age + stale_while_revalidate` has passed.
+
+        Example
+        -------
+        **Refresh stale values before handling an event**
+
+            >>> from aws_lambda_powertools.utilities.parameters import SSMProvider
+            >>> ssm_provider = SSMProvider()
+            >>>
+            >>> def lambda_handler(event, context):
+            ...     ssm_provider.refresh_stale_values()
+            ...     value = ssm_provider.get("/my/parameter", max_age=60, stale_while_revalidate=300)
+        """
+        with self._refresh_lock:
+            pending_keys = list(self._pending_refresh)
+
+        for key in pending_keys:
+            self._run_refresh(key)
+
+    def _revalidate(self, key: tuple, fetch: Callable[[], Any]):
+        """Schedule a refresh for a stale cached value, at most once per key at a time"""
+        with self._refresh_lock:
+            if key in self._pending_refresh or key in self._refresh_in_flight:
+                return
+
+            self._pending_refresh[key] = fetch
+
+        background_refresh = resolve_truthy_env_var_choice(
+            env=os.getenv(constants.PARAMETERS_BACKGROUND_REFRESH_ENV, "true"),
+        )
+        if background_refresh:
+            logger.debug(f"Refreshing stale value in the background for key {key}")
+            threading.Thread(target=self._run_refresh, args=(key,), daemon=True).start()
+
+    def _run_refresh(self, key: tuple):
+        with self._refresh_lock:
+            fetch = self._pending_refresh.pop(key, None)
+            if fetch is None:
+                return
+
+            self._refresh_in_flight.add(key)
+
+        try:
+            fetch()
+        except Exception as exc:
+            # Stale value is kept until it's outside the stale window, where it'll be fetched synchronously
+            logger.debug(f"Failed to refresh stale value for key {key}: {exc}")
+        finally:
+            with self._refresh_lock:
+                self._refresh_in_flight.discard(key)
+
     def clear_cache(self):
         self.store.clear()
 
     def fetch_from_cache(self, key: tuple):
-        return self.store[key].value if key in self.store else {}
+        cached = self.store.get(key)
+        if cached is None:
+            return {}
+
+        if isinstance(cached.value, NotFoundValue):
+            raise GetParameterError(cached.value.error)
+
+        return cached.value
 
     def add_to_cache(self, key: tuple, value: Any, max_age: int):
         if max_age <= 0:
             return
 
-        self.store[key] = ExpirableValue(value, datetime.now() + timedelta(seconds=max_age))
+        self.store[key] = ExpirableValue(value, time.monotonic() + max_age)
+
+    def add_not_found_to_cache(self, key: tuple, error: str):
+        """Remember a parameter doesn't exist for the cache negative TTL, if negative caching is enabled"""
+        if self.cache.negative_ttl <= 0:
+            return
+
+        self.store[key] = ExpirableValue(NotFoundValue(error), time.monotonic() + self.cache.negative_ttl)
+
+    @staticmethod
+    def _is_not_found_error(exc: Exception) -> bool:
+        """Whether an exception raised by `_get` means the parameter doesn't exist, used for negative caching"""
+        response = getattr(exc, "response", None)
+        if not isinstance(response, dict):
+            return False
+
+        error = response.get("Error")
+        if not isinstance(error, dict):
+            return False
+
+        return error.get("Code") in NOT_FOUND_ERROR_CODES
 
     def _build_cache_key(
         self,
@@ -355,5 +660,13 @@ def transform_value(
 
 
 def clear_caches():
-    """Clear cached parameter values from all providers"""
+    """Clear cached parameter values from all providers used by high-level functions, e.g. `get_parameter`"""
+    for provider in list(DEFAULT_PROVIDERS.values()):
+        provider.clear_cache()
     DEFAULT_PROVIDERS.clear()
+
+
+def refresh_stale_values():
+    """Refresh stale parameter values from all providers used by high-level functions, e.g. `get_parameter`"""
+    for provider in list(DEFAULT_PROVIDERS.values()):
+        provider.refresh_stale_values()
@@ -0,0 +1,223 @@
+"""
+Cache backends for Parameter providers
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Hashable, Iterator, MutableMapping, NamedTuple
+
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.utilities.parameters.constants import (
+    DEFAULT_CACHE_MAX_ITEMS,
+    DEFAULT_NEGATIVE_CACHE_TTL_SECS,
+)
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.parameters.base import ExpirableValue
+
+
+class NotFoundValue(NamedTuple):
+    """Cached marker for a parameter that doesn't exist (negative caching)"""
+
+    error: str
+
+
+@dataclass
+class CacheStats:
+    """Cache counters, e.g. to be published as metrics
+
+    Attributes
+    ----------
+    hits: int
+        Lookups that returned a non-expired value
+    misses: int
+        Lookups for values that were not cached, or expired
+    negative_hits: int
+        Lookups that returned a cached "parameter not found" marker, also counted as hits
+    evictions: int
+        Values evicted to keep the cache within its maximum size
+    """
+
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+    evictions: int = 0
+
+
+class BaseCache(ABC):
+    """
+    Abstract Base Class for Parameter provider cache backends
+
+    Parameters
+    ----------
+    negative_ttl: int, optional
+        For how long (in seconds) to cache parameters that were not found, by default 0 (disabled)
+    """
+
+    def __init__(self, negative_ttl: int = 0):
+        self.negative_ttl = negative_ttl
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: Hashable) -> ExpirableValue | None:
+        """Return cached value for a given key regardless of its expiration, or None"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, key: Hashable, value: ExpirableValue) -> None:
+        """Cache a value for a given key"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Remove a value from cache, if present"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def keys(self) -> list[Hashable]:
+        """List all cached keys"""
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """Remove all values from cache"""
+        for key in self.keys():
+            self.delete(key)
+
+    def record_hit(self, negative: bool = False) -> None:
+        self.stats.hits += 1
+        if negative:
+            self.stats.negative_hits += 1
+
+    def record_miss(self) -> None:
+        self.stats.misses += 1
+
+    def record_eviction(self) -> None:
+        self.stats.evictions += 1
+
+
+class InMemoryCache(BaseCache):
+    """
+    In-memory cache bounded by number of items, evicting the least recently used value first
+
+    Parameters
+    ----------
+    max_items: int, optional
+        Maximum number of cached values, by default 1024
+    negative_ttl: int, optional
+        For how long (in seconds) to cache parameters that were not found, by default 0 (disabled)
+
+    Example
+    -------
+    **Share a bounded cache between providers and cache parameters not found for 5 seconds**
+
+        >>> from aws_lambda_powertools.utilities.parameters import InMemoryCache, SecretsProvider, SSMProvider
+        >>>
+        >>> cache = InMemoryCache(max_items=256, negative_ttl=5)
+        >>> ssm_provider = SSMProvider(cache=cache)
+        >>> secrets_provider = SecretsProvider(cache=cache)
+        >>>
+        >>> ssm_provider.get("/my/parameter")
+        >>>
+        >>> print(cache.stats)
+        CacheStats(hits=0, misses=1, negative_hits=0, evictions=0)
+    """
+
+    def __init__(self, max_items: int = 1024, negative_ttl: int = 0):
+        super().__init__(negative_ttl=negative_ttl)
+        self.max_items = max_items
+        self._data: OrderedDict[Hashable, ExpirableValue] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> ExpirableValue | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: ExpirableValue) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+                self.record_eviction()
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self) -> list[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class ProviderCache(MutableMapping):
+    """Provider view over a cache backend, so providers sharing a backend don't share keys"""
+
+    _namespaces = itertools.count()
+
+    def __init__(self, backend: BaseCache):
+        self.backend = backend
+        # NOTE: a counter over id() as a new provider could reuse the address of a garbage collected one
+        self._namespace = next(self._namespaces)
+
+    def __getitem__(self, key: Hashable) -> ExpirableValue:
+        value = self.backend.get((self._namespace, key))
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self.backend.get((self._namespace, key))
+        return default if value is None else value
+
+    def __setitem__(self, key: Hashable, value: ExpirableValue) -> None:
+        self.backend.set((self._namespace, key), value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self.backend.delete((self._namespace, key))
+
+    def __contains__(self, key: object) -> bool:
+        return self.backend.get((self._namespace, key)) is not None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter([key[1] for key in self.backend.keys() if key[0] == self._namespace])  # type: ignore[index]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def clear(self) -> None:
+        for key in list(self):
+            del self[key]
+
+
+_default_cache: BaseCache | None = None
+
+
+def get_default_cache() -> BaseCache:
+    """Return the cache backend shared by providers initialized without an explicit cache
+
+    Its size and negative caching can be configured via `POWERTOOLS_PARAMETERS_CACHE_MAX_ITEMS`
+    and `POWERTOOLS_PARAMETERS_NEGATIVE_CACHE_TTL` environment variables.
+    """
+    global _default_cache
+
+    if _default_cache is None:
+        _default_cache = InMemoryCache(
+            max_items=int(os.getenv(constants.PARAMETERS_CACHE_MAX_ITEMS_ENV, DEFAULT_CACHE_MAX_ITEMS)),
+            negative_ttl=int(os.getenv(constants.PARAMETERS_NEGATIVE_CACHE_TTL_ENV, DEFAULT_NEGATIVE_CACHE_TTL_SECS)),
+        )
+
+    return _default_cache
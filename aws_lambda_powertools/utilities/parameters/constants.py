@@ -8,6 +8,14 @@ SSM_PARAMETER_TYPES = Literal["String", "StringList", "SecureString"]
 SSM_PARAMETER_TIER = Literal["Standard", "Advanced", "Intelligent-Tiering"]
 
 DEFAULT_MAX_AGE_SECS = "300"
+DEFAULT_STALE_WHILE_REVALIDATE_SECS = "0"
+DEFAULT_CACHE_MAX_ITEMS = "1024"
+DEFAULT_NEGATIVE_CACHE_TTL_SECS = "0"
+DEFAULT_EXTENSION_HTTP_PORT = "2773"
+DEFAULT_EXTENSION_TIMEOUT_SECS = 5.0
+
+# Error codes returned when a parameter, secret, or configuration doesn't exist
+NOT_FOUND_ERROR_CODES = {"ParameterNotFound", "ResourceNotFoundException"}
 
 # These providers will be dynamically initialized on first use of the helper functions
 DEFAULT_PROVIDERS: dict[str, Any] = {}
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
     from botocore.config import Config
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
 
+    from aws_lambda_powertools.utilities.parameters.cache import BaseCache
+
 
 class DynamoDBProvider(BaseProvider):
     """
@@ -40,6 +42,8 @@ class DynamoDBProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: DynamoDBServiceResource, optional
             Boto3 DynamoDB Resource Client to use; boto3_session will be ignored if both are provided
+    cache: BaseCache, optional
+            Cache backend to store values in, by default a bounded in-memory cache shared by all providers
 
     Example
     -------
@@ -162,6 +166,7 @@ class DynamoDBProvider(BaseProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: DynamoDBServiceResource | None = None,
+        cache: BaseCache | None = None,
     ):
         """
         Initialize the DynamoDB client
@@ -183,7 +188,7 @@ class DynamoDBProvider(BaseProvider):
         self.sort_attr = sort_attr
         self.value_attr = value_attr
 
-        super().__init__(resource=boto3_client)
+        super().__init__(resource=boto3_client, cache=cache)
 
     def _get(self, name: str, **sdk_options) -> str:
         """
@@ -204,6 +209,11 @@ class DynamoDBProvider(BaseProvider):
         # without a breaking change within ABC return type
         return self.table.get_item(**sdk_options)["Item"][self.value_attr]  # type: ignore[return-value]
 
+    @staticmethod
+    def _is_not_found_error(exc: Exception) -> bool:
+        # get_item returns no "Item" when the key doesn't exist
+        return isinstance(exc, KeyError) or BaseProvider._is_not_found_error(exc)
+
     def _get_multiple(self, path: str, **sdk_options) -> dict[str, str]:
         """
         Retrieve multiple parameter values from Amazon DynamoDB
@@ -0,0 +1,147 @@
+"""
+AWS Parameters and Secrets Lambda Extension client
+"""
+
+from __future__ import annotations
+
+import base64
+import http.client
+import json
+import logging
+import os
+import threading
+from typing import Any
+from urllib.parse import urlencode
+
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.utilities.parameters.constants import (
+    DEFAULT_EXTENSION_HTTP_PORT,
+    DEFAULT_EXTENSION_TIMEOUT_SECS,
+    NOT_FOUND_ERROR_CODES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ExtensionUnavailableError(Exception):
+    """When the Parameters and Secrets Lambda Extension can't be reached
+
+    `connection_refused` tells whether nothing listens on the extension port, i.e. the extension isn't running,
+    as opposed to a transient failure like a timeout.
+    """
+
+    def __init__(self, message: str, connection_refused: bool = False):
+        super().__init__(message)
+        self.connection_refused = connection_refused
+
+
+class ExtensionRequestError(Exception):
+    """When the Parameters and Secrets Lambda Extension fails to retrieve a value
+
+    Similar to botocore's `ClientError`, the error code is available in `response["Error"]["Code"]`.
+    """
+
+    def __init__(self, message: str, code: str, status: int):
+        super().__init__(message)
+        self.status = status
+        self.response = {"Error": {"Code": code, "Message": message}}
+
+
+class ParametersExtensionClient:
+    """
+    HTTP client for the AWS Parameters and Secrets Lambda Extension local cache
+
+    A single keep-alive connection to the extension is reused across requests, and recreated when closed.
+
+    Parameters
+    ----------
+    port: int, optional
+        Port the extension listens to, by default `PARAMETERS_SECRETS_EXTENSION_HTTP_PORT` env var or 2773
+    timeout: float, optional
+        Timeout in seconds for each request, by default 5
+
+    Example
+    -------
+    **Retrieves a parameter value through the extension**
+
+        >>> from aws_lambda_powertools.utilities.parameters.extension import ParametersExtensionClient
+        >>> client = ParametersExtensionClient()
+        >>>
+        >>> value = client.get_parameter("/my/parameter", decrypt=True)
+    """
+
+    def __init__(self, port: int | None = None, timeout: float = DEFAULT_EXTENSION_TIMEOUT_SECS):
+        self.port = port or int(os.getenv(constants.PARAMETERS_EXTENSION_HTTP_PORT_ENV, DEFAULT_EXTENSION_HTTP_PORT))
+        self.timeout = timeout
+        self._connection: http.client.HTTPConnection | None = None
+        self._lock = threading.Lock()
+
+    def get_parameter(self, name: str, decrypt: bool = False) -> str:
+        """Retrieve a parameter value from AWS Systems Manager Parameter Store, like ssm:GetParameter"""
+        query = {"name": name, "withDecryption": str(decrypt).lower()}
+        response = self._request(f"/systemsmanager/parameters/get?{urlencode(query)}")
+
+        return response["Parameter"]["Value"]
+
+    def get_secret(self, secret_id: str) -> str | bytes:
+        """Retrieve a secret value from AWS Secrets Manager, like secretsmanager:GetSecretValue"""
+        response = self._request(f"/secretsmanager/get?{urlencode({'secretId': secret_id})}")
+
+        if "SecretString" in response:
+            return response["SecretString"]
+
+        # unlike boto3, the extension returns binary secrets base64 encoded
+        return base64.b64decode(response["SecretBinary"])
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _request(self, path: str) -> dict[str, Any]:
+        headers = {"X-Aws-Parameters-Secrets-Token": os.getenv(constants.AWS_SESSION_TOKEN_ENV, "")}
+
+        with self._lock:
+            # a kept-alive connection may have been closed by the extension while idle, retry once on a fresh one
+            for attempt in range(2):
+                reused = self._connection is not None
+                try:
+                    connection = self._get_connection()
+                    connection.request("GET", path, headers=headers)
+                    response = connection.getresponse()
+                    status, body = response.status, response.read()
+                    break
+                except (http.client.HTTPException, OSError) as exc:
+                    self._close()
+                    if reused and attempt == 0:
+                        continue
+
+                    raise ExtensionUnavailableError(
+                        f"Parameters and Secrets Lambda Extension not reachable: {exc}",
+                        connection_refused=isinstance(exc, ConnectionRefusedError),
+                    ) from exc
+
+        if status != 200:
+            message = body.decode("utf-8", errors="replace")
+            raise ExtensionRequestError(message, code=self._extract_error_code(message), status=status)
+
+        return json.loads(body)
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        if self._connection is None:
+            self._connection = http.client.HTTPConnection("localhost", self.port, timeout=self.timeout)
+
+        return self._connection
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def _extract_error_code(message: str) -> str:
+        # the extension relays the AWS API error within a plain text message
+        for code in NOT_FOUND_ERROR_CODES:
+            if code in message:
+                return code
+
+        return "ExtensionRequestError"
@@ -12,12 +12,13 @@ from typing import TYPE_CHECKING, Literal, overload
 
 import boto3
 
-from aws_lambda_powertools.shared import constants
-from aws_lambda_powertools.shared.functions import resolve_max_age
+from aws_lambda_powertools.shared import constants, user_agent
+from aws_lambda_powertools.shared.functions import resolve_max_age, resolve_truthy_env_var_choice
 from aws_lambda_powertools.shared.json_encoder import Encoder
 from aws_lambda_powertools.utilities.parameters.base import BaseProvider
 from aws_lambda_powertools.utilities.parameters.constants import DEFAULT_MAX_AGE_SECS, DEFAULT_PROVIDERS
 from aws_lambda_powertools.utilities.parameters.exceptions import SetSecretError
+from aws_lambda_powertools.utilities.parameters.extension import ExtensionUnavailableError, ParametersExtensionClient
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
     from mypy_boto3_secretsmanager.client import SecretsManagerClient
     from mypy_boto3_secretsmanager.type_defs import CreateSecretResponseTypeDef
 
+    from aws_lambda_powertools.utilities.parameters.cache import BaseCache
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,11 @@ class SecretsProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: SecretsManagerClient, optional
             Boto3 SecretsManager Client to use, boto3_session will be ignored if both are provided
+    cache: BaseCache, optional
+            Cache backend to store values in, by default a bounded in-memory cache shared by all providers
+    use_extension: bool, optional
+            Retrieve values through the AWS Parameters and Secrets Lambda Extension, falling back to boto3 when
+            it isn't running. Defaults to `POWERTOOLS_PARAMETERS_USE_EXTENSION` env var or False
 
     Example
     -------
@@ -85,6 +92,8 @@ class SecretsProvider(BaseProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: SecretsManagerClient | None = None,
+        cache: BaseCache | None = None,
+        use_extension: bool | None = None,
     ):
         """
         Initialize the Secrets Manager client
@@ -97,12 +106,39 @@ class SecretsProvider(BaseProvider):
                 stacklevel=2,
             )
 
+        use_extension = resolve_truthy_env_var_choice(
+            env=os.getenv(constants.PARAMETERS_USE_EXTENSION_ENV, "false"),
+            choice=use_extension,
+        )
+        self._extension = ParametersExtensionClient() if use_extension else None
+
+        if boto3_client is None and self._extension is not None:
+            # Creating a boto3 client is costly during cold start, defer it until the extension can't be used
+            self._client: SecretsManagerClient | None = None
+            self._boto3_session = boto3_session
+            self._boto_config = boto_config or config
+            super().__init__(cache=cache)
+            return
+
         if boto3_client is None:
             boto3_session = boto3_session or boto3.session.Session()
             boto3_client = boto3_session.client("secretsmanager", config=boto_config or config)
         self.client = boto3_client
 
-        super().__init__(client=self.client)
+        super().__init__(client=self.client, cache=cache)
+
+    @property
+    def client(self) -> SecretsManagerClient:
+        if self._client is None:
+            boto3_session = self._boto3_session or boto3.session.Session()
+            self._client = boto3_session.client("secretsmanager", config=self._boto_config)
+            user_agent.register_feature_to_client(client=self._client, feature="parameters")
+
+        return self._client
+
+    @client.setter
+    def client(self, client: SecretsManagerClient) -> None:
+        self._client = client
 
     def _get(self, name: str, **sdk_options) -> str | bytes:
         """
@@ -116,6 +152,16 @@ class SecretsProvider(BaseProvider):
             Dictionary of options that will be passed to the Secrets Manager get_secret_value API call
         """
 
+        # The extension doesn't support additional SDK options
+        if self._extension is not None and not sdk_options:
+            try:
+                return self._extension.get_secret(name)
+            except ExtensionUnavailableError as exc:
+                logger.debug(f"Falling back to boto3: {exc}")
+                # only stop using the extension when it isn't running, transient failures fall back for this call
+                if exc.connection_refused:
+                    self._extension = None
+
         # Explicit arguments will take precedence over keyword arguments
         sdk_options["SecretId"] = name
 
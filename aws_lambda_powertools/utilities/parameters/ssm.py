@@ -4,6 +4,7 @@ AWS SSM Parameter retrieval and caching utility
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import warnings
@@ -11,7 +12,7 @@ from typing import TYPE_CHECKING, Any, Literal, overload
 
 import boto3
 
-from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared import constants, user_agent
 from aws_lambda_powertools.shared.functions import (
     resolve_max_age,
     resolve_truthy_env_var_choice,
@@ -21,6 +22,7 @@ from aws_lambda_powertools.utilities.parameters.base import (
     BaseProvider,
     transform_value,
 )
+from aws_lambda_powertools.utilities.parameters.cache import NotFoundValue
 from aws_lambda_powertools.utilities.parameters.constants import (
     DEFAULT_MAX_AGE_SECS,
     DEFAULT_PROVIDERS,
@@ -28,6 +30,7 @@ from aws_lambda_powertools.utilities.parameters.constants import (
     SSM_PARAMETER_TYPES,
 )
 from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError, SetParameterError
+from aws_lambda_powertools.utilities.parameters.extension import ExtensionUnavailableError, ParametersExtensionClient
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
@@ -35,6 +38,7 @@ if TYPE_CHECKING:
     from mypy_boto3_ssm.client import SSMClient
     from mypy_boto3_ssm.type_defs import GetParametersResultTypeDef, PutParameterResultTypeDef
 
+    from aws_lambda_powertools.utilities.parameters.cache import BaseCache
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
 logger = logging.getLogger(__name__)
@@ -52,6 +56,11 @@ class SSMProvider(BaseProvider):
             Boto3 session to create a boto3_client from
     boto3_client: SSMClient, optional
             Boto3 SSM Client to use, boto3_session will be ignored if both are provided
+    cache: BaseCache, optional
+            Cache backend to store values in, by default a bounded in-memory cache shared by all providers
+    use_extension: bool, optional
+            Retrieve values through the AWS Parameters and Secrets Lambda Extension, falling back to boto3 when
+            it isn't running. Defaults to `POWERTOOLS_PARAMETERS_USE_EXTENSION` env var or False
 
     Example
     -------
@@ -114,6 +123,8 @@ class SSMProvider(BaseProvider):
         boto_config: Config | None = None,
         boto3_session: boto3.session.Session | None = None,
         boto3_client: SSMClient | None = None,
+        cache: BaseCache | None = None,
+        use_extension: bool | None = None,
     ):
         """
         Initialize the SSM Parameter Store client
@@ -126,12 +137,39 @@ class SSMProvider(BaseProvider):
                 stacklevel=2,
             )
 
+        use_extension = resolve_truthy_env_var_choice(
+            env=os.getenv(constants.PARAMETERS_USE_EXTENSION_ENV, "false"),
+            choice=use_extension,
+        )
+        self._extension = ParametersExtensionClient() if use_extension else None
+
+        if boto3_client is None and self._extension is not None:
+            # Creating a boto3 client is costly during cold start, defer it until the extension can't be used
+            self._client: SSMClient | None = None
+            self._boto3_session = boto3_session
+            self._boto_config = boto_config or config
+            super().__init__(cache=cache)
+            return
+
         if boto3_client is None:
             boto3_session = boto3_session or boto3.session.Session()
             boto3_client = boto3_session.client("ssm", config=boto_config or config)
         self.client = boto3_client
 
-        super().__init__(client=self.client)
+        super().__init__(client=self.client, cache=cache)
+
+    @property
+    def client(self) -> SSMClient:
+        if self._client is None:
+            boto3_session = self._boto3_session or boto3.session.Session()
+            self._client = boto3_session.client("ssm", config=self._boto_config)
+            user_agent.register_feature_to_client(client=self._client, feature="parameters")
+
+        return self._client
+
+    @client.setter
+    def client(self, client: SSMClient) -> None:
+        self._client = client
 
     def get_multiple(  # type: ignore[override]
         self,
@@ -378,6 +416,16 @@ class SSMProvider(BaseProvider):
             Dictionary of options that will be passed to the Parameter Store get_parameter API call
         """
 
+        # The extension doesn't support additional SDK options
+        if self._extension is not None and not sdk_options:
+            try:
+                return self._extension.get_parameter(name, decrypt=decrypt)
+            except ExtensionUnavailableError as exc:
+                logger.debug(f"Falling back to boto3: {exc}")
+                # only stop using the extension when it isn't running, transient failures fall back for this call
+                if exc.connection_refused:
+                    self._extension = None
+
         # Explicit arguments will take precedence over keyword arguments
         sdk_options["Name"] = name
         sdk_options["WithDecryption"] = decrypt
@@ -519,6 +567,109 @@ class SSMProvider(BaseProvider):
 
         return {**response, **batch_ret, **decrypt_ret}
 
+    async def get_parameters_by_name_async(
+        self,
+        parameters: dict[str, dict],
+        transform: TransformOptions = None,
+        decrypt: bool | None = None,
+        max_age: int | None = None,
+        raise_on_error: bool = True,
+    ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
+        """
+        Retrieve multiple parameter values by name from SSM or cache, without blocking the event loop.
+
+        Same as `get_parameters_by_name`, except that GetParameters batches and GetParameter calls
+        for parameters that need decryption are made concurrently.
+
+        Parameters
+        ----------
+        parameters: dict[str, dict]
+            List of parameter names, and any optional overrides
+        transform: str, optional
+            Transforms the content from a JSON object ('json') or base64 binary string ('binary')
+        decrypt: bool, optional
+            If the parameter values should be decrypted
+        max_age: int, optional
+            Maximum age of the cached value
+        raise_on_error: bool
+            Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+
+        Raises
+        ------
+        GetParameterError
+            When the parameter provider fails to retrieve a parameter value for a given name.
+
+            When "_errors" reserved key is in parameters to be fetched from SSM.
+        """
+
+        # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
+        max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
+
+        # If decrypt is not set, resolve it from the environment variable, defaulting to False
+        decrypt = resolve_truthy_env_var_choice(
+            env=os.getenv(constants.PARAMETERS_SSM_DECRYPT_ENV, "false"),
+            choice=decrypt,
+        )
+
+        response: dict[str, Any] = {}
+        errors: list[str] = []
+
+        self._raise_if_errors_key_is_present(parameters, self._ERRORS_KEY, raise_on_error)
+
+        batch_params, decrypt_params = self._split_batch_and_decrypt_parameters(parameters, transform, max_age, decrypt)
+
+        # Same API selection as get_parameters_by_name: GetParameter for each parameter to decrypt,
+        # unless all of them must be decrypted
+        if len(decrypt_params) == len(parameters):
+            batch_params, batch_decrypt = decrypt_params, True
+            decrypt_params = {}
+        else:
+            batch_decrypt = False
+
+        cached_params, cached_errors = self._get_parameters_by_name_from_cache(batch_params, raise_on_error)
+        response.update(cached_params)
+        errors.extend(cached_errors)
+        diff = {
+            name: options
+            for name, options in batch_params.items()
+            if name not in cached_params and name not in cached_errors
+        }
+        batch_fetches = [
+            self._run_in_executor(self._get_parameters_by_name, chunk, raise_on_error, batch_decrypt)
+            for chunk in slice_dictionary(data=diff, chunk_size=self._MAX_GET_PARAMETERS_ITEM)
+        ]
+
+        # Created after the cache lookup, as it raises for parameters known not to exist
+        single_names = list(decrypt_params)
+        single_fetches = [
+            self.get_async(name, options["max_age"], options["transform"], decrypt=options["decrypt"])
+            for name, options in decrypt_params.items()
+        ]
+
+        results = await asyncio.gather(*single_fetches, *batch_fetches, return_exceptions=True)
+
+        for name, result in zip(single_names, results[: len(single_names)]):
+            if isinstance(result, GetParameterError) and not raise_on_error:
+                errors.append(name)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                response[name] = result
+
+        for result in results[len(single_names) :]:
+            if isinstance(result, BaseException):
+                raise result
+
+            batch_ret, batch_err = result
+            response.update(batch_ret)
+            errors.extend(batch_err)
+
+        # Fail-fast disabled, let's aggregate errors under "_errors" key so they can handle gracefully
+        if not raise_on_error:
+            response[self._ERRORS_KEY] = errors
+
+        return response
+
     def _get_parameters_by_name_with_decrypt_option(
         self,
         batch: dict[str, dict],
@@ -550,24 +701,39 @@ class SSMProvider(BaseProvider):
         errors: list[str] = []
 
         # Fetch each possible batch param from cache and return if entire batch is cached
-        cached_params = self._get_parameters_by_name_from_cache(batch)
-        if len(cached_params) == len(batch):
-            return cached_params, errors
+        cached_params, cached_errors = self._get_parameters_by_name_from_cache(batch, raise_on_error)
+        if len(cached_params) + len(cached_errors) == len(batch):
+            return cached_params, cached_errors
 
         # Slice batch by max permitted GetParameters call
-        batch_ret, errors = self._get_parameters_by_name_in_chunks(batch, cached_params, raise_on_error, decrypt)
+        uncached = {name: options for name, options in batch.items() if name not in cached_errors}
+        batch_ret, errors = self._get_parameters_by_name_in_chunks(uncached, cached_params, raise_on_error, decrypt)
 
-        return {**cached_params, **batch_ret}, errors
+        return {**cached_params, **batch_ret}, [*cached_errors, *errors]
 
-    def _get_parameters_by_name_from_cache(self, batch: dict[str, dict]) -> dict[str, Any]:
-        """Fetch each parameter from batch that hasn't been expired"""
-        cache = {}
+    def _get_parameters_by_name_from_cache(
+        self,
+        batch: dict[str, dict],
+        raise_on_error: bool = True,
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Fetch each parameter from batch that hasn't been expired, collecting those cached as not found"""
+        cache: dict[str, Any] = {}
+        errors: list[str] = []
         for name, options in batch.items():
             cache_key = (name, options["transform"])
-            if self.has_not_expired_in_cache(cache_key):
-                cache[name] = self.store[cache_key].value
+            if not self.has_not_expired_in_cache(cache_key):
+                continue
+
+            value = self.store[cache_key].value
+            if isinstance(value, NotFoundValue):
+                if raise_on_error:
+                    raise GetParameterError(value.error)
+                errors.append(name)
+                continue
 
-        return cache
+            cache[name] = value
+
+        return cache, errors
 
     def _get_parameters_by_name_in_chunks(
         self,
@@ -634,6 +800,8 @@ class SSMProvider(BaseProvider):
             return ret, parameter_names
 
         batch_errors = self._handle_any_invalid_get_parameter_errors(response, raise_on_error)
+        for name in batch_errors:
+            self.add_not_found_to_cache(key=(name, parameters[name]["transform"]), error=f"Parameter not found: {name}")
         transformed_params = self._transform_and_cache_get_parameters_response(response, parameters, raise_on_error)
 
         return transformed_params, batch_errors
@@ -1190,3 +1358,65 @@ def get_parameters_by_name(
         decrypt=decrypt,
         raise_on_error=raise_on_error,
     )
+
+
+async def get_parameters_by_name_async(
+    parameters: dict[str, Any],
+    transform: TransformOptions = None,
+    decrypt: bool | None = None,
+    max_age: int | None = None,
+    raise_on_error: bool = True,
+) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
+    """
+    Retrieve multiple parameter values by name from AWS Systems Manager (SSM) Parameter Store, without blocking
+    the event loop
+
+    Parameters
+    ----------
+    parameters: dict[str, Any]
+        List of parameter names, and any optional overrides
+    transform: str, optional
+        Transforms the content from a JSON object ('json') or base64 binary string ('binary')
+    decrypt: bool, optional
+        If the parameter values should be decrypted
+    max_age: int, optional
+        Maximum age of the cached value
+    raise_on_error: bool, optional
+        Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+
+    Example
+    -------
+
+    **Retrieves multiple parameters concurrently from an async handler**
+
+        import asyncio
+
+        from aws_lambda_powertools.utilities.parameters import get_parameters_by_name_async
+
+        params = {
+            "/param": {},
+            "/json": {"transform": "json"},
+            "/api_key": {"decrypt": True},
+        }
+
+        async def handler(event, context):
+            values = await get_parameters_by_name_async(parameters=params)
+
+    Raises
+    ------
+    GetParameterError
+        When the parameter provider fails to retrieve a parameter value for
+        a given name.
+    """
+
+    # Only create the provider if this function is called at least once
+    if "ssm" not in DEFAULT_PROVIDERS:
+        DEFAULT_PROVIDERS["ssm"] = SSMProvider()
+
+    return await DEFAULT_PROVIDERS["ssm"].get_parameters_by_name_async(
+        parameters=parameters,
+        max_age=max_age,
+        transform=transform,
+        decrypt=decrypt,
+        raise_on_error=raise_on_error,
+    )
@@ -1,6 +1,6 @@
 from .apigw import ApiGatewayEnvelope
 from .apigwv2 import ApiGatewayV2Envelope
-from .base import BaseEnvelope
+from .base import BaseEnvelope, LazyRecords, RecordEnvelope
 from .bedrock_agent import BedrockAgentEnvelope
 from .cloudwatch import CloudWatchLogsEnvelope
 from .dynamodb import DynamoDBStreamEnvelope
@@ -29,6 +29,8 @@ __all__ = [
     "SqsEnvelope",
     "KafkaEnvelope",
     "BaseEnvelope",
+    "LazyRecords",
+    "RecordEnvelope",
     "VpcLatticeEnvelope",
     "VpcLatticeV2Envelope",
 ]
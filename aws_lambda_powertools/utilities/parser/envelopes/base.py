@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, TypeVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Generic, Sequence, TypeVar, overload
 
 from aws_lambda_powertools.utilities.parser.functions import (
     _parse_and_validate_event,
+    _retrieve_or_set_composed_model_from_cache,
     _retrieve_or_set_model_from_cache,
 )
 
@@ -14,6 +16,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+RecordData = TypeVar("RecordData")
+
+# Sentinel for records not parsed yet, as parsed records can be None
+_NOT_PARSED = object()
+
 
 class BaseEnvelope(ABC):
     """ABC implementation for creating a supported Envelope"""
@@ -64,6 +71,186 @@ class BaseEnvelope(ABC):
         return NotImplemented  # pragma: no cover
 
 
+class RecordEnvelope(BaseEnvelope):
+    """ABC implementation for creating a supported Envelope with records, e.g. SQS messages
+
+    Records are parsed in a single pass against the envelope model composed with the data model,
+    or lazily with `parse_lazy`.
+    """
+
+    def parse_lazy(self, data: dict[str, Any] | Any, model: type[T]) -> LazyRecords[T]:
+        """Parses envelope data, returning records whose data is only parsed with model provided when first accessed
+
+        Only the envelope structure is validated upfront, so handlers reading a few records, or stopping early,
+        don't pay for validating every record, and an invalid record only fails when it's accessed.
+
+        Parameters
+        ----------
+        data : dict
+            Lambda event to be parsed, or the raw JSON event as str or bytes
+        model : type[T]
+            Data model to parse and validate data within each record against
+
+        Returns
+        -------
+        LazyRecords[T]
+            Records parsed with model provided when first accessed
+        """
+        logger.debug("parsing event against envelope, deferring records parsing")
+        envelope = self._validate_envelope(data=data, model=Any)
+        return LazyRecords(records=self._get_records(envelope), parse_record=partial(self._parse_record, model=model))
+
+    @abstractmethod
+    def _compose_record(self, model: type[Any]) -> Any:
+        """Composes the record model with the data model, e.g. `SqsRecordModel` with a `body` of type `Json[model]`
+
+        Parameters
+        ----------
+        model : type[Any]
+            Data model to parse and validate data within each record against
+
+        Returns
+        -------
+        Any
+            Record model composed with the data model
+        """
+        return NotImplemented  # pragma: no cover
+
+    @abstractmethod
+    def _compose_envelope(self, record_model: Any) -> Any:
+        """Composes the envelope model with the record model, e.g. `SqsModel` with `Records` of `record_model`
+
+        Parameters
+        ----------
+        record_model : Any
+            Record model, composed with the data model by `_compose_record`, or `Any` to skip parsing records
+
+        Returns
+        -------
+        Any
+            Envelope model composed with the record model
+        """
+        return NotImplemented  # pragma: no cover
+
+    @abstractmethod
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        """Returns records of the parsed envelope"""
+        return NotImplemented  # pragma: no cover
+
+    @abstractmethod
+    def _get_record_data(self, record: Any) -> Any:
+        """Returns data within the parsed record, e.g. the SQS record `body`"""
+        return NotImplemented  # pragma: no cover
+
+    def _validate_envelope(self, data: dict[str, Any] | Any, model: type[Any]) -> Any:
+        adapter = _retrieve_or_set_composed_model_from_cache(
+            key=(type(self), id(model), "envelope"),
+            compose=lambda: self._compose_envelope(self._compose_record(model) if model is not Any else Any),
+        )
+
+        if isinstance(data, (str, bytes)):
+            return adapter.validate_json(data)
+        return adapter.validate_python(data)
+
+    def _parse_envelope(self, data: dict[str, Any] | Any, model: type[T]) -> list[Any] | None:
+        """Parses envelope data and the data within each record in a single pass, against the envelope model
+        composed with model provided
+
+        Data can also be the raw JSON event as str or bytes, parsed straight into the composed envelope model.
+
+        Parameters
+        ----------
+        data : dict
+            Data to be parsed and validated
+        model : type[T]
+            Data model to parse and validate data within each record against
+
+        Returns
+        -------
+        list[Any] | None
+            Data within each record parsed with model provided, or None when the data model can't be validated
+            in a single pass, e.g. it has fields of type `type[BaseModel]`
+        """
+        logger.debug("parsing event against envelope composed with model")
+        try:
+            envelope = self._validate_envelope(data=data, model=model)
+        except NotImplementedError:
+            # See: https://github.com/aws-powertools/powertools-lambda-python/issues/5303
+            logger.debug("Falling back to parsing the envelope and the data within it separately")
+            return None
+
+        return [self._get_record_data(record) for record in self._get_records(envelope)]
+
+    def _parse_record(self, record: Any, model: type[T]) -> Any:
+        """Parses a single record, and the data within it, against the record model composed with model provided"""
+        adapter = _retrieve_or_set_composed_model_from_cache(
+            key=(type(self), id(model), "record"),
+            compose=lambda: self._compose_record(model),
+        )
+
+        try:
+            return self._get_record_data(adapter.validate_python(record))
+        except NotImplementedError:
+            # See: https://github.com/aws-powertools/powertools-lambda-python/issues/5303
+            logger.debug("Falling back to parsing the record and the data within it separately")
+
+        adapter = _retrieve_or_set_composed_model_from_cache(
+            key=(type(self), id(Any), "record"),
+            compose=lambda: self._compose_record(Any),
+        )
+        return self._parse(data=self._get_record_data(adapter.validate_python(record)), model=model)
+
+
+class LazyRecords(Sequence[RecordData], Generic[RecordData]):
+    """Records of an envelope, whose data is parsed with the data model when first accessed
+
+    Each record is parsed at most once, and errors are raised when accessing the invalid record only.
+
+    Example
+    -------
+
+    **Processing records of an SQS event until an invalid one**
+
+        from aws_lambda_powertools.utilities.parser import ValidationError, envelopes, parse
+
+        def lambda_handler(event: dict, context):
+            orders = parse(event=event, model=Order, envelope=envelopes.SqsEnvelope, lazy=True)
+            for index in range(len(orders)):
+                try:
+                    order = orders[index]
+                except ValidationError:
+                    ...
+    """
+
+    def __init__(self, records: Sequence[Any], parse_record: Callable[[Any], RecordData]):
+        self._records = records
+        self._parse_record = parse_record
+        self._parsed: list[Any] = [_NOT_PARSED] * len(records)
+
+    @property
+    def raw_records(self) -> Sequence[Any]:
+        """Records before parsing, e.g. to report the ones failing validation"""
+        return self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @overload
+    def __getitem__(self, index: int) -> RecordData: ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RecordData]: ...  # pragma: no cover
+
+    def __getitem__(self, index: int | slice) -> RecordData | list[RecordData]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        parsed = self._parsed[index]
+        if parsed is _NOT_PARSED:
+            parsed = self._parsed[index] = self._parse_record(self._records[index])
+        return parsed
+
+
 # Generic to support type annotations throughout parser
 # Note: Can't be defined under base.py due to circular dependency
 Envelope = TypeVar("Envelope", bound=BaseEnvelope)
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List, Sequence, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
+from pydantic import Json
+
+from aws_lambda_powertools.utilities.parser.envelopes.base import RecordEnvelope
+from aws_lambda_powertools.utilities.parser.functions import _compose_model
 from aws_lambda_powertools.utilities.parser.models import CloudWatchLogsModel
+from aws_lambda_powertools.utilities.parser.models.cloudwatch import (
+    CloudWatchLogsData,
+    CloudWatchLogsDecode,
+    CloudWatchLogsLogEvent,
+)
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import Model
@@ -12,7 +20,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class CloudWatchLogsEnvelope(BaseEnvelope):
+class CloudWatchLogsEnvelope(RecordEnvelope):
     """CloudWatch Envelope to extract a list of log records.
 
     The record's body parameter is a string (after being base64 decoded and gzipped),
@@ -20,8 +28,25 @@ class CloudWatchLogsEnvelope(BaseEnvelope):
     Regardless of its type it'll be parsed into a BaseModel object.
 
     Note: The record will be parsed the same way so if model is str
+
+    The envelope and every log event message are parsed in a single pass, against `CloudWatchLogsModel` composed
+    with log event messages of type `Json[model]`.
     """
 
+    def _compose_record(self, model: type[Any]) -> Any:
+        return _compose_model(CloudWatchLogsLogEvent, message=Json[model])  # type: ignore[misc, valid-type]
+
+    def _compose_envelope(self, record_model: Any) -> Any:
+        decode_model = _compose_model(CloudWatchLogsDecode, logEvents=List[record_model])
+        data_model = _compose_model(CloudWatchLogsData, decoded_data=decode_model)
+        return _compose_model(CloudWatchLogsModel, awslogs=data_model)
+
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        return envelope.awslogs.decoded_data.logEvents
+
+    def _get_record_data(self, record: Any) -> Any:
+        return record.message
+
     def parse(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
         """Parses records found with model provided
 
@@ -37,9 +62,15 @@ class CloudWatchLogsEnvelope(BaseEnvelope):
         list
             List of records parsed with model provided
         """
+        logger.debug(f"Parsing incoming data and CloudWatch records with {CloudWatchLogsModel} and {model}")
+        records = self._parse_envelope(data=data, model=model)
+        if records is not None:
+            return records
+
         logger.debug(f"Parsing incoming data with SNS model {CloudWatchLogsModel}")
-        parsed_envelope = CloudWatchLogsModel.model_validate(data)
+        cloudwatch_envelope = cast(CloudWatchLogsModel, self._parse(data=data, model=CloudWatchLogsModel))
         logger.debug(f"Parsing CloudWatch records in `body` with {model}")
         return [
-            self._parse(data=record.message, model=model) for record in parsed_envelope.awslogs.decoded_data.logEvents
+            self._parse(data=record.message, model=model)
+            for record in cloudwatch_envelope.awslogs.decoded_data.logEvents
         ]
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import DynamoDBStreamModel
+from aws_lambda_powertools.utilities.parser.envelopes.base import RecordEnvelope
+from aws_lambda_powertools.utilities.parser.functions import _compose_model
+from aws_lambda_powertools.utilities.parser.models import (
+    DynamoDBStreamChangedRecordModel,
+    DynamoDBStreamModel,
+    DynamoDBStreamRecordModel,
+)
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import Model
@@ -12,13 +17,33 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class DynamoDBStreamEnvelope(BaseEnvelope):
+class DynamoDBStreamEnvelope(RecordEnvelope):
     """DynamoDB Stream Envelope to extract data within NewImage/OldImage
 
     Note: Values are the parsed models. Images' values can also be None, and
     length of the list is the record's amount in the original event.
+
+    The envelope and every image are parsed in a single pass, against `DynamoDBStreamModel` composed
+    with images of type `Optional[model]`.
     """
 
+    def _compose_record(self, model: type[Any]) -> Any:
+        changed_record_model = _compose_model(
+            DynamoDBStreamChangedRecordModel,
+            NewImage=Optional[model],
+            OldImage=Optional[model],
+        )
+        return _compose_model(DynamoDBStreamRecordModel, dynamodb=changed_record_model)
+
+    def _compose_envelope(self, record_model: Any) -> Any:
+        return _compose_model(DynamoDBStreamModel, Records=List[record_model])
+
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        return envelope.Records
+
+    def _get_record_data(self, record: Any) -> Any:
+        return {"NewImage": record.dynamodb.NewImage, "OldImage": record.dynamodb.OldImage}
+
     def parse(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[dict[str, Model | None]]:
         """Parses DynamoDB Stream records found in either NewImage and OldImage with model provided
 
@@ -34,13 +59,18 @@ class DynamoDBStreamEnvelope(BaseEnvelope):
         list
             List of dictionaries with NewImage and OldImage records parsed with model provided
         """
+        logger.debug(f"Parsing incoming data and DynamoDB Stream records with {DynamoDBStreamModel} and {model}")
+        records = self._parse_envelope(data=data, model=model)
+        if records is not None:
+            return records
+
         logger.debug(f"Parsing incoming data with DynamoDB Stream model {DynamoDBStreamModel}")
-        parsed_envelope = DynamoDBStreamModel.model_validate(data)
+        dynamodb_envelope = cast(DynamoDBStreamModel, self._parse(data=data, model=DynamoDBStreamModel))
         logger.debug(f"Parsing DynamoDB Stream new and old records with {model}")
         return [
             {
                 "NewImage": self._parse(data=record.dynamodb.NewImage, model=model),
                 "OldImage": self._parse(data=record.dynamodb.OldImage, model=model),
             }
-            for record in parsed_envelope.Records
+            for record in dynamodb_envelope.Records
         ]
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import json
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Union, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import KafkaMskEventModel, KafkaSelfManagedEventModel
+from pydantic import Field, Json
+from typing_extensions import Annotated
+
+from aws_lambda_powertools.utilities.parser.envelopes.base import RecordEnvelope
+from aws_lambda_powertools.utilities.parser.functions import _compose_model
+from aws_lambda_powertools.utilities.parser.models import (
+    KafkaMskEventModel,
+    KafkaRecordModel,
+    KafkaSelfManagedEventModel,
+)
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import Model
@@ -12,15 +21,33 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class KafkaEnvelope(BaseEnvelope):
+class KafkaEnvelope(RecordEnvelope):
     """Kafka event envelope to extract data within body key
     The record's body parameter is a string, though it can also be a JSON encoded string.
     Regardless of its type it'll be parsed into a BaseModel object.
 
     Note: Records will be parsed the same way so if model is str,
     all items in the list will be parsed as str and npt as JSON (and vice versa)
+
+    The envelope and every record value are parsed in a single pass, against the Kafka event models composed
+    with record values of type `Json[model]`, and discriminated by `eventSource`.
     """
 
+    def _compose_record(self, model: type[Any]) -> Any:
+        return _compose_model(KafkaRecordModel, value=Json[model])  # type: ignore[misc, valid-type]
+
+    def _compose_envelope(self, record_model: Any) -> Any:
+        records = Dict[str, List[record_model]]
+        msk_model = _compose_model(KafkaMskEventModel, records=records)
+        self_managed_model = _compose_model(KafkaSelfManagedEventModel, records=records)
+        return Annotated[Union[msk_model, self_managed_model], Field(discriminator="eventSource")]
+
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        return [record for records in envelope.records.values() for record in records]
+
+    def _get_record_data(self, record: Any) -> Any:
+        return record.value
+
     def parse(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
         """Parses data found with model provided
 
@@ -36,15 +63,23 @@ class KafkaEnvelope(BaseEnvelope):
         list
             List of records parsed with model provided
         """
+        logger.debug(f"Parsing incoming data and Kafka event records in `value` with {model}")
+        records = self._parse_envelope(data=data, model=model)
+        if records is not None:
+            return records
+
+        if isinstance(data, (str, bytes)):
+            data = json.loads(data)
+
         event_source = cast(dict, data).get("eventSource")
         model_parse_event: type[KafkaMskEventModel | KafkaSelfManagedEventModel] = (
             KafkaMskEventModel if event_source == "aws:kafka" else KafkaSelfManagedEventModel
         )
 
         logger.debug(f"Parsing incoming data with Kafka event model {model_parse_event}")
-        parsed_envelope = model_parse_event.model_validate(data)
+        kafka_envelope = model_parse_event.model_validate(data)
         logger.debug(f"Parsing Kafka event records in `value` with {model}")
         ret_list = []
-        for records in parsed_envelope.records.values():
+        for records in kafka_envelope.records.values():
             ret_list += [self._parse(data=record.value, model=model) for record in records]
         return ret_list
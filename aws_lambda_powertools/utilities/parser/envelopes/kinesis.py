@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, List, Sequence, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
+from pydantic import Json
+
+from aws_lambda_powertools.utilities.parser.envelopes.base import RecordEnvelope
+from aws_lambda_powertools.utilities.parser.functions import _compose_model
 from aws_lambda_powertools.utilities.parser.models import KinesisDataStreamModel
+from aws_lambda_powertools.utilities.parser.models.kinesis import (
+    KinesisDataStreamRecord,
+    KinesisDataStreamRecordPayload,
+)
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import Model
@@ -12,7 +19,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class KinesisDataStreamEnvelope(BaseEnvelope):
+class KinesisDataStreamEnvelope(RecordEnvelope):
     """Kinesis Data Stream Envelope to extract array of Records
 
     The record's data parameter is a base64 encoded string which is parsed into a bytes array,
@@ -21,8 +28,24 @@ class KinesisDataStreamEnvelope(BaseEnvelope):
 
     Note: Records will be parsed the same way so if model is str,
     all items in the list will be parsed as str and not as JSON (and vice versa)
+
+    The envelope and every record data are parsed in a single pass, against `KinesisDataStreamModel` composed
+    with record data of type `Json[model]`.
     """
 
+    def _compose_record(self, model: type[Any]) -> Any:
+        payload_model = _compose_model(KinesisDataStreamRecordPayload, data=Json[model])  # type: ignore[misc, valid-type]
+        return _compose_model(KinesisDataStreamRecord, kinesis=payload_model)
+
+    def _compose_envelope(self, record_model: Any) -> Any:
+        return _compose_model(KinesisDataStreamModel, Records=List[record_model])
+
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        return envelope.Records
+
+    def _get_record_data(self, record: Any) -> Any:
+        return record.kinesis.data
+
     def parse(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
         """Parses records found with model provided
 
@@ -38,11 +61,16 @@ class KinesisDataStreamEnvelope(BaseEnvelope):
         list
             List of records parsed with model provided
         """
+        logger.debug(f"Parsing incoming data and Kinesis records with {KinesisDataStreamModel} and {model}")
+        records = self._parse_envelope(data=data, model=model)
+        if records is not None:
+            return records
+
         logger.debug(f"Parsing incoming data with Kinesis model {KinesisDataStreamModel}")
-        parsed_envelope: KinesisDataStreamModel = KinesisDataStreamModel.model_validate(data)
+        kinesis_envelope = cast(KinesisDataStreamModel, self._parse(data=data, model=KinesisDataStreamModel))
         logger.debug(f"Parsing Kinesis records in `body` with {model}")
         models = []
-        for record in parsed_envelope.Records:
+        for record in kinesis_envelope.Records:
             # We allow either AWS expected contract (bytes) or a custom Model, see #943
             data = cast(bytes, record.kinesis.data)
             models.append(self._parse(data=data.decode("utf-8"), model=model))
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, List, Sequence, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import SnsModel, SnsNotificationModel, SqsModel
+from pydantic import Json
+
+from aws_lambda_powertools.utilities.parser.envelopes.base import RecordEnvelope
+from aws_lambda_powertools.utilities.parser.functions import _compose_model
+from aws_lambda_powertools.utilities.parser.models import (
+    SnsModel,
+    SnsNotificationModel,
+    SnsRecordModel,
+    SqsModel,
+    SqsRecordModel,
+)
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import Model
@@ -12,7 +21,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class SnsEnvelope(BaseEnvelope):
+class SnsEnvelope(RecordEnvelope):
     """SNS Envelope to extract array of Records
 
     The record's body parameter is a string, though it can also be a JSON encoded string.
@@ -20,8 +29,24 @@ class SnsEnvelope(BaseEnvelope):
 
     Note: Records will be parsed the same way so if model is str,
     all items in the list will be parsed as str and npt as JSON (and vice versa)
+
+    The envelope and every record message are parsed in a single pass, against `SnsModel` composed
+    with record messages of type `Json[model]`.
     """
 
+    def _compose_record(self, model: type[Any]) -> Any:
+        notification_model = _compose_model(SnsNotificationModel, Message=Json[model])  # type: ignore[misc, valid-type]
+        return _compose_model(SnsRecordModel, Sns=notification_model)
+
+    def _compose_envelope(self, record_model: Any) -> Any:
+        return _compose_model(SnsModel, Records=List[record_model])
+
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        return envelope.Records
+
+    def _get_record_data(self, record: Any) -> Any:
+        return record.Sns.Message
+
     def parse(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
         """Parses records found with model provided
 
@@ -37,13 +62,18 @@ class SnsEnvelope(BaseEnvelope):
         list
             List of records parsed with model provided
         """
+        logger.debug(f"Parsing incoming data and SNS records in `body` with SNS model {SnsModel} and {model}")
+        records = self._parse_envelope(data=data, model=model)
+        if records is not None:
+            return records
+
         logger.debug(f"Parsing incoming data with SNS model {SnsModel}")
-        parsed_envelope = SnsModel.model_validate(data)
+        sns_envelope = cast(SnsModel, self._parse(data=data, model=SnsModel))
         logger.debug(f"Parsing SNS records in `body` with {model}")
-        return [self._parse(data=record.Sns.Message, model=model) for record in parsed_envelope.Records]
+        return [self._parse(data=record.Sns.Message, model=model) for record in sns_envelope.Records]
 
 
-class SnsSqsEnvelope(BaseEnvelope):
+class SnsSqsEnvelope(RecordEnvelope):
     """SNS plus SQS Envelope to extract array of Records
 
     Published messages from SNS to SQS has a slightly different payload.
@@ -52,8 +82,24 @@ class SnsSqsEnvelope(BaseEnvelope):
     1. Parse SQS schema with incoming data
     2. Unmarshall SNS payload and parse against SNS Notification model not SNS/SNS Record
     3. Finally, parse provided model against payload extracted
+
+    These steps run in a single pass, against `SqsModel` composed with record bodies of type
+    `Json[SnsNotificationModel]`, itself composed with messages of type `Json[model]`.
     """
 
+    def _compose_record(self, model: type[Any]) -> Any:
+        notification_model = _compose_model(SnsNotificationModel, Message=Json[model])  # type: ignore[misc, valid-type]
+        return _compose_model(SqsRecordModel, body=Json[notification_model])  # type: ignore[misc, valid-type]
+
+    def _compose_envelope(self, record_model: Any) -> Any:
+        return _compose_model(SqsModel, Records=List[record_model])
+
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        return envelope.Records
+
+    def _get_record_data(self, record: Any) -> Any:
+        return record.body.Message
+
     def parse(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
         """Parses records found with model provided
 
@@ -69,10 +115,15 @@ class SnsSqsEnvelope(BaseEnvelope):
         list
             List of records parsed with model provided
         """
+        logger.debug(f"Parsing incoming data and SNS notifications in SQS records with {SqsModel} and {model}")
+        records = self._parse_envelope(data=data, model=model)
+        if records is not None:
+            return records
+
         logger.debug(f"Parsing incoming data with SQS model {SqsModel}")
-        parsed_envelope = SqsModel.model_validate(data)
+        sqs_envelope = cast(SqsModel, self._parse(data=data, model=SqsModel))
         output = []
-        for record in parsed_envelope.Records:
+        for record in sqs_envelope.Records:
             # We allow either AWS expected contract (str) or a custom Model, see #943
             body = cast(str, record.body)
             sns_notification = SnsNotificationModel.model_validate_json(body)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List, Sequence, cast
 
-from aws_lambda_powertools.utilities.parser.envelopes.base import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.models import SqsModel
+from pydantic import Json
+
+from aws_lambda_powertools.utilities.parser.envelopes.base import RecordEnvelope
+from aws_lambda_powertools.utilities.parser.functions import _compose_model
+from aws_lambda_powertools.utilities.parser.models import SqsModel, SqsRecordModel
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.parser.types import Model
@@ -12,7 +15,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class SqsEnvelope(BaseEnvelope):
+class SqsEnvelope(RecordEnvelope):
     """SQS Envelope to extract array of Records
 
     The record's body parameter is a string, though it can also be a JSON encoded string.
@@ -20,8 +23,23 @@ class SqsEnvelope(BaseEnvelope):
 
     Note: Records will be parsed the same way so if model is str,
     all items in the list will be parsed as str and npt as JSON (and vice versa)
+
+    The envelope and every record body are parsed in a single pass, against `SqsModel` composed
+    with record bodies of type `Json[model]`.
     """
 
+    def _compose_record(self, model: type[Any]) -> Any:
+        return _compose_model(SqsRecordModel, body=Json[model])  # type: ignore[misc, valid-type]
+
+    def _compose_envelope(self, record_model: Any) -> Any:
+        return _compose_model(SqsModel, Records=List[record_model])
+
+    def _get_records(self, envelope: Any) -> Sequence[Any]:
+        return envelope.Records
+
+    def _get_record_data(self, record: Any) -> Any:
+        return record.body
+
     def parse(self, data: dict[str, Any] | Any | None, model: type[Model]) -> list[Model | None]:
         """Parses records found with model provided
 
@@ -37,7 +55,12 @@ class SqsEnvelope(BaseEnvelope):
         list
             List of records parsed with model provided
         """
+        logger.debug(f"Parsing incoming data and SQS records in `body` with SQS model {SqsModel} and {model}")
+        records = self._parse_envelope(data=data, model=model)
+        if records is not None:
+            return records
+
         logger.debug(f"Parsing incoming data with SQS model {SqsModel}")
-        parsed_envelope = SqsModel.model_validate(data)
+        sqs_envelope = cast(SqsModel, self._parse(data=data, model=SqsModel))
         logger.debug(f"Parsing SQS records in `body` with {model}")
-        return [self._parse(data=record.body, model=model) for record in parsed_envelope.Records]
+        return [self._parse(data=record.body, model=model) for record in sqs_envelope.Records]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aws_lambda_powertools.utilities.data_classes.event_source_router import EventSourceType, detect_event_source
+from aws_lambda_powertools.utilities.parser.models import (
+    AlbModel,
+    APIGatewayProxyEventModel,
+    APIGatewayProxyEventV2Model,
+    BedrockAgentEventModel,
+    CloudWatchLogsModel,
+    DynamoDBStreamModel,
+    EventBridgeModel,
+    KafkaMskEventModel,
+    KafkaSelfManagedEventModel,
+    KinesisDataStreamModel,
+    KinesisFirehoseModel,
+    LambdaFunctionUrlModel,
+    S3Model,
+    SesModel,
+    SnsModel,
+    SqsModel,
+    VpcLatticeModel,
+    VpcLatticeV2Model,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# ActiveMQ and RabbitMQ events have no built-in model
+EVENT_SOURCE_MODELS: dict[EventSourceType, type[BaseModel]] = {
+    EventSourceType.SQS: SqsModel,
+    EventSourceType.SNS: SnsModel,
+    EventSourceType.SES: SesModel,
+    EventSourceType.S3: S3Model,
+    EventSourceType.DYNAMODB_STREAM: DynamoDBStreamModel,
+    EventSourceType.KINESIS_DATA_STREAM: KinesisDataStreamModel,
+    EventSourceType.KINESIS_FIREHOSE: KinesisFirehoseModel,
+    EventSourceType.KAFKA_MSK: KafkaMskEventModel,
+    EventSourceType.KAFKA_SELF_MANAGED: KafkaSelfManagedEventModel,
+    EventSourceType.EVENTBRIDGE: EventBridgeModel,
+    EventSourceType.CLOUDWATCH_LOGS: CloudWatchLogsModel,
+    EventSourceType.API_GATEWAY_REST: APIGatewayProxyEventModel,
+    EventSourceType.API_GATEWAY_HTTP: APIGatewayProxyEventV2Model,
+    EventSourceType.LAMBDA_FUNCTION_URL: LambdaFunctionUrlModel,
+    EventSourceType.ALB: AlbModel,
+    EventSourceType.VPC_LATTICE: VpcLatticeModel,
+    EventSourceType.VPC_LATTICE_V2: VpcLatticeV2Model,
+    EventSourceType.BEDROCK_AGENT: BedrockAgentEventModel,
+}
+
+
+def detect_model(event: Any) -> type[BaseModel] | None:
+    """Detects the built-in model of a Lambda event from its event source
+
+    Parameters
+    ----------
+    event: Any
+        Lambda event
+
+    Returns
+    -------
+    type[BaseModel] | None
+        The built-in model for the event source, or None when the event source isn't detected or has no model
+
+    Example
+    -------
+
+    **Parsing events from multiple event sources**
+
+        from aws_lambda_powertools.utilities.parser import parse
+        from aws_lambda_powertools.utilities.parser.event_sources import detect_model
+
+        def lambda_handler(event: dict, context):
+            model = detect_model(event)
+            if model is None:
+                raise ValueError("Unsupported event")
+
+            parsed_event = parse(event=event, model=model)
+    """
+    source = detect_event_source(event)
+    return EVENT_SOURCE_MODELS.get(source) if source is not None else None
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any
+from copy import copy
+from typing import TYPE_CHECKING, Any, Callable
 
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter, create_model
 
 from aws_lambda_powertools.shared.cache_dict import LRUDict
 
@@ -44,6 +45,59 @@ def _retrieve_or_set_model_from_cache(model: type[T]) -> TypeAdapter:
     return CACHE_TYPE_ADAPTER[id_model]
 
 
+def _retrieve_or_set_composed_model_from_cache(key: tuple, compose: Callable[[], Any]) -> TypeAdapter:
+    """
+    Retrieves or sets a TypeAdapter instance from the cache for a model composed from other models,
+    e.g. an envelope model composed with the data model parsed within it.
+
+    Parameters
+    ----------
+    key: tuple
+        Cache key identifying the composed model, e.g. the envelope type and the id of the data model.
+    compose: Callable[[], Any]
+        Function returning the composed model, only called when not cached.
+
+    Returns
+    -------
+    TypeAdapter
+        The TypeAdapter instance for the composed model,
+        either retrieved from the cache or newly created and stored in the cache.
+    """
+    if key in CACHE_TYPE_ADAPTER:
+        return CACHE_TYPE_ADAPTER[key]
+
+    CACHE_TYPE_ADAPTER[key] = TypeAdapter(compose())
+    return CACHE_TYPE_ADAPTER[key]
+
+
+def _compose_model(model: type[BaseModel], **fields: Any) -> type[BaseModel]:
+    """
+    Creates a subclass of the given model overriding the type of some of its fields.
+
+    Defaults, aliases and validators of the overridden fields are kept.
+
+    Params
+    ------
+    model: type[BaseModel]
+        The model to subclass.
+    fields: Any
+        New type of each overridden field, by field name.
+
+    Returns
+    -------
+    type[BaseModel]
+        The subclass of the model.
+    """
+    field_definitions: dict[str, Any] = {}
+    for name, annotation in fields.items():
+        field_info = copy(model.model_fields[name])
+        # metadata is extended with the new type's metadata, e.g. Json, so it can't be shared with the model
+        field_info.metadata = list(field_info.metadata)
+        field_definitions[name] = (annotation, field_info)
+
+    return create_model(model.__name__, __base__=model, **field_definitions)
+
+
 def _parse_and_validate_event(data: dict[str, Any] | Any, adapter: TypeAdapter):
     """
     Parse and validate the event data using the provided adapter.
@@ -63,8 +117,8 @@ def _parse_and_validate_event(data: dict[str, Any] | Any, adapter: TypeAdapter):
     """
     logger.debug("Parsing event against model")
 
-    if isinstance(data, str):
-        logger.debug("Parsing event as string")
+    if isinstance(data, (str, bytes)):
+        logger.debug("Parsing event as JSON string")
         try:
             return adapter.validate_json(data)
         except NotImplementedError:
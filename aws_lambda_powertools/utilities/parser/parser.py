@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import logging
 import typing
-from typing import TYPE_CHECKING, Any, Callable, overload
+from typing import TYPE_CHECKING, Any, Callable, Literal, overload
 
 from pydantic import PydanticSchemaGenerationError
 
 from aws_lambda_powertools.middleware_factory import lambda_handler_decorator
+from aws_lambda_powertools.utilities.parser.envelopes.base import RecordEnvelope
 from aws_lambda_powertools.utilities.parser.exceptions import InvalidEnvelopeError, InvalidModelTypeError
 from aws_lambda_powertools.utilities.parser.functions import (
     _parse_and_validate_event,
@@ -14,7 +15,7 @@ from aws_lambda_powertools.utilities.parser.functions import (
 )
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.parser.envelopes.base import Envelope
+    from aws_lambda_powertools.utilities.parser.envelopes.base import Envelope, LazyRecords
     from aws_lambda_powertools.utilities.parser.types import EventParserReturnType, T
     from aws_lambda_powertools.utilities.typing import LambdaContext
 
@@ -28,6 +29,7 @@ def event_parser(
     context: LambdaContext,
     model: type[T] | None = None,
     envelope: type[Envelope] | None = None,
+    lazy: bool = False,
     **kwargs: Any,
 ) -> EventParserReturnType:
     """Lambda handler decorator to parse & validate events using Pydantic models
@@ -80,6 +82,8 @@ def event_parser(
         Your data model that will replace the event.
     envelope: Envelope
         Optional envelope to extract the model from
+    lazy: bool
+        Whether to parse each record of the envelope only when first accessed, see `parse`
 
     Raises
     ------
@@ -105,7 +109,7 @@ def event_parser(
 
     try:
         if envelope:
-            parsed_event = parse(event=event, model=model, envelope=envelope)
+            parsed_event = parse(event=event, model=model, envelope=envelope, lazy=lazy)
         else:
             parsed_event = parse(event=event, model=model)
 
@@ -120,10 +124,33 @@ def parse(event: dict[str, Any], model: type[T]) -> T: ...  # pragma: no cover
 
 
 @overload
-def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope]) -> T: ...  # pragma: no cover
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[Envelope],
+    lazy: Literal[False] = False,
+) -> T: ...  # pragma: no cover
+
+
+@overload
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[RecordEnvelope],
+    lazy: Literal[True],
+) -> LazyRecords[T]: ...  # pragma: no cover
+
+
+@overload
+def parse(
+    event: dict[str, Any],
+    model: type[T],
+    envelope: type[Envelope],
+    lazy: bool,
+) -> T | LazyRecords[T]: ...  # pragma: no cover
 
 
-def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None = None):
+def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None = None, lazy: bool = False):
     """Standalone function to parse & validate events using Pydantic models
 
     Typically used when you need fine-grained control over error handling compared to event_parser decorator.
@@ -167,6 +194,9 @@ def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None
         Your data model that will replace the event
     envelope: Envelope
         Optional envelope to extract the model from
+    lazy: bool
+        Whether to parse each record of the envelope only when first accessed, returning `LazyRecords`.
+        Only supported by envelopes with records, e.g. `SqsEnvelope`.
 
     Raises
     ------
@@ -175,8 +205,17 @@ def parse(event: dict[str, Any], model: type[T], envelope: type[Envelope] | None
     InvalidModelTypeError
         When model given does not implement BaseModel
     InvalidEnvelopeError
-        When envelope given does not implement BaseEnvelope
+        When envelope given does not implement BaseEnvelope, or doesn't implement RecordEnvelope when parsing lazily
     """
+    if lazy:
+        if not (isinstance(envelope, type) and issubclass(envelope, RecordEnvelope)):
+            raise InvalidEnvelopeError(
+                f"Lazy parsing requires an envelope with records, e.g. SqsEnvelope, got envelope={envelope}",
+            )
+
+        logger.debug(f"Parsing and validating event model lazily with envelope={envelope}")
+        return envelope().parse_lazy(data=event, model=model)
+
     if envelope and callable(envelope):
         try:
             logger.debug(f"Parsing and validating event model with envelope={envelope}")
@@ -0,0 +1,46 @@
+import asyncio
+
+import aiohttp
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response
+from aws_lambda_powertools.event_handler.middlewares import AsyncNextMiddleware
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+app = APIGatewayRestResolver()
+
+TODOS_URL = "https://jsonplaceholder.typicode.com/todos"
+
+
+async def log_request_response(app: APIGatewayRestResolver, next_middleware: AsyncNextMiddleware) -> Response:
+    logger.info("Incoming request", path=app.current_event.path)
+
+    result = await next_middleware(app)
+    logger.info("Response received", status_code=result.status_code)
+
+    return result
+
+
+@app.get("/todos/<todo_id>", middlewares=[log_request_response])
+async def get_todo_with_comments(todo_id: str):
+    async with aiohttp.ClientSession() as session:
+        # both requests run concurrently
+        todo, comments = await asyncio.gather(
+            fetch_json(session, f"{TODOS_URL}/{todo_id}"),
+            fetch_json(session, f"{TODOS_URL}/{todo_id}/comments"),
+        )
+
+    return {"todo": todo, "comments": comments}
+
+
+async def fetch_json(session: aiohttp.ClientSession, url: str) -> dict:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
@@ -0,0 +1,31 @@
+import requests
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, CompressionConfig
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+tracer = Tracer()
+logger = Logger()
+
+compression = CompressionConfig(
+    level={"br": 5, "gzip": 5},  # faster than their maximum level, with a similar compression ratio for JSON
+    minimum_size=1024,  # smaller bodies are returned as-is
+    encodings=["br", "gzip"],  # br is used when brotli is installed and the client accepts it
+)
+app = APIGatewayRestResolver(compression=compression)
+
+
+@app.get("/todos", compress=True)
+@tracer.capture_method
+def get_todos():
+    todos: requests.Response = requests.get("https://jsonplaceholder.typicode.com/todos")
+    todos.raise_for_status()
+
+    return {"todos": todos.json()}
+
+
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@tracer.capture_lambda_handler
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
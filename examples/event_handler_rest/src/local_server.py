@@ -0,0 +1,25 @@
+from wsgiref.simple_server import make_server
+
+from aws_lambda_powertools.event_handler import APIGatewayHttpResolver
+from aws_lambda_powertools.event_handler.local import ASGIAdapter, WSGIAdapter
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+app = APIGatewayHttpResolver()
+
+
+@app.get("/todos/<todo_id>")
+def get_todo(todo_id: str):
+    return {"id": todo_id, "page": app.current_event.get_query_string_value("page")}
+
+
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
+
+
+# ASGI server, e.g. `uvicorn local_server:asgi_app --workers 4`
+asgi_app = ASGIAdapter(app)
+
+if __name__ == "__main__":
+    # WSGI server from the standard library, e.g. `python local_server.py`
+    with make_server("127.0.0.1", 3000, WSGIAdapter(app)) as server:
+        server.serve_forever()
@@ -0,0 +1,27 @@
+import requests
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.event_handler.middlewares.conditional_requests import ConditionalRequestMiddleware
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+app = APIGatewayRestResolver()
+
+# Cache responses for 5 minutes in warm execution environments, one per page and language
+conditional_requests = ConditionalRequestMiddleware(
+    cache_ttl=300,
+    cache_query_params=["page"],
+    cache_headers=["Accept-Language"],
+)
+
+
+@app.get("/todos", middlewares=[conditional_requests], cache_control="max-age=60")
+def get_todos():
+    page = app.current_event.get_query_string_value(name="page", default_value="1")
+    todos: requests.Response = requests.get("https://jsonplaceholder.typicode.com/todos", params={"_page": page})
+    todos.raise_for_status()
+
+    return {"todos": todos.json()}
+
+
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Iterator
+
+from aws_lambda_powertools.event_handler import LambdaFunctionUrlResolver, StreamingResponse
+from aws_lambda_powertools.event_handler.streaming import send_streaming_response
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+app = LambdaFunctionUrlResolver()
+
+
+@app.get("/progress", compress=True)
+def get_progress():
+    def events() -> Iterator[str]:
+        for percent in range(0, 101, 10):
+            yield f"data: {percent}\n\n"  # each event is written as soon as it's produced
+            time.sleep(0.5)
+
+    return StreamingResponse(status_code=200, content_type="text/event-stream", body=events())
+
+
+@app.get("/report")
+def download_report():
+    # files are read and written in 64 KiB chunks by default
+    report = Path(__file__).parent / "report.csv"
+    return StreamingResponse(status_code=200, content_type="text/csv", body=report.open("rb"))
+
+
+def lambda_handler(event: dict, context: LambdaContext) -> None:
+    send_streaming_response(context.aws_request_id, app.resolve_stream(event, context))
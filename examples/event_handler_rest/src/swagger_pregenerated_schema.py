@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+OPENAPI_SCHEMA_FILE = Path(__file__).parent / "openapi.json"
+
+app = APIGatewayRestResolver(enable_validation=True)
+app.enable_swagger(path="/swagger", openapi_schema_file=OPENAPI_SCHEMA_FILE)
+
+
+@app.get("/todos/<todo_id>")
+def get_todo(todo_id: int) -> dict:
+    return {"id": todo_id}
+
+
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
+
+
+if __name__ == "__main__":
+    # Run at build time, e.g. `python swagger_pregenerated_schema.py`, to package the schema with your function
+    OPENAPI_SCHEMA_FILE.write_text(app.get_openapi_json_schema(title="My API", version="1.0.0"))
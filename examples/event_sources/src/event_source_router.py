@@ -0,0 +1,22 @@
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent, SQSEvent
+from aws_lambda_powertools.utilities.data_classes.event_source_router import EventSourceRouter, EventSourceType
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+router = EventSourceRouter()
+
+
+@router.register(EventSourceType.SQS)
+def handle_messages(event: SQSEvent, context: LambdaContext):
+    for record in event.records:
+        logger.info(record.body)
+
+
+@router.register(EventSourceType.API_GATEWAY_REST)
+def handle_request(event: APIGatewayProxyEvent, context: LambdaContext):
+    return {"statusCode": 200, "body": event.path}
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    return router.resolve(event, context)
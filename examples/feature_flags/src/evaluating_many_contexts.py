@@ -0,0 +1,23 @@
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities.data_classes import SQSEvent, event_source
+from aws_lambda_powertools.utilities.feature_flags import AppConfigStore, FeatureFlags
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+
+app_config = AppConfigStore(environment="dev", application="product-catalogue", name="features")
+
+feature_flags = FeatureFlags(store=app_config)
+
+
+@event_source(data_class=SQSEvent)
+def lambda_handler(event: SQSEvent, context: LambdaContext):
+    records = list(event.records)
+    contexts = [{"tenant_id": record.json_body["tenant_id"]} for record in records]
+
+    # evaluated once per distinct tenant, rather than once per record
+    premium = feature_flags.evaluate_many(name="premium_features", contexts=contexts, default=False)
+
+    for record, has_premium_features in zip(records, premium):
+        if has_premium_features:
+            logger.info("Processing message with premium features", message_id=record.message_id)
@@ -0,0 +1,32 @@
+from aws_lambda_powertools.utilities.feature_flags import FeatureFlags, InMemoryStore, RuleAction
+
+
+def test_flags_condition_match():
+    # GIVEN
+    store = InMemoryStore(
+        {
+            "my_feature": {
+                "default": False,
+                "rules": {
+                    "tenant id equals 12345": {
+                        "when_match": True,
+                        "conditions": [
+                            {
+                                "action": RuleAction.EQUALS.value,
+                                "key": "tenant_id",
+                                "value": "12345",
+                            },
+                        ],
+                    },
+                },
+            },
+        },
+    )
+    feature_flags = FeatureFlags(store=store)
+
+    # WHEN
+    ctx = {"tenant_id": "12345", "username": "a"}
+    flag = feature_flags.evaluate(name="my_feature", context=ctx, default=False)
+
+    # THEN
+    assert flag is True
@@ -0,0 +1,18 @@
+from typing import Any
+
+from aws_lambda_powertools.utilities.feature_flags import FeatureFlags, LocalFileStore
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# features.json is packaged with the function, or at /opt/features.json when shipped in a Lambda Layer
+local_store = LocalFileStore(path="features.json", max_age=60)
+
+feature_flags = FeatureFlags(store=local_store)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    ctx = {"tier": event.get("tier", "standard")}
+
+    has_premium_features: Any = feature_flags.evaluate(name="premium_features", context=ctx, default=False)
+    if has_premium_features:
+        # enable premium features
+        ...
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+appconf_provider = parameters.AppConfigProvider(environment="dev", application="comments")
+
+routing_table: dict = {}
+routing_table_etag: str | None = None
+
+
+def build_routing_table(config: Any) -> dict:
+    return {route["path"]: route["target"] for route in config["routes"]}
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    global routing_table, routing_table_etag
+
+    config: Any = appconf_provider.get("routing", transform="json")
+
+    # Rebuild derived state only when a new configuration version is deployed
+    etag = appconf_provider.get_etag("routing")
+    if etag != routing_table_etag:
+        routing_table = build_routing_table(config)
+        routing_table_etag = etag
+
+    return {"target": routing_table.get(event["path"]), "statusCode": 200}
@@ -0,0 +1,22 @@
+from typing import Any
+
+import requests
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# Retrieve values through the Parameters and Secrets Lambda Extension, boto3 is only used as fallback
+ssm_provider = parameters.SSMProvider(use_extension=True)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    try:
+        # Retrieve a single parameter
+        endpoint_comments: Any = ssm_provider.get("/lambda-powertools/endpoint_comments")
+
+        # the value of this parameter is https://jsonplaceholder.typicode.com/comments/
+        comments: requests.Response = requests.get(endpoint_comments)
+
+        return {"comments": comments.json()[:10], "statusCode": 200}
+    except parameters.exceptions.GetParameterError as error:
+        return {"comments": None, "message": str(error), "statusCode": 400}
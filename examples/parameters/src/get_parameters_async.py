@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+ssm_provider = parameters.SSMProvider()
+secrets_provider = parameters.SecretsProvider()
+
+
+async def fetch_configuration() -> dict[str, Any]:
+    # Cache misses are fetched concurrently, without blocking the event loop
+    endpoint, api_key, settings = await asyncio.gather(
+        ssm_provider.get_async("/lambda-powertools/endpoint_comments"),
+        secrets_provider.get_async("/lambda-powertools/api_key"),
+        ssm_provider.get_multiple_async("/lambda-powertools/settings", transform="auto"),
+    )
+
+    return {"endpoint": endpoint, "api_key": api_key, "settings": settings}
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    try:
+        configuration = asyncio.run(fetch_configuration())
+        return {"settings": configuration["settings"], "statusCode": 200}
+    except parameters.exceptions.GetParameterError as error:
+        return {"message": str(error), "statusCode": 400}
@@ -0,0 +1,24 @@
+from typing import Any
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+
+# Bounded cache shared by both providers; parameters not found are cached for 10 seconds
+cache = parameters.InMemoryCache(max_items=256, negative_ttl=10)
+ssm_provider = parameters.SSMProvider(cache=cache)
+secrets_provider = parameters.SecretsProvider(cache=cache)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    try:
+        feature_toggle: Any = ssm_provider.get("/lambda-powertools/feature_toggle")
+        api_key: Any = secrets_provider.get("/lambda-powertools/api_key")
+
+        return {"toggle": feature_toggle, "key_length": len(api_key), "statusCode": 200}
+    except parameters.exceptions.GetParameterError as error:
+        return {"message": str(error), "statusCode": 400}
+    finally:
+        logger.info("Parameters cache stats", extra={"cache_stats": vars(cache.stats)})
@@ -0,0 +1,28 @@
+from typing import Any
+
+import requests
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+# Requires POWERTOOLS_PARAMETERS_BACKGROUND_REFRESH env var set to "false"
+ssm_provider = parameters.SSMProvider()
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    # Refresh any value returned stale in previous invocations before handling this event
+    ssm_provider.refresh_stale_values()
+
+    try:
+        endpoint_comments: Any = ssm_provider.get(
+            "/lambda-powertools/endpoint_comments",
+            max_age=20,
+            stale_while_revalidate=300,
+        )
+
+        # the value of this parameter is https://jsonplaceholder.typicode.com/comments/
+        comments: requests.Response = requests.get(endpoint_comments)
+
+        return {"comments": comments.json()[:10], "statusCode": 200}
+    except parameters.exceptions.GetParameterError as error:
+        return {"comments": None, "message": str(error), "statusCode": 400}
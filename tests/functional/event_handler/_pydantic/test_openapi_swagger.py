@@ -5,6 +5,7 @@ from typing import Dict
 import pytest
 
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.event_handler.openapi import compat
 from aws_lambda_powertools.event_handler.openapi.swagger_ui import OAuth2Config
 from tests.functional.utils import load_event
 
@@ -124,3 +125,111 @@ def test_openapi_swagger_oauth2_with_powertools_dev(monkeypatch):
         )
 
     monkeypatch.delenv("POWERTOOLS_DEV")
+
+
+def test_openapi_schema_cached_until_routes_registered(mocker):
+    # GIVEN a resolver with a route
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    @app.get("/hello")
+    def hello() -> str:
+        return "world"
+
+    get_definitions = mocker.spy(compat, "get_definitions")
+
+    # WHEN generating the schema multiple times with the same parameters
+    schema = app.get_openapi_json_schema(title="My API")
+    assert app.get_openapi_json_schema(title="My API") is schema
+    assert app.get_openapi_schema(title="My API") == app.get_openapi_schema(title="My API")
+
+    # THEN model definitions are only generated once
+    assert get_definitions.call_count == 1
+
+    # WHEN registering a new route
+    @app.get("/bye")
+    def bye() -> str:
+        return "world"
+
+    # THEN the schema is generated again
+    assert "/bye" in json.loads(app.get_openapi_json_schema(title="My API"))["paths"]
+    assert get_definitions.call_count == 2
+
+
+def test_openapi_schema_cached_returns_copy():
+    # GIVEN a resolver with a route
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    @app.get("/hello")
+    def hello() -> str:
+        return "world"
+
+    # WHEN modifying the returned schema
+    schema = app.get_openapi_schema(title="My API")
+    schema.info.title = "Changed"
+    schema.openapi = "3.0.3"
+
+    # THEN subsequent calls are not affected
+    assert app.get_openapi_schema(title="My API").info.title == "My API"
+    assert json.loads(app.get_openapi_json_schema(title="My API"))["info"]["title"] == "My API"
+    assert app.get_openapi_schema(title="My API").openapi != "3.0.3"
+
+
+def test_openapi_swagger_etag():
+    # GIVEN Swagger UI enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger()
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+
+    # WHEN requesting the Swagger UI and the OpenAPI JSON
+    html = app(event, {})
+    event["queryStringParameters"] = {"format": "json"}
+    spec = app(event, {})
+
+    # THEN each representation has its own ETag
+    html_etag = html["multiValueHeaders"]["ETag"][0]
+    spec_etag = spec["multiValueHeaders"]["ETag"][0]
+    assert html_etag != spec_etag
+
+    # WHEN requesting them again with their ETag
+    event["headers"]["If-None-Match"] = spec_etag
+    result = app(event, {})
+
+    # THEN a 304 without body is returned
+    assert result["statusCode"] == 304
+    assert result["body"] == ""
+
+    # WHEN the schema changes
+    @app.get("/hello")
+    def hello() -> str:
+        return "world"
+
+    result = app(event, {})
+
+    # THEN the new schema is returned
+    assert result["statusCode"] == 200
+    assert "/hello" in json.loads(result["body"])["paths"]
+
+
+def test_openapi_swagger_schema_file(tmp_path):
+    # GIVEN an OpenAPI schema generated at build time
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    @app.get("/hello")
+    def hello() -> str:
+        return "world"
+
+    schema_file = tmp_path / "openapi.json"
+    schema_file.write_text(app.get_openapi_json_schema(title="Pre-generated API"))
+    app.enable_swagger(openapi_schema_file=schema_file)
+
+    # WHEN requesting the OpenAPI JSON
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["queryStringParameters"] = {"format": "json"}
+    result = app(event, {})
+
+    # THEN the schema file is served
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"])["info"]["title"] == "Pre-generated API"
+    assert result["multiValueHeaders"]["ETag"]
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from dataclasses import dataclass
 from enum import Enum
@@ -17,6 +18,7 @@ from aws_lambda_powertools.event_handler import (
     VPCLatticeResolver,
     VPCLatticeV2Resolver,
 )
+from aws_lambda_powertools.event_handler.middlewares import openapi_validation
 from aws_lambda_powertools.event_handler.openapi.params import Body, Header, Query
 
 
@@ -811,6 +813,36 @@ def test_validation_header_with_http_rest_resolver(
         assert any(text in result["body"] for text in expected_error_text)
 
 
+@pytest.mark.parametrize("compile_plan", [True, False])
+def test_validation_keeps_event_headers_and_query_string_values(gw_event, mocker, compile_plan):
+    # GIVEN a REST resolver with validation, and a route with scalar header and query string parameters
+    if not compile_plan:
+        mocker.patch.object(openapi_validation, "create_model", side_effect=TypeError("unsupported"))
+    app = APIGatewayRestResolver(enable_validation=True)
+    gw_event["path"] = "/users"
+    gw_event["multiValueHeaders"] = {"header1": ["value1"]}
+    gw_event["multiValueQueryStringParameters"] = {"page": ["2"]}
+
+    @app.get("/users")
+    def handler(header1: Annotated[str, Header()], page: Annotated[int, Query()]):
+        # THEN the route receives scalar values
+        assert header1 == "value1"
+        assert page == 2
+
+        return {
+            "headers": app.current_event.resolved_headers_field,
+            "query": app.current_event.resolved_query_string_parameters,
+        }
+
+    # WHEN validating the request in a single call, or each field separately
+    result = app(gw_event, {})
+
+    # THEN headers and query string read from the event after validation keep their raw values
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"headers": {"header1": ["value1"]}, "query": {"page": ["2"]}}
+    assert gw_event["multiValueQueryStringParameters"] == {"page": ["2"]}
+
+
 @pytest.mark.parametrize(
     "handler_func, expected_status_code, expected_error_text",
     [
@@ -1128,3 +1160,180 @@ def test_validate_with_minimal_event():
     # THEN the handler should be invoked and return 200
     result = app(minimal_event, {})
     assert result["statusCode"] == 200
+
+
+def test_validate_request_in_a_single_call(gw_event, mocker):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    class Model(BaseModel):
+        name: str
+
+    # WHEN a handler is defined with path, query, header and body parameters
+    @app.post("/users/<user_id>")
+    def handler(
+        user_id: int,
+        user: Model,
+        page: Annotated[int, Query(gt=0)] = 1,
+        trace_id: Annotated[Optional[str], Header(alias="X-Trace-Id")] = None,
+    ):
+        return {"user_id": user_id, "name": user.name, "page": page, "trace_id": trace_id}
+
+    route = app._dynamic_routes[0]
+    validate = mocker.spy(route.request_validation_plan.model, "model_validate")
+
+    gw_event["httpMethod"] = "POST"
+    gw_event["path"] = "/users/123"
+    gw_event["multiValueQueryStringParameters"] = {"page": ["2", "3"]}
+    gw_event["multiValueHeaders"] = {"X-Trace-Id": ["abc"]}
+    gw_event["body"] = json.dumps({"name": "John"})
+
+    # THEN the whole request is validated with one call, using the same plan across requests
+    for _ in range(2):
+        result = app(gw_event, {})
+        assert result["statusCode"] == 200
+        assert json.loads(result["body"]) == {"user_id": 123, "name": "John", "page": 2, "trace_id": "abc"}
+
+    assert validate.call_count == 2
+
+
+def test_validate_request_errors_across_locations(gw_event):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    class Model(BaseModel):
+        name: str
+        age: int
+
+    # WHEN a handler is defined with path, query and body parameters
+    @app.post("/users/<user_id>")
+    def handler(user_id: int, user: Model, page: Annotated[int, Query(gt=0)]):
+        return {}
+
+    gw_event["httpMethod"] = "POST"
+    gw_event["path"] = "/users/abc"
+    gw_event["multiValueQueryStringParameters"] = {"other": ["value"]}
+    gw_event["body"] = json.dumps({"name": 1, "age": "x"})
+
+    # THEN all errors are reported with their location, in order of path, query and body params
+    result = app(gw_event, {})
+    assert result["statusCode"] == 422
+
+    errors = json.loads(result["body"])["detail"]
+    assert [error["loc"] for error in errors] == [
+        ["path", "user_id"],
+        ["query", "page"],
+        ["body", "name"],
+        ["body", "age"],
+    ]
+    assert errors[1]["type"] == "missing"
+
+
+def test_validate_request_fields_separately_when_plan_cannot_be_compiled(gw_event, mocker):
+    # GIVEN request parameters that can't be compiled into a single model
+    mocker.patch(
+        "aws_lambda_powertools.event_handler.middlewares.openapi_validation.create_model",
+        side_effect=TypeError("unsupported"),
+    )
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    @app.get("/users/<user_id>")
+    def handler(user_id: int):
+        return {"user_id": user_id}
+
+    # WHEN validating requests
+    gw_event["path"] = "/users/123"
+    result = app(gw_event, {})
+
+    gw_event["path"] = "/users/abc"
+    invalid_result = app(gw_event, {})
+
+    # THEN each field is validated separately
+    assert app._dynamic_routes[0].request_validation_plan.model is None
+    assert json.loads(result["body"]) == {"user_id": 123}
+    assert invalid_result["statusCode"] == 422
+
+
+def test_serialize_return_type_straight_to_json(gw_event, mocker):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+    jsonable_encoder = mocker.spy(openapi_validation, "jsonable_encoder")
+
+    class Model(BaseModel):
+        name: str
+        age: int
+
+    # WHEN a handler is defined with a return type
+    @app.get("/")
+    def handler() -> List[Model]:
+        return [Model(name="John", age=30), {"name": "Jane", "age": "31"}]
+
+    gw_event["path"] = "/"
+
+    # THEN the response is serialized to JSON by pydantic-core, without walking it
+    result = app(gw_event, {})
+    assert result["statusCode"] == 200
+    assert result["body"] == '[{"name":"John","age":30},{"name":"Jane","age":31}]'
+    assert jsonable_encoder.call_count == 0
+
+
+def test_serialize_return_type_string(gw_event):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    # WHEN a handler returns a string
+    @app.get("/")
+    def handler() -> str:
+        return "hello world"
+
+    gw_event["path"] = "/"
+
+    # THEN the string is returned as-is, as before
+    result = app(gw_event, {})
+    assert result["statusCode"] == 200
+    assert result["body"] == "hello world"
+
+
+def test_serialize_return_type_falls_back_to_jsonable_encoder(gw_event, mocker):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+    jsonable_encoder = mocker.spy(openapi_validation, "jsonable_encoder")
+
+    # GIVEN a type pydantic-core can't serialize
+    class CustomClass:
+        def __init__(self, value: str):
+            self.value = value
+
+    # WHEN a handler returns it within an open return type
+    @app.get("/")
+    def handler() -> dict:
+        return {"custom": CustomClass("value")}
+
+    gw_event["path"] = "/"
+
+    # THEN the response is serialized with jsonable_encoder instead
+    result = app(gw_event, {})
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"custom": {"value": "value"}}
+    assert jsonable_encoder.call_count == 1
+
+
+def test_validate_async_route(gw_event):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    # WHEN an async handler is defined with a scalar parameter
+    @app.get("/users/<user_id>")
+    async def handler(user_id: int) -> dict:
+        await asyncio.sleep(0)
+        return {"user_id": user_id}
+
+    # THEN the path parameter is validated before awaiting the handler, and the response after
+    gw_event["path"] = "/users/123"
+    result = app(gw_event, {})
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"user_id": 123}
+
+    gw_event["path"] = "/users/abc"
+    result = app(gw_event, {})
+    assert result["statusCode"] == 422
@@ -12,7 +12,7 @@ from typing import Dict
 
 import pytest
 
-from aws_lambda_powertools.event_handler import content_types
+from aws_lambda_powertools.event_handler import CompressionConfig, compression, content_types
 from aws_lambda_powertools.event_handler.api_gateway import (
     ALBResolver,
     APIGatewayHttpResolver,
@@ -554,6 +554,24 @@ def test_base64_encode():
     assert headers["Content-Encoding"] == ["gzip"]
 
 
+@pytest.mark.parametrize("body_type", [bytes, bytearray, memoryview])
+def test_base64_encode_bytes_like_body(body_type):
+    # GIVEN a function that returns a bytes-like body
+    app = ApiGatewayResolver()
+    image = read_media("tracer_utility_showcase.png")
+
+    @app.get("/my/path")
+    def read_image() -> Response:
+        return Response(200, "image/png", body_type(image))
+
+    # WHEN calling the event handler
+    result = app({"path": "/my/path", "httpMethod": "GET"}, None)
+
+    # THEN return the body as a base64 encoded string
+    assert result["isBase64Encoded"] is True
+    assert base64.b64decode(result["body"]) == image
+
+
 def test_compress_no_accept_encoding():
     # GIVEN a function with compress=True
     # AND the request has no "Accept-Encoding" set to include gzip
@@ -590,6 +608,126 @@ def test_compress_no_accept_encoding_null_headers():
     assert result["body"] == expected_value
 
 
+def test_compress_skips_small_bodies():
+    # GIVEN a resolver only compressing bodies of at least 100 bytes
+    app = ApiGatewayResolver(compression=CompressionConfig(minimum_size=100))
+    mock_event = {"path": "/my/path", "httpMethod": "GET", "headers": {"Accept-Encoding": "gzip"}}
+
+    @app.get("/my/path", compress=True)
+    def return_text() -> Response:
+        return Response(200, content_types.TEXT_PLAIN, app.current_event.query_string_parameters["body"])
+
+    # WHEN the body is smaller than the minimum size
+    mock_event["queryStringParameters"] = {"body": "Foo"}
+    result = app(mock_event, None)
+
+    # THEN it's returned as-is
+    assert result["isBase64Encoded"] is False
+    assert result["body"] == "Foo"
+    assert "Content-Encoding" not in result["multiValueHeaders"]
+
+    # WHEN the body is large enough
+    mock_event["queryStringParameters"] = {"body": "Foo" * 50}
+    result = app(mock_event, None)
+
+    # THEN it's compressed
+    assert result["isBase64Encoded"] is True
+    decompress = zlib.decompress(base64.b64decode(result["body"]), wbits=zlib.MAX_WBITS | 16).decode("UTF-8")
+    assert decompress == "Foo" * 50
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected_encoding",
+    [
+        ("gzip, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("BR;q=0.2, x-gzip;q=0.3", "gzip"),
+        ("*", "br"),
+        ("gzip;q=0, *;q=0.1", "br"),
+        ("gzip;q=0", None),
+        ("deflate, identity", None),
+    ],
+)
+def test_compress_negotiates_accept_encoding(mocker, accept_encoding, expected_encoding):
+    # GIVEN a resolver preferring br over gzip
+    mocker.patch.dict(compression.COMPRESSORS, {"br": lambda body, level: b"br:" + body})
+    app = ApiGatewayResolver(compression=CompressionConfig(encodings=["br", "gzip"]))
+    mock_event = {"path": "/my/path", "httpMethod": "GET", "headers": {"Accept-Encoding": accept_encoding}}
+
+    @app.get("/my/path", compress=True)
+    def return_text() -> Response:
+        return Response(200, content_types.TEXT_PLAIN, "Foo")
+
+    # WHEN calling the event handler
+    result = app(mock_event, None)
+
+    # THEN the encoding with the highest quality value is used, and br wins ties
+    assert result["multiValueHeaders"].get("Content-Encoding", [None]) == [expected_encoding]
+    if expected_encoding == "br":
+        assert base64.b64decode(result["body"]) == b"br:Foo"
+    elif expected_encoding is None:
+        assert result["body"] == "Foo"
+
+
+def test_compression_config_ignores_unavailable_encodings(mocker):
+    # GIVEN zstd isn't installed
+    mocker.patch.dict(compression.COMPRESSORS, {"gzip": compression.COMPRESSORS["gzip"]}, clear=True)
+
+    # WHEN configuring zstd and gzip
+    config = CompressionConfig(encodings=["zstd", "gzip"])
+
+    # THEN only gzip is used
+    assert config.encodings == ["gzip"]
+    assert config.negotiate("zstd, gzip") == "gzip"
+
+
+def test_compression_config_invalid():
+    with pytest.raises(ValueError, match="gzip must be between 1 and 9"):
+        CompressionConfig(level=10)
+
+    with pytest.raises(ValueError, match="br must be between 0 and 11"):
+        CompressionConfig(level={"br": 12})
+
+    with pytest.raises(ValueError, match="deflate"):
+        CompressionConfig(encodings=["deflate"])
+
+
+def test_compression_config_level_per_encoding(mocker):
+    # GIVEN compressors recording the level they're called with
+    mocker.patch.dict(
+        compression.COMPRESSORS,
+        {"br": lambda body, level: f"br:{level}".encode(), "zstd": lambda body, level: f"zstd:{level}".encode()},
+    )
+
+    # WHEN configuring a level for zstd only
+    config = CompressionConfig(level={"zstd": 19}, encodings=["zstd", "br", "gzip"])
+
+    # THEN it's used for zstd, and other encodings use their own default level
+    assert config.compress(b"Foo", "zstd") == b"zstd:19"
+    assert config.compress(b"Foo", "br") == b"br:4"
+    assert config.levels["gzip"] == 6
+
+    # WHEN configuring a single level above gzip's maximum for br only
+    # THEN it's accepted within br's range
+    assert CompressionConfig(level=11, encodings=["br"]).compress(b"Foo", "br") == b"br:11"
+
+
+def test_compress_adds_vary_header():
+    # GIVEN a route with compression enabled, already varying on another header
+    app = ApiGatewayResolver()
+
+    @app.get("/my/path", compress=True)
+    def return_text() -> Response:
+        return Response(200, content_types.TEXT_PLAIN, "Foo", headers={"Vary": "Origin"})
+
+    # WHEN a client accepting gzip calls it
+    result = app({"path": "/my/path", "httpMethod": "GET", "headers": {"Accept-Encoding": "gzip"}}, None)
+
+    # THEN the compressed response varies on Accept-Encoding too
+    assert result["multiValueHeaders"]["Content-Encoding"] == ["gzip"]
+    assert result["multiValueHeaders"]["Vary"] == ["Origin, Accept-Encoding"]
+
+
 def test_cache_control_200():
     # GIVEN a function with cache_control set
     app = ApiGatewayResolver()
@@ -702,6 +840,30 @@ def test_cors_multi_origin():
     assert "Access-Control-Allow-Origin" not in headers
 
 
+def test_cors_wildcard_origin():
+    # GIVEN a custom cors configuration allowing any subdomain of an origin
+    cors_config = CORSConfig(allow_origin="https://origin1", extra_origins=["https://*.example.com"])
+    app = ApiGatewayResolver(cors=cors_config)
+
+    @app.get("/cors")
+    def get_with_cors():
+        return {}
+
+    def get_allowed_origin(origin: str):
+        event = {"path": "/cors", "httpMethod": "GET", "headers": {"Origin": origin}}
+        return app(event, None)["multiValueHeaders"].get("Access-Control-Allow-Origin")
+
+    # WHEN calling the event handler with a matching subdomain
+    # THEN the origin is allowed
+    assert get_allowed_origin("https://dev.example.com") == ["https://dev.example.com"]
+    assert get_allowed_origin("https://origin1") == ["https://origin1"]
+
+    # WHEN calling the event handler with nested subdomains, other schemes or lookalike domains
+    # THEN the origin isn't allowed
+    for origin in ["https://a.b.example.com", "http://dev.example.com", "https://dev.example.com.evil", "https://x"]:
+        assert get_allowed_origin(origin) is None
+
+
 def test_custom_cors_config():
     # GIVEN a custom cors configuration
     allow_header = ["foo2"]
@@ -806,6 +968,59 @@ def test_cors_preflight():
     assert headers["Access-Control-Allow-Methods"] == [",".join(sorted(["DELETE", "GET", "OPTIONS"]))]
 
 
+def test_cors_preflight_methods_by_path():
+    # GIVEN routes with different methods for different paths
+    app = ApiGatewayResolver(cors=CORSConfig())
+
+    @app.get("/todos")
+    def get_todos(): ...
+
+    @app.post("/todos")
+    def create_todo(): ...
+
+    @app.get("/todos/fetch")
+    def fetch_todos(): ...
+
+    @app.delete("/todos/<todo_id>")
+    def delete_todo(todo_id: str): ...
+
+    def get_allow_methods(path: str):
+        event = {"path": path, "httpMethod": "OPTIONS", "headers": {"Origin": "http://example.org"}}
+        return app(event, None)["multiValueHeaders"]["Access-Control-Allow-Methods"]
+
+    # WHEN calling the handler with pre-flight requests
+    # THEN only methods of routes matching the path are allowed
+    assert get_allow_methods("/todos") == ["GET,OPTIONS,POST"]
+    assert get_allow_methods("/todos/1") == ["DELETE,OPTIONS"]
+    # AND static and dynamic routes matching the same path are combined
+    assert get_allow_methods("/todos/fetch") == ["DELETE,GET,OPTIONS"]
+    # AND all methods are allowed for paths without routes
+    assert get_allow_methods("/unknown") == ["DELETE,GET,OPTIONS,POST"]
+
+
+def test_cors_preflight_methods_with_trailing_slashes_and_regex_rules():
+    # GIVEN a REST resolver with CORS, a static route, and a catch-all regex route
+    app = APIGatewayRestResolver(cors=CORSConfig())
+
+    @app.get("/todos")
+    def get_todos(): ...
+
+    @app.put(".+")
+    def catch_all(): ...
+
+    def get_allow_methods(path: str):
+        event = {"path": path, "httpMethod": "OPTIONS", "headers": {"Origin": "http://example.org"}}
+        return app(event, None)["multiValueHeaders"]["Access-Control-Allow-Methods"]
+
+    # WHEN calling the handler with pre-flight requests
+    # THEN static routes are matched with trailing slashes, and regex routes are matched like dynamic routes
+    assert get_allow_methods("/todos") == ["GET,OPTIONS,PUT"]
+    assert get_allow_methods("/todos/") == ["GET,OPTIONS,PUT"]
+    assert get_allow_methods("/other") == ["OPTIONS,PUT"]
+    # AND only regex and dynamic rules are scanned for each request
+    assert list(app._cors_dynamic_preflight_rules) == ["^.+/*$"]
+
+
 def test_custom_preflight_response():
     # GIVEN cors is enabled
     # AND we have a custom preflight method
@@ -561,3 +561,62 @@ def test_global_middleware_not_found_preflight():
     # AND ensure middlewares are called
     assert result["statusCode"] == 204
     assert result["body"] == "middleware works"
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_middleware_chain_with_and_without_debug(debug: bool, capsys):
+    # GIVEN nested middlewares, with and without debug mode
+    app = APIGatewayRestResolver(debug=debug)
+    calls = []
+
+    def outer(app: APIGatewayRestResolver, next_middleware: NextMiddleware):
+        calls.append(f"outer -> {next_middleware.__name__}")
+        return next_middleware(app)
+
+    def inner(app: APIGatewayRestResolver, next_middleware: NextMiddleware):
+        calls.append("inner")
+        return next_middleware(app)
+
+    app.use([outer])
+
+    @app.get("/my/path", middlewares=[inner])
+    def get_lambda():
+        calls.append("route")
+        return {}
+
+    # WHEN processing multiple requests
+    for _ in range(2):
+        result = app(API_REST_EVENT, {})
+
+    # THEN middlewares are called in order, and the next middleware name is available
+    assert result["statusCode"] == 200
+    assert calls == ["outer -> inner", "inner", "route"] * 2
+
+    # AND processed stack frames are only recorded in debug mode
+    assert ("[outer] next call chain is outer -> inner" in capsys.readouterr().out) is debug
+    assert bool(app.processed_stack_frames) is debug
+
+
+def test_exception_handler_lookup_cache():
+    # GIVEN an exception handler for a base exception class
+    app = APIGatewayRestResolver()
+
+    @app.get("/my/path")
+    def get_lambda():
+        raise BadRequestError("bad request")
+
+    @app.exception_handler(Exception)
+    def handle_exception(ex: Exception):
+        return Response(status_code=500, content_type=content_types.TEXT_PLAIN, body="base")
+
+    # WHEN the exception is raised
+    # THEN the base class handler is used
+    assert app(API_REST_EVENT, {})["body"] == "base"
+
+    # WHEN a handler for a more specific exception is registered later
+    @app.exception_handler(BadRequestError)
+    def handle_bad_request(ex: BadRequestError):
+        return Response(status_code=400, content_type=content_types.TEXT_PLAIN, body="specific")
+
+    # THEN the previously resolved handler isn't reused
+    assert app(API_REST_EVENT, {})["body"] == "specific"
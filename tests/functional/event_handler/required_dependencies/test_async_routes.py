@@ -0,0 +1,172 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response, content_types
+from aws_lambda_powertools.event_handler.exceptions import NotFoundError
+from aws_lambda_powertools.event_handler.middlewares import AsyncNextMiddleware, BaseMiddlewareHandler, NextMiddleware
+from tests.functional.utils import load_event
+
+API_REST_EVENT = load_event("apiGatewayProxyEvent.json")
+
+
+def test_resolve_async_route_gather():
+    # GIVEN an async route fanning out to multiple downstream calls
+    app = APIGatewayRestResolver()
+    running = []
+
+    async def fetch(name: str) -> str:
+        running.append(name)
+        await asyncio.sleep(0)
+        # all calls are started before any of them finishes
+        assert len(running) == 3
+        return name
+
+    @app.get("/my/path")
+    async def get_todos():
+        return {"results": await asyncio.gather(fetch("a"), fetch("b"), fetch("c"))}
+
+    # WHEN resolving the event synchronously
+    result = app(API_REST_EVENT, {})
+
+    # THEN the route is awaited
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"results": ["a", "b", "c"]}
+
+
+def test_resolve_async_route_reuses_event_loop():
+    # GIVEN an async route
+    app = APIGatewayRestResolver()
+    loops = []
+
+    @app.get("/my/path")
+    async def get_todos():
+        loops.append(asyncio.get_running_loop())
+        return {}
+
+    # WHEN resolving multiple events
+    app(API_REST_EVENT, {})
+    app(API_REST_EVENT, {})
+
+    # THEN the same event loop is used across invocations
+    assert loops[0] is loops[1]
+    assert not loops[0].is_running()
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_resolve_async_route_more_sync_middlewares_than_workers(debug):
+    # GIVEN an async route behind more sync middlewares than the event loop has worker threads
+    app = APIGatewayRestResolver(debug=debug)
+    app._event_loop = asyncio.new_event_loop()
+    app._event_loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+    threads = set()
+
+    def sync_middleware(app: APIGatewayRestResolver, next_middleware: NextMiddleware) -> Response:
+        threads.add(threading.get_ident())
+        return next_middleware(app)
+
+    @app.get("/my/path", middlewares=[sync_middleware] * 6)
+    async def get_todos():
+        return {"todos": []}
+
+    # WHEN resolving the event
+    results = []
+    resolve = threading.Thread(target=lambda: results.append(app(API_REST_EVENT, {})), daemon=True)
+    resolve.start()
+    resolve.join(timeout=5)
+
+    # THEN it doesn't deadlock, as consecutive sync middlewares share a worker thread
+    assert results[0]["statusCode"] == 200
+    assert len(threads) == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_async_route_in_running_event_loop():
+    # GIVEN an async route
+    app = APIGatewayRestResolver()
+
+    @app.get("/my/path")
+    async def get_todos():
+        return {}
+
+    # WHEN resolving it synchronously from a running event loop
+    # THEN async_resolve is suggested instead
+    with pytest.raises(RuntimeError, match="async_resolve"):
+        app.resolve(API_REST_EVENT, {})
+
+
+@pytest.mark.asyncio
+async def test_async_resolve_middlewares():
+    # GIVEN async and sync middlewares around an async route
+    app = APIGatewayRestResolver()
+    calls = []
+
+    async def async_middleware(app: APIGatewayRestResolver, next_middleware: AsyncNextMiddleware) -> Response:
+        calls.append("async before")
+        response = await next_middleware(app)
+        calls.append("async after")
+        response.headers["X-Async"] = "true"
+        return response
+
+    def sync_middleware(app: APIGatewayRestResolver, next_middleware: NextMiddleware) -> Response:
+        # sync middlewares don't block the event loop
+        calls.append(f"sync before in main thread: {threading.current_thread() is threading.main_thread()}")
+        response = next_middleware(app)
+        calls.append("sync after")
+        return response
+
+    class AsyncHandlerMiddleware(BaseMiddlewareHandler):
+        async def handler(self, app: APIGatewayRestResolver, next_middleware: AsyncNextMiddleware) -> Response:
+            calls.append("handler before")
+            return await next_middleware(app)
+
+    app.use([async_middleware])
+
+    @app.get("/my/path", middlewares=[sync_middleware, AsyncHandlerMiddleware()])
+    async def get_todos():
+        calls.append("route")
+        return {"todos": []}
+
+    # WHEN resolving the event in the running event loop
+    result = await app.async_resolve(API_REST_EVENT, {})
+
+    # THEN middlewares run in order, awaiting the route
+    assert result["statusCode"] == 200
+    assert result["multiValueHeaders"]["X-Async"] == ["true"]
+    assert calls == [
+        "async before",
+        "sync before in main thread: False",
+        "handler before",
+        "route",
+        "sync after",
+        "async after",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_resolve_sync_route_and_exception_handler():
+    # GIVEN sync routes and an exception handler
+    app = APIGatewayRestResolver()
+
+    @app.get("/my/path")
+    def get_todos():
+        raise ValueError("boom")
+
+    @app.exception_handler(ValueError)
+    def handle_value_error(ex: ValueError):
+        return Response(status_code=400, content_type=content_types.TEXT_PLAIN, body=str(ex))
+
+    @app.not_found
+    def handle_not_found(ex: NotFoundError):
+        return Response(status_code=418, content_type=content_types.TEXT_PLAIN, body="not here")
+
+    # WHEN resolving events asynchronously
+    error = await app.async_resolve(API_REST_EVENT, {})
+    not_found = await app.async_resolve({**API_REST_EVENT, "path": "/other"}, {})
+
+    # THEN exceptions are handled as with resolve
+    assert (error["statusCode"], error["body"]) == (400, "boom")
+    assert (not_found["statusCode"], not_found["body"]) == (418, "not here")
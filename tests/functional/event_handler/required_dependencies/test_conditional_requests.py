@@ -0,0 +1,243 @@
+import json
+from typing import Optional
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response, content_types
+from aws_lambda_powertools.event_handler.middlewares.conditional_requests import ConditionalRequestMiddleware
+from aws_lambda_powertools.shared.cookies import Cookie
+
+
+def build_event(
+    path: str = "/todos",
+    method: str = "GET",
+    headers: Optional[dict] = None,
+    query: Optional[dict] = None,
+):
+    return {
+        "path": path,
+        "httpMethod": method,
+        "headers": headers or {},
+        "queryStringParameters": query,
+        "requestContext": {},
+    }
+
+
+def test_etag_not_modified():
+    # GIVEN a route answering conditional requests
+    app = APIGatewayRestResolver()
+
+    @app.get("/todos", middlewares=[ConditionalRequestMiddleware()], cache_control="max-age=60")
+    def get_todos():
+        return {"todos": [1, 2, 3]}
+
+    # WHEN requesting it
+    result = app(build_event(), {})
+
+    # THEN an ETag of the body is returned
+    etag = result["multiValueHeaders"]["ETag"][0]
+    assert etag.startswith('W/"')
+    assert json.loads(result["body"]) == {"todos": [1, 2, 3]}
+
+    # WHEN requesting it again with the ETag
+    result = app(build_event(headers={"If-None-Match": etag}), {})
+
+    # THEN a 304 without body is returned, keeping the cache control
+    assert result["statusCode"] == 304
+    assert result["body"] == ""
+    assert result["multiValueHeaders"]["ETag"] == [etag]
+    assert result["multiValueHeaders"]["Cache-Control"] == ["max-age=60"]
+
+    # WHEN the ETag doesn't match
+    result = app(build_event(headers={"If-None-Match": 'W/"other", "another"'}), {})
+
+    # THEN the full response is returned
+    assert result["statusCode"] == 200
+
+
+def test_etag_version_skips_route():
+    # GIVEN a route with a resource version function
+    app = APIGatewayRestResolver()
+    calls = []
+
+    @app.get("/todos", middlewares=[ConditionalRequestMiddleware(version=lambda app: "v2")])
+    def get_todos():
+        calls.append(1)
+        return {"todos": [1, 2, 3]}
+
+    # WHEN requesting it with the current version
+    result = app(build_event(headers={"if-none-match": '"v2"'}), {})
+
+    # THEN a 304 is returned without running the route
+    assert result["statusCode"] == 304
+    assert calls == []
+
+    # WHEN requesting it with an older version
+    result = app(build_event(headers={"if-none-match": 'W/"v1"'}), {})
+
+    # THEN the route runs, and the version is the ETag
+    assert result["statusCode"] == 200
+    assert result["multiValueHeaders"]["ETag"] == ['W/"v2"']
+    assert calls == [1]
+
+
+def test_response_cache(mocker):
+    # GIVEN a route caching responses for 60 seconds, varying on the page query string parameter
+    monotonic = mocker.patch(
+        "aws_lambda_powertools.event_handler.middlewares.conditional_requests.time.monotonic",
+        return_value=100.0,
+    )
+    app = APIGatewayRestResolver()
+    calls = []
+
+    @app.get("/todos", middlewares=[ConditionalRequestMiddleware(cache_ttl=60, cache_query_params=["page"])])
+    def get_todos():
+        page = app.current_event.get_query_string_value("page")
+        calls.append(page)
+        return {"page": page}
+
+    # WHEN requesting the same page multiple times, ignoring other query string parameters
+    first = app(build_event(query={"page": "1"}), {})
+    second = app(build_event(query={"page": "1", "utm_source": "x"}), {})
+
+    # THEN the route only runs once
+    assert first == second
+    assert calls == ["1"]
+
+    # WHEN requesting another page
+    other = app(build_event(query={"page": "2"}), {})
+
+    # THEN it's cached separately
+    assert json.loads(other["body"]) == {"page": "2"}
+    assert calls == ["1", "2"]
+
+    # WHEN the cached response expires
+    monotonic.return_value = 160.0
+    app(build_event(query={"page": "1"}), {})
+
+    # THEN the route runs again
+    assert calls == ["1", "2", "1"]
+
+
+def test_response_cache_varies_on_query_string_by_default():
+    # GIVEN a route caching responses without listing the query string parameters changing them
+    app = APIGatewayRestResolver()
+    calls = []
+
+    @app.get("/todos", middlewares=[ConditionalRequestMiddleware(cache_ttl=60)])
+    def get_todos():
+        page = app.current_event.get_query_string_value("page")
+        calls.append(page)
+        return {"page": page}
+
+    # WHEN requesting the first and second page
+    first = app(build_event(), {})
+    second = app(build_event(query={"page": "2"}), {})
+
+    # THEN each page is cached separately
+    assert json.loads(first["body"]) == {"page": None}
+    assert json.loads(second["body"]) == {"page": "2"}
+    assert calls == [None, "2"]
+
+
+def test_response_cache_varies_on_credentials():
+    # GIVEN a route caching responses depending on the caller
+    app = APIGatewayRestResolver()
+    calls = []
+
+    @app.get("/me", middlewares=[ConditionalRequestMiddleware(cache_ttl=60)])
+    def get_me():
+        user = app.current_event.headers.get("authorization")
+        calls.append(user)
+        return {"user": user}
+
+    # WHEN different callers request it
+    alice = app(build_event(path="/me", headers={"Authorization": "Bearer alice"}), {})
+    bob = app(build_event(path="/me", headers={"Authorization": "Bearer bob"}), {})
+    alice_again = app(build_event(path="/me", headers={"Authorization": "Bearer alice"}), {})
+
+    # THEN responses are never shared across callers
+    assert json.loads(alice["body"]) == {"user": "Bearer alice"}
+    assert json.loads(bob["body"]) == {"user": "Bearer bob"}
+    assert alice_again == alice
+    assert calls == ["Bearer alice", "Bearer bob"]
+
+
+def test_response_cache_lru_eviction():
+    # GIVEN a cache of a single response
+    app = APIGatewayRestResolver()
+    calls = []
+
+    @app.get("/todos/<todo_id>", middlewares=[ConditionalRequestMiddleware(cache_ttl=60, max_cache_entries=1)])
+    def get_todo(todo_id: str):
+        calls.append(todo_id)
+        return {"id": todo_id}
+
+    # WHEN requesting different paths
+    for todo_id in ["1", "1", "2", "1"]:
+        app(build_event(path=f"/todos/{todo_id}"), {})
+
+    # THEN the least recently used response is evicted
+    assert calls == ["1", "2", "1"]
+
+
+def test_response_cache_headers_not_shared():
+    # GIVEN a compressed route returning a multi-value Vary header
+    app = APIGatewayRestResolver()
+    calls = []
+
+    @app.get("/todos", compress=True, middlewares=[ConditionalRequestMiddleware(cache_ttl=60)])
+    def get_todos():
+        calls.append(1)
+        return Response(200, content_types.APPLICATION_JSON, {"todos": []}, headers={"Vary": ["Origin"]})
+
+    # WHEN serving the same cached response several times
+    results = [app(build_event(headers={"Accept-Encoding": "gzip"}), {}) for _ in range(3)]
+
+    # THEN building a response doesn't modify the cached one
+    assert len(calls) == 1
+    for result in results:
+        assert result["multiValueHeaders"]["Vary"] == ["Origin", "Accept-Encoding"]
+
+
+def test_response_cache_not_used_for_unsafe_methods_or_cookies():
+    # GIVEN a resolver caching responses
+    app = APIGatewayRestResolver()
+    app.use([ConditionalRequestMiddleware(cache_ttl=60)])
+    calls = []
+
+    @app.post("/todos")
+    def create_todo():
+        calls.append("post")
+        return {"created": True}
+
+    @app.get("/session")
+    def get_session():
+        calls.append("session")
+        return Response(200, content_types.APPLICATION_JSON, {}, cookies=[Cookie(name="session", value="1")])
+
+    # WHEN calling routes changing state or setting cookies
+    for _ in range(2):
+        post_result = app(build_event(method="POST"), {})
+        app(build_event(path="/session"), {})
+
+    # THEN responses aren't cached
+    assert calls == ["post", "session", "post", "session"]
+    assert "ETag" not in post_result["multiValueHeaders"]
+
+
+def test_response_cache_with_validation():
+    # GIVEN a resolver with validation, caching responses
+    app = APIGatewayRestResolver(enable_validation=True)
+    calls = []
+
+    @app.get("/todos", middlewares=[ConditionalRequestMiddleware(cache_ttl=60)])
+    def get_todos() -> dict:
+        calls.append(1)
+        return {"todos": [1, 2, 3]}
+
+    # WHEN requesting it multiple times
+    results = [app(build_event(), {}) for _ in range(2)]
+
+    # THEN the cached response is validated and serialized
+    assert calls == [1]
+    assert [json.loads(result["body"]) for result in results] == [{"todos": [1, 2, 3]}] * 2
+    assert results[0]["multiValueHeaders"]["ETag"] == results[1]["multiValueHeaders"]["ETag"]
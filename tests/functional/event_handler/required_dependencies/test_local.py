@@ -0,0 +1,184 @@
+import asyncio
+import io
+import json
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from aws_lambda_powertools.event_handler import (
+    ALBResolver,
+    APIGatewayHttpResolver,
+    APIGatewayRestResolver,
+    BedrockAgentResolver,
+    LambdaFunctionUrlResolver,
+    Response,
+    VPCLatticeResolver,
+    VPCLatticeV2Resolver,
+    content_types,
+)
+from aws_lambda_powertools.event_handler.local import ASGIAdapter, WSGIAdapter
+from aws_lambda_powertools.shared.cookies import Cookie
+
+RESOLVERS = [
+    APIGatewayRestResolver,
+    APIGatewayHttpResolver,
+    ALBResolver,
+    LambdaFunctionUrlResolver,
+    VPCLatticeResolver,
+    VPCLatticeV2Resolver,
+]
+
+
+def build_app(resolver_class):
+    app = resolver_class()
+
+    @app.get("/todos/<todo_id>")
+    def get_todo(todo_id: str):
+        return Response(
+            status_code=200,
+            content_type=content_types.APPLICATION_JSON,
+            body={
+                "id": todo_id,
+                "page": app.current_event.get_query_string_value("page"),
+                "tenant": app.current_event.headers.get("x-tenant-id"),
+                "request_id": app.lambda_context.aws_request_id,
+            },
+            cookies=[Cookie(name="session", value="1")],
+        )
+
+    @app.post("/todos")
+    def create_todo():
+        return {"created": app.current_event.json_body}, 201
+
+    @app.get("/binary")
+    def get_binary():
+        return Response(status_code=200, content_type="application/octet-stream", body=b"\x00\xff")
+
+    @app.get("/fail")
+    def fail():
+        raise RuntimeError("unhandled")
+
+    return app
+
+
+def asgi_request(adapter: ASGIAdapter, method: str, path: str, query_string=b"", headers=(), body=b""):
+    messages = [
+        {"type": "http.request", "body": body[:1], "more_body": True},
+        {"type": "http.request", "body": body[1:]},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": [(name.encode(), value.encode()) for name, value in headers],
+        "client": ("10.0.0.1", 1234),
+    }
+    asyncio.run(adapter(scope, receive, send))
+
+    start, body_message = sent
+    response_headers = [(name.decode().lower(), value.decode()) for name, value in start["headers"]]
+    return start["status"], response_headers, body_message["body"]
+
+
+@pytest.mark.parametrize("resolver_class", RESOLVERS)
+def test_asgi_adapter_get(resolver_class):
+    # GIVEN a resolver exposed as an ASGI application
+    adapter = ASGIAdapter(build_app(resolver_class))
+
+    # WHEN sending an HTTP request with a path parameter, query string and headers
+    status, headers, body = asgi_request(
+        adapter,
+        "GET",
+        "/todos/1",
+        query_string=b"page=2",
+        headers=[("X-Tenant-Id", "tenant"), ("Cookie", "a=1; b=2")],
+    )
+
+    # THEN the request is translated into the resolver's event, and the response back
+    assert status == 200
+    assert ("content-type", "application/json") in headers
+    assert any(name == "set-cookie" and value.startswith("session=1") for name, value in headers)
+
+    todo = json.loads(body)
+    assert {"id": "1", "page": "2", "tenant": "tenant"}.items() <= todo.items()
+    assert todo["request_id"]
+
+
+@pytest.mark.parametrize("resolver_class", RESOLVERS)
+def test_asgi_adapter_post_and_binary(resolver_class):
+    # GIVEN a resolver exposed as an ASGI application
+    adapter = ASGIAdapter(build_app(resolver_class))
+
+    # WHEN sending a JSON body in multiple chunks
+    status, _, body = asgi_request(
+        adapter,
+        "POST",
+        "/todos",
+        headers=[("Content-Type", "application/json")],
+        body=b'{"title": "write tests"}',
+    )
+
+    # THEN it's received by the route
+    assert status == 201
+    assert json.loads(body) == {"created": {"title": "write tests"}}
+
+    # WHEN the route returns a binary body
+    status, _, body = asgi_request(adapter, "GET", "/binary")
+
+    # THEN it's decoded from base64
+    assert (status, body) == (200, b"\x00\xff")
+
+
+def test_asgi_adapter_unhandled_exception():
+    # GIVEN a route raising an unhandled exception
+    adapter = ASGIAdapter(build_app(APIGatewayRestResolver))
+
+    # WHEN calling it
+    status, _, body = asgi_request(adapter, "GET", "/fail")
+
+    # THEN a 502 is returned, like API Gateway does
+    assert status == 502
+    assert json.loads(body) == {"message": "Internal server error"}
+
+
+def test_wsgi_adapter():
+    # GIVEN a resolver exposed as a WSGI application
+    adapter = WSGIAdapter(build_app(APIGatewayHttpResolver))
+    payload = b'{"title": "write tests"}'
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "PATH_INFO": "/todos",
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(payload)),
+        "HTTP_X_TENANT_ID": "tenant",
+        "wsgi.input": io.BytesIO(payload),
+    }
+    setup_testing_defaults(environ)
+    responses = []
+
+    # WHEN sending a request
+    body = adapter(environ, lambda status, headers: responses.append((status, headers)))
+
+    # THEN the response is returned to the WSGI server
+    status, headers = responses[0]
+    assert status == "201 Created"
+    assert ("Content-Type", "application/json") in headers
+    assert json.loads(b"".join(body)) == {"created": {"title": "write tests"}}
+
+
+def test_adapter_unsupported_resolver():
+    # GIVEN a resolver for events that aren't HTTP requests
+    # WHEN exposing it as an ASGI application
+    # THEN an error is raised on the first request
+    adapter = ASGIAdapter(BedrockAgentResolver())
+    with pytest.raises(ValueError, match="BedrockAgentEvent"):
+        asgi_request(adapter, "GET", "/todos")
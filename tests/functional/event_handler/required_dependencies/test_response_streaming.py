@@ -0,0 +1,254 @@
+import base64
+import io
+import json
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aws_lambda_powertools.event_handler import (
+    APIGatewayRestResolver,
+    LambdaFunctionUrlResolver,
+    StreamingResponse,
+    content_types,
+)
+from aws_lambda_powertools.event_handler.streaming import ResponseStreamError, send_streaming_response
+from aws_lambda_powertools.shared.cookies import Cookie
+from tests.functional.utils import load_event
+
+DELIMITER = b"\x00" * 8
+
+
+class RuntimeApiStandIn:
+    """Local stand-in for the Lambda Runtime API receiving streamed responses"""
+
+    def __init__(self, status: int = 202):
+        self.requests: list = []
+
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                chunks, trailers = [], {}
+                while True:
+                    size = int(self.rfile.readline().strip(), 16)
+                    if size == 0:
+                        break
+                    chunks.append(self.rfile.read(size))
+                    self.rfile.readline()
+
+                while line := self.rfile.readline().strip():
+                    name, _, value = line.decode().partition(":")
+                    trailers[name] = value.strip()
+
+                stand_in.requests.append((self.path, dict(self.headers), chunks, trailers))
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("localhost", 0), Handler)
+        self.address = f"localhost:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def runtime_api(monkeypatch):
+    with RuntimeApiStandIn() as stand_in:
+        monkeypatch.setenv("AWS_LAMBDA_RUNTIME_API", stand_in.address)
+        yield stand_in
+
+
+def split_stream(chunks):
+    prelude, _, body = b"".join(chunks).partition(DELIMITER)
+    return json.loads(prelude), body
+
+
+def test_resolve_stream_generator(runtime_api):
+    # GIVEN a route streaming server-sent events
+    app = LambdaFunctionUrlResolver()
+    produced = []
+
+    @app.get("/")
+    def stream_events():
+        def events():
+            for i in range(3):
+                produced.append(i)
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(200, "text/event-stream", events(), cookies=[Cookie(name="session", value="1")])
+
+    # WHEN streaming the response to the Runtime API
+    chunks = app.resolve_stream(load_event("lambdaFunctionUrlEvent.json"), {})
+    assert produced == []  # nothing is produced until the response is written
+    send_streaming_response("request-id", chunks)
+
+    # THEN the prelude is written first, followed by each chunk as it's produced
+    path, headers, written, trailers = runtime_api.requests[0]
+    assert path == "/2018-06-01/runtime/invocation/request-id/response"
+    assert headers["Lambda-Runtime-Function-Response-Mode"] == "streaming"
+    assert headers["Content-Type"] == "application/vnd.awslambda.http-integration-response"
+    prelude = {"statusCode": 200, "headers": {"Content-Type": "text/event-stream"}, "cookies": ["session=1; Secure"]}
+    assert written[0].endswith(DELIMITER)
+    assert json.loads(written[0][: -len(DELIMITER)]) == prelude
+    assert written[1:] == [
+        b"data: 0\n\n",
+        b"data: 1\n\n",
+        b"data: 2\n\n",
+    ]
+    assert trailers == {}
+
+
+def test_resolve_stream_keeps_context_until_written():
+    # GIVEN a route streaming chunks that read the current event and routing context as they're produced
+    app = LambdaFunctionUrlResolver()
+
+    @app.get("/")
+    def stream():
+        app.append_context(user="lessa")
+
+        def chunks():
+            yield app.current_event.path
+            yield app.context["user"]
+
+        return StreamingResponse(200, content_types.TEXT_PLAIN, chunks())
+
+    # WHEN resolving the response as a stream
+    chunks = list(app.resolve_stream(load_event("lambdaFunctionUrlEvent.json"), {}))
+
+    # THEN the event and context are still available while chunks are produced
+    assert chunks[1:] == [b"/", b"lessa"]
+
+    # AND the routing context is cleared once the last chunk is written
+    assert app.context == {}
+
+
+def test_resolve_stream_file_like_object():
+    # GIVEN a route streaming a file-like object in 4-byte chunks
+    app = APIGatewayRestResolver()
+
+    file = io.BytesIO(b"\x00binary\xff")
+
+    @app.get("/my/path")
+    def download():
+        return StreamingResponse(200, "application/octet-stream", file, chunk_size=4)
+
+    # WHEN resolving the response as a stream
+    chunks = list(app.resolve_stream(load_event("apiGatewayProxyEvent.json"), {}))
+
+    # THEN bytes are written as-is without base64 encoding
+    prelude, body = split_stream(chunks)
+    assert prelude["statusCode"] == 200
+    assert prelude["multiValueHeaders"]["Content-Type"] == ["application/octet-stream"]
+    assert chunks[1:] == [b"\x00bin", b"ary\xff"]
+    assert body == b"\x00binary\xff"
+
+    # AND the file is closed once written
+    assert file.closed
+
+
+def test_resolve_stream_compressed():
+    # GIVEN a route streaming compressed chunks
+    app = LambdaFunctionUrlResolver()
+
+    @app.get("/", compress=True)
+    def stream():
+        return StreamingResponse(200, content_types.TEXT_PLAIN, (f"line {i}\n" for i in range(100)))
+
+    # WHEN the client accepts gzip
+    chunks = list(app.resolve_stream(load_event("lambdaFunctionUrlEvent.json"), {}))
+
+    # THEN each chunk is compressed as it's written
+    prelude, body = split_stream(chunks)
+    assert prelude["headers"]["Content-Encoding"] == "gzip"
+    assert len(chunks) == 102
+    assert zlib.decompress(body, wbits=zlib.MAX_WBITS | 16).decode() == "".join(f"line {i}\n" for i in range(100))
+
+
+def test_resolve_stream_regular_response():
+    # GIVEN a route returning a regular response
+    app = LambdaFunctionUrlResolver()
+
+    @app.get("/")
+    def get_todos():
+        return {"todos": [1, 2, 3]}
+
+    # WHEN resolving the response as a stream
+    prelude, body = split_stream(app.resolve_stream(load_event("lambdaFunctionUrlEvent.json"), {}))
+
+    # THEN the body is written at once
+    assert prelude == {"statusCode": 200, "headers": {"Content-Type": "application/json"}, "cookies": []}
+    assert json.loads(body) == {"todos": [1, 2, 3]}
+
+
+def test_resolve_streaming_response_without_streaming():
+    # GIVEN a route streaming a response
+    app = LambdaFunctionUrlResolver()
+
+    @app.get("/")
+    def stream():
+        return StreamingResponse(200, content_types.TEXT_PLAIN, iter(["hello ", "world"]))
+
+    # WHEN resolving the response without response streaming
+    result = app(load_event("lambdaFunctionUrlEvent.json"), {})
+
+    # THEN the body is read into memory
+    assert result["isBase64Encoded"] is True
+    assert base64.b64decode(result["body"]) == b"hello world"
+
+
+def test_resolve_streaming_response_compressed_without_streaming():
+    # GIVEN a route streaming compressed chunks
+    app = LambdaFunctionUrlResolver()
+
+    @app.get("/", compress=True)
+    def stream():
+        return StreamingResponse(200, content_types.TEXT_PLAIN, (f"line {i}\n" for i in range(100)))
+
+    # WHEN resolving the response without response streaming, and the client accepts gzip
+    result = app(load_event("lambdaFunctionUrlEvent.json"), {})
+
+    # THEN the body read into memory is compressed at once
+    assert result["headers"]["Content-Encoding"] == "gzip"
+    assert result["isBase64Encoded"] is True
+    body = zlib.decompress(base64.b64decode(result["body"]), wbits=zlib.MAX_WBITS | 16)
+    assert body.decode() == "".join(f"line {i}\n" for i in range(100))
+
+
+def test_send_streaming_response_error(runtime_api):
+    # GIVEN a response failing midway
+    def chunks():
+        yield b"partial"
+        raise ValueError("something went wrong")
+
+    # WHEN streaming it to the Runtime API
+    with pytest.raises(ValueError, match="something went wrong"):
+        send_streaming_response("request-id", chunks())
+
+    # THEN the error is reported in the trailers
+    _, _, written, trailers = runtime_api.requests[0]
+    assert written == [b"partial"]
+    assert trailers["Lambda-Runtime-Function-Error-Type"] == "ValueError"
+    error = json.loads(base64.b64decode(trailers["Lambda-Runtime-Function-Error-Body"]))
+    assert error == {"errorMessage": "something went wrong", "errorType": "ValueError"}
+
+
+def test_send_streaming_response_rejected():
+    # GIVEN a Runtime API rejecting the response, e.g. the invocation already responded
+    with RuntimeApiStandIn(status=400) as stand_in:
+        # WHEN streaming a response
+        # THEN an error is raised
+        with pytest.raises(ResponseStreamError, match="400"):
+            send_streaming_response("request-id", [b"hello"], stand_in.address)
@@ -10,10 +10,12 @@ from botocore.stub import Stubber
 
 from aws_lambda_powertools.utilities.feature_flags import (
     ConfigurationStoreError,
+    InMemoryStore,
+    comparators,
     schema,
 )
 from aws_lambda_powertools.utilities.feature_flags.appconfig import AppConfigStore
-from aws_lambda_powertools.utilities.feature_flags.exceptions import StoreClientError
+from aws_lambda_powertools.utilities.feature_flags.exceptions import SchemaValidationError, StoreClientError
 from aws_lambda_powertools.utilities.feature_flags.feature_flags import FeatureFlags
 from aws_lambda_powertools.utilities.feature_flags.schema import (
     CONDITION_ACTION,
@@ -1701,3 +1703,186 @@ def test_exception_handler(mocker, config):
             context={"tenant_id": "not a list value"},
             default=False,
         )
+
+
+def test_flags_compiled_once_per_configuration(mocker):
+    # GIVEN a store returning the same configuration object until it changes
+    store = InMemoryStore(
+        {
+            "my_feature": {
+                "default": False,
+                "rules": {
+                    "tenant id is in allowed list": {
+                        "when_match": True,
+                        "conditions": [{"action": RuleAction.IN.value, "key": "tenant_id", "value": ["a", "b"]}],
+                    },
+                },
+            },
+        },
+    )
+    feature_flags = FeatureFlags(store=store)
+    validate = mocker.spy(schema.SchemaValidator, "validate")
+
+    # WHEN evaluating features multiple times
+    for _ in range(3):
+        assert feature_flags.evaluate(name="my_feature", context={"tenant_id": "a"}, default=False) is True
+        assert feature_flags.get_enabled_features(context={"tenant_id": "b"}) == ["my_feature"]
+
+    # THEN the configuration is validated only once
+    assert validate.call_count == 1
+
+    # WHEN the store returns a new configuration
+    store.update({"my_feature": {"default": True}})
+
+    # THEN it's validated and compiled again
+    assert feature_flags.evaluate(name="my_feature", context={"tenant_id": "c"}, default=False) is True
+    assert validate.call_count == 2
+
+
+def test_flags_invalid_configuration_is_not_cached():
+    # GIVEN a store returning an invalid configuration
+    store = InMemoryStore({"my_feature": {"rules": {}}})
+    feature_flags = FeatureFlags(store=store)
+
+    # WHEN evaluating a feature
+    # THEN validation fails on every evaluation
+    for _ in range(2):
+        with pytest.raises(SchemaValidationError):
+            feature_flags.evaluate(name="my_feature", default=False)
+
+
+def test_flags_in_value_unhashable_context_value():
+    # GIVEN a condition matching a context value in a list of values
+    store = InMemoryStore(
+        {
+            "my_feature": {
+                "default": False,
+                "rules": {
+                    "tenant is in allowed list": {
+                        "when_match": True,
+                        "conditions": [
+                            {"action": RuleAction.KEY_IN_VALUE.value, "key": "tenant", "value": [["a", "b"], "c"]},
+                        ],
+                    },
+                },
+            },
+        },
+    )
+    feature_flags = FeatureFlags(store=store)
+
+    # WHEN the context value is unhashable
+    # THEN it's matched like a list membership test
+    assert feature_flags.evaluate(name="my_feature", context={"tenant": ["a", "b"]}, default=False) is True
+    assert feature_flags.evaluate(name="my_feature", context={"tenant": ["c"]}, default=False) is False
+    assert feature_flags.evaluate(name="my_feature", context={"tenant": "c"}, default=False) is True
+
+    # WHEN the values are hashable but the context value isn't
+    store.update(
+        {
+            "my_feature": {
+                "default": False,
+                "rules": {
+                    "tenant is not in denied list": {
+                        "when_match": True,
+                        "conditions": [{"action": RuleAction.KEY_NOT_IN_VALUE.value, "key": "tenant", "value": ["a"]}],
+                    },
+                },
+            },
+        },
+    )
+
+    # THEN it's matched like a list membership test
+    assert feature_flags.evaluate(name="my_feature", context={"tenant": ["a"]}, default=False) is True
+    assert feature_flags.evaluate(name="my_feature", context={"tenant": "a"}, default=False) is False
+
+
+def test_flags_evaluate_many(mocker):
+    # GIVEN a feature matching on tenant and a time window
+    store = InMemoryStore(
+        {
+            "my_feature": {
+                "default": False,
+                "rules": {
+                    "tenant is premium during the day": {
+                        "when_match": True,
+                        "conditions": [
+                            {"action": RuleAction.EQUALS.value, "key": "tier", "value": "premium"},
+                            {
+                                "action": RuleAction.SCHEDULE_BETWEEN_TIME_RANGE.value,
+                                "key": "CURRENT_TIME",
+                                "value": {"START": "00:00", "END": "23:59"},
+                            },
+                        ],
+                    },
+                },
+            },
+            "always_on": {"default": True},
+        },
+    )
+    feature_flags = FeatureFlags(store=store)
+    now = mocker.spy(comparators, "_get_now_from_timezone")
+    evaluate_rules = mocker.spy(FeatureFlags, "_evaluate_rules")
+
+    contexts = [{"tier": "premium", "id": i} if i % 2 else {"tier": "basic", "id": i} for i in range(100)]
+
+    # WHEN evaluating the feature for many contexts
+    values = feature_flags.evaluate_many(name="my_feature", contexts=contexts, default=False)
+
+    # THEN results are the same as evaluating each context
+    assert values == [i % 2 == 1 for i in range(100)]
+    assert feature_flags.evaluate_many(name="always_on", contexts=[None, {}], default=False) == [True, True]
+    assert feature_flags.evaluate_many(name="missing", contexts=[{}, {}], default="x") == ["x", "x"]
+
+    # AND rules are evaluated once per distinct tier, with the current time retrieved once
+    assert evaluate_rules.call_count == 2
+    assert now.call_count == 1
+
+
+def test_flags_get_enabled_features_many():
+    # GIVEN features matching on different context keys
+    store = InMemoryStore(
+        {
+            "premium": {
+                "default": False,
+                "rules": {
+                    "tier is premium": {
+                        "when_match": True,
+                        "conditions": [{"action": RuleAction.EQUALS.value, "key": "tier", "value": "premium"}],
+                    },
+                },
+            },
+            "beta": {
+                "default": False,
+                "rules": {
+                    "tenant is in beta list": {
+                        "when_match": True,
+                        "conditions": [{"action": RuleAction.IN.value, "key": "tenant_id", "value": ["a", "b"]}],
+                    },
+                },
+            },
+            "always_on": {"default": True},
+        },
+    )
+    feature_flags = FeatureFlags(store=store)
+    contexts = [
+        {"tier": "premium", "tenant_id": "a"},
+        {"tier": "basic", "tenant_id": ["unhashable"]},
+        None,
+    ]
+
+    # WHEN getting enabled features for many contexts
+    enabled = feature_flags.get_enabled_features_many(contexts=contexts)
+
+    # THEN results are the same as getting enabled features for each context
+    assert enabled == [feature_flags.get_enabled_features(context=context) for context in contexts]
+    assert enabled == [["premium", "beta", "always_on"], ["always_on"], ["always_on"]]
+
+
+def test_flags_evaluate_many_store_error(mocker, config):
+    # GIVEN a store failing to fetch the configuration
+    feature_flags = FeatureFlags(store=init_fetcher_side_effect(mocker, config, GetParameterError()))
+
+    # WHEN evaluating features for many contexts
+    # THEN defaults are returned for each context
+    assert feature_flags.evaluate_many(name="my_feature", contexts=[{}, {}], default=True) == [True, True]
+    assert feature_flags.get_enabled_features_many(contexts=[{}, {}]) == [[], []]
@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+
+from aws_lambda_powertools.utilities.feature_flags import (
+    ConfigurationStoreError,
+    FeatureFlags,
+    InMemoryStore,
+    LocalFileStore,
+    schema,
+)
+
+FEATURES = {
+    "my_feature": {
+        "default": False,
+        "rules": {
+            "tenant id equals 345345435": {
+                "when_match": True,
+                "conditions": [{"action": "EQUALS", "key": "tenant_id", "value": "345345435"}],
+            },
+        },
+    },
+}
+
+
+def write_features(path, features: dict, mtime_ns: int):
+    path.write_text(json.dumps(features))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_in_memory_store():
+    # GIVEN an in-memory store with features under an envelope
+    store = InMemoryStore({"features": FEATURES, "other": "config"}, envelope="features")
+    feature_flags = FeatureFlags(store=store)
+
+    # WHEN evaluating a feature
+    # THEN features are extracted from the envelope
+    assert feature_flags.evaluate(name="my_feature", context={"tenant_id": "345345435"}, default=False) is True
+    assert store.get_raw_configuration == {"features": FEATURES, "other": "config"}
+
+    # WHEN updating the configuration
+    store.update({"features": {"my_feature": {"default": True}}})
+
+    # THEN the new configuration is used
+    assert feature_flags.evaluate(name="my_feature", default=False) is True
+
+
+def test_local_file_store(tmp_path, mocker):
+    # GIVEN a local file store checking for changes on every evaluation
+    path = tmp_path / "features.json"
+    write_features(path, FEATURES, mtime_ns=1_000_000_000)
+    feature_flags = FeatureFlags(store=LocalFileStore(path=path, max_age=0))
+    validate = mocker.spy(schema.SchemaValidator, "validate")
+
+    # WHEN evaluating features multiple times
+    for _ in range(3):
+        assert feature_flags.evaluate(name="my_feature", context={"tenant_id": "345345435"}, default=False) is True
+
+    # THEN the file is parsed and validated once
+    assert validate.call_count == 1
+
+    # WHEN the file changes
+    write_features(path, {"my_feature": {"default": True}}, mtime_ns=2_000_000_000)
+
+    # THEN it's reloaded
+    assert feature_flags.evaluate(name="my_feature", context={"tenant_id": "other"}, default=False) is True
+    assert validate.call_count == 2
+
+
+def test_local_file_store_checks_file_at_most_once_per_max_age(tmp_path, mocker):
+    # GIVEN a local file store checking for changes every 5 seconds
+    path = tmp_path / "features.json"
+    write_features(path, FEATURES, mtime_ns=1_000_000_000)
+    store = LocalFileStore(path=path, max_age=5)
+
+    monotonic = mocker.patch("aws_lambda_powertools.utilities.feature_flags.local.time.monotonic")
+    monotonic.return_value = 100.0
+    config = store.get_configuration()
+
+    # WHEN the file changes within max_age
+    write_features(path, {"my_feature": {"default": True}}, mtime_ns=2_000_000_000)
+    monotonic.return_value = 104.0
+
+    # THEN the previous configuration is returned
+    assert store.get_configuration() is config
+
+    # WHEN max_age expires
+    monotonic.return_value = 105.0
+
+    # THEN the file is reloaded
+    assert store.get_configuration() == {"my_feature": {"default": True}}
+
+
+@pytest.mark.parametrize("content", [None, "not json"])
+def test_local_file_store_invalid_file(tmp_path, content):
+    # GIVEN a missing or invalid file
+    path = tmp_path / "features.json"
+    if content is not None:
+        path.write_text(content)
+
+    store = LocalFileStore(path=path)
+
+    # WHEN evaluating features
+    # THEN ConfigurationStoreError is raised by the store, and defaults returned by feature flags
+    with pytest.raises(ConfigurationStoreError):
+        store.get_configuration()
+
+    assert FeatureFlags(store=store).evaluate(name="my_feature", default="default") == "default"
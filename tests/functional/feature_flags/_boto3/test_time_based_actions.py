@@ -538,3 +538,69 @@ def test_time_based_multiple_conditions_utc_days_range_and_certain_hours_no_rule
     assert not evaluate(mocked_time=(2022, 11, 17, 9, 0, 0, datetime.timezone.utc))  # thursday 9:00
     assert not evaluate(mocked_time=(2022, 11, 18, 13, 0, 0, datetime.timezone.utc))  # friday 16:00
     assert not evaluate(mocked_time=(2022, 11, 18, 9, 0, 0, datetime.timezone.utc))  # friday 9:00
+
+
+def test_time_based_current_time_retrieved_once_per_timezone(mocker):
+    # GIVEN scheduled features, two of them on the same timezone
+    def scheduled_feature(action: RuleAction, key: TimeKeys, value: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            FEATURE_DEFAULT_VAL_KEY: False,
+            RULES_KEY: {
+                "match during schedule": {
+                    RULE_MATCH_VALUE: True,
+                    CONDITIONS_KEY: [
+                        {
+                            CONDITION_ACTION: action.value,
+                            CONDITION_KEY: key.value,
+                            CONDITION_VALUE: value,
+                        },
+                    ],
+                },
+            },
+        }
+
+    mocked_get_conf = mocker.patch("aws_lambda_powertools.utilities.parameters.AppConfigProvider.get")
+    mocked_get_conf.return_value = {
+        "business_hours": scheduled_feature(
+            RuleAction.SCHEDULE_BETWEEN_TIME_RANGE,
+            TimeKeys.CURRENT_TIME,
+            {TimeValues.START.value: "09:00", TimeValues.END.value: "17:00"},
+        ),
+        "weekdays": scheduled_feature(
+            RuleAction.SCHEDULE_BETWEEN_DAYS_OF_WEEK,
+            TimeKeys.CURRENT_DAY_OF_WEEK,
+            {TimeValues.DAYS.value: [TimeValues.MONDAY.value, TimeValues.TUESDAY.value]},
+        ),
+        "copenhagen_sale": scheduled_feature(
+            RuleAction.SCHEDULE_BETWEEN_DATETIME_RANGE,
+            TimeKeys.CURRENT_DATETIME,
+            {
+                TimeValues.START.value: "2022-10-05T12:00:00",
+                TimeValues.END.value: "2022-10-10T12:15:00",
+                TimeValues.TIMEZONE.value: "Europe/Copenhagen",
+            },
+        ),
+    }
+    feature_flags = FeatureFlags(
+        store=AppConfigStore(
+            environment="test_env",
+            application="test_app",
+            name="test_conf_name",
+            max_age=600,
+            sdk_config=Config(region_name="us-east-1"),
+        ),
+    )
+
+    time = mocker.patch("aws_lambda_powertools.utilities.feature_flags.comparators._get_now_from_timezone")
+    time.return_value = datetime.datetime(2022, 10, 10, 10, 0, 0, tzinfo=gettz("Europe/Copenhagen"))  # monday
+
+    # WHEN getting enabled features
+    enabled = feature_flags.get_enabled_features()
+
+    # THEN the current time is retrieved once per timezone
+    assert enabled == ["business_hours", "weekdays", "copenhagen_sale"]
+    assert time.call_count == 2
+
+    # AND retrieved again on the next evaluation
+    feature_flags.get_enabled_features()
+    assert time.call_count == 4
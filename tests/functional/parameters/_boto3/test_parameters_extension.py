@@ -0,0 +1,227 @@
+import base64
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from botocore import stub
+from botocore.config import Config
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.parameters import InMemoryCache
+
+
+class ExtensionStandIn:
+    """Local stand-in for the Parameters and Secrets Lambda Extension HTTP server"""
+
+    def __init__(self):
+        self.values: dict = {}
+        self.requests: list = []
+        self.connections = 0
+
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                stand_in.connections += 1
+                super().setup()
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {key: value[0] for key, value in parse_qs(url.query).items()}
+                stand_in.requests.append((url.path, query, dict(self.headers)))
+
+                name = query.get("name") or query.get("secretId")
+                if name not in stand_in.values:
+                    code = "ParameterNotFound" if "name" in query else "ResourceNotFoundException"
+                    self._respond(400, f"an error occurred ({code}) when calling the API".encode())
+                elif url.path == "/systemsmanager/parameters/get":
+                    parameter = {"Name": name, "Value": stand_in.values[name]}
+                    self._respond(200, json.dumps({"Parameter": parameter}).encode())
+                else:
+                    self._respond(200, json.dumps({"Name": name, **stand_in.values[name]}).encode())
+
+            def _respond(self, status: int, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("localhost", 0), Handler)
+        self.port = self.server.server_address[1]
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def extension(monkeypatch):
+    with ExtensionStandIn() as stand_in:
+        monkeypatch.setenv("PARAMETERS_SECRETS_EXTENSION_HTTP_PORT", str(stand_in.port))
+        monkeypatch.setenv("AWS_SESSION_TOKEN", "session-token")
+        yield stand_in
+
+
+@pytest.fixture
+def unused_port(monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        port = sock.getsockname()[1]
+
+    monkeypatch.setenv("PARAMETERS_SECRETS_EXTENSION_HTTP_PORT", str(port))
+    return port
+
+
+@pytest.fixture(scope="module")
+def config():
+    return Config(region_name="us-east-1")
+
+
+def test_ssm_provider_get_from_extension(extension):
+    # GIVEN the extension is running
+    extension.values["/my/parameter"] = "value"
+    provider = parameters.SSMProvider(use_extension=True)
+
+    # WHEN retrieving a parameter
+    value = provider.get("/my/parameter", decrypt=True)
+
+    # THEN it's retrieved through the extension, authenticated with the session token
+    assert value == "value"
+    path, query, headers = extension.requests[0]
+    assert path == "/systemsmanager/parameters/get"
+    assert query == {"name": "/my/parameter", "withDecryption": "true"}
+    assert headers["X-Aws-Parameters-Secrets-Token"] == "session-token"
+
+    # AND no boto3 client was created
+    assert provider._client is None
+
+
+def test_ssm_provider_get_from_extension_reuses_connection(extension):
+    # GIVEN the extension is running
+    extension.values["/my/parameter"] = "value"
+    provider = parameters.SSMProvider(use_extension=True)
+
+    # WHEN retrieving a parameter multiple times
+    for _ in range(5):
+        provider.get("/my/parameter", force_fetch=True)
+
+    # THEN a single keep-alive connection is used
+    assert len(extension.requests) == 5
+    assert extension.connections == 1
+
+
+def test_ssm_provider_get_from_extension_env_var(monkeypatch, extension):
+    # GIVEN the extension is enabled via environment variable
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_USE_EXTENSION", "true")
+    extension.values["/my/parameter"] = "value"
+
+    # WHEN retrieving a parameter with the high-level function
+    parameters.clear_caches()
+    value = parameters.get_parameter("/my/parameter")
+    parameters.clear_caches()
+
+    # THEN it's retrieved through the extension
+    assert value == "value"
+    assert len(extension.requests) == 1
+
+
+def test_ssm_provider_get_from_extension_not_found(extension):
+    # GIVEN a provider caching parameters not found
+    provider = parameters.SSMProvider(use_extension=True, cache=InMemoryCache(negative_ttl=5))
+
+    # WHEN retrieving a parameter that doesn't exist
+    for _ in range(2):
+        with pytest.raises(parameters.GetParameterError, match="ParameterNotFound"):
+            provider.get("/missing")
+
+    # THEN the extension is only called once
+    assert len(extension.requests) == 1
+
+
+def test_ssm_provider_get_falls_back_to_boto3(unused_port, config):
+    # GIVEN the extension is not running
+    provider = parameters.SSMProvider(use_extension=True, boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "get_parameter",
+        {"Parameter": {"Name": "/my/parameter", "Type": "String", "Value": "value"}},
+        {"Name": "/my/parameter", "WithDecryption": False},
+    )
+    stubber.activate()
+
+    # WHEN retrieving a parameter
+    try:
+        value = provider.get("/my/parameter")
+
+        # THEN it's retrieved with boto3 instead
+        assert value == "value"
+        stubber.assert_no_pending_responses()
+
+        # AND the extension isn't tried again
+        assert provider._extension is None
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_keeps_extension_on_transient_failure(extension, config, mocker):
+    # GIVEN the extension is running but a request times out
+    extension.values["/my/parameter"] = "value"
+    provider = parameters.SSMProvider(use_extension=True, boto_config=config, cache=InMemoryCache())
+    mocker.patch.object(
+        provider._extension,
+        "get_parameter",
+        side_effect=[parameters.extension.ExtensionUnavailableError("timed out"), "value"],
+    )
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "get_parameter",
+        {"Parameter": {"Name": "/my/parameter", "Type": "String", "Value": "value"}},
+        {"Name": "/my/parameter", "WithDecryption": False},
+    )
+    stubber.activate()
+
+    # WHEN retrieving a parameter twice
+    try:
+        assert provider.get("/my/parameter", force_fetch=True) == "value"
+        assert provider.get("/my/parameter", force_fetch=True) == "value"
+
+        # THEN only the failed request falls back to boto3 and the extension keeps being used
+        stubber.assert_no_pending_responses()
+        assert provider._extension.get_parameter.call_count == 2
+    finally:
+        stubber.deactivate()
+
+
+def test_secrets_provider_get_from_extension(extension):
+    # GIVEN the extension is running
+    extension.values["my-secret"] = {"SecretString": "secret"}
+    extension.values["my-binary-secret"] = {"SecretBinary": base64.b64encode(b"\x00binary").decode()}
+    provider = parameters.SecretsProvider(use_extension=True)
+
+    # WHEN retrieving secrets
+    # THEN string and binary values are returned like with boto3
+    assert provider.get("my-secret") == "secret"
+    assert provider.get("my-binary-secret") == b"\x00binary"
+    assert extension.requests[0][1] == {"secretId": "my-secret"}
+    assert provider._client is None
+
+
+def test_secrets_provider_get_from_extension_not_found(extension):
+    provider = parameters.SecretsProvider(use_extension=True)
+
+    with pytest.raises(parameters.GetParameterError, match="ResourceNotFoundException"):
+        provider.get("missing-secret")
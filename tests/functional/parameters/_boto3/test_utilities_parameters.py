@@ -1,9 +1,15 @@
+import asyncio
 import base64
+import gc
+import hashlib
 import json
 import random
 import string
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+import warnings
+from datetime import datetime
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -21,6 +27,7 @@ from aws_lambda_powertools.utilities.parameters.base import (
     BaseProvider,
     ExpirableValue,
 )
+from aws_lambda_powertools.utilities.parameters.cache import CacheStats, InMemoryCache
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 
@@ -169,7 +176,7 @@ def test_dynamodb_provider_get_expired(mock_name, mock_value, config):
     provider = parameters.DynamoDBProvider(table_name, boto_config=config)
 
     # Inject value in the internal store
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() - 60)
 
     # Stub the boto3 client
     stubber = stub.Stubber(provider.table.meta.client)
@@ -1045,7 +1052,7 @@ def test_providers_global_clear_cache(mock_name, mock_value, monkeypatch):
 def test_ssm_provider_clear_cache(mock_name, mock_value, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.SSMProvider(boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1223,7 +1230,7 @@ def test_ssm_provider_get_parameters_by_name_all_decrypt_should_use_get_paramete
 def test_dynamodb_provider_clear_cache(mock_name, mock_value, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.DynamoDBProvider(table_name="test", boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1235,7 +1242,7 @@ def test_dynamodb_provider_clear_cache(mock_name, mock_value, config):
 def test_secrets_provider_clear_cache(mock_name, mock_value, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.SecretsProvider(boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1247,7 +1254,7 @@ def test_secrets_provider_clear_cache(mock_name, mock_value, config):
 def test_appconf_provider_clear_cache(mock_name, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.AppConfigProvider(environment="test", application="test", boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1265,7 +1272,7 @@ def test_ssm_provider_get_expired(mock_name, mock_value, mock_version, config):
     provider = parameters.SSMProvider(boto_config=config)
 
     # Inject value in the internal store
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() - 60)
 
     # Stub the boto3 client
     stubber = stub.Stubber(provider.client)
@@ -1781,7 +1788,7 @@ def test_secrets_provider_get_expired(mock_name, mock_value, config):
     provider = parameters.SecretsProvider(boto_config=config)
 
     # Inject value in the internal store
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() - 60)
 
     # Stub the boto3 client
     stubber = stub.Stubber(provider.client)
@@ -2183,7 +2190,7 @@ def test_base_provider_get_multiple_expired(mock_name, mock_value):
 
     provider = TestProvider()
 
-    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, time.monotonic() - 60)
 
     value = provider.get_multiple(mock_name)
 
@@ -2677,6 +2684,115 @@ def test_appconf_provider_multiple_unique_config_names(mock_name, config):
         stubber.deactivate()
 
 
+def test_appconf_provider_get_unchanged_configuration_not_transformed_again(mock_name, config):
+    """
+    Test appconfig_provider.get with transform doesn't transform an unchanged configuration again
+    """
+    # GIVEN a configuration that doesn't change between two polls
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+    encoded_message = json.dumps({"myenvvar1": "Black Panther"}).encode("utf-8")
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    stubber.add_response(
+        "get_latest_configuration",
+        {
+            "Configuration": StreamingBody(BytesIO(encoded_message), len(encoded_message)),
+            "NextPollConfigurationToken": "next_token",
+            "ContentType": "application/json",
+        },
+    )
+    stubber.add_response(
+        "get_latest_configuration",
+        {
+            "Configuration": StreamingBody(BytesIO(b""), 0),
+            "NextPollConfigurationToken": "next_token",
+            "ContentType": "application/json",
+        },
+    )
+    stubber.activate()
+
+    # WHEN polling it twice
+    try:
+        first_value = provider.get(mock_name, transform="json", force_fetch=True)
+        first_etag = provider.get_etag(mock_name)
+        second_value = provider.get(mock_name, transform="json", force_fetch=True)
+
+        # THEN the previously transformed value is returned, and the etag doesn't change
+        stubber.assert_no_pending_responses()
+        assert second_value is first_value
+        assert provider.get_etag(mock_name) == first_etag == hashlib.sha256(encoded_message).hexdigest()
+    finally:
+        stubber.deactivate()
+
+
+def test_appconf_provider_get_changed_configuration(mock_name, config):
+    """
+    Test appconfig_provider.get with transform returns and transforms a new configuration version
+    """
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+    first_message = json.dumps({"version": 1}).encode("utf-8")
+    second_message = json.dumps({"version": 2}).encode("utf-8")
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    for message in (first_message, second_message):
+        stubber.add_response(
+            "get_latest_configuration",
+            {
+                "Configuration": StreamingBody(BytesIO(message), len(message)),
+                "NextPollConfigurationToken": "next_token",
+                "ContentType": "application/json",
+            },
+        )
+    stubber.activate()
+
+    try:
+        first_value = provider.get(mock_name, transform="json", force_fetch=True)
+        first_etag = provider.get_etag(mock_name)
+        second_value = provider.get(mock_name, transform="json", force_fetch=True)
+
+        stubber.assert_no_pending_responses()
+        assert first_value == {"version": 1}
+        assert second_value == {"version": 2}
+        assert provider.get_etag(mock_name) != first_etag
+    finally:
+        stubber.deactivate()
+
+
+@pytest.mark.parametrize("max_age,expected_ttl", [(None, 600), (5, 5)])
+def test_appconf_provider_get_respects_next_poll_interval(mock_name, mock_value, config, max_age, expected_ttl):
+    """
+    Test appconfig_provider.get caches values for at least NextPollIntervalInSeconds, unless max_age is explicit
+    """
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+    encoded_message = mock_value.encode("utf-8")
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    stubber.add_response(
+        "get_latest_configuration",
+        {
+            "Configuration": StreamingBody(BytesIO(encoded_message), len(encoded_message)),
+            "NextPollConfigurationToken": "next_token",
+            "NextPollIntervalInSeconds": 600,
+            "ContentType": "text/plain",
+        },
+    )
+    stubber.activate()
+
+    # WHEN AppConfig asks to wait 600 seconds, longer than the default max_age before polling again
+    try:
+        provider.get(mock_name, max_age=max_age)
+
+        # THEN the value is cached for 600 seconds by default, or for the explicit max_age
+        stubber.assert_no_pending_responses()
+        cached = provider.store[provider._build_cache_key(name=mock_name)]
+        assert expected_ttl - 5 < cached.ttl - time.monotonic() <= expected_ttl
+    finally:
+        stubber.deactivate()
+
+
 def test_appconf_get_app_config_no_transform(monkeypatch, mock_name):
     """
     Test get_app_config()
@@ -2883,7 +2999,7 @@ def test_base_provider_get_multiple_force_update(mock_name, mock_value):
 
     provider = TestProvider()
 
-    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, time.monotonic() + 60)
 
     value = provider.get_multiple(mock_name, force_fetch=True)
 
@@ -2905,7 +3021,7 @@ def test_base_provider_get_force_update(mock_name, mock_value):
 
     provider = TestProvider()
 
-    provider.store[(mock_name, None)] = ExpirableValue("not-value", datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue("not-value", time.monotonic() + 60)
 
     value = provider.get(mock_name, force_fetch=True)
 
@@ -2976,3 +3092,489 @@ def test_raise_warning_when_using_config_parameter_secrets(config):
     # THEN must raise a warning
     with pytest.warns(PowertoolsDeprecationWarning, match="The 'config' parameter is deprecated in V3*"):
         SecretsProvider(config=config)
+
+
+def test_base_provider_get_stale_while_revalidate_background_refresh(mock_name, mock_value):
+    """
+    Test BaseProvider.get() returns a stale value and refreshes it in the background
+    """
+
+    refreshed = threading.Event()
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            assert name == mock_name
+            refreshed.set()
+            return mock_value
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    provider = TestProvider()
+    cache_key = provider._build_cache_key(name=mock_name)
+    provider.store[cache_key] = ExpirableValue("stale", time.monotonic() - 10)
+
+    # WHEN the cached value expired less than stale_while_revalidate seconds ago
+    value = provider.get(mock_name, stale_while_revalidate=60)
+
+    # THEN the stale value is returned immediately, and refreshed in the background
+    assert value == "stale"
+    assert refreshed.wait(timeout=5)
+
+    for _ in range(100):
+        if provider.fetch_from_cache(cache_key) == mock_value:
+            break
+        time.sleep(0.01)
+
+    assert provider.get(mock_name, stale_while_revalidate=60) == mock_value
+
+
+def test_base_provider_get_stale_while_revalidate_refresh_hook(monkeypatch, mock_name, mock_value):
+    """
+    Test BaseProvider.get() defers refresh of stale values to refresh_stale_values() once per key
+    """
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_BACKGROUND_REFRESH", "false")
+    fetch_count = 0
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            nonlocal fetch_count
+            fetch_count += 1
+            return mock_value
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    provider = TestProvider()
+    cache_key = provider._build_cache_key(name=mock_name)
+    provider.store[cache_key] = ExpirableValue("stale", time.monotonic() - 10)
+
+    # WHEN the stale value is requested multiple times before the refresh hook runs
+    values = [provider.get(mock_name, stale_while_revalidate=60) for _ in range(10)]
+    assert values == ["stale"] * 10
+    assert fetch_count == 0
+
+    provider.refresh_stale_values()
+
+    # THEN the value is fetched once and cached
+    assert fetch_count == 1
+    assert provider.get(mock_name, stale_while_revalidate=60) == mock_value
+    assert fetch_count == 1
+
+
+def test_base_provider_get_stale_while_revalidate_max_staleness(mock_name, mock_value):
+    """
+    Test BaseProvider.get() fetches synchronously once a value is past the stale window
+    """
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            return mock_value
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    provider = TestProvider()
+    cache_key = provider._build_cache_key(name=mock_name)
+    provider.store[cache_key] = ExpirableValue("stale", time.monotonic() - 120)
+
+    # WHEN the cached value expired more than stale_while_revalidate seconds ago
+    value = provider.get(mock_name, stale_while_revalidate=60)
+
+    # THEN the latest value is fetched synchronously
+    assert value == mock_value
+
+
+def test_base_provider_get_multiple_stale_while_revalidate_refresh_hook(monkeypatch, mock_name, mock_value):
+    """
+    Test BaseProvider.get_multiple() returns stale values until refresh_stale_values() runs
+    """
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_BACKGROUND_REFRESH", "false")
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            raise NotImplementedError()
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            assert path == mock_name
+            return {"A": mock_value}
+
+    provider = TestProvider()
+    cache_key = provider._build_cache_key(name=mock_name, is_nested=True)
+    provider.store[cache_key] = ExpirableValue({"A": "stale"}, time.monotonic() - 10)
+
+    assert provider.get_multiple(mock_name, stale_while_revalidate=60) == {"A": "stale"}
+
+    provider.refresh_stale_values()
+
+    assert provider.get_multiple(mock_name, stale_while_revalidate=60) == {"A": mock_value}
+
+
+def test_in_memory_cache_evicts_least_recently_used(mock_value):
+    """
+    Test InMemoryCache evicts the least recently used value once full, and counts evictions
+    """
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            return mock_value
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    # GIVEN a provider with a cache that holds up to 2 values
+    cache = InMemoryCache(max_items=2)
+    provider = TestProvider(cache=cache)
+
+    # WHEN a third value is cached after reading the first one again
+    provider.get("a")
+    provider.get("b")
+    provider.get("a")
+    provider.get("c")
+
+    # THEN the least recently used value is evicted
+    assert provider.has_not_expired_in_cache(provider._build_cache_key(name="a"))
+    assert provider.has_not_expired_in_cache(provider._build_cache_key(name="c"))
+    assert not provider.has_not_expired_in_cache(provider._build_cache_key(name="b"))
+    assert len(provider.store) == 2
+    assert cache.stats == CacheStats(hits=3, misses=4, negative_hits=0, evictions=1)
+
+
+def test_in_memory_cache_shared_between_providers(mock_name):
+    """
+    Test providers sharing a cache backend don't share cached values
+    """
+
+    class TestProvider(BaseProvider):
+        def __init__(self, value: str, **kwargs):
+            self.value = value
+            super().__init__(**kwargs)
+
+        def _get(self, name: str, **kwargs) -> str:
+            return self.value
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    # GIVEN two providers sharing the same cache
+    cache = InMemoryCache()
+    provider_a = TestProvider("a", cache=cache)
+    provider_b = TestProvider("b", cache=cache)
+
+    # WHEN both retrieve a parameter with the same name
+    # THEN each provider gets its own value
+    assert provider_a.get(mock_name) == "a"
+    assert provider_b.get(mock_name) == "b"
+    assert len(cache.keys()) == 2
+
+    # WHEN one of them clears its cache
+    provider_a.clear_cache()
+
+    # THEN values cached by other providers are kept
+    assert len(provider_a.store) == 0
+    assert provider_b.get(mock_name) == "b"
+
+
+def test_ssm_provider_get_negative_cache(mock_name, config):
+    """
+    Test SSMProvider.get() caches parameters not found when negative caching is enabled
+    """
+    # GIVEN a provider caching parameters not found for 5 seconds
+    cache = InMemoryCache(negative_ttl=5)
+    provider = parameters.SSMProvider(boto_config=config, cache=cache)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_client_error("get_parameter", "ParameterNotFound")
+    stubber.activate()
+
+    # WHEN the parameter is retrieved multiple times
+    try:
+        for _ in range(3):
+            with pytest.raises(parameters.GetParameterError, match="ParameterNotFound"):
+                provider.get(mock_name)
+
+        # THEN SSM is called only once
+        stubber.assert_no_pending_responses()
+        assert cache.stats.negative_hits == 2
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_negative_cache_disabled(mock_name, config):
+    """
+    Test SSMProvider.get() doesn't cache parameters not found by default
+    """
+    provider = parameters.SSMProvider(boto_config=config, cache=InMemoryCache())
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_client_error("get_parameter", "ParameterNotFound")
+    stubber.add_client_error("get_parameter", "ParameterNotFound")
+    stubber.activate()
+
+    try:
+        for _ in range(2):
+            with pytest.raises(parameters.GetParameterError):
+                provider.get(mock_name)
+
+        stubber.assert_no_pending_responses()
+        assert len(provider.store) == 0
+    finally:
+        stubber.deactivate()
+
+
+def test_ssm_provider_get_negative_cache_ignores_other_errors(mock_name, config):
+    """
+    Test SSMProvider.get() only caches parameters not found, not other errors
+    """
+    provider = parameters.SSMProvider(boto_config=config, cache=InMemoryCache(negative_ttl=5))
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_client_error("get_parameter", "ThrottlingException")
+    stubber.activate()
+
+    try:
+        with pytest.raises(parameters.GetParameterError):
+            provider.get(mock_name)
+
+        stubber.assert_no_pending_responses()
+        assert len(provider.store) == 0
+    finally:
+        stubber.deactivate()
+
+
+def test_base_provider_negative_cache_ignores_errors_without_response_dict(mock_name):
+    """
+    Test BaseProvider.get() doesn't cache errors whose "response" attribute isn't a botocore-like dict
+    """
+
+    class ResponseError(Exception):
+        response = "ParameterNotFound"
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            raise ResponseError()
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    provider = TestProvider(cache=InMemoryCache(negative_ttl=5))
+
+    with pytest.raises(parameters.GetParameterError):
+        provider.get(mock_name)
+
+    assert len(provider.store) == 0
+
+
+def test_ssm_provider_get_parameters_by_name_negative_cache(mock_value, config):
+    """
+    Test SSMProvider.get_parameters_by_name() reports parameters cached as not found under "_errors"
+    """
+    # GIVEN a provider caching parameters not found for 5 seconds
+    provider = parameters.SSMProvider(boto_config=config, cache=InMemoryCache(negative_ttl=5))
+    params = {"/missing": {}, "/found": {}}
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "get_parameters",
+        {
+            "Parameters": [
+                {
+                    "Name": "/found",
+                    "Type": "String",
+                    "Value": mock_value,
+                    "Version": 1,
+                    "ARN": "arn:aws:ssm:us-east-2:111122223333:parameter/found",
+                    "DataType": "text",
+                },
+            ],
+            "InvalidParameters": ["/missing"],
+        },
+    )
+    stubber.activate()
+
+    try:
+        # WHEN parameters are retrieved twice without failing fast
+        first = provider.get_parameters_by_name(parameters=params, raise_on_error=False)
+        second = provider.get_parameters_by_name(parameters=params, raise_on_error=False)
+
+        # THEN SSM is called only once and the missing parameter is reported as an error both times
+        stubber.assert_no_pending_responses()
+        assert first == second == {"/found": mock_value, "_errors": ["/missing"]}
+
+        # and raised when failing fast
+        with pytest.raises(parameters.GetParameterError, match="/missing"):
+            provider.get_parameters_by_name(parameters=params)
+    finally:
+        stubber.deactivate()
+
+
+def test_providers_global_clear_cache_keeps_other_providers(mock_name, mock_value, monkeypatch):
+    """
+    Test clear_caches() only clears values cached by the default providers
+    """
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            return mock_value
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]: ...
+
+    # GIVEN a default provider and a user-created provider sharing the default cache
+    monkeypatch.setitem(parameters.base.DEFAULT_PROVIDERS, "ssm", TestProvider())
+    provider = TestProvider()
+
+    parameters.get_parameter(mock_name)
+    provider.get(mock_name)
+
+    # WHEN clear_caches is called
+    parameters.clear_caches()
+
+    # THEN the user-created provider keeps its cached values
+    assert parameters.base.DEFAULT_PROVIDERS == {}
+    assert len(provider.store) == 1
+
+
+@pytest.mark.asyncio
+async def test_base_provider_get_async_concurrent(mock_value):
+    """
+    Test BaseProvider.get_async() fetches independent names concurrently
+    """
+    barrier = threading.Barrier(3, timeout=5)
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            # fails unless all three names are being fetched at the same time
+            barrier.wait()
+            return f"{name}-{mock_value}"
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    provider = TestProvider(cache=InMemoryCache())
+
+    # WHEN fetching three parameters concurrently
+    values = await asyncio.gather(*(provider.get_async(name) for name in ("a", "b", "c")))
+
+    # THEN all of them are retrieved and cached
+    assert values == [f"a-{mock_value}", f"b-{mock_value}", f"c-{mock_value}"]
+    assert len(provider.store) == 3
+
+
+@pytest.mark.asyncio
+async def test_base_provider_get_async_cached(mock_name, mock_value):
+    """
+    Test BaseProvider.get_async() returns cached and transformed values like get()
+    """
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            return json.dumps({"value": mock_value})
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    cache = InMemoryCache()
+    provider = TestProvider(cache=cache)
+
+    # WHEN the same parameter is fetched twice
+    first = await provider.get_async(mock_name, transform="json")
+    second = await provider.get_async(mock_name, transform="json")
+
+    # THEN the second value comes from cache
+    assert first == second == {"value": mock_value}
+    assert cache.stats == CacheStats(hits=1, misses=1, negative_hits=0, evictions=0)
+
+
+@pytest.mark.asyncio
+async def test_base_provider_get_multiple_async(mock_name, mock_value):
+    """
+    Test BaseProvider.get_multiple_async() retrieves and transforms values like get_multiple()
+    """
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            raise NotImplementedError()
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            assert path == mock_name
+            return {"A.json": json.dumps(mock_value)}
+
+    provider = TestProvider()
+
+    value = await provider.get_multiple_async(mock_name, transform="auto")
+
+    assert value == {"A.json": mock_value}
+    assert provider.has_not_expired_in_cache(
+        provider._build_cache_key(name=mock_name, transform="auto", is_nested=True),
+    )
+
+
+@pytest.mark.asyncio
+async def test_ssm_provider_get_parameters_by_name_async(mock_name, mock_value):
+    # GIVEN two parameters are requested and one of them is cached
+    dev_param = f"/dev/{mock_name}"
+    prod_param = f"/prod/{mock_name}"
+    params = {dev_param: {}, prod_param: {}}
+    requested_names = []
+
+    class FakeClient:
+        def get_parameters(self, Names, **kwargs):
+            requested_names.extend(Names)
+            return build_get_parameters_stub(params={dev_param: mock_value})
+
+    provider = SSMProvider(boto3_client=FakeClient(), cache=InMemoryCache())
+    provider.add_to_cache(key=(prod_param, None), value="cached", max_age=60)
+
+    # WHEN fetching them without blocking the event loop
+    ret = await provider.get_parameters_by_name_async(parameters=params)
+
+    # THEN only the parameter not cached is fetched
+    assert requested_names == [dev_param]
+    assert ret == {dev_param: mock_value, prod_param: "cached"}
+
+
+@pytest.mark.asyncio
+async def test_ssm_provider_get_parameters_by_name_async_negative_cache(mock_name):
+    # GIVEN a parameter cached as not found, and a parameter to decrypt
+    missing = f"/dev/{mock_name}"
+    params = {missing: {}, f"/prod/{mock_name}": {"decrypt": True}}
+
+    provider = SSMProvider(boto3_client=object(), cache=InMemoryCache(negative_ttl=5))
+    provider.add_not_found_to_cache(key=(missing, None), error="Parameter not found")
+
+    # WHEN fetching them and failing fast
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with pytest.raises(parameters.exceptions.GetParameterError):
+            await provider.get_parameters_by_name_async(parameters=params)
+        gc.collect()
+
+    # THEN no fetch was left pending
+    assert not [warning for warning in caught if "was never awaited" in str(warning.message)]
+
+
+@pytest.mark.asyncio
+async def test_ssm_provider_get_parameters_by_name_async_do_not_raise_on_failure(mock_name, mock_value, config):
+    # GIVEN two parameters are requested
+    success = f"/dev/{mock_name}"
+    fail = f"/prod/{mock_name}"
+    params = {success: {}, fail: {}}
+
+    provider = parameters.SSMProvider(boto_config=config, cache=InMemoryCache())
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response(
+        "get_parameters",
+        build_get_parameters_stub(params={success: mock_value}, invalid_parameters=[fail]),
+        {"Names": [success, fail]},
+    )
+    stubber.activate()
+
+    # WHEN one of them fails to be retrieved
+    try:
+        ret = await provider.get_parameters_by_name_async(parameters=params, raise_on_error=False)
+
+        # THEN failed ones are available within "_errors" key
+        stubber.assert_no_pending_responses()
+        assert ret == {success: mock_value, "_errors": [fail]}
+    finally:
+        stubber.deactivate()
@@ -1,8 +1,16 @@
+import asyncio
 import contextlib
 
 import pytest
+from aws_xray_sdk import global_sdk_config
+from aws_xray_sdk.core.async_recorder import AsyncAWSXRayRecorder
+from aws_xray_sdk.core.context import Context
 
 from aws_lambda_powertools import Tracer
+from aws_lambda_powertools.tracing.context import (
+    ContextVarsContext,
+    LambdaContextVarsContext,
+)
 
 
 @pytest.fixture
@@ -21,6 +29,31 @@ def service_name():
     return "booking"
 
 
+@pytest.fixture
+def xray_recorder():
+    class FakeEmitter:
+        def __init__(self):
+            self.entities = []
+
+        def send_entity(self, entity):
+            self.entities.append(entity)
+
+    sdk_enabled = global_sdk_config.sdk_enabled()
+    global_sdk_config.set_sdk_enabled(True)
+
+    recorder = AsyncAWSXRayRecorder()
+    recorder.configure(
+        sampling=False,
+        context=Context(),
+        emitter=FakeEmitter(),
+        streaming_threshold=10_000,
+        service="booking",
+    )
+    yield recorder
+
+    global_sdk_config.set_sdk_enabled(sdk_enabled)
+
+
 def test_capture_lambda_handler(dummy_response):
     # GIVEN tracer lambda handler decorator is used
     tracer = Tracer(disabled=True)
@@ -226,3 +259,68 @@ def test_tracer_yield_with_capture():
     result = handler({}, {})
     assert "testresult" in result
     assert "testresult2" in result
+
+
+def test_tracer_uses_contextvars_context(xray_recorder):
+    # GIVEN an X-Ray recorder using the default thread local context
+    # WHEN tracer is enabled
+    Tracer(provider=xray_recorder, disabled=False, auto_patch=False)
+
+    # THEN X-Ray context should be replaced with a contextvars context
+    assert isinstance(xray_recorder.context, ContextVarsContext)
+
+
+def test_tracer_concurrent_async_subsegments_parent(xray_recorder):
+    # GIVEN tracer is enabled with an X-Ray recorder
+    tracer = Tracer(provider=xray_recorder, disabled=False, auto_patch=False)
+
+    @tracer.capture_method
+    async def traced_task(idx: int):
+        await asyncio.sleep(0)
+        return idx
+
+    @tracer.capture_method
+    async def fan_out():
+        return await asyncio.gather(*(traced_task(idx) for idx in range(1000)))
+
+    # WHEN 1000 traced coroutines run concurrently
+    segment = xray_recorder.begin_segment("handler")
+    result = asyncio.run(fan_out())
+
+    # THEN each coroutine subsegment should be a closed child of the caller subsegment
+    assert result == list(range(1000))
+    assert len(segment.subsegments) == 1
+
+    fan_out_subsegment = segment.subsegments[0]
+    assert len(fan_out_subsegment.subsegments) == 1000
+    for subsegment in fan_out_subsegment.subsegments:
+        assert subsegment.parent_id == fan_out_subsegment.id
+        assert not subsegment.subsegments
+        assert not subsegment.in_progress
+
+    # THEN the caller context should be restored
+    assert xray_recorder.get_trace_entity() is segment
+    xray_recorder.end_segment()
+
+
+def test_lambda_contextvars_context_isolates_concurrent_tasks(monkeypatch, xray_recorder):
+    # GIVEN X-Ray recorder uses the Lambda contextvars context within a sampled invocation
+    monkeypatch.setenv("_X_AMZN_TRACE_ID", "Root=1-5759e988-bd862e3fe1be46a994272793;Parent=53995c3f42cd8ad8;Sampled=1")
+    xray_recorder.context = LambdaContextVarsContext()
+    facade_segment = xray_recorder.get_trace_entity()
+
+    async def traced_task(name: str):
+        async with xray_recorder.in_subsegment_async(name) as subsegment:
+            await asyncio.sleep(0)
+            return xray_recorder.get_trace_entity() is subsegment
+
+    async def fan_out():
+        return await asyncio.gather(*(traced_task(f"task_{idx}") for idx in range(10)))
+
+    # WHEN traced coroutines run concurrently
+    result = asyncio.run(fan_out())
+
+    # THEN each coroutine should see its own subsegment as the current entity
+    assert all(result)
+    assert len(facade_segment.subsegments) == 10
+    assert xray_recorder.get_trace_entity() is facade_segment
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, CompressionConfig, Response, content_types
+
+PAYLOAD_SIZES = [200, 2_000, 20_000, 200_000, 2_000_000]
+
+
+def build_payload(size: int) -> str:
+    """JSON document of roughly `size` bytes, with the repetition typical of API responses"""
+    item = {"id": "d0b8b1a2-4f5e-4c4b-9a0e-2a1c8f3e5d7b", "name": "Powertools for AWS Lambda", "done": False}
+    count = max(1, size // len(json.dumps(item)))
+    return json.dumps({"todos": [{**item, "index": i} for i in range(count)]})
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("size", PAYLOAD_SIZES)
+@pytest.mark.parametrize("level", [1, 6, 9])
+def test_compression_latency_by_payload_size(benchmark, size, level):
+    # GIVEN a route returning a JSON payload of a given size, compressed at a given level
+    benchmark.group = f"compression-{size}"
+    app = APIGatewayRestResolver(compression=CompressionConfig(level=level))
+    event = {"path": "/todos", "httpMethod": "GET", "headers": {"Accept-Encoding": "gzip"}, "requestContext": {}}
+    payload = build_payload(size)
+
+    @app.get("/todos", compress=True)
+    def get_todos():
+        return Response(200, content_types.APPLICATION_JSON, payload)
+
+    # WHEN resolving the request
+    result = benchmark(app, event, {})
+
+    # THEN the response is compressed
+    assert result["multiValueHeaders"]["Content-Encoding"] == ["gzip"]
+    benchmark.extra_info["response_size"] = len(result["body"])
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("size", PAYLOAD_SIZES)
+def test_uncompressed_latency_by_payload_size(benchmark, size):
+    # GIVEN a route returning a JSON payload of a given size, smaller than the minimum size to compress
+    benchmark.group = f"compression-{size}"
+    app = APIGatewayRestResolver(compression=CompressionConfig(minimum_size=size * 10))
+    event = {"path": "/todos", "httpMethod": "GET", "headers": {"Accept-Encoding": "gzip"}, "requestContext": {}}
+    payload = build_payload(size)
+
+    @app.get("/todos", compress=True)
+    def get_todos():
+        return Response(200, content_types.APPLICATION_JSON, payload)
+
+    # WHEN resolving the request
+    result = benchmark(app, event, {})
+
+    # THEN the response is returned as-is
+    assert "Content-Encoding" not in result["multiValueHeaders"]
+    benchmark.extra_info["response_size"] = len(result["body"])
@@ -0,0 +1,59 @@
+import pytest
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, CORSConfig
+
+ROUTE_COUNTS = [1, 10, 100]
+ORIGIN = "https://app.example.com"
+
+
+def build_app(route_count: int) -> APIGatewayRestResolver:
+    cors = CORSConfig(
+        allow_origin="https://www.example.com",
+        extra_origins=[f"https://origin{i}.example.org" for i in range(20)] + ["https://*.example.com"],
+        expose_headers=["x-request-id"],
+        max_age=300,
+        allow_credentials=True,
+    )
+    app = APIGatewayRestResolver(cors=cors)
+
+    for i in range(route_count):
+
+        @app.get(f"/resource{i}/<item_id>")
+        def get_item(item_id: str):
+            return {"id": item_id}
+
+        @app.put(f"/resource{i}/<item_id>")
+        def update_item(item_id: str):
+            return {"id": item_id}
+
+    return app
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("route_count", ROUTE_COUNTS)
+def test_preflight_latency_by_route_count(benchmark, route_count):
+    # GIVEN a resolver with CORS and a given number of routes
+    benchmark.group = f"cors-preflight-{route_count}"
+    app = build_app(route_count)
+    event = {"path": "/resource0/1", "httpMethod": "OPTIONS", "headers": {"Origin": ORIGIN}, "requestContext": {}}
+
+    # WHEN resolving a pre-flight request
+    result = benchmark(app, event, {})
+
+    # THEN the methods of the matching route are allowed
+    assert result["statusCode"] == 204
+    assert result["multiValueHeaders"]["Access-Control-Allow-Methods"] == ["GET,OPTIONS,PUT"]
+
+
+@pytest.mark.perf
+def test_cors_response_latency(benchmark):
+    # GIVEN a resolver with CORS allowing multiple origins
+    app = build_app(1)
+    event = {"path": "/resource0/1", "httpMethod": "GET", "headers": {"Origin": ORIGIN}, "requestContext": {}}
+
+    # WHEN resolving a request from an allowed origin
+    result = benchmark(app, event, {})
+
+    # THEN CORS headers are added
+    assert result["multiValueHeaders"]["Access-Control-Allow-Origin"] == [ORIGIN]
+    assert result["multiValueHeaders"]["Access-Control-Allow-Credentials"] == ["true"]
@@ -0,0 +1,65 @@
+import pytest
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response, content_types
+from aws_lambda_powertools.event_handler.exceptions import BadRequestError
+
+MIDDLEWARE_DEPTHS = [0, 1, 5, 10, 25]
+EVENT = {"path": "/todos", "httpMethod": "GET", "headers": {}, "requestContext": {}}
+
+
+def passthrough(app, next_middleware):
+    return next_middleware(app)
+
+
+def build_app(depth: int, dispatch: str) -> APIGatewayRestResolver:
+    app = APIGatewayRestResolver()
+    app.use([passthrough] * depth)
+
+    @app.get("/todos")
+    def get_todos():
+        return {"todos": []}
+
+    if dispatch == "frames":
+        # MiddlewareFrame chain recording processed stack frames, as used in debug mode
+        for route in app._static_routes:
+            route._build_middleware_stack(router_middlewares=app._router_middlewares, debug=True)
+
+    return app
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("depth", MIDDLEWARE_DEPTHS)
+@pytest.mark.parametrize("dispatch", ["compiled", "frames"])
+def test_request_latency_by_middleware_depth(benchmark, depth, dispatch):
+    # GIVEN a route with a given number of middlewares
+    benchmark.group = f"middlewares-{depth}"
+    app = build_app(depth, dispatch)
+
+    # WHEN resolving the request
+    result = benchmark(app, EVENT, {})
+
+    # THEN every middleware is called
+    assert result["statusCode"] == 200
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("depth", MIDDLEWARE_DEPTHS)
+def test_exception_handler_latency_by_middleware_depth(benchmark, depth):
+    # GIVEN a route raising an exception handled by a handler for its base class
+    benchmark.group = f"exception-handlers-{depth}"
+    app = APIGatewayRestResolver()
+    app.use([passthrough] * depth)
+
+    @app.get("/todos")
+    def get_todos():
+        raise BadRequestError("invalid todo")
+
+    @app.exception_handler(Exception)
+    def handle_exception(ex: Exception):
+        return Response(status_code=400, content_type=content_types.TEXT_PLAIN, body=str(ex))
+
+    # WHEN resolving the request
+    result = benchmark(app, EVENT, {})
+
+    # THEN the exception handler response is returned
+    assert result["statusCode"] == 400
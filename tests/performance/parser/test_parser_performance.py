@@ -6,7 +6,7 @@ import pytest
 from pydantic import BaseModel, Field
 from typing_extensions import Annotated
 
-from aws_lambda_powertools.utilities.parser import parse
+from aws_lambda_powertools.utilities.parser import envelopes, parse
 
 # adjusted for slower machines in CI too
 PARSER_VALIDATION_SLA: float = 0.010
@@ -69,3 +69,37 @@ def test_parser_with_cache():
     elapsed = t()
     if elapsed > PARSER_VALIDATION_SLA:
         pytest.fail(f"Parser validation should be below {PARSER_VALIDATION_SLA}s: {elapsed}")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="core", disable_gc=True, warmup=False)
+def test_parser_sqs_envelope_large_batch():
+    # GIVEN an SQS batch of 1000 records with JSON bodies
+    record = {
+        "messageId": "059f36b4-87a3-44ab-83d2-661975830a7d",
+        "receiptHandle": "AQEBwJnKyrHigUMZj6rYigCgxlaS3SLy0a...",
+        "body": '{"status": "failed", "error": "X"}',
+        "attributes": {
+            "ApproximateReceiveCount": "1",
+            "SentTimestamp": "1545082649183",
+            "SenderId": "AIDAIENQZJOLO23YVJ4VO",
+            "ApproximateFirstReceiveTimestamp": "1545082649185",
+        },
+        "messageAttributes": {},
+        "md5OfBody": "e4e68fb7bd0e697a0ae8f1bb342846b3",
+        "eventSource": "aws:sqs",
+        "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+        "awsRegion": "us-east-2",
+    }
+    event = {"Records": [record] * 1000}
+    parse(event=event, model=DogCallback, envelope=envelopes.SqsEnvelope)
+
+    # WHEN we parse the envelope and every record body
+    with timing() as t:
+        parsed_event = parse(event=event, model=DogCallback, envelope=envelopes.SqsEnvelope)
+
+    # THEN completion time should be below our validation SLA
+    elapsed = t()
+    assert len(parsed_event) == 1000
+    if elapsed > PARSER_VALIDATION_SLA * 5:
+        pytest.fail(f"Parsing a batch of SQS records should be below {PARSER_VALIDATION_SLA * 5}s: {elapsed}")
@@ -1,7 +1,15 @@
+import base64
+import json
+
+import pytest
+
 from aws_lambda_powertools.utilities.data_classes import (
     APIGatewayProxyEvent,
     APIGatewayProxyEventV2,
+    VPCLatticeEventV2,
 )
+from aws_lambda_powertools.utilities.data_classes.common import CaseInsensitiveDict
+from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 from tests.functional.utils import load_event
 
 
@@ -239,3 +247,119 @@ def test_api_gateway_proxy_v2_iam_event():
     assert iam.principal_org_id == iam_raw["principalOrgId"]
     assert iam.user_arn == iam_raw["userArn"]
     assert iam.user_id == iam_raw["userId"]
+
+
+def test_api_gateway_proxy_event_headers_normalized_once(mocker):
+    # GIVEN an API Gateway proxy event
+    raw_event = load_event("apiGatewayProxyEvent.json")
+    parsed_event = APIGatewayProxyEvent(raw_event)
+    normalize = mocker.spy(CaseInsensitiveDict, "update")
+
+    # WHEN reading headers multiple times
+    headers = parsed_event.headers
+    assert parsed_event.headers is headers
+    assert parsed_event.resolved_headers_field is parsed_event.resolved_headers_field
+    with pytest.warns(PowertoolsDeprecationWarning):
+        assert parsed_event.get_header_value("HEADER1") == raw_event["headers"]["Header1"]
+
+    # THEN header names are only normalized once per view
+    assert normalize.call_count == 2
+
+    # WHEN the raw headers are replaced
+    raw_event["headers"] = {"X-Custom": "value"}
+
+    # THEN headers are normalized again
+    assert parsed_event.headers == {"x-custom": "value"}
+    assert parsed_event.headers is not headers
+
+
+def test_api_gateway_proxy_v2_event_resolved_fields_normalized_once():
+    # GIVEN an API Gateway HTTP API event with a multi-value header
+    raw_event = load_event("apiGatewayProxyV2Event.json")
+    raw_event["headers"]["X-Multi"] = "a,b"
+    parsed_event = APIGatewayProxyEventV2(raw_event)
+
+    # WHEN reading the resolved headers and query string multiple times
+    resolved_headers = parsed_event.resolved_headers_field
+    resolved_query = parsed_event.resolved_query_string_parameters
+
+    # THEN multi-value headers are split, and views are reused
+    assert resolved_headers["x-multi"] == ["a", "b"]
+    assert parsed_event.resolved_headers_field is resolved_headers
+    assert parsed_event.resolved_query_string_parameters is resolved_query
+
+    # WHEN the raw query string is replaced
+    raw_event["queryStringParameters"] = {"page": "1,2"}
+
+    # THEN the resolved query string is rebuilt
+    assert parsed_event.resolved_query_string_parameters == {"page": ["1", "2"]}
+
+
+def test_api_gateway_proxy_event_base64_body_bytes(mocker):
+    # GIVEN an API Gateway event with a base64 encoded binary body
+    raw_event = load_event("apiGatewayProxyEvent.json")
+    raw_event["body"] = base64.b64encode(b"\x00\xff binary").decode()
+    raw_event["isBase64Encoded"] = True
+    parsed_event = APIGatewayProxyEvent(raw_event)
+
+    # WHEN reading the decoded body as bytes
+    # THEN it's decoded without a str round trip
+    assert parsed_event.decoded_body_bytes == b"\x00\xff binary"
+
+    # GIVEN a base64 encoded JSON body
+    raw_event["body"] = base64.b64encode(b'{"message": "hello"}').decode()
+    json_loads = mocker.spy(json, "loads")
+    parsed_event = APIGatewayProxyEvent(raw_event)
+
+    # WHEN parsing it as JSON
+    # THEN it's parsed from the decoded bytes
+    assert parsed_event.json_body == {"message": "hello"}
+    json_loads.assert_called_once_with(b'{"message": "hello"}')
+    assert parsed_event.decoded_body == '{"message": "hello"}'
+
+    # GIVEN a body that isn't base64 encoded
+    raw_event.update(body="plain", isBase64Encoded=False)
+    parsed_event = APIGatewayProxyEvent(raw_event)
+
+    # THEN it's encoded as UTF-8
+    assert parsed_event.decoded_body_bytes == b"plain"
+
+
+@pytest.mark.parametrize(
+    "event_class, event_file",
+    [(APIGatewayProxyEvent, "apiGatewayProxyEvent.json"), (VPCLatticeEventV2, "vpcLatticeV2Event.json")],
+)
+def test_base64_json_body_custom_deserializer(event_class, event_file):
+    # GIVEN a base64 encoded JSON body and a custom deserializer only accepting str
+    raw_event = load_event(event_file)
+    raw_event["body"] = base64.b64encode(b'{"message": "hello"}').decode()
+    raw_event["isBase64Encoded"] = True
+
+    def deserializer(body: str):
+        assert isinstance(body, str)
+        return json.loads(body)
+
+    parsed_event = event_class(raw_event, json_deserializer=deserializer)
+
+    # WHEN parsing it as JSON
+    # THEN the custom deserializer receives the decoded str
+    assert parsed_event.json_body == {"message": "hello"}
+
+
+def test_api_gateway_proxy_event_headers_shared_per_event():
+    # GIVEN an API Gateway proxy event
+    parsed_event = APIGatewayProxyEvent(load_event("apiGatewayProxyEvent.json"))
+
+    # WHEN modifying a copy of its headers
+    headers = dict(parsed_event.headers)
+    headers["x-copy"] = "value"
+
+    # THEN the event isn't affected
+    assert "x-copy" not in parsed_event.headers
+    assert "x-copy" not in parsed_event.resolved_headers_field
+
+    # WHEN modifying its headers in place
+    parsed_event.headers["X-Shared"] = "value"
+
+    # THEN later reads of the same view see it, as documented
+    assert parsed_event.headers["x-shared"] == "value"
@@ -0,0 +1,134 @@
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes import (
+    APIGatewayProxyEvent,
+    SQSEvent,
+    event_source,
+)
+from aws_lambda_powertools.utilities.data_classes.event_source_router import (
+    EVENT_SOURCE_DATA_CLASSES,
+    EventSourceRouter,
+    EventSourceType,
+    detect_event_source,
+)
+from tests.functional.utils import load_event
+
+
+@pytest.mark.parametrize(
+    "event_file, expected_source",
+    [
+        ("sqsEvent.json", EventSourceType.SQS),
+        ("snsEvent.json", EventSourceType.SNS),
+        ("sesEvent.json", EventSourceType.SES),
+        ("s3Event.json", EventSourceType.S3),
+        ("dynamoStreamEvent.json", EventSourceType.DYNAMODB_STREAM),
+        ("kinesisStreamEvent.json", EventSourceType.KINESIS_DATA_STREAM),
+        ("kinesisFirehosePutEvent.json", EventSourceType.KINESIS_FIREHOSE),
+        ("kafkaEventMsk.json", EventSourceType.KAFKA_MSK),
+        ("kafkaEventSelfManaged.json", EventSourceType.KAFKA_SELF_MANAGED),
+        ("activeMQEvent.json", EventSourceType.ACTIVE_MQ),
+        ("rabbitMQEvent.json", EventSourceType.RABBIT_MQ),
+        ("eventBridgeEvent.json", EventSourceType.EVENTBRIDGE),
+        ("cloudWatchLogEvent.json", EventSourceType.CLOUDWATCH_LOGS),
+        ("apiGatewayProxyEvent.json", EventSourceType.API_GATEWAY_REST),
+        ("apiGatewayProxyV2Event.json", EventSourceType.API_GATEWAY_HTTP),
+        ("lambdaFunctionUrlEvent.json", EventSourceType.LAMBDA_FUNCTION_URL),
+        ("albEvent.json", EventSourceType.ALB),
+        ("vpcLatticeEvent.json", EventSourceType.VPC_LATTICE),
+        ("vpcLatticeV2Event.json", EventSourceType.VPC_LATTICE_V2),
+        ("bedrockAgentEvent.json", EventSourceType.BEDROCK_AGENT),
+    ],
+)
+def test_detect_event_source(event_file, expected_source):
+    # GIVEN a sample event of an event source
+    raw_event = load_event(event_file)
+
+    # WHEN detecting its event source
+    source = detect_event_source(raw_event)
+
+    # THEN the event source is detected, and its data class wraps the event
+    assert source is expected_source
+    assert EVENT_SOURCE_DATA_CLASSES[source](raw_event).raw_event == raw_event
+
+
+@pytest.mark.parametrize("event_source_name", ["aws:mq", "aws:amq"])
+def test_detect_event_source_active_mq(event_source_name):
+    # GIVEN an ActiveMQ event with either of its event source names
+    raw_event = load_event("activeMQEvent.json")
+    raw_event["eventSource"] = event_source_name
+
+    # WHEN detecting its event source
+    # THEN it's detected as ActiveMQ
+    assert detect_event_source(raw_event) == EventSourceType.ACTIVE_MQ
+
+
+@pytest.mark.parametrize(
+    "raw_event",
+    [
+        {"invalid": "event"},
+        {"Records": []},
+        {"Records": [{"eventSource": "aws:unknown"}]},
+        {"requestContext": {}},
+        "not a dict",
+    ],
+)
+def test_detect_event_source_unknown(raw_event):
+    # GIVEN an event of an unsupported event source
+    # WHEN detecting its event source
+    # THEN None is returned
+    assert detect_event_source(raw_event) is None
+
+
+def test_event_source_router():
+    # GIVEN a router with handlers for SQS and API Gateway events
+    router = EventSourceRouter()
+
+    @router.register(EventSourceType.SQS)
+    def handle_messages(event: SQSEvent, context):
+        return [record.message_id for record in event.records]
+
+    @router.register(EventSourceType.API_GATEWAY_REST, EventSourceType.API_GATEWAY_HTTP)
+    def handle_request(event: APIGatewayProxyEvent, context):
+        return type(event).__name__
+
+    # WHEN resolving events from each event source
+    sqs_event = load_event("sqsEvent.json")
+
+    # THEN each event is dispatched to its handler, wrapped in its data class
+    assert router(sqs_event, {}) == [record["messageId"] for record in sqs_event["Records"]]
+    assert router.resolve(load_event("apiGatewayProxyEvent.json"), {}) == "APIGatewayProxyEvent"
+    assert router.resolve(load_event("apiGatewayProxyV2Event.json"), {}) == "APIGatewayProxyEventV2"
+
+
+def test_event_source_router_no_handler():
+    # GIVEN a router with a handler for SQS events only
+    router = EventSourceRouter()
+
+    @router.register(EventSourceType.SQS)
+    def handle_messages(event: SQSEvent, context): ...
+
+    # WHEN resolving events without a handler
+    # THEN an error is raised
+    with pytest.raises(ValueError, match="SNS"):
+        router.resolve(load_event("snsEvent.json"), {})
+
+    with pytest.raises(ValueError, match="unknown"):
+        router.resolve({"invalid": "event"}, {})
+
+
+def test_event_source_detects_data_class():
+    # GIVEN a handler decorated with event_source without data class
+    @event_source
+    def handler(event, context):
+        return event
+
+    # WHEN calling it with an SQS event
+    result = handler(load_event("sqsEvent.json"), {})
+
+    # THEN the event is wrapped in the SQS data class
+    assert isinstance(result, SQSEvent)
+
+    # WHEN calling it with an unsupported event
+    # THEN an error is raised
+    with pytest.raises(ValueError, match="Unable to detect the event source"):
+        handler({"invalid": "event"}, {})
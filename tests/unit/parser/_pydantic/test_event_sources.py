@@ -0,0 +1,57 @@
+import pytest
+
+from aws_lambda_powertools.utilities.data_classes.event_source_router import EventSourceRouter, EventSourceType
+from aws_lambda_powertools.utilities.parser import parse
+from aws_lambda_powertools.utilities.parser.event_sources import detect_model
+from aws_lambda_powertools.utilities.parser.models import (
+    APIGatewayProxyEventV2Model,
+    KafkaMskEventModel,
+    SqsModel,
+    VpcLatticeModel,
+)
+from tests.functional.utils import load_event
+
+
+@pytest.mark.parametrize(
+    "event_file, expected_model",
+    [
+        ("sqsEvent.json", SqsModel),
+        ("kafkaEventMsk.json", KafkaMskEventModel),
+        ("apiGatewayProxyV2Event.json", APIGatewayProxyEventV2Model),
+        ("vpcLatticeEvent.json", VpcLatticeModel),
+    ],
+)
+def test_detect_model(event_file, expected_model):
+    # GIVEN a sample event of an event source
+    raw_event = load_event(event_file)
+
+    # WHEN detecting its model
+    model = detect_model(raw_event)
+
+    # THEN the built-in model of its event source is returned, and it parses the event
+    assert model is expected_model
+    assert isinstance(parse(event=raw_event, model=model), expected_model)
+
+
+def test_detect_model_without_model():
+    # GIVEN events without a built-in model
+    # WHEN detecting their model
+    # THEN None is returned
+    assert detect_model(load_event("activeMQEvent.json")) is None
+    assert detect_model({"invalid": "event"}) is None
+
+
+def test_event_source_router_with_model():
+    # GIVEN a router parsing SQS events with a model
+    router = EventSourceRouter()
+
+    @router.register(EventSourceType.SQS, model=SqsModel)
+    def handle_messages(event: SqsModel, context):
+        return event
+
+    # WHEN resolving an SQS event
+    result = router.resolve(load_event("sqsEvent.json"), {})
+
+    # THEN the handler receives the parsed model
+    assert isinstance(result, SqsModel)
+    assert len(result.Records) == 2
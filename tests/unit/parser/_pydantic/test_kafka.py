@@ -1,3 +1,5 @@
+import json
+
 from aws_lambda_powertools.utilities.parser import envelopes, parse
 from aws_lambda_powertools.utilities.parser.models import (
     KafkaMskEventModel,
@@ -20,6 +22,19 @@ def test_kafka_msk_event_with_envelope():
     assert len(parsed_event) == 1
 
 
+def test_kafka_event_raw_json_with_envelope():
+    # GIVEN the raw JSON events of both Kafka event sources
+    for event_file in ["kafkaEventMsk.json", "kafkaEventSelfManaged.json"]:
+        raw_event = json.dumps(load_event(event_file))
+
+        # WHEN parsing them with the Kafka envelope
+        parsed_event = parse(event=raw_event, model=MyLambdaKafkaBusiness, envelope=envelopes.KafkaEnvelope)
+
+        # THEN record values are parsed
+        assert parsed_event[0].key == "value"
+        assert len(parsed_event) == 1
+
+
 def test_kafka_self_managed_event_with_envelope():
     raw_event = load_event("kafkaEventSelfManaged.json")
     parsed_event: MyLambdaKafkaBusiness = parse(
@@ -0,0 +1,197 @@
+import json
+from typing import Type, Union
+
+import pytest
+
+from aws_lambda_powertools.utilities.parser import (
+    BaseModel,
+    ValidationError,
+    envelopes,
+    event_parser,
+    field_validator,
+    parse,
+)
+from aws_lambda_powertools.utilities.parser.envelopes import BaseEnvelope, LazyRecords, RecordEnvelope
+from aws_lambda_powertools.utilities.parser.exceptions import InvalidEnvelopeError
+from tests.functional.utils import load_event
+from tests.unit.parser._pydantic.schemas import MyDynamoBusiness, MyLambdaKafkaBusiness, MySqsBusiness
+
+
+def build_sqs_event(*bodies: str) -> dict:
+    raw_event = load_event("sqsEvent.json")
+    record = raw_event["Records"][0]
+    raw_event["Records"] = [{**record, "messageId": str(index), "body": body} for index, body in enumerate(bodies)]
+    return raw_event
+
+
+def test_lazy_records_parsed_when_accessed():
+    # GIVEN a model tracking how many times it's validated
+    validated = []
+
+    class Order(BaseModel):
+        id: int
+
+        @field_validator("id")
+        def track(cls, value):
+            validated.append(value)
+            return value
+
+    raw_event = build_sqs_event(*[json.dumps({"id": index}) for index in range(10)])
+
+    # WHEN parsing an SQS event lazily
+    orders = parse(event=raw_event, model=Order, envelope=envelopes.SqsEnvelope, lazy=True)
+
+    # THEN no record is parsed upfront
+    assert isinstance(orders, LazyRecords)
+    assert len(orders) == 10
+    assert validated == []
+
+    # WHEN accessing records
+    assert orders[3].id == 3
+    assert orders[3].id == 3
+    assert orders[-1].id == 9
+
+    # THEN each record is parsed only once, when first accessed
+    assert validated == [3, 9]
+
+    # WHEN accessing every record
+    assert [order.id for order in orders][:2] == [0, 1]
+    assert [order.id for order in orders[8:]] == [8, 9]
+
+    # THEN the remaining records are parsed
+    assert sorted(validated) == list(range(10))
+
+
+def test_lazy_records_invalid_record():
+    # GIVEN an SQS event with an invalid record
+    raw_event = build_sqs_event("not a valid JSON!", json.dumps({"message": "hello world", "username": "lessa"}))
+
+    # WHEN parsing it lazily
+    records = parse(event=raw_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, lazy=True)
+
+    # THEN valid records are parsed
+    assert records[1].username == "lessa"
+
+    # AND only accessing the invalid record raises an error
+    with pytest.raises(ValidationError):
+        records[0]
+
+    assert records.raw_records[0]["messageId"] == "0"
+
+
+def test_lazy_records_invalid_record_fallback():
+    # GIVEN a model that can't be validated from JSON when invalid
+    class MyModel(BaseModel):
+        value: Union[int, Type[BaseModel]]
+
+    raw_event = build_sqs_event(json.dumps({"value": "not a number"}), json.dumps({"value": 1}))
+
+    # WHEN parsing it lazily
+    records = parse(event=raw_event, model=MyModel, envelope=envelopes.SqsEnvelope, lazy=True)
+
+    # THEN errors are still raised per record
+    assert records[1].value == 1
+    with pytest.raises(ValidationError):
+        records[0]
+
+
+def test_lazy_records_invalid_envelope():
+    # GIVEN an event without records
+    # WHEN parsing it lazily
+    # THEN the envelope is validated upfront
+    with pytest.raises(ValidationError):
+        parse(event={"invalid": "event"}, model=MySqsBusiness, envelope=envelopes.SqsEnvelope, lazy=True)
+
+
+def test_lazy_records_raw_json_event():
+    # GIVEN the raw JSON of a Kafka event
+    raw_event = json.dumps(load_event("kafkaEventMsk.json"))
+
+    # WHEN parsing it lazily
+    records = parse(event=raw_event, model=MyLambdaKafkaBusiness, envelope=envelopes.KafkaEnvelope, lazy=True)
+
+    # THEN records of every topic are parsed
+    assert len(records) == 1
+    assert records[0].key == "value"
+
+
+def test_lazy_records_dynamodb():
+    # GIVEN a DynamoDB Stream event
+    raw_event = load_event("dynamoStreamEvent.json")
+
+    # WHEN parsing it lazily
+    records = parse(event=raw_event, model=MyDynamoBusiness, envelope=envelopes.DynamoDBStreamEnvelope, lazy=True)
+
+    # THEN records are parsed like the envelope does
+    eager_records = parse(event=raw_event, model=MyDynamoBusiness, envelope=envelopes.DynamoDBStreamEnvelope)
+    assert list(records) == eager_records
+
+
+def test_lazy_records_not_supported():
+    # GIVEN an envelope without records
+    # WHEN parsing lazily
+    # THEN an error is raised
+    with pytest.raises(InvalidEnvelopeError, match="EventBridgeEnvelope"):
+        parse(event=load_event("eventBridgeEvent.json"), model=dict, envelope=envelopes.EventBridgeEnvelope, lazy=True)
+
+    assert not hasattr(envelopes.EventBridgeEnvelope, "parse_lazy")
+
+    with pytest.raises(InvalidEnvelopeError):
+        parse(event=load_event("eventBridgeEvent.json"), model=dict, lazy=True)
+
+
+def test_lazy_records_custom_envelope_without_records():
+    # GIVEN a custom envelope without records
+    class MyEnvelope(BaseEnvelope):
+        def parse(self, data, model):
+            return self._parse(data=data["detail"], model=model)
+
+    # WHEN parsing lazily
+    # THEN an error is raised
+    with pytest.raises(InvalidEnvelopeError, match="MyEnvelope"):
+        parse(event=load_event("eventBridgeEvent.json"), model=dict, envelope=MyEnvelope, lazy=True)
+
+
+def test_record_envelope_requires_record_methods():
+    # GIVEN a custom envelope with records missing how to compose and read them
+    class MyEnvelope(RecordEnvelope):
+        def parse(self, data, model):
+            return self._parse_envelope(data=data, model=model)
+
+    # WHEN instantiating it
+    # THEN an error is raised instead of failing when parsing
+    with pytest.raises(TypeError, match="_compose_record"):
+        MyEnvelope()
+
+
+@pytest.mark.parametrize(
+    "envelope",
+    [
+        envelopes.SqsEnvelope,
+        envelopes.SnsEnvelope,
+        envelopes.SnsSqsEnvelope,
+        envelopes.KinesisDataStreamEnvelope,
+        envelopes.KafkaEnvelope,
+        envelopes.CloudWatchLogsEnvelope,
+        envelopes.DynamoDBStreamEnvelope,
+    ],
+)
+def test_record_envelopes(envelope):
+    # GIVEN a built-in envelope with records
+    # WHEN instantiating it
+    # THEN it's a record envelope supporting lazy parsing
+    assert isinstance(envelope(), RecordEnvelope)
+
+
+def test_event_parser_lazy():
+    # GIVEN a handler parsing SQS records lazily
+    @event_parser(model=MySqsBusiness, envelope=envelopes.SqsEnvelope, lazy=True)
+    def handler(event: LazyRecords[MySqsBusiness], context):
+        return event
+
+    # WHEN calling it
+    records = handler(build_sqs_event(json.dumps({"message": "hello world", "username": "lessa"})), {})
+
+    # THEN records are parsed when accessed
+    assert isinstance(records, LazyRecords)
+    assert records[0].message == "hello world"
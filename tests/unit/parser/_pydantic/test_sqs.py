@@ -1,6 +1,9 @@
+import json
+from typing import Type, Union
+
 import pytest
 
-from aws_lambda_powertools.utilities.parser import ValidationError, envelopes, parse
+from aws_lambda_powertools.utilities.parser import BaseModel, ValidationError, envelopes, parse
 from aws_lambda_powertools.utilities.parser.models import SqsModel
 from tests.functional.utils import load_event
 from tests.functional.validator.conftest import sqs_event  # noqa: F401
@@ -118,3 +121,45 @@ def test_sqs_dlq_trigger_event():
     assert convert_time == int(raw_record["attributes"]["SentTimestamp"])
 
     assert attributes.DeadLetterQueueSourceArn == raw_record["attributes"]["DeadLetterQueueSourceArn"]
+
+
+def test_handle_sqs_trigger_event_raw_json(sqs_event):  # noqa: F811
+    # GIVEN the raw JSON event as bytes
+    raw_event = json.dumps(sqs_event).encode()
+
+    # WHEN parsing it with the SQS envelope
+    parsed_event = parse(event=raw_event, model=MySqsBusiness, envelope=envelopes.SqsEnvelope)
+
+    # THEN the envelope and record bodies are parsed straight from JSON
+    assert parsed_event[0].message == "hello world"
+    assert parsed_event[0].username == "lessa"
+
+
+def test_sqs_envelope_composed_model_is_cached(mocker, sqs_event):  # noqa: F811
+    # GIVEN the SQS envelope composing its envelope model with the data model
+    class MyModel(BaseModel):
+        message: str
+
+    compose = mocker.spy(envelopes.SqsEnvelope, "_compose_envelope")
+
+    # WHEN parsing multiple events with the same model
+    for _ in range(3):
+        parsed_event = parse(event=sqs_event, model=MyModel, envelope=envelopes.SqsEnvelope)
+
+    # THEN the composed model is only built once
+    assert compose.call_count == 1
+    assert parsed_event[0].message == "hello world"
+
+
+def test_sqs_envelope_fallback_to_parsing_records_separately():
+    # GIVEN a model that can't be validated from JSON when invalid
+    class MyModel(BaseModel):
+        value: Union[int, Type[BaseModel]]
+
+    raw_event = load_event("sqsEvent.json")
+    raw_event["Records"][0]["body"] = json.dumps({"value": "not a number"})
+
+    # WHEN parsing it with the SQS envelope
+    # THEN a ValidationError is raised
+    with pytest.raises(ValidationError):
+        parse(event=raw_event, model=MyModel, envelope=envelopes.SqsEnvelope)